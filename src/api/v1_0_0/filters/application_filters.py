@@ -2,7 +2,30 @@
 Application app filters.
 """
 import django_filters
+from django.contrib.postgres.search import TrigramSimilarity
 from django.db.models import Q
+from django.db.models.functions import Greatest
+
+from application.models.address import Address, normalize_search_text
+from application.models.builder import Builder
+from application.models.customer import Customer
+from application.models.mortgage_lender import MortgageLender
+from application.models.real_estate_agent import RealEstateAgent
+
+# relation, model and fields searched by `q`; every field has a trigram index
+SEARCH_RELATIONS = [
+    ('customer', Customer, ['name', 'email', 'phone']),
+    ('real_estate_agent', RealEstateAgent, ['name', 'email', 'phone']),
+    ('mortgage_lender', MortgageLender, ['name', 'email', 'phone']),
+    ('builder', Builder, ['company_name']),
+]
+
+# filter name and the address relation it searches
+ADDRESS_RELATIONS = {
+    'address': 'current_home__address',
+    'builder__address': 'builder__address',
+    'offer_property_address': 'offer_property_address',
+}
 
 
 class CharInFilter(django_filters.BaseInFilter, django_filters.CharFilter):
@@ -38,6 +61,26 @@ class ApplicationFilterSet(django_filters.FilterSet):
     lead_source = django_filters.CharFilter(field_name='lead_source', lookup_expr="icontains")
     lead_source_drill_down_1 = django_filters.CharFilter(field_name="lead_source_drill_down_1", lookup_expr="icontains")
     agent_service_buying_agent_id = django_filters.CharFilter(field_name='agent_service_buying_agent_id', lookup_expr='icontains')
+    q = django_filters.CharFilter(method='filter_search')
+
+    def filter_search(self, queryset, name, value):
+        """
+        Search customers, agents, lenders, builders and application ids at once, best matches first.
+        """
+        value = value.strip()
+        if not value:
+            return queryset
+        # each relation is searched in its own subquery, so every table is read through its trigram indexes
+        matches = Q(id__icontains=value)
+        similarities = []
+        for relation, model, fields in SEARCH_RELATIONS:
+            related_matches = Q()
+            for field in fields:
+                related_matches |= Q(**{'{}__icontains'.format(field): value})
+                similarities.append(TrigramSimilarity('{}__{}'.format(relation, field), value))
+            matches |= Q(**{'{}__in'.format(relation): model.objects.filter(related_matches).values('id')})
+        return queryset.filter(matches).annotate(search_rank=Greatest(*similarities)) \
+            .order_by('-search_rank', '-start_date')
 
     def filter_start_date(self, queryset, name, value):
         """
@@ -51,15 +94,10 @@ class ApplicationFilterSet(django_filters.FilterSet):
 
     def filter_address(self, queryset, address_type, value_string):
         """
-        Filter by address.
+        Filter by address, matching street, city, state and zip through the address search index.
         """
-        if address_type == 'address':
-            address_type = 'current_home__address'
-        if address_type and value_string:
-            return queryset.filter(
-                Q(**{('{}__street__icontains'.format(address_type)): value_string.strip()})
-                or Q(**{('{}__city__icontains'.format(address_type)): value_string.strip()})
-                or Q(**{('{}__state__icontains'.format(address_type)): value_string.strip()})
-                or Q(**{('{}__zip__icontains'.format(address_type)): value_string.strip()})
-            )
-        return queryset
+        search_text = normalize_search_text(value_string or '')
+        if not search_text:
+            return queryset
+        matching_addresses = Address.objects.filter(search_text__contains=search_text).values('id')
+        return queryset.filter(**{'{}__in'.format(ADDRESS_RELATIONS[address_type]): matching_addresses})
@@ -117,7 +117,9 @@ class CurrentHomeSerializerBase(ExpanderSerializerMixin, serializers.ModelSerial
         images = validated_data.pop('images', [])
         if address:
             if instance.address:
-                Address.objects.filter(pk=instance.address.pk).update(**address)
+                for field, value in address.items():
+                    setattr(instance.address, field, value)
+                instance.address.save(update_fields=list(address) + ['updated_at'])
             else:
                 address = Address.objects.create(**address)
                 validated_data.update({'address': address})
@@ -52,7 +52,10 @@ class OfferSerializer(serializers.ModelSerializer):
             "created_at",
             "updated_at",
             "new_home_purchase",
+            "enrichment_status",
+            "enriched_at",
         ]
+        read_only_fields = ["enrichment_status", "enriched_at"]
 
     def create(self, validated_data):
         logger.info("Creating offer", extra=dict(
@@ -109,7 +112,7 @@ class OfferSerializer(serializers.ModelSerializer):
         latest_close_date = date_restrictor.get_latest_close_date(offer_created_date)
         self.__validate_preferred_closing_date_too_early(preferred_closing_date, earliest_close_date)
         self.__validate_preferred_closing_date_too_late(preferred_closing_date, latest_close_date)
-        self.__validate_preferred_closing_date_restricted(preferred_closing_date, earliest_close_date, latest_close_date)
+        self.__validate_preferred_closing_date_restricted(preferred_closing_date)
 
     def __validate_preferred_closing_date_too_early(self, preferred_closing_date: datetime.date,
                                                     earliest_close_date: datetime.date):
@@ -120,11 +123,8 @@ class OfferSerializer(serializers.ModelSerializer):
         if preferred_closing_date > latest_close_date:
             raise serializers.ValidationError({'preferred_closing_date': f'preferred closing date of {preferred_closing_date} cannot be after {latest_close_date}'})
 
-    def __validate_preferred_closing_date_restricted(self, preferred_closing_date: datetime.date,
-                                                     earliest_close_date: datetime.date,
-                                                     latest_close_date: datetime.date):
-        restricted_dates = date_restrictor.calculate_restricted_dates(earliest_close_date, latest_close_date)
-        if preferred_closing_date in restricted_dates:
+    def __validate_preferred_closing_date_restricted(self, preferred_closing_date: datetime.date):
+        if date_restrictor.is_restricted(preferred_closing_date):
             raise serializers.ValidationError({'preferred_closing_date': f'preferred closing date of {preferred_closing_date} cannot be on a restricted date'})
 
     def __get_offer_created_date(self, offer_created_date: datetime.datetime):
@@ -628,6 +628,44 @@ class ApplicationTests(AuthMixin, APITestCase):
         response = self.client.get(url, **headers)
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
+    def test_list_search_ranks_matches_across_fields(self):
+        """
+        Test the q search over customers and agents.
+        """
+        exact = Application.objects.create(customer=Customer.objects.create(
+            name='Marisol Quintanilla', email='mq@example.com', phone='5125550101'))
+        partial = Application.objects.create(
+            customer=Customer.objects.create(name='Dana Lee', email='dana@example.com', phone='5125550102'),
+            real_estate_agent=RealEstateAgent.objects.create(name='Quintanilla Realty Group'))
+        random_objects.random_application()
+        token = self.create_and_login_admin('fakeloginadmin')
+        headers = {
+            'HTTP_AUTHORIZATION': 'Token {}'.format(token)
+        }
+
+        response = self.client.get('/api/1.0.0/application/?q=quintanilla', **headers)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([record['id'] for record in response.json()['results']], [str(exact.id), str(partial.id)])
+
+    def test_list_filter_address_matches_any_address_part(self):
+        """
+        Test the address filters match city and zip as well as street.
+        """
+        address = Address.objects.create(street='3211 Test Rd.', city='Round Rock', state='TX', zip='78664')
+        application = random_objects.random_application(offer_property_address=address)
+        random_objects.random_application(offer_property_address=Address.objects.create(
+            street='12 Other St', city='Austin', state='TX', zip='78704'))
+        token = self.create_and_login_admin('fakeloginadmin')
+        headers = {
+            'HTTP_AUTHORIZATION': 'Token {}'.format(token)
+        }
+
+        for value in ['round  rock', 'ROUND ROCK, tx', '78664', 'test rd']:
+            response = self.client.get('/api/1.0.0/application/', {'offer_property_address': value}, **headers)
+
+            self.assertEqual([record['id'] for record in response.json()['results']], [str(application.id)])
+
     def test_application_get_with_login(self):
         application_id = str(self.create_application('fakeapplicant').id)
         url = '/api/1.0.0/application/' + application_id + '/'
@@ -671,7 +709,7 @@ class ApplicationTests(AuthMixin, APITestCase):
         self.assertEqual(response.data.get('cx_manager'), None)
         self.assertEqual(response.data.get('loan_advisor'), None)
 
-    @patch("application.signals.get_partner")
+    @patch("application.email_trigger_tasks.get_partner")
     def test_get_users_application(self, get_partner_patch):
         user = self.create_user('fakeapplicant')
         get_partner_patch.return_value = {}
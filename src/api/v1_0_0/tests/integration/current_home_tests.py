@@ -34,7 +34,7 @@ class CurrentHomeTests(AuthMixin, APITestCase):
         self.application = Application.objects.get(pk="aca30e9e-776b-44fb-ba37-93e4b195cefe")
         self.user = User.objects.get(pk=1)
 
-    @patch("application.signals.get_partner")
+    @patch("application.email_trigger_tasks.get_partner")
     @patch("application.tasks.push_current_home_to_salesforce.apply_async")
     def test_update_current_home(self, push_to_sf_patch, get_partner_patch):
         get_partner_patch.return_value = {}
@@ -68,7 +68,7 @@ class CurrentHomeTests(AuthMixin, APITestCase):
         self.assertEqual(self.application.current_home.salesforce_id, 'some-salesforce-id')
         push_to_sf_patch.assert_called_once()
 
-    @patch("application.signals.get_partner")
+    @patch("application.email_trigger_tasks.get_partner")
     def test_cant_update_current_home_of_other_user(self, get_partner_patch):
         get_partner_patch.return_value = {}
         self.application.customer.email="some-other-email@gmai.com"
@@ -88,7 +88,7 @@ class CurrentHomeTests(AuthMixin, APITestCase):
         # Current home is unchanged
         self.assertEqual(self.current_home.listing_url, "https://listing-site.com/my-listing-id")
 
-    @patch("application.signals.get_partner")
+    @patch("application.email_trigger_tasks.get_partner")
     def test_update_current_home_bad_request(self, get_partner_patch):
         get_partner_patch.return_value = {}
         url = f'/api/1.0.0/application/{self.application.id}/current-home/'
@@ -102,7 +102,7 @@ class CurrentHomeTests(AuthMixin, APITestCase):
         response = self.client.patch(url, payload, **headers, format='json')
         self.assertEqual(response.status_code, 400)
 
-    @patch("application.signals.get_partner")
+    @patch("application.email_trigger_tasks.get_partner")
     def test_update_current_home_does_not_exist(self, get_partner_patch):
         get_partner_patch.return_value = {}
         self.application.current_home = None
@@ -118,7 +118,7 @@ class CurrentHomeTests(AuthMixin, APITestCase):
         response = self.client.patch(url, payload, **headers, format='json')
         self.assertEqual(response.status_code, 404)
     
-    @patch("application.signals.get_partner")
+    @patch("application.email_trigger_tasks.get_partner")
     def test_create_current_home_already_exists(self, get_partner_patch):
         get_partner_patch.return_value = {}
         url = f'/api/1.0.0/application/{self.application.id}/current-home/'
@@ -142,7 +142,7 @@ class CurrentHomeTests(AuthMixin, APITestCase):
         # Current home is unchanged
         self.assertEqual(self.current_home.listing_url, "https://listing-site.com/my-listing-id")
 
-    @patch("application.signals.get_partner")
+    @patch("application.email_trigger_tasks.get_partner")
     def test_create_current_home_requires_address(self, get_partner_patch):
         get_partner_patch.return_value = {}
         url = f'/api/1.0.0/application/{self.application.id}/current-home/'
@@ -161,7 +161,7 @@ class CurrentHomeTests(AuthMixin, APITestCase):
         # Current home is unchanged
         self.assertEqual(self.current_home.listing_url, "https://listing-site.com/my-listing-id")
 
-    @patch("application.signals.get_partner")
+    @patch("application.email_trigger_tasks.get_partner")
     @patch("application.tasks.push_current_home_to_salesforce.apply_async")
     def test_create_current_home(self, push_to_sf_patch, get_partner_patch):
         get_partner_patch.return_value = {}
@@ -25,7 +25,7 @@ class MortgageLenderTests(AuthMixin, APITestCase):
         self.application = Application.objects.get(pk="aca30e9e-776b-44fb-ba37-93e4b195cefe")
         self.user = User.objects.get(pk=1)
 
-    @patch("application.signals.get_partner")
+    @patch("application.email_trigger_tasks.get_partner")
     def test_update_lender(self, get_partner_patch):
         get_partner_patch.return_value = {}
         url = '/api/1.0.0/mortgage-lender/application-mortgage-lender/'
@@ -44,7 +44,7 @@ class MortgageLenderTests(AuthMixin, APITestCase):
         self.application.refresh_from_db()
         self.assertEqual(self.application.mortgage_lender.name, "New Name")
 
-    @patch("application.signals.get_partner")
+    @patch("application.email_trigger_tasks.get_partner")
     def test_update_mortgage_lender_bad_request(self, get_partner_patch):
         get_partner_patch.return_value = {}
         url = '/api/1.0.0/mortgage-lender/application-mortgage-lender/'
@@ -60,7 +60,7 @@ class MortgageLenderTests(AuthMixin, APITestCase):
         response = self.client.put(url, payload, **headers, format='json')
         self.assertEqual(response.status_code, 400)
 
-    @patch("application.signals.get_partner")
+    @patch("application.email_trigger_tasks.get_partner")
     def test_update_mortgage_lender_no_application(self, get_partner_patch):
         get_partner_patch.return_value = {}
         url = '/api/1.0.0/mortgage-lender/application-mortgage-lender/'
@@ -77,7 +77,7 @@ class MortgageLenderTests(AuthMixin, APITestCase):
         response = self.client.put(url, payload, **headers, format='json')
         self.assertEqual(response.status_code, 404)
 
-    @patch("application.signals.get_partner")
+    @patch("application.email_trigger_tasks.get_partner")
     def test_create_mortgage_lender(self, get_partner_patch):
         get_partner_patch.return_value = {}
         url = '/api/1.0.0/mortgage-lender/application-mortgage-lender/'
@@ -12,6 +12,7 @@ from rest_framework.test import APITestCase
 
 from api.v1_0_0.tests._utils import data_generators
 from api.v1_0_0.tests.integration.mixins import AuthMixin
+from application import offer_contracts
 from application.models.address import Address
 from application.models.application import Application, ApplicationStage, ProductOffering
 from application.models.contract_template import ContractTemplate, BuyingState
@@ -281,6 +282,7 @@ class OfferTests(AuthMixin, APITestCase):
 
         offer.pda_listing_uuid = pda_listing_uuid
         offer.save()
+        offer.refresh_from_db()
 
         self.assertEqual(offer.pda_listing_uuid, pda_listing_uuid)
         self.assertEqual(offer.year_built, 2003)
@@ -847,9 +849,11 @@ class OfferTests(AuthMixin, APITestCase):
         self.assertEqual(response.json().get('offer_property_address')['state'], fake_listing_data['state'])
         self.assertEqual(response.json().get('offer_property_address')['zip'], fake_listing_data['postal_code'])
 
+    @mock.patch('application.contract_template_cache.contract_template_etag', return_value='"v1"')
+    @mock.patch('application.offer_contracts.find_homeward_contract', return_value=None)
     @mock.patch('application.generate_pdf_task.ProcessPdf.add_data_to_pdf')
     @mock.patch('user.models.requests.get')
-    def test_returns_offer_contract_url(self, user_patch, pdf_mock):
+    def test_returns_offer_contract_url(self, user_patch, pdf_mock, find_contract_mock, etag_mock):
         user_patch.return_value = data_generators.MockedAgentUserResponse()
 
         pdf_mock.return_value = 'www.blah.com'
@@ -965,6 +969,103 @@ class OfferTests(AuthMixin, APITestCase):
 
         self.assertEqual(response.status_code, 403)
 
+    def create_contract_offer(self, user):
+        agent = RealEstateAgent.objects.create(**data_generators.get_fake_real_estate_agent("agent", email=user.email))
+        application = random_objects.random_application()
+        application.buying_agent = agent
+        application.save()
+
+        offer = random_objects.random_offer(application=application)
+        offer.offer_property_address.state = 'TX'
+        offer.offer_property_address.save()
+        ContractTemplate.objects.create(filename='tx_resale_non_condo.pdf', contract_type=ContractType.RESALE,
+                                        property_type=PropertyType.SINGLE_FAMILY, buying_state=BuyingState.TX,
+                                        active=True)
+        etag_patch = mock.patch('application.contract_template_cache.contract_template_etag', return_value='"v1"')
+        etag_patch.start()
+        self.addCleanup(etag_patch.stop)
+        return offer
+
+    @mock.patch('application.offer_contracts.find_homeward_contract', return_value=None)
+    @mock.patch('api.v1_0_0.views.offer_views.queue_offer_contract.apply_async')
+    @mock.patch('user.models.requests.get')
+    def test_starts_one_contract_job_per_offer_version(self, user_patch, apply_async_mock, find_contract_mock):
+        user_patch.return_value = data_generators.MockedAgentUserResponse()
+        user = self.create_user("fake_agent_user4")
+        headers = {'HTTP_AUTHORIZATION': 'Token {}'.format(self.login_user(user)[1])}
+        offer = self.create_contract_offer(user)
+        url = '/api/1.0.0/offer/{}/contract/'.format(offer.id)
+
+        first_response = self.client.get(url, **headers, format='json')
+        second_response = self.client.get(url, **headers, format='json')
+
+        self.assertEqual(first_response.status_code, 202)
+        self.assertEqual(second_response.status_code, 202)
+        self.assertEqual(first_response.json()['job_id'], second_response.json()['job_id'])
+        apply_async_mock.assert_called_once_with([offer.id, first_response.json()['job_id']])
+
+    @mock.patch('application.offer_contracts.find_homeward_contract', return_value=None)
+    @mock.patch('api.v1_0_0.views.offer_views.queue_offer_contract.apply_async')
+    @mock.patch('user.models.requests.get')
+    def test_returns_contract_url_once_job_is_done(self, user_patch, apply_async_mock, find_contract_mock):
+        user_patch.return_value = data_generators.MockedAgentUserResponse()
+        user = self.create_user("fake_agent_user4")
+        headers = {'HTTP_AUTHORIZATION': 'Token {}'.format(self.login_user(user)[1])}
+        offer = self.create_contract_offer(user)
+
+        job_id = self.client.get('/api/1.0.0/offer/{}/contract/'.format(offer.id), **headers,
+                                  format='json').json()['job_id']
+        status_url = '/api/1.0.0/offer/{}/contract/{}/'.format(offer.id, job_id)
+        pending_response = self.client.get(status_url, **headers, format='json')
+        offer_contracts.finish_job(offer.id, job_id, 'www.blah.com')
+        ready_response = self.client.get(status_url, **headers, format='json')
+
+        self.assertEqual(pending_response.status_code, 202)
+        self.assertEqual(ready_response.status_code, 200)
+        self.assertEqual(ready_response.json()['url'], 'www.blah.com')
+
+    @mock.patch('application.offer_contracts.find_homeward_contract', return_value=None)
+    @mock.patch('api.v1_0_0.views.offer_views.queue_offer_contract.apply_async')
+    @mock.patch('user.models.requests.get')
+    def test_does_not_start_contract_job_without_template(self, user_patch, apply_async_mock, find_contract_mock):
+        user_patch.return_value = data_generators.MockedAgentUserResponse()
+        user = self.create_user("fake_agent_user4")
+        headers = {'HTTP_AUTHORIZATION': 'Token {}'.format(self.login_user(user)[1])}
+        offer = self.create_contract_offer(user)
+        ContractTemplate.objects.all().delete()
+
+        response = self.client.get('/api/1.0.0/offer/{}/contract/'.format(offer.id), **headers, format='json')
+
+        self.assertEqual(response.status_code, 404)
+        apply_async_mock.assert_not_called()
+
+    @mock.patch('api.v1_0_0.views.offer_views.offer_contracts.claim_job', side_effect=ConnectionError)
+    @mock.patch('user.models.requests.get')
+    def test_contract_job_unavailable_when_cache_fails(self, user_patch, claim_job_mock):
+        user_patch.return_value = data_generators.MockedAgentUserResponse()
+        user = self.create_user("fake_agent_user4")
+        headers = {'HTTP_AUTHORIZATION': 'Token {}'.format(self.login_user(user)[1])}
+        offer = self.create_contract_offer(user)
+
+        response = self.client.get('/api/1.0.0/offer/{}/contract/'.format(offer.id), **headers, format='json')
+
+        self.assertEqual(response.status_code, 503)
+
+    @mock.patch('application.offer_contracts.find_homeward_contract', return_value='www.blah.com')
+    @mock.patch('api.v1_0_0.views.offer_views.queue_offer_contract.apply_async')
+    @mock.patch('user.models.requests.get')
+    def test_returns_stored_contract_url_without_starting_job(self, user_patch, apply_async_mock, find_contract_mock):
+        user_patch.return_value = data_generators.MockedAgentUserResponse()
+        user = self.create_user("fake_agent_user4")
+        headers = {'HTTP_AUTHORIZATION': 'Token {}'.format(self.login_user(user)[1])}
+        offer = self.create_contract_offer(user)
+
+        response = self.client.get('/api/1.0.0/offer/{}/contract/'.format(offer.id), **headers, format='json')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['url'], 'www.blah.com')
+        apply_async_mock.assert_not_called()
+
     @mock.patch('user.models.requests.get')
     def test_start_date_return_for_offer(self, user_patch):
         user_patch.return_value = data_generators.MockedAgentUserResponse()
@@ -1244,3 +1345,20 @@ class OfferTests(AuthMixin, APITestCase):
         self.assertIn(date(datetime.today().year, 12, 25).isoformat(),
                       response.json()['restricted_close_dates'])
         self.assertEqual(date_at_capacity, parser.parse(response.json()['restricted_close_dates'][0]).date())
+
+    def test_general_restricted_calendar_is_not_modified_until_capacity_changes(self):
+        url = reverse_lazy('api:offer-internal-closing-restricted-dates')
+        response = self.client.get(url, format='json')
+        etag = response['ETag']
+
+        not_modified = self.client.get(url, format='json', HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(not_modified.status_code, 304)
+
+        app = random_objects.random_application(stage=ApplicationStage.OPTION_PERIOD)
+        random_objects.random_offer(application=app, finance_approved_close_date=date.today() + timedelta(days=1),
+                                    status=OfferStatus.WON)
+        response = self.client.get(url, format='json', HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
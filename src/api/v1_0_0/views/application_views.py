@@ -19,9 +19,11 @@ from application.models.models import (Application, CurrentHomeImage,
                                        CurrentHomeImageStatus, Note)
 from application.models.real_estate_agent import AgentType, RealEstateAgent
 from application.task_operations import run_task_operations
-from application.tasks import (push_agent_to_salesforce, push_to_salesforce,
-                               update_app_status, push_current_home_to_salesforce)
-from utils.salesforce import (sync_loan_record_from_salesforce,
+from application.tasks import (push_agent_to_salesforce, update_app_status,
+                               push_current_home_to_salesforce)
+from utils.salesforce import (bulk_sync_records_from_salesforce,
+                              queue_bulk_sync,
+                              sync_loan_record_from_salesforce,
                               sync_record_from_salesforce)
 
 logger = logging.getLogger(__name__)
@@ -160,10 +162,9 @@ class ApplicationViewSet(viewsets.ModelViewSet):
     @action(methods=['post'], detail=False, url_path='salesforce/bulk', permission_classes=[IsAdminUser])
     def bulk_salesforce(self, request):
         saleforce_records = request.data
-        for record in saleforce_records:
-            sync_record_from_salesforce.delay(record)
+        task_ids = queue_bulk_sync(bulk_sync_records_from_salesforce, list(saleforce_records))
 
-        return Response(status=status.HTTP_200_OK)
+        return Response(data={'task_ids': task_ids}, status=status.HTTP_200_OK)
 
     @action(methods=['post'], detail=False, url_path='agents', permission_classes=[IsAuthenticated])
     def agents(self, request):
@@ -203,9 +204,7 @@ class ApplicationViewSet(viewsets.ModelViewSet):
         """
         serializer.save()
 
-        push_to_salesforce.apply_async(kwargs={
-            'application_id': serializer.instance.pk
-        })
+        serializer.instance.request_salesforce_push()
         update_app_status.apply_async(kwargs={
             'application_id': serializer.instance.pk
         })
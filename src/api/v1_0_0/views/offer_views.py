@@ -1,20 +1,29 @@
-from datetime import datetime
+import hashlib
+import logging
+from datetime import date, datetime
 
-from celery.exceptions import TimeoutError
 from django.shortcuts import get_object_or_404
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated, IsAdminUser, AllowAny
 from rest_framework.response import Response
+from rest_framework.reverse import reverse
 
 from api.v1_0_0.permissions import IsApplicationBuyingAgent
 from api.v1_0_0.serializers.offer_serializer import OfferSerializer
+from application import offer_contracts
 from application.models.application import ProductOffering
 from application.models.offer import Offer
+from application.generate_pdf_task import ContractTemplateNotFound
+from application.offer_contracts import ContractJobStatus
 from application.tasks import queue_offer_contract
-from utils.date_restrictor import calculate_restricted_dates
+from utils.date_restrictor import calculate_restricted_dates, closing_capacity_version
 from utils.date_restrictor import get_earliest_close_date, get_latest_close_date
-from utils.salesforce import sync_offer_record_from_salesforce
+from utils.salesforce import bulk_sync_offer_records_from_salesforce, queue_bulk_sync
+
+logger = logging.getLogger(__name__)
 
 
 class OfferViewSet(viewsets.ModelViewSet):
@@ -26,14 +35,18 @@ class OfferViewSet(viewsets.ModelViewSet):
     @action(methods=['post'], detail=False, url_path='salesforce/bulk', permission_classes=[IsAdminUser])
     def bulk_salesforce(self, request):
         saleforce_records = request.data
+        task_ids = []
         if isinstance(saleforce_records, list):
-            for record in saleforce_records:
-                sync_offer_record_from_salesforce.delay(record)
+            task_ids = queue_bulk_sync(bulk_sync_offer_records_from_salesforce, saleforce_records)
 
-        return Response(status=status.HTTP_200_OK)
+        return Response(data={'task_ids': task_ids}, status=status.HTTP_200_OK)
 
     @action(methods=['get'], detail=True, url_path='contract')
     def get_offer_contract(self, request, pk):
+        """
+        Answers 200 with the url of the offer contract when the contract of the offer as it is now was already rendered.
+        Otherwise starts rendering it and answers 202 with the job to poll.
+        """
         try:
             offer = Offer.objects.get(id=pk)
         except Offer.DoesNotExist:
@@ -42,15 +55,41 @@ class OfferViewSet(viewsets.ModelViewSet):
         if offer.application.buying_agent.email != request.user.email:
             return Response({}, status=status.HTTP_403_FORBIDDEN)
 
-        task = queue_offer_contract.apply_async([offer.id], task_id=str(offer.id))
-
         try:
-            url = task.get(interval=0.5, timeout=25)
-        except TimeoutError:
-            return Response({}, status=status.HTTP_408_REQUEST_TIMEOUT)
+            job, created = offer_contracts.claim_job(offer.id)
+        except (ContractTemplateNotFound, ValueError):
+            return Response({}, status=status.HTTP_404_NOT_FOUND)
+        except Exception as e:
+            logger.exception("Unable to start offer contract job", exc_info=e, extra=dict(
+                type="unable_to_start_offer_contract_job",
+                offer_id=offer.id
+            ))
+            return Response({}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+        if created:
+            queue_offer_contract.apply_async([offer.id, job['job_id']])
+            # tasks running eagerly have already finished the job
+            job = offer_contracts.get_job(offer.id, job['job_id']) or job
+
+        return self.contract_job_response(request, offer, job)
+
+    @action(methods=['get'], detail=True, url_path=r'contract/(?P<job_id>[0-9a-f]+)')
+    def contract_status(self, request, pk, job_id):
+        offer = get_object_or_404(Offer, pk=pk)
+        if offer.application.buying_agent.email != request.user.email:
+            return Response({}, status=status.HTTP_403_FORBIDDEN)
+
+        return self.contract_job_response(request, offer, offer_contracts.get_job(offer.id, job_id))
+
+    def contract_job_response(self, request, offer, job):
+        if job is None or job['status'] == ContractJobStatus.FAILED:
+            return Response({}, status=status.HTTP_404_NOT_FOUND)
+        if job['status'] == ContractJobStatus.READY:
+            return Response({'url': job['url'], 'job_id': job['job_id']}, status=status.HTTP_200_OK)
 
-        return Response({'url': url}, status=status.HTTP_200_OK) if url else Response({},
-                                                                                      status=status.HTTP_404_NOT_FOUND)
+        status_url = reverse('{}:offer-contract-status'.format(request.resolver_match.namespace),
+                             kwargs={'pk': offer.id, 'job_id': job['job_id']}, request=request)
+        return Response({'job_id': job['job_id'], 'status': job['status'], 'status_url': status_url},
+                        status=status.HTTP_202_ACCEPTED, headers={'Location': status_url, 'Retry-After': '2'})
 
     @action(methods=['get'], detail=True, url_path='offer-restricted-dates')
     def closing_restricted_dates(self, request, pk):
@@ -58,12 +97,8 @@ class OfferViewSet(viewsets.ModelViewSet):
         offer = get_object_or_404(Offer, pk=pk)
 
         args = (ProductOffering(offer.application.product_offering), reference_date := datetime.now())
-        date_response = {'earliest_possible_close_date': get_earliest_close_date(*args).isoformat(),
-                         'latest_possible_close_date': (end_date := get_latest_close_date(reference_date)).isoformat(),
-                         'restricted_close_dates': [rd.isoformat() for rd in
-                                              calculate_restricted_dates(reference_date.date(), end_date)]}
-
-        return Response(date_response)
+        return restricted_dates_response(request, get_earliest_close_date(*args), reference_date.date(),
+                                         get_latest_close_date(reference_date))
 
     @action(methods=['get'], detail=False, url_path='internal-restricted-dates', permission_classes=[AllowAny])
     def internal_closing_restricted_dates(self, request):
@@ -77,10 +112,22 @@ class OfferViewSet(viewsets.ModelViewSet):
         start_date = datetime.now()
         end_date = get_latest_close_date(start_date)
 
-        date_response = {
-            'earliest_possible_close_date': start_date.date().isoformat(),
-            'latest_possible_close_date': end_date.isoformat(),
-            'restricted_close_dates': [rd.isoformat() for rd in calculate_restricted_dates(start_date.date(), end_date)]
-        }
-
-        return Response(date_response)
+        return restricted_dates_response(request, start_date.date(), start_date.date(), end_date)
+
+
+def restricted_dates_response(request, earliest_close_date: date, start_date: date, end_date: date) -> Response:
+    """
+    Restricted close dates between start_date and end_date, tagged with an ETag that only changes with the dates or
+    with the closing capacity, so clients polling for them mostly get a 304.
+    """
+    version = '{}|{}|{}|{}'.format(earliest_close_date, start_date, end_date, closing_capacity_version())
+    etag = quote_etag(hashlib.md5(version.encode()).hexdigest())
+    not_modified = get_conditional_response(request, etag=etag)
+    if not_modified is not None:
+        not_modified['ETag'] = etag
+        return not_modified
+
+    date_response = {'earliest_possible_close_date': earliest_close_date.isoformat(),
+                     'latest_possible_close_date': end_date.isoformat(),
+                     'restricted_close_dates': [rd.isoformat() for rd in calculate_restricted_dates(start_date, end_date)]}
+    return Response(date_response, headers={'ETag': etag})
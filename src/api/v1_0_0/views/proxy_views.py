@@ -9,6 +9,7 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 
+from user import cas_groups
 from utils.homeward_sso_client import HomewardSSO
 from user.constants import (HOMEWARD_SSO_CLAIMED_AGENT_GROUP,
                             HOMEWARD_SSO_CUSTOMER_GROUP)
@@ -47,7 +48,10 @@ def add_user_to_cas_groups(request):
     if bad_group_names:
         return Response(f"The following group(s) are invalid: {bad_group_names}", status=status.HTTP_400_BAD_REQUEST)
 
-    return HomewardSSO().update_user_groups(group_names, request.user.username)
+    response = HomewardSSO().update_user_groups(group_names, request.user.username)
+    if status.is_success(response.status_code):
+        cas_groups.invalidate(request.user.username)
+    return response
 
 
 
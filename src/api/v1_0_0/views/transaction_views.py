@@ -3,7 +3,7 @@ from rest_framework.permissions import IsAuthenticated, IsAdminUser
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from utils.salesforce import sync_transaction_record_from_salesforce
+from utils.salesforce import bulk_sync_transaction_records_from_salesforce, queue_bulk_sync
 
 
 class TransactionView(APIView):
@@ -11,8 +11,8 @@ class TransactionView(APIView):
 
     def post(self, request):
         saleforce_records = request.data
+        task_ids = []
         if isinstance(saleforce_records, list):
-            for record in saleforce_records:
-                sync_transaction_record_from_salesforce.delay(record)
+            task_ids = queue_bulk_sync(bulk_sync_transaction_records_from_salesforce, saleforce_records)
 
-        return Response(status=status.HTTP_200_OK)
+        return Response(data={'task_ids': task_ids}, status=status.HTTP_200_OK)
@@ -6,3 +6,4 @@ class ApplicationConfig(AppConfig):  # pragma: no cover
 
     def ready(self):
         import application.signals  # noqa: F401
+        import application.salesforce_push_tasks  # noqa: F401
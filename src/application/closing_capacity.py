@@ -0,0 +1,90 @@
+"""
+Maintains the ClosingCapacity table.
+
+A closing's weight depends on its offer's status and finance approved close date and on its application's stage, so
+saving any of those publishes a job that recomputes the days involved once the save is committed. Days are locked while
+they are recomputed, which makes concurrent jobs for the same day wait for each other instead of overwriting each
+other's totals, and every day that has been computed keeps its row, so the latest updated_at moves whenever any day
+changes.
+"""
+import datetime
+import logging
+from typing import Iterable
+
+from django.db import transaction
+from django.db.models import Case, DateField, FloatField, Q, Sum, Value, When
+from django.utils import timezone
+
+from application.models.application import ApplicationStage
+from application.models.closing_capacity import ClosingCapacity
+from application.models.offer import Offer, OfferStatus
+
+logger = logging.getLogger(__name__)
+
+
+def capacity_weight() -> Case:
+    return Case(
+        When(Q(application__stage__in=[ApplicationStage.QUALIFIED_APPLICATION, ApplicationStage.FLOOR_PRICE_REQUESTED,
+                                       ApplicationStage.FLOOR_PRICE_COMPLETED, ApplicationStage.APPROVED,
+                                       ApplicationStage.OFFER_REQUESTED, ApplicationStage.OFFER_SUBMITTED],
+               status__in=[OfferStatus.REQUESTED, OfferStatus.MOP_COMPLETE, OfferStatus.APPROVED,
+                           OfferStatus.BACKUP_POSITION_ACCEPTED]),
+             then=Value(0.45)),
+        When(Q(application__stage__in=[ApplicationStage.OPTION_PERIOD, ApplicationStage.POST_OPTION],
+               status=OfferStatus.WON),
+             then=Value(1.0)),
+        default=Value(0.0), output_field=FloatField())
+
+
+def weighted_closings(offers) -> dict:
+    """
+    Weighted number of closings per finance approved close date of the given offers.
+    """
+    return dict(offers.exclude(finance_approved_close_date=None)
+                .annotate(capacity_weight=capacity_weight())
+                .values('finance_approved_close_date')
+                .annotate(weighted_offers=Sum('capacity_weight'))
+                .values_list('finance_approved_close_date', 'weighted_offers'))
+
+
+def refresh_dates(dates: Iterable[datetime.date]):
+    """
+    Recomputes the closing capacity of the given days.
+    """
+    # dates set from Salesforce may still be ISO strings
+    dates = sorted({DateField().to_python(date) for date in dates if date is not None})
+    if not dates:
+        return
+    with transaction.atomic():
+        ClosingCapacity.objects.bulk_create([ClosingCapacity(date=date) for date in dates], ignore_conflicts=True)
+        # locked in date order, so saves touching several days can't deadlock
+        capacities = list(ClosingCapacity.objects.select_for_update().filter(date__in=dates).order_by('date'))
+        weights = weighted_closings(Offer.objects.filter(finance_approved_close_date__in=dates))
+        changed = []
+        for capacity in capacities:
+            weighted_offers = weights.get(capacity.date, 0.0)
+            if capacity.weighted_offers != weighted_offers:
+                capacity.weighted_offers = weighted_offers
+                capacity.updated_at = timezone.now()
+                changed.append(capacity)
+        ClosingCapacity.objects.bulk_update(changed, ['weighted_offers', 'updated_at'])
+
+
+def refresh_application(application_id):
+    refresh_dates(Offer.objects.filter(application_id=application_id)
+                  .exclude(finance_approved_close_date=None)
+                  .values_list('finance_approved_close_date', flat=True))
+
+
+def rebuild():
+    """
+    Recomputes every day from scratch, for changes that bypass model signals such as queryset updates.
+    """
+    weights = weighted_closings(Offer.objects.all())
+    stale_dates = ClosingCapacity.objects.exclude(date__in=list(weights)).exclude(weighted_offers=0.0) \
+        .values_list('date', flat=True)
+    refresh_dates(list(weights) + list(stale_dates))
+    logger.info("Rebuilt closing capacity", extra=dict(
+        type="closing_capacity_rebuilt",
+        date_count=len(weights)
+    ))
@@ -0,0 +1,123 @@
+"""
+Per-process cache of parsed contract templates.
+
+Parsing a template is most of the cost of rendering a contract, so each process keeps the parsed tree of every
+template it has rendered, with the index of its form fields. Every CONTRACT_TEMPLATE_REVALIDATE_SECONDS the template is
+revalidated against S3 with a conditional GET on its ETag, which downloads it again only when it has changed. Loads are
+locked per template, so a slow download only holds up renders of that template. Renders fill a copy of the cached
+tree, never the tree itself.
+"""
+import logging
+import threading
+import time
+from typing import List, Tuple
+
+import pdfrw
+from django.conf import settings
+from pdfrw import PdfArray, PdfDict
+
+from utils.aws import contract_template_etag, retrieve_contract_template_if_modified
+
+logger = logging.getLogger(__name__)
+
+
+class ParsedTemplate:
+    def __init__(self, etag: str, trailer: PdfDict):
+        self.etag = etag
+        self.trailer = trailer
+        self.annotations = [annotation for page in trailer.pages for annotation in (page['/Annots'] or [])]
+        self.checked_at = time.monotonic()
+        # resolves every lazily loaded object now, so that copies only read the shared tree
+        self.copy()
+
+    def copy(self) -> Tuple[PdfDict, List[PdfDict]]:
+        """
+        Returns a copy of the template and of its form fields, in page order.
+        """
+        memo = {}
+        trailer = copy_pdf_object(self.trailer, memo)
+        return trailer, [memo[id(annotation)] for annotation in self.annotations]
+
+
+def copy_pdf_object(obj, memo: dict):
+    # pdfrw objects don't support copy.deepcopy; names, strings and stream data are immutable and can be shared
+    if id(obj) in memo:
+        return memo[id(obj)]
+    if isinstance(obj, PdfDict):
+        new = memo[id(obj)] = PdfDict()
+        new.indirect = obj.indirect
+        for key, value in obj.iteritems():
+            new[key] = copy_pdf_object(value, memo)
+        if obj.stream is not None:
+            new.stream = obj.stream
+        return new
+    if isinstance(obj, PdfArray):
+        new = memo[id(obj)] = PdfArray()
+        new.indirect = obj.indirect
+        new.extend(copy_pdf_object(value, memo) for value in obj)
+        return new
+    return obj
+
+
+_templates = {}
+_template_locks = {}
+_lock = threading.Lock()
+
+
+def revalidate_seconds() -> int:
+    return int(getattr(settings, 'CONTRACT_TEMPLATE_REVALIDATE_SECONDS', 60))
+
+
+def get_template(filename: str) -> Tuple[PdfDict, List[PdfDict]]:
+    """
+    Returns a copy of the parsed template and its form fields, ready to be filled.
+    """
+    template = _templates.get(filename)
+    if needs_loading(template):
+        with template_lock(filename):
+            template = _templates.get(filename)
+            if needs_loading(template):
+                template = _templates[filename] = load_template(filename, template)
+    return template.copy()
+
+
+def template_etag(filename: str) -> str:
+    """
+    Returns the ETag of the template, from the cache while it doesn't need revalidating and otherwise from S3 without
+    downloading the template.
+    """
+    template = _templates.get(filename)
+    if needs_loading(template):
+        return contract_template_etag(filename)
+    return template.etag
+
+
+def needs_loading(template: ParsedTemplate) -> bool:
+    return template is None or time.monotonic() - template.checked_at >= revalidate_seconds()
+
+
+def template_lock(filename: str) -> threading.Lock:
+    with _lock:
+        return _template_locks.setdefault(filename, threading.Lock())
+
+
+def load_template(filename: str, cached_template: ParsedTemplate = None) -> ParsedTemplate:
+    retrieved = retrieve_contract_template_if_modified(filename, cached_template.etag if cached_template else None)
+    if retrieved is None:
+        cached_template.checked_at = time.monotonic()
+        return cached_template
+
+    body, etag = retrieved
+    template = ParsedTemplate(etag, pdfrw.PdfReader(body))
+    logger.info("Loaded contract template", extra=dict(
+        type="contract_template_loaded",
+        template_filename=filename,
+        etag=etag
+    ))
+    return template
+
+
+def clear():
+    with _lock:
+        _templates.clear()
+        _template_locks.clear()
@@ -0,0 +1,101 @@
+"""
+Batched dispatch of email trigger tasks.
+
+Email tasks published together (see utils.outbox) are handed to `dispatch_email_batch`, which runs them on a bounded
+thread pool so their HubSpot sends overlap instead of running one after another. The notification statuses a task
+records are written with a single bulk_create as soon as that task completes, so the tasks running next to it see
+them. Tasks that fail are published again as messages of their own.
+"""
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+
+from django.conf import settings
+from django.db import connection
+
+from application.models.notification_status import NotificationStatus
+from utils.celery import app as celery_app
+
+logger = logging.getLogger(__name__)
+
+_local = threading.local()
+
+
+def create_notification_status(**fields) -> NotificationStatus:
+    """
+    Creates a notification status, or holds it back until the task completes when called from a batch dispatch.
+    """
+    statuses = getattr(_local, 'statuses', None)
+    if statuses is None:
+        return NotificationStatus.objects.create(**fields)
+    notification_status = NotificationStatus(**fields)
+    statuses.append(notification_status)
+    return notification_status
+
+
+def pending_notification_statuses() -> List[NotificationStatus]:
+    """
+    Notification statuses recorded by the task the batch dispatch is running on this thread that are not written yet.
+    """
+    return getattr(_local, 'statuses', None) or []
+
+
+def run_email_task(entry, in_worker_thread: bool) -> Tuple[int, Optional[Exception]]:
+    """
+    Runs the task and writes the notification statuses it recorded, returning how many there were and the error the
+    task raised, if any.
+    """
+    task_name, args, kwargs = entry
+    statuses = _local.statuses = []
+    error = None
+    try:
+        celery_app.tasks[task_name].run(*args, **kwargs)
+    except Exception as e:
+        logger.exception("Email task failed during batch dispatch", exc_info=e, extra=dict(
+            type="email_task_failed_during_batch_dispatch",
+            task=task_name,
+            task_args=args
+        ))
+        error = e
+    try:
+        # emails sent before a task failed are recorded as well, so they are not sent again when it is retried
+        NotificationStatus.objects.bulk_create(statuses)
+        return len(statuses), error
+    finally:
+        _local.statuses = None
+        if in_worker_thread:
+            # every thread opens its own connection, which would otherwise be left behind
+            connection.close()
+
+
+def requeue_email_task(entry):
+    task_name, args, kwargs = entry
+    try:
+        celery_app.tasks[task_name].apply_async(args=args, kwargs=kwargs)
+    except Exception as e:
+        logger.exception("Unable to requeue email task", exc_info=e, extra=dict(
+            type="email_task_requeue_failed",
+            task=task_name,
+            task_args=args
+        ))
+
+
+@celery_app.task(queue='application-service-tasks')
+def dispatch_email_batch(entries: List[list]):
+    max_workers = int(getattr(settings, 'EMAIL_DISPATCH_MAX_WORKERS', 8))
+    if max_workers > 1 and len(entries) > 1:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(entries))) as executor:
+            results = list(executor.map(lambda entry: run_email_task(entry, True), entries))
+    else:
+        results = [run_email_task(entry, False) for entry in entries]
+
+    failed = [entry for entry, (_, error) in zip(entries, results) if error is not None]
+    for entry in failed:
+        requeue_email_task(entry)
+    logger.info("Dispatched email batch", extra=dict(
+        type="email_batch_dispatched",
+        task_count=len(entries),
+        failed_count=len(failed),
+        notification_status_count=sum(status_count for status_count, _ in results)
+    ))
@@ -6,6 +6,7 @@ from celery.task import periodic_task
 from django.utils import timezone
 
 from application import constants
+from application.email_dispatcher import create_notification_status
 from application.models.application import (FloorPriceNotFoundException,
                                             MortgageStatus)
 from application.models.models import (Application, ApplicationStage,
@@ -14,8 +15,10 @@ from application.models.notification import Notification
 from application.models.notification_status import NotificationStatus
 from application.models.offer import Offer
 from application.models.pricing import Pricing
+from application.notification_registry import get_notification, notification_status_exists
 from utils import mailer
 from utils.celery import app as celery_app
+from utils.partner_branding_config_service import get_partner
 
 
 class EmailTriggerCriteriaValidationException(Exception):
@@ -25,9 +28,9 @@ class EmailTriggerCriteriaValidationException(Exception):
 logger = logging.getLogger(__name__)
 
 
-@celery_app.task(queue='application-service-tasks')
+@celery_app.task(queue='application-service-tasks', batch_dispatch=True)
 def queue_photo_task_complete_notification(current_home_id: uuid.UUID):
-    photo_upload_notification = Notification.objects.get(name=Notification.PHOTO_UPLOAD)
+    photo_upload_notification = get_notification(Notification.PHOTO_UPLOAD)
 
     if not photo_upload_notification.is_active:
         logger.info("Photo upload notification is_active is False", extra=dict(
@@ -47,14 +50,14 @@ def queue_photo_task_complete_notification(current_home_id: uuid.UUID):
         application: Application = applications.first()
         mailer.send_photo_task_complete_notification(application.customer.get_first_name(),
                                                  application.customer.get_last_name(), application.get_link())
-        NotificationStatus.objects.create(status=NotificationStatus.SENT,
-                                          application=application,
-                                          notification=photo_upload_notification)
+        create_notification_status(status=NotificationStatus.SENT,
+                                   application=application,
+                                   notification=photo_upload_notification)
 
 
-@celery_app.task(queue='application-service-tasks')
+@celery_app.task(queue='application-service-tasks', batch_dispatch=True)
 def queue_under_review_email(application_id: uuid.UUID):
-    application_under_review_notification = Notification.objects.get(name=Notification.APPLICATION_UNDER_REVIEW)
+    application_under_review_notification = get_notification(Notification.APPLICATION_UNDER_REVIEW)
 
     if not application_under_review_notification.is_active:
         logger.info("Photo under review notification is_active is False", extra=dict(
@@ -89,9 +92,9 @@ def queue_under_review_email(application_id: uuid.UUID):
                                                             application.customer.email,
                                                             str(application.id), cc_email_list)
         if response.status_code == 200:
-            NotificationStatus.objects.create(status=NotificationStatus.SENT,
-                                              application=application,
-                                              notification=application_under_review_notification)
+            create_notification_status(status=NotificationStatus.SENT,
+                                       application=application,
+                                       notification=application_under_review_notification)
     else:
         logger.info("Email not sent", extra=dict(
             type="email_not_sent_under_review_email",
@@ -101,18 +104,17 @@ def queue_under_review_email(application_id: uuid.UUID):
         ))
 
 
-@celery_app.task(queue='application-service-tasks')
+@celery_app.task(queue='application-service-tasks', batch_dispatch=True)
 def queue_approval_email(application_id: uuid.UUID):
     application = Application.objects.get(id=application_id)
     street_address = mailer.get_address_if_applicable(application)
 
-    approval_notification = Notification.objects.get(name=Notification.APPROVAL)
-    hw_mortgage_candidate_approval_notification = Notification.objects.get(
-        name=Notification.HW_MORTGAGE_CANDIDATE_APPROVAL)
+    approval_notification = get_notification(Notification.APPROVAL)
+    hw_mortgage_candidate_approval_notification = get_notification(Notification.HW_MORTGAGE_CANDIDATE_APPROVAL)
 
-    if NotificationStatus.objects.filter(application=application, status=NotificationStatus.SENT,
-                                         notification_id__in=[approval_notification,
-                                                              hw_mortgage_candidate_approval_notification]).count() == 0:
+    if not notification_status_exists(application,
+                                      [approval_notification, hw_mortgage_candidate_approval_notification],
+                                      NotificationStatus.SENT):
         if application.is_hw_mortgage_candidate():
             if not hw_mortgage_candidate_approval_notification.is_active:
                 logger.info(
@@ -145,12 +147,12 @@ def queue_hw_mortgage_candidate_email(application, address, notification):
         return
 
     if address is None:
-        NotificationStatus.objects.create(status=NotificationStatus.NOT_SENT, application=application,
-                                          notification=notification, reason="Missing street_address value")
+        create_notification_status(status=NotificationStatus.NOT_SENT, application=application,
+                                   notification=notification, reason="Missing street_address value")
         return
     if application.homeward_owner_email is None:
-        NotificationStatus.objects.create(status=NotificationStatus.NOT_SENT, application=application,
-                                          notification=notification, reason="Missing homeward_owner_email")
+        create_notification_status(status=NotificationStatus.NOT_SENT, application=application,
+                                   notification=notification, reason="Missing homeward_owner_email")
         return
 
     if application.preapproval:
@@ -190,8 +192,8 @@ def queue_hw_mortgage_candidate_email(application, address, notification):
                                                               constants.DEFAULT_LOAN_ADVISOR_EMAIL,
                                                               constants.DEFAULT_LOAN_ADVISOR_CALL_URL)
     if response.status_code == 200:
-        NotificationStatus.objects.create(status=NotificationStatus.SENT, application=application,
-                                          notification=notification)
+        create_notification_status(status=NotificationStatus.SENT, application=application,
+                                   notification=notification)
     else:
         logger.info("Non-success response code from send_hw_mortgage_candidate_approval", extra=dict(
             type="non_success_from_send_hw_mortgage_candidate_approval",
@@ -211,12 +213,12 @@ def queue_non_hw_mortgage_candidate_email(application, address, notification):
         return
 
     if address is None:
-        NotificationStatus.objects.create(status=NotificationStatus.NOT_SENT, application=application,
-                                          notification=notification, reason="Missing street_address value")
+        create_notification_status(status=NotificationStatus.NOT_SENT, application=application,
+                                   notification=notification, reason="Missing street_address value")
         return
     if application.homeward_owner_email is None:
-        NotificationStatus.objects.create(status=NotificationStatus.NOT_SENT, application=application,
-                                          notification=notification, reason="Missing homeward_owner_email")
+        create_notification_status(status=NotificationStatus.NOT_SENT, application=application,
+                                   notification=notification, reason="Missing homeward_owner_email")
         return
 
     if application.preapproval:
@@ -241,8 +243,8 @@ def queue_non_hw_mortgage_candidate_email(application, address, notification):
                                                                   cc_email_list, application.homeward_owner_email)
 
     if response.status_code == 200:
-        NotificationStatus.objects.create(status=NotificationStatus.SENT, application=application,
-                                          notification=notification)
+        create_notification_status(status=NotificationStatus.SENT, application=application,
+                                   notification=notification)
     else:
         logger.info("Non-success response code from send_non_hw_mortgage_candidate_approval", extra=dict(
             type="non_success_from_send_non_hw_mortgage_candidate_approval",
@@ -252,9 +254,9 @@ def queue_non_hw_mortgage_candidate_email(application, address, notification):
         ))
 
 
-@celery_app.task(queue='application-service-tasks')
+@celery_app.task(queue='application-service-tasks', batch_dispatch=True)
 def queue_agent_instructions_email(application_id: uuid.UUID):
-    agent_instructions_notification = Notification.objects.get(name=Notification.AGENT_OFFER_INSTRUCTIONS)
+    agent_instructions_notification = get_notification(Notification.AGENT_OFFER_INSTRUCTIONS)
 
     if not agent_instructions_notification.is_active:
         logger.info("Queue agent instructions email notification is_active is False", extra=dict(
@@ -271,11 +273,10 @@ def queue_agent_instructions_email(application_id: uuid.UUID):
         raise EmailTriggerCriteriaValidationException(
             'missing buying agent email address for application {}'.format(application_id))
     street_address = mailer.get_address_if_applicable(application)
-    notification_count = NotificationStatus.objects.filter(application=application,
-                                                           notification=agent_instructions_notification).count()
+    already_notified = notification_status_exists(application, agent_instructions_notification)
     if (street_address is not None
         and application.homeward_owner_email is not None) \
-            and notification_count == 0:
+            and not already_notified:
 
         cx = application.cx_manager
         homeward_owner_email = application.homeward_owner_email
@@ -296,17 +297,17 @@ def queue_agent_instructions_email(application_id: uuid.UUID):
                         type="missing_info_queue_agent_instructions_email",
                         street_address=street_address,
                         homeward_owner_email=application.homeward_owner_email,
-                        notification_count=notification_count
+                        already_notified=already_notified
                     ))
         return
     if response.status_code == 200:
-        NotificationStatus.objects.create(status=NotificationStatus.SENT, application=application,
-                                          notification=agent_instructions_notification)
+        create_notification_status(status=NotificationStatus.SENT, application=application,
+                                   notification=agent_instructions_notification)
 
 
-@celery_app.task(queue='application-service-tasks')
+@celery_app.task(queue='application-service-tasks', batch_dispatch=True)
 def queue_offer_submitted_email(offer_id: uuid.UUID, offer_price: int):
-    offer_submitted_notification = Notification.objects.get(name=Notification.OFFER_SUBMITTED)
+    offer_submitted_notification = get_notification(Notification.OFFER_SUBMITTED)
 
     if not offer_submitted_notification.is_active:
         logger.info("Queue offer submitted notification not active", extra=dict(
@@ -328,9 +329,9 @@ def queue_offer_submitted_email(offer_id: uuid.UUID, offer_price: int):
 
     if offer.already_under_contract:
         # Do not send offer submitted email if offer is takeover
-        NotificationStatus.objects.create(status=NotificationStatus.SUPPRESSED, application=application,
-                                          notification=offer_submitted_notification,
-                                          reason="Offer is takeover")
+        create_notification_status(status=NotificationStatus.SUPPRESSED, application=application,
+                                   notification=offer_submitted_notification,
+                                   reason="Offer is takeover")
         return
 
     cc_email_list = []
@@ -346,18 +347,18 @@ def queue_offer_submitted_email(offer_id: uuid.UUID, offer_price: int):
             type="send_offer_submitted_exception_raised",
             application_id=application.id
         ))
-        NotificationStatus.objects.create(status=NotificationStatus.NOT_SENT, application=application,
-                                          notification=offer_submitted_notification, reason=f"Floor price not set: {e}")
+        create_notification_status(status=NotificationStatus.NOT_SENT, application=application,
+                                   notification=offer_submitted_notification, reason=f"Floor price not set: {e}")
         return
 
     if response.status_code == 200:
-        NotificationStatus.objects.create(status=NotificationStatus.SENT, application=application,
-                                          notification=offer_submitted_notification)
+        create_notification_status(status=NotificationStatus.SENT, application=application,
+                                   notification=offer_submitted_notification)
 
 
-@celery_app.task(queue='application-service-tasks')
+@celery_app.task(queue='application-service-tasks', batch_dispatch=True)
 def queue_offer_submitted_agent_email(offer_id: uuid.UUID):
-    offer_submitted_agent_notification = Notification.objects.get(name=Notification.OFFER_SUBMITTED_AGENT)
+    offer_submitted_agent_notification = get_notification(Notification.OFFER_SUBMITTED_AGENT)
 
     if not offer_submitted_agent_notification.is_active:
         logger.info("Queue offer_submitted_agent_notification is not active", extra=dict(
@@ -382,9 +383,9 @@ def queue_offer_submitted_agent_email(offer_id: uuid.UUID):
 
     if offer.already_under_contract:
         # Do not send offer submitted email if offer is takeover
-        NotificationStatus.objects.create(status=NotificationStatus.SUPPRESSED, application=offer.application,
-                                          notification=offer_submitted_agent_notification,
-                                          reason="Offer is takeover")
+        create_notification_status(status=NotificationStatus.SUPPRESSED, application=offer.application,
+                                   notification=offer_submitted_agent_notification,
+                                   reason="Offer is takeover")
         return
 
     cc_email_list = [offer.application.get_cx_email()]
@@ -397,14 +398,13 @@ def queue_offer_submitted_agent_email(offer_id: uuid.UUID):
                                                  cc_email_list)
 
     if response.status_code == 200:
-        NotificationStatus.objects.create(status=NotificationStatus.SENT, application=offer.application,
-                                          notification=offer_submitted_agent_notification)
+        create_notification_status(status=NotificationStatus.SENT, application=offer.application,
+                                   notification=offer_submitted_agent_notification)
 
 
-@celery_app.task(queue='application-service-tasks')
+@celery_app.task(queue='application-service-tasks', batch_dispatch=True)
 def queue_unacknowledged_service_agreement_email(application_id: uuid.UUID):
-    unacknowledged_service_agreement_notification = Notification.objects.get(
-        name=Notification.OFFER_REQUESTED_UNACKNOWLEDGED_SERVICE_AGREEMENT)
+    unacknowledged_service_agreement_notification = get_notification(Notification.OFFER_REQUESTED_UNACKNOWLEDGED_SERVICE_AGREEMENT)
 
     if not unacknowledged_service_agreement_notification.is_active:
         logger.info("Queue unacknowledged_service_agreement_notification is not active", extra=dict(
@@ -426,8 +426,8 @@ def queue_unacknowledged_service_agreement_email(application_id: uuid.UUID):
     response = mailer.send_unacknowledged_service_agreement_email(application.customer)
 
     if response.status_code == 200:
-        NotificationStatus.objects.create(status=NotificationStatus.SENT, application=application,
-                                          notification=unacknowledged_service_agreement_notification)
+        create_notification_status(status=NotificationStatus.SENT, application=application,
+                                   notification=unacknowledged_service_agreement_notification)
     else:
         logger.error("Non-success response code from send_unacknowledged_service_agreement_email", extra=dict(
             type="non_success_for_send_unacknowledged_service_agreement_email",
@@ -435,14 +435,14 @@ def queue_unacknowledged_service_agreement_email(application_id: uuid.UUID):
             response=response.json(),
             application_id=application_id,
         ))
-        NotificationStatus.objects.create(status=NotificationStatus.NOT_SENT, application=application,
-                                          notification=unacknowledged_service_agreement_notification,
-                                          reason=f"hubspot returned {response.status_code}")
+        create_notification_status(status=NotificationStatus.NOT_SENT, application=application,
+                                   notification=unacknowledged_service_agreement_notification,
+                                   reason=f"hubspot returned {response.status_code}")
 
 
-@celery_app.task(queue='application-service-tasks')
+@celery_app.task(queue='application-service-tasks', batch_dispatch=True)
 def queue_offer_accepted_email(application_id: uuid.UUID):
-    offer_accepted_notification = Notification.objects.get(name=Notification.OFFER_ACCEPTED)
+    offer_accepted_notification = get_notification(Notification.OFFER_ACCEPTED)
 
     if not offer_accepted_notification.is_active:
         logger.info("Queue offer_accepted_notification is not active", extra=dict(
@@ -473,8 +473,8 @@ def queue_offer_accepted_email(application_id: uuid.UUID):
                                           cc_email_list, application.homeward_owner_email)
 
     if response.status_code == 200:
-        NotificationStatus.objects.create(status=NotificationStatus.SENT, application=application,
-                                          notification=offer_accepted_notification)
+        create_notification_status(status=NotificationStatus.SENT, application=application,
+                                   notification=offer_accepted_notification)
     else:
         logger.error("Non-success response code from send_offer_accepted", extra=dict(
             type="non_success_for_send_offer_accepted",
@@ -482,14 +482,14 @@ def queue_offer_accepted_email(application_id: uuid.UUID):
             response=response.json(),
             application_id=application_id,
         ))
-        NotificationStatus.objects.create(status=NotificationStatus.NOT_SENT, application=application,
-                                          notification=offer_accepted_notification,
-                                          reason=f"hubspot returned {response.status_code}")
+        create_notification_status(status=NotificationStatus.NOT_SENT, application=application,
+                                   notification=offer_accepted_notification,
+                                   reason=f"hubspot returned {response.status_code}")
 
 
-@celery_app.task(queue='application-service-tasks')
+@celery_app.task(queue='application-service-tasks', batch_dispatch=True)
 def queue_purchase_price_updated_email(preapproval_id: uuid.UUID, amount: int):
-    purchase_price_notification = Notification.objects.get(name=Notification.PURCHASE_PRICE_UPDATED)
+    purchase_price_notification = get_notification(Notification.PURCHASE_PRICE_UPDATED)
 
     if not purchase_price_notification.is_active:
         logger.info("Queue purchase_price_notification is not active", extra=dict(
@@ -538,8 +538,8 @@ def queue_purchase_price_updated_email(preapproval_id: uuid.UUID, amount: int):
                                                   contact_last_name, contact_email, contact_schedule_a_call_url)
 
     if response.status_code == 200:
-        NotificationStatus.objects.create(status=NotificationStatus.SENT, application=application,
-                                          notification=purchase_price_notification)
+        create_notification_status(status=NotificationStatus.SENT, application=application,
+                                   notification=purchase_price_notification)
     else:
         logger.error("Non-success response code from send_purchase_price_updated", extra=dict(
             type="non_success_for_send_purchase_price_updated",
@@ -547,14 +547,14 @@ def queue_purchase_price_updated_email(preapproval_id: uuid.UUID, amount: int):
             response=response.json(),
             application_id=application.id,
         ))
-        NotificationStatus.objects.create(status=NotificationStatus.NOT_SENT, application=application,
-                                          notification=purchase_price_notification,
-                                          reason=f'hubspot returned {response.status_code}')
+        create_notification_status(status=NotificationStatus.NOT_SENT, application=application,
+                                   notification=purchase_price_notification,
+                                   reason=f'hubspot returned {response.status_code}')
 
 
-@celery_app.task(queue='application-service-tasks')
+@celery_app.task(queue='application-service-tasks', batch_dispatch=True)
 def queue_customer_close_email(application_id: uuid.UUID):
-    customer_close_notification = Notification.objects.get(name=Notification.CUSTOMER_CLOSE)
+    customer_close_notification = get_notification(Notification.CUSTOMER_CLOSE)
 
     if not customer_close_notification.is_active:
         logger.info("Queue customer_close_notification is not active", extra=dict(
@@ -566,8 +566,7 @@ def queue_customer_close_email(application_id: uuid.UUID):
 
     application = Application.objects.get(id=application_id)
 
-    if application.notificationstatus_set.filter(notification=customer_close_notification,
-                                                 status=NotificationStatus.SENT).count() > 0:
+    if notification_status_exists(application, customer_close_notification, NotificationStatus.SENT):
         logger.info(f"Customer close email send for {application_id} has been sent", extra=dict(
             type="customer_close_email_already_sent",
             application_id=application_id
@@ -588,8 +587,8 @@ def queue_customer_close_email(application_id: uuid.UUID):
                                               application.new_home_purchase.address.street, cc_email_list,
                                               application.homeward_owner_email)
         if response.status_code == 200:
-            NotificationStatus.objects.create(status=NotificationStatus.SENT, application=application,
-                                              notification=customer_close_notification)
+            create_notification_status(status=NotificationStatus.SENT, application=application,
+                                       notification=customer_close_notification)
         else:
             logger.error("Non-success response code from send_customer_close", extra=dict(
                 type="non_success_for_send_customer_close",
@@ -597,14 +596,14 @@ def queue_customer_close_email(application_id: uuid.UUID):
                 response=response.json(),
                 application_id=application.id,
             ))
-            NotificationStatus.objects.create(status=NotificationStatus.NOT_SENT, application=application,
-                                              notification=customer_close_notification,
-                                              reason=f'hubspot returned {response.status_code}')
+            create_notification_status(status=NotificationStatus.NOT_SENT, application=application,
+                                       notification=customer_close_notification,
+                                       reason=f'hubspot returned {response.status_code}')
 
 
-@celery_app.task(queue='application-service-tasks')
+@celery_app.task(queue='application-service-tasks', batch_dispatch=True)
 def queue_agent_customer_close_email(application_id: uuid.UUID):
-    agent_customer_close_notification = Notification.objects.get(name=Notification.AGENT_CUSTOMER_CLOSE)
+    agent_customer_close_notification = get_notification(Notification.AGENT_CUSTOMER_CLOSE)
 
     if not agent_customer_close_notification.is_active:
         logger.info("Queue agent_customer_close_notification is not active", extra=dict(
@@ -616,8 +615,7 @@ def queue_agent_customer_close_email(application_id: uuid.UUID):
 
     application = Application.objects.get(id=application_id)
 
-    if application.notificationstatus_set.filter(notification=agent_customer_close_notification,
-                                                 status=NotificationStatus.SENT).count() > 0:
+    if notification_status_exists(application, agent_customer_close_notification, NotificationStatus.SENT):
         logger.info(f"Agent customer close email send for {application_id} has been sent", extra=dict(
             type="agent_customer_close_email_already_sent",
             application_id=application_id
@@ -640,8 +638,8 @@ def queue_agent_customer_close_email(application_id: uuid.UUID):
                                                     application.new_home_purchase.address.street,
                                                     application.homeward_owner_email, tc_email)
         if response.status_code == 200:
-            NotificationStatus.objects.create(status=NotificationStatus.SENT, application=application,
-                                              notification=agent_customer_close_notification)
+            create_notification_status(status=NotificationStatus.SENT, application=application,
+                                       notification=agent_customer_close_notification)
         else:
             logger.error("Non-success response code from send_agent_customer_close", extra=dict(
                 type="non_success_for_send_agent_customer_close",
@@ -649,14 +647,14 @@ def queue_agent_customer_close_email(application_id: uuid.UUID):
                 response=response.json(),
                 application_id=application.id,
             ))
-            NotificationStatus.objects.create(status=NotificationStatus.NOT_SENT, application=application,
-                                              notification=agent_customer_close_notification,
-                                              reason=f'hubspot returned {response.status_code}')
+            create_notification_status(status=NotificationStatus.NOT_SENT, application=application,
+                                       notification=agent_customer_close_notification,
+                                       reason=f'hubspot returned {response.status_code}')
 
 
-@celery_app.task(queue='application-service-tasks')
+@celery_app.task(queue='application-service-tasks', batch_dispatch=True)
 def queue_homeward_close_email(application_id: uuid.UUID):
-    homeward_close_notification = Notification.objects.get(name=Notification.HOMEWARD_CLOSE)
+    homeward_close_notification = get_notification(Notification.HOMEWARD_CLOSE)
 
     if not homeward_close_notification.is_active:
         logger.info("Queue homeward_close_notification is not active", extra=dict(
@@ -668,8 +666,7 @@ def queue_homeward_close_email(application_id: uuid.UUID):
 
     application = Application.objects.get(id=application_id)
 
-    if application.notificationstatus_set.filter(notification=homeward_close_notification,
-                                                 status=NotificationStatus.SENT).count() == 0:
+    if not notification_status_exists(application, homeward_close_notification, NotificationStatus.SENT):
         if application.new_home_purchase and application.new_home_purchase.is_reassigned_contract:
             NotificationStatus.objects.get_or_create(status=NotificationStatus.SUPPRESSED, application=application,
                                                      notification=homeward_close_notification,
@@ -680,8 +677,8 @@ def queue_homeward_close_email(application_id: uuid.UUID):
         response = mailer.send_homeward_close(application.customer, cc_email_list,
                                               application.homeward_owner_email)
         if response.status_code == 200:
-            NotificationStatus.objects.create(status=NotificationStatus.SENT, application=application,
-                                              notification=homeward_close_notification)
+            create_notification_status(status=NotificationStatus.SENT, application=application,
+                                       notification=homeward_close_notification)
         else:
             logger.error("Non-success response code from send_homeward_close", extra=dict(
                 type="non_success_for_send_homeward_close",
@@ -689,9 +686,9 @@ def queue_homeward_close_email(application_id: uuid.UUID):
                 response=response.json(),
                 application_id=application.id,
             ))
-            NotificationStatus.objects.create(status=NotificationStatus.NOT_SENT, application=application,
-                                              notification=homeward_close_notification,
-                                              reason=f'hubspot returned {response.status_code}')
+            create_notification_status(status=NotificationStatus.NOT_SENT, application=application,
+                                       notification=homeward_close_notification,
+                                       reason=f'hubspot returned {response.status_code}')
     else:
         logger.info("Notification homeward_close_notification already sent for application", extra=dict(
             type="homeward_close_notification_already_sent",
@@ -700,9 +697,9 @@ def queue_homeward_close_email(application_id: uuid.UUID):
         ))
 
 
-@celery_app.task(queue='application-service-tasks')
+@celery_app.task(queue='application-service-tasks', batch_dispatch=True)
 def send_completion_reminder(application_id: uuid.UUID, reminder_type: str):
-    completion_reminder_notification = Notification.objects.get(name=reminder_type)
+    completion_reminder_notification = get_notification(reminder_type)
 
     if not completion_reminder_notification.is_active:
         logger.info("completion_reminder notification is not active", extra=dict(
@@ -714,20 +711,20 @@ def send_completion_reminder(application_id: uuid.UUID, reminder_type: str):
 
     application = Application.objects.get(id=application_id)
     if application.apex_partner_slug:
-        NotificationStatus.objects.create(status=NotificationStatus.SUPPRESSED,
-                                          application=application,
-                                          notification=completion_reminder_notification,
-                                          reason="Application has apex partner slug")
+        create_notification_status(status=NotificationStatus.SUPPRESSED,
+                                   application=application,
+                                   notification=completion_reminder_notification,
+                                   reason="Application has apex partner slug")
         return
-    elif application.notificationstatus_set.filter(notification=completion_reminder_notification).count() == 0:
+    elif not notification_status_exists(application, completion_reminder_notification):
         if application.stage == ApplicationStage.INCOMPLETE:
             response = mailer.send_incomplete_account_notification(application.customer, application.buying_agent,
                                                                    application.build_resume_link(),
                                                                    completion_reminder_notification.name)
 
             if response.status_code == 200:
-                NotificationStatus.objects.create(status=NotificationStatus.SENT, application=application,
-                                                  notification=completion_reminder_notification)
+                create_notification_status(status=NotificationStatus.SENT, application=application,
+                                           notification=completion_reminder_notification)
             else:
                 logger.error("Non-success response code from send_incomplete_account_notification", extra=dict(
                     type="non_success_for_send_incomplete_account_notification_in_completion_reminder",
@@ -735,9 +732,9 @@ def send_completion_reminder(application_id: uuid.UUID, reminder_type: str):
                     response=response.json(),
                     application_id=application.id,
                 ))
-                NotificationStatus.objects.create(status=NotificationStatus.NOT_SENT, application=application,
-                                                  notification=completion_reminder_notification,
-                                                  reason=f'hubspot returned {response.status_code}')
+                create_notification_status(status=NotificationStatus.NOT_SENT, application=application,
+                                           notification=completion_reminder_notification,
+                                           reason=f'hubspot returned {response.status_code}')
     else:
         logger.info("Notification send_completion_reminder already sent for application", extra=dict(
             type="completion_reminder_already_sent",
@@ -746,13 +743,13 @@ def send_completion_reminder(application_id: uuid.UUID, reminder_type: str):
         ))
 
 
-@celery_app.task(queue='application-service-tasks')
+@celery_app.task(queue='application-service-tasks', batch_dispatch=True)
 def send_registered_client_notification(application_id: uuid.UUID):
     logger.info("Sending registered_client_notification", extra=dict(
         type="sending_registered_client_notification",
         application_id=application_id
     ))
-    registered_client_notification = Notification.objects.get(name=Notification.AGENT_REFERRAL_CUSTOMER_WELCOME_EMAIL)
+    registered_client_notification = get_notification(Notification.AGENT_REFERRAL_CUSTOMER_WELCOME_EMAIL)
 
     if not registered_client_notification.is_active:
         logger.info("registered_client_notification is not active", extra=dict(
@@ -765,11 +762,11 @@ def send_registered_client_notification(application_id: uuid.UUID):
     application = Application.objects.get(id=application_id)
 
     if application.apex_partner_slug:
-        NotificationStatus.objects.create(status=NotificationStatus.SUPPRESSED,
-                                          application=application,
-                                          notification=registered_client_notification,
-                                          reason="Application has apex partner slug")
-    elif application.notificationstatus_set.filter(notification=registered_client_notification).count() == 0:
+        create_notification_status(status=NotificationStatus.SUPPRESSED,
+                                   application=application,
+                                   notification=registered_client_notification,
+                                   reason="Application has apex partner slug")
+    elif not notification_status_exists(application, registered_client_notification):
         try:
             application.pricing
         except Application.pricing.RelatedObjectDoesNotExist:
@@ -783,16 +780,16 @@ def send_registered_client_notification(application_id: uuid.UUID):
                     questionnaire_response_id=application.questionnaire_response_id,
                     application_id=application_id
                 ))
-                NotificationStatus.objects.create(status=NotificationStatus.NOT_SENT, application=application,
-                                                  notification=registered_client_notification,
-                                                  reason="Pricing object not found for app: {}".format(application.id))
+                create_notification_status(status=NotificationStatus.NOT_SENT, application=application,
+                                           notification=registered_client_notification,
+                                           reason="Pricing object not found for app: {}".format(application.id))
                 return
 
         response = mailer.send_agent_referral_welcome_email(application.customer, application.buying_agent,
                                                             application.get_pricing_url())
         if response.status_code == 200:
-            NotificationStatus.objects.create(status=NotificationStatus.SENT, application=application,
-                                              notification=registered_client_notification)
+            create_notification_status(status=NotificationStatus.SENT, application=application,
+                                       notification=registered_client_notification)
         else:
             logger.error("Non-success response code from send_agent_referral_welcome_email", extra=dict(
                 type="non_success_for_send_agent_referral_welcome_email",
@@ -800,9 +797,9 @@ def send_registered_client_notification(application_id: uuid.UUID):
                 response=response.json(),
                 application_id=application.id,
             ))
-            NotificationStatus.objects.create(status=NotificationStatus.NOT_SENT, application=application,
-                                              notification=registered_client_notification,
-                                              reason=f'hubspot returned {response.status_code}')
+            create_notification_status(status=NotificationStatus.NOT_SENT, application=application,
+                                       notification=registered_client_notification,
+                                       reason=f'hubspot returned {response.status_code}')
 
     else:
         logger.info("Notification send_registered_client_notification already sent for application", extra=dict(
@@ -812,9 +809,9 @@ def send_registered_client_notification(application_id: uuid.UUID):
         ))
 
 
-@celery_app.task(queue='application-service-tasks')
+@celery_app.task(queue='application-service-tasks', batch_dispatch=True)
 def queue_cma_request(application_id: uuid.UUID):
-    cma_request_notification = Notification.objects.get(name=Notification.CMA_REQUEST)
+    cma_request_notification = get_notification(Notification.CMA_REQUEST)
 
     if not cma_request_notification.is_active:
         logger.info("cma_request_notification is not active", extra=dict(
@@ -835,14 +832,14 @@ def queue_cma_request(application_id: uuid.UUID):
             raise EmailTriggerCriteriaValidationException(
                 f"missing information necessary to send CMA request for application {application.id}")
 
-        if application.notificationstatus_set.filter(notification=cma_request_notification).count() == 0:
+        if not notification_status_exists(application, cma_request_notification):
             response = mailer.send_cma_request(application.buying_agent.email,
                                                application.buying_agent.get_first_name(),
                                                application.customer.name, application.current_home.address.street)
 
             if response.status_code == 200:
-                NotificationStatus.objects.create(status=NotificationStatus.SENT, application=application,
-                                                  notification=cma_request_notification)
+                create_notification_status(status=NotificationStatus.SENT, application=application,
+                                           notification=cma_request_notification)
             else:
                 logger.error("Non-success response code from send_cma_request", extra=dict(
                     type="non_success_for_send_cma_request",
@@ -850,9 +847,9 @@ def queue_cma_request(application_id: uuid.UUID):
                     response=response.json(),
                     application_id=application.id,
                 ))
-                NotificationStatus.objects.create(status=NotificationStatus.NOT_SENT, application=application,
-                                                  notification=cma_request_notification,
-                                                  reason=f'hubspot returned {response.status_code}')
+                create_notification_status(status=NotificationStatus.NOT_SENT, application=application,
+                                           notification=cma_request_notification,
+                                           reason=f'hubspot returned {response.status_code}')
         else:
             logger.info("Notification cma_request_notification already sent for application", extra=dict(
                 type="cma_request_notification_already_sent",
@@ -861,9 +858,9 @@ def queue_cma_request(application_id: uuid.UUID):
             ))
 
 
-@celery_app.task(queue='application-service-tasks')
+@celery_app.task(queue='application-service-tasks', batch_dispatch=True)
 def queue_saved_quote_cta(pricing_id: uuid.UUID):
-    cma_saved_quote_cta_notification = Notification.objects.get(name=Notification.SAVED_QUOTE)
+    cma_saved_quote_cta_notification = get_notification(Notification.SAVED_QUOTE)
 
     if not cma_saved_quote_cta_notification.is_active:
         logger.info("cma_request_notification is not active", extra=dict(
@@ -878,9 +875,16 @@ def queue_saved_quote_cta(pricing_id: uuid.UUID):
                                 pricing.get_resume_link())
 
 
-@celery_app.task(queue='application-service-tasks')
-def queue_new_customer_partner_email(application_id: uuid.UUID, apex_partner):
-    new_customer_partner_email_notification = Notification.objects.get(name=Notification.NEW_CUSTOMER_PARTNER_EMAIL)
+def get_apex_partner(apex_partner_slug) -> dict:
+    # messages queued before the lookup moved into these tasks carry the partner config itself
+    if isinstance(apex_partner_slug, dict):
+        return apex_partner_slug
+    return get_partner(apex_partner_slug)
+
+
+@celery_app.task(queue='application-service-tasks', batch_dispatch=True)
+def queue_new_customer_partner_email(application_id: uuid.UUID, apex_partner_slug):
+    new_customer_partner_email_notification = get_notification(Notification.NEW_CUSTOMER_PARTNER_EMAIL)
 
     if not new_customer_partner_email_notification.is_active:
         logger.info("new_customer_partner_email_notification is not active", extra=dict(
@@ -891,18 +895,18 @@ def queue_new_customer_partner_email(application_id: uuid.UUID, apex_partner):
         return
 
     application = Application.objects.get(id=application_id)
+    apex_partner = get_apex_partner(apex_partner_slug)
     partner_name = apex_partner.get('name')
     partner_email = apex_partner.get('partner-email')
     if partner_email is None:
         # Handle legacy weblfow typo case
         partner_email = apex_partner.get('parnter-email')
         if partner_email is None:
-            NotificationStatus.objects.create(status=NotificationStatus.NOT_SENT, application=application,
-                                              notification=new_customer_partner_email_notification,
-                                              reason='Missing partner email address')
+            create_notification_status(status=NotificationStatus.NOT_SENT, application=application,
+                                       notification=new_customer_partner_email_notification,
+                                       reason='Missing partner email address')
             return
-    if application.notificationstatus_set.filter(notification=new_customer_partner_email_notification,
-                                                 status=NotificationStatus.SENT).count() == 0:
+    if not notification_status_exists(application, new_customer_partner_email_notification, NotificationStatus.SENT):
         if application.current_home:
             address = application.current_home.address.get_inline_address()
         else:
@@ -920,8 +924,8 @@ def queue_new_customer_partner_email(application_id: uuid.UUID, apex_partner):
                                                           partner_name,
                                                           partner_email)
         if response.status_code == 200:
-            NotificationStatus.objects.create(status=NotificationStatus.SENT, application=application,
-                                              notification=new_customer_partner_email_notification)
+            create_notification_status(status=NotificationStatus.SENT, application=application,
+                                       notification=new_customer_partner_email_notification)
         else:
             logger.error("Non-success response code from send_new_customer_partner_email", extra=dict(
                 type="non_success_for_send_new_customer_partner_email",
@@ -929,9 +933,9 @@ def queue_new_customer_partner_email(application_id: uuid.UUID, apex_partner):
                 response=response.json(),
                 application_id=application.id,
             ))
-            NotificationStatus.objects.create(status=NotificationStatus.NOT_SENT, application=application,
-                                              notification=new_customer_partner_email_notification,
-                                              reason=f'hubspot returned {response.status_code}')
+            create_notification_status(status=NotificationStatus.NOT_SENT, application=application,
+                                       notification=new_customer_partner_email_notification,
+                                       reason=f'hubspot returned {response.status_code}')
     else:
         logger.info("Notification new_customer_partner_email_notification already sent for application", extra=dict(
             type="new_customer_partner_email_notification_already_sent",
@@ -940,9 +944,9 @@ def queue_new_customer_partner_email(application_id: uuid.UUID, apex_partner):
         ))
 
 
-@celery_app.task(queue='application-service-tasks')
-def queue_apex_site_pre_account_email(application_id: uuid.UUID, apex_partner):
-    apex_site_pre_account_notification = Notification.objects.get(name=Notification.APEX_SITE_PRE_ACCOUNT)
+@celery_app.task(queue='application-service-tasks', batch_dispatch=True)
+def queue_apex_site_pre_account_email(application_id: uuid.UUID, apex_partner_slug):
+    apex_site_pre_account_notification = get_notification(Notification.APEX_SITE_PRE_ACCOUNT)
 
     if not apex_site_pre_account_notification.is_active:
         logger.info("apex_site_pre_account_notification is not active", extra=dict(
@@ -953,10 +957,9 @@ def queue_apex_site_pre_account_email(application_id: uuid.UUID, apex_partner):
         return
 
     application = Application.objects.get(id=application_id)
-    partner_name = apex_partner.get('name')
 
-    if application.notificationstatus_set.filter(notification=apex_site_pre_account_notification,
-                                                 status=NotificationStatus.SENT).count() == 0:
+    if not notification_status_exists(application, apex_site_pre_account_notification, NotificationStatus.SENT):
+        partner_name = get_apex_partner(apex_partner_slug).get('name')
         response = mailer.send_apex_site_pre_account_email(application.customer.email,
                                                            application.customer.get_first_name(),
                                                            partner_name,
@@ -965,8 +968,8 @@ def queue_apex_site_pre_account_email(application_id: uuid.UUID, apex_partner):
                                                            application.get_buying_agent_email())
 
         if response.status_code == 200:
-            NotificationStatus.objects.create(status=NotificationStatus.SENT, application=application,
-                                              notification=apex_site_pre_account_notification)
+            create_notification_status(status=NotificationStatus.SENT, application=application,
+                                       notification=apex_site_pre_account_notification)
         else:
             logger.error("Non-success response code from send_apex_site_pre_account_email", extra=dict(
                 type="non_success_for_send_apex_site_pre_account_email",
@@ -974,9 +977,9 @@ def queue_apex_site_pre_account_email(application_id: uuid.UUID, apex_partner):
                 response=response.json(),
                 application_id=application.id,
             ))
-            NotificationStatus.objects.create(status=NotificationStatus.NOT_SENT, application=application,
-                                              notification=apex_site_pre_account_notification,
-                                              reason=f'hubspot returned {response.status_code}')
+            create_notification_status(status=NotificationStatus.NOT_SENT, application=application,
+                                       notification=apex_site_pre_account_notification,
+                                       reason=f'hubspot returned {response.status_code}')
 
     else:
         logger.info("Notification new_customer_partner_email_notification already sent for application", extra=dict(
@@ -986,9 +989,9 @@ def queue_apex_site_pre_account_email(application_id: uuid.UUID, apex_partner):
         ))
 
 
-@celery_app.task(queue='application-service-tasks')
+@celery_app.task(queue='application-service-tasks', batch_dispatch=True)
 def queue_fast_track_resume_email(application_id: uuid.UUID):
-    fast_track_resume_notification = Notification.objects.get(name=Notification.FAST_TRACK_RESUME)
+    fast_track_resume_notification = get_notification(Notification.FAST_TRACK_RESUME)
 
     if not fast_track_resume_notification.is_active:
         logger.info("fast_track_resume_notification is not active", extra=dict(
@@ -1001,20 +1004,20 @@ def queue_fast_track_resume_email(application_id: uuid.UUID):
     application = Application.objects.get(id=application_id)
 
     if application.apex_partner_slug:
-        NotificationStatus.objects.create(status=NotificationStatus.SUPPRESSED,
-                                          application=application,
-                                          notification=fast_track_resume_notification,
-                                          reason="Application has apex partner slug")
-    elif application.buying_agent.has_name_and_email() and application.notificationstatus_set.filter(
-            notification=fast_track_resume_notification).count() == 0:
+        create_notification_status(status=NotificationStatus.SUPPRESSED,
+                                   application=application,
+                                   notification=fast_track_resume_notification,
+                                   reason="Application has apex partner slug")
+    elif application.buying_agent.has_name_and_email() \
+            and not notification_status_exists(application, fast_track_resume_notification):
         response = mailer.send_fast_track_resume_email(application.buying_agent.email, application.buying_agent.name,
                                                        application.customer.name,
                                                        application.customer.get_first_name(),
                                                        application.customer.email,
                                                        application.build_resume_link())
         if response.status_code == 200:
-            NotificationStatus.objects.create(status=NotificationStatus.SENT, application=application,
-                                              notification=fast_track_resume_notification)
+            create_notification_status(status=NotificationStatus.SENT, application=application,
+                                       notification=fast_track_resume_notification)
         else:
             logger.error("Non-success response code from send_fast_track_resume_email", extra=dict(
                 type="non_success_for_send_fast_track_resume_email",
@@ -1022,9 +1025,9 @@ def queue_fast_track_resume_email(application_id: uuid.UUID):
                 response=response.json(),
                 application_id=application.id,
             ))
-            NotificationStatus.objects.create(status=NotificationStatus.NOT_SENT, application=application,
-                                              notification=fast_track_resume_notification,
-                                              reason=f'hubspot returned {response.status_code}')
+            create_notification_status(status=NotificationStatus.NOT_SENT, application=application,
+                                       notification=fast_track_resume_notification,
+                                       reason=f'hubspot returned {response.status_code}')
     else:
         logger.info("Notification fast_track_resume_notification already sent for application", extra=dict(
             type="fast_track_resume_notification_already_sent",
@@ -1033,9 +1036,9 @@ def queue_fast_track_resume_email(application_id: uuid.UUID):
         ))
 
 
-@celery_app.task(queue='application-service-tasks')
+@celery_app.task(queue='application-service-tasks', batch_dispatch=True)
 def queue_vpal_incomplete_email(application_id: uuid.UUID):
-    vpal_incomplete_notification = Notification.objects.get(name=Notification.VPAL_INCOMPLETE)
+    vpal_incomplete_notification = get_notification(Notification.VPAL_INCOMPLETE)
 
     if not vpal_incomplete_notification.is_active:
         logger.info("vpal_incomplete_notification is not active", extra=dict(
@@ -1047,8 +1050,7 @@ def queue_vpal_incomplete_email(application_id: uuid.UUID):
 
     application = Application.objects.get(id=application_id)
 
-    if application.notificationstatus_set.filter(notification=vpal_incomplete_notification,
-                                                 status=NotificationStatus.SENT).count() == 0:
+    if not notification_status_exists(application, vpal_incomplete_notification, NotificationStatus.SENT):
         response = mailer.send_vpal_incomplete_email(application.get_buying_agent_email(),
                                                      application.customer.get_first_name(),
                                                      application.customer.email,
@@ -1057,8 +1059,8 @@ def queue_vpal_incomplete_email(application_id: uuid.UUID):
                                                      application.get_approval_specialist_first_name(),
                                                      application.get_approval_specialist_last_name())
         if response.status_code == 200:
-            NotificationStatus.objects.create(status=NotificationStatus.SENT, application=application,
-                                              notification=vpal_incomplete_notification)
+            create_notification_status(status=NotificationStatus.SENT, application=application,
+                                       notification=vpal_incomplete_notification)
         else:
             logger.error("Non-success response code from send_vpal_incomplete_email", extra=dict(
                 type="non_success_for_send_vpal_incomplete_email",
@@ -1066,9 +1068,9 @@ def queue_vpal_incomplete_email(application_id: uuid.UUID):
                 response=response.json(),
                 application_id=application.id,
             ))
-            NotificationStatus.objects.create(status=NotificationStatus.NOT_SENT, application=application,
-                                              notification=vpal_incomplete_notification,
-                                              reason=f"hubspot returned {response.status_code}")
+            create_notification_status(status=NotificationStatus.NOT_SENT, application=application,
+                                       notification=vpal_incomplete_notification,
+                                       reason=f"hubspot returned {response.status_code}")
     else:
         logger.info("Notification vpal_incomplete_notification already sent for application", extra=dict(
             type="vpal_incomplete_notification_already_sent",
@@ -1077,9 +1079,9 @@ def queue_vpal_incomplete_email(application_id: uuid.UUID):
         ))
 
 
-@celery_app.task(queue='application-service-tasks')
+@celery_app.task(queue='application-service-tasks', batch_dispatch=True)
 def queue_vpal_suspended_email(application_id: uuid.UUID):
-    vpal_suspended_notification = Notification.objects.get(name=Notification.VPAL_SUSPENDED)
+    vpal_suspended_notification = get_notification(Notification.VPAL_SUSPENDED)
 
     if not vpal_suspended_notification.is_active:
         logger.info("vpal_suspended_notification is not active", extra=dict(
@@ -1091,8 +1093,7 @@ def queue_vpal_suspended_email(application_id: uuid.UUID):
 
     application = Application.objects.get(id=application_id)
 
-    if application.notificationstatus_set.filter(notification=vpal_suspended_notification,
-                                                 status=NotificationStatus.SENT).count() == 0:
+    if not notification_status_exists(application, vpal_suspended_notification, NotificationStatus.SENT):
         cc_email_list = [application.get_buying_agent_email(), application.customer.co_borrower_email]
         loan_advisor = application.loan_advisor
         if loan_advisor:
@@ -1115,8 +1116,8 @@ def queue_vpal_suspended_email(application_id: uuid.UUID):
                                                         application.get_approval_specialist_first_name(),
                                                         application.get_approval_specialist_last_name())
         if response.status_code == 200:
-            NotificationStatus.objects.create(status=NotificationStatus.SENT, application=application,
-                                              notification=vpal_suspended_notification)
+            create_notification_status(status=NotificationStatus.SENT, application=application,
+                                       notification=vpal_suspended_notification)
         else:
             logger.error("Non-success response code from send_vpal_suspended_email", extra=dict(
                 type="non_success_for_send_vpal_suspended_email",
@@ -1124,9 +1125,9 @@ def queue_vpal_suspended_email(application_id: uuid.UUID):
                 response=response.json(),
                 application_id=application.id,
             ))
-            NotificationStatus.objects.create(status=NotificationStatus.NOT_SENT, application=application,
-                                              notification=vpal_suspended_notification,
-                                              reason=f"hubspot returned {response.status_code}")
+            create_notification_status(status=NotificationStatus.NOT_SENT, application=application,
+                                       notification=vpal_suspended_notification,
+                                       reason=f"hubspot returned {response.status_code}")
     else:
         logger.info("Notification vpal_suspended_notification already sent for application", extra=dict(
             type="vpal_suspended_notification_already_sent",
@@ -1135,9 +1136,9 @@ def queue_vpal_suspended_email(application_id: uuid.UUID):
         ))
 
 
-@celery_app.task(queue='application-service-tasks')
+@celery_app.task(queue='application-service-tasks', batch_dispatch=True)
 def queue_vpal_ready_for_review_email(application_id: uuid.UUID):
-    vpal_ready_for_review_notification = Notification.objects.get(name=Notification.VPAL_READY_FOR_REVIEW)
+    vpal_ready_for_review_notification = get_notification(Notification.VPAL_READY_FOR_REVIEW)
 
     if not vpal_ready_for_review_notification.is_active:
         logger.info("vpal_ready_for_review_notification is not active", extra=dict(
@@ -1149,8 +1150,7 @@ def queue_vpal_ready_for_review_email(application_id: uuid.UUID):
 
     application = Application.objects.get(id=application_id)
 
-    if application.notificationstatus_set.filter(notification=vpal_ready_for_review_notification,
-                                                 status=NotificationStatus.SENT).count() == 0:
+    if not notification_status_exists(application, vpal_ready_for_review_notification, NotificationStatus.SENT):
 
         response = mailer.send_vpal_ready_for_review_email(application.customer.get_first_name(),
                                                            application.customer.email,
@@ -1160,8 +1160,8 @@ def queue_vpal_ready_for_review_email(application_id: uuid.UUID):
                                                            application.get_approval_specialist_first_name(),
                                                            application.get_approval_specialist_last_name())
         if response.status_code == 200:
-            NotificationStatus.objects.create(status=NotificationStatus.SENT, application=application,
-                                              notification=vpal_ready_for_review_notification)
+            create_notification_status(status=NotificationStatus.SENT, application=application,
+                                       notification=vpal_ready_for_review_notification)
         else:
             logger.error("Non-success response code from send_vpal_ready_for_review_email", extra=dict(
                 type="non_success_for_send_vpal_ready_for_review_email",
@@ -1169,9 +1169,9 @@ def queue_vpal_ready_for_review_email(application_id: uuid.UUID):
                 response=response.json(),
                 application_id=application.id,
             ))
-            NotificationStatus.objects.create(status=NotificationStatus.NOT_SENT, application=application,
-                                              notification=vpal_ready_for_review_notification,
-                                              reason=f"hubspot returned {response.status_code}")
+            create_notification_status(status=NotificationStatus.NOT_SENT, application=application,
+                                       notification=vpal_ready_for_review_notification,
+                                       reason=f"hubspot returned {response.status_code}")
     else:
         logger.info("Notification vpal_ready_for_review_notification already sent for application", extra=dict(
             type="vpal_ready_for_review_notification_already_sent",
@@ -1179,10 +1179,10 @@ def queue_vpal_ready_for_review_email(application_id: uuid.UUID):
             vpal_ready_for_review_notification_id=vpal_ready_for_review_notification.id
         ))
 
-@celery_app.task(queue='application-service-tasks')
+@celery_app.task(queue='application-service-tasks', batch_dispatch=True)
 def queue_application_complete_email(application_id: uuid.UUID):
 
-    application_complete_notification = Notification.objects.get(name=Notification.APPLICATION_COMPLETE)
+    application_complete_notification = get_notification(Notification.APPLICATION_COMPLETE)
     
     if not application_complete_notification.is_active:
         logger.info("application_complete_notification is not active", extra=dict(
@@ -1194,8 +1194,7 @@ def queue_application_complete_email(application_id: uuid.UUID):
     
     application = Application.objects.get(id=application_id)
     
-    if application.notificationstatus_set.filter(notification=application_complete_notification,
-                                                 status=NotificationStatus.SENT).count() == 0:
+    if not notification_status_exists(application, application_complete_notification, NotificationStatus.SENT):
         response = mailer.send_application_complete_email(application.customer.email, 
                                                           application.customer.get_first_name(), 
                                                           application.get_buying_agent_email(), 
@@ -1206,8 +1205,8 @@ def queue_application_complete_email(application_id: uuid.UUID):
                                                           application.get_loan_advisor_last_name())
         
         if response.status_code == 200:
-            NotificationStatus.objects.create(status=NotificationStatus.SENT, application=application,
-                                              notification=application_complete_notification)
+            create_notification_status(status=NotificationStatus.SENT, application=application,
+                                       notification=application_complete_notification)
         else:
             logger.error("Non-success response code from application_complete_notification", extra=dict(
                 type="non_success_for_send_application_complete_email",
@@ -1215,9 +1214,9 @@ def queue_application_complete_email(application_id: uuid.UUID):
                 response=response.json(),
                 application_id=application.id,
             ))
-            NotificationStatus.objects.create(status=NotificationStatus.NOT_SENT, application=application,
-                                              notification=application_complete_notification,
-                                              reason=f"hubspot returned {response.status_code}")
+            create_notification_status(status=NotificationStatus.NOT_SENT, application=application,
+                                       notification=application_complete_notification,
+                                       reason=f"hubspot returned {response.status_code}")
     else:
         logger.info("Notification application_complete_notification already sent for application", extra=dict(
             type="application_complete_notification_already_sent",
@@ -1228,7 +1227,7 @@ def queue_application_complete_email(application_id: uuid.UUID):
 
 @periodic_task(run_every=timedelta(hours=24), options={'queue': 'application-service-tasks'})
 def send_pre_homeward_close_email():
-    pre_homeward_close_notification = Notification.objects.get(name=Notification.PRE_HOMEWARD_CLOSE)
+    pre_homeward_close_notification = get_notification(Notification.PRE_HOMEWARD_CLOSE)
 
     if not pre_homeward_close_notification.is_active:
         logger.info("pre_homeward_close_notification is not active", extra=dict(
@@ -1253,10 +1252,10 @@ def send_pre_homeward_close_email():
                 application_id=application.id,
                 new_home_purchase_obj=application.new_home_purchase.__dict__
             ))
-            NotificationStatus.objects.create(status=NotificationStatus.NOT_SENT,
-                                              application=application,
-                                              notification=pre_homeward_close_notification,
-                                              reason=f"missing new_home_purchase data")
+            create_notification_status(status=NotificationStatus.NOT_SENT,
+                                       application=application,
+                                       notification=pre_homeward_close_notification,
+                                       reason=f"missing new_home_purchase data")
 
         elif application.new_home_purchase.is_reassigned_contract:
             NotificationStatus.objects.get_or_create(status=NotificationStatus.SUPPRESSED, application=application,
@@ -1268,8 +1267,8 @@ def send_pre_homeward_close_email():
                 response = mailer.send_pre_homeward_close(application.customer, application.new_home_purchase,
                                                           cc_email_list, application.homeward_owner_email)
                 if response.status_code == 200:
-                    NotificationStatus.objects.create(status=NotificationStatus.SENT, application=application,
-                                                      notification=pre_homeward_close_notification)
+                    create_notification_status(status=NotificationStatus.SENT, application=application,
+                                               notification=pre_homeward_close_notification)
                 else:
                     logger.error("Non-success response code from send_pre_homeward_close", extra=dict(
                         type="non_success_for_send_pre_homeward_close",
@@ -1277,9 +1276,9 @@ def send_pre_homeward_close_email():
                         application_id=application.id,
                         response=response.json()
                     ))
-                    NotificationStatus.objects.create(status=NotificationStatus.NOT_SENT, application=application,
-                                                      notification=pre_homeward_close_notification,
-                                                      reason=f"hubspot returned {response.status_code}")
+                    create_notification_status(status=NotificationStatus.NOT_SENT, application=application,
+                                               notification=pre_homeward_close_notification,
+                                               reason=f"hubspot returned {response.status_code}")
             except Exception as e:
                 logger.exception(f"Unable to send pre-homeward close email for application {application.id}",
                                  exc_info=e,
@@ -1289,7 +1288,7 @@ def send_pre_homeward_close_email():
 
 @periodic_task(run_every=timedelta(hours=24), options={'queue': 'application-service-tasks'})
 def send_agent_pre_customer_close_email():
-    pre_customer_close_agent_notification = Notification.objects.get(name=Notification.AGENT_PRE_CUSTOMER_CLOSE)
+    pre_customer_close_agent_notification = get_notification(Notification.AGENT_PRE_CUSTOMER_CLOSE)
 
     if not pre_customer_close_agent_notification.is_active:
         logger.info("pre_customer_close_agent_notification is not active", extra=dict(
@@ -1337,8 +1336,8 @@ def send_agent_pre_customer_close_email():
                                                          application.homeward_owner_email,
                                                          tc_email)
                 if response.status_code == 200:
-                    NotificationStatus.objects.create(status=NotificationStatus.SENT, application=application,
-                                                      notification=pre_customer_close_agent_notification)
+                    create_notification_status(status=NotificationStatus.SENT, application=application,
+                                               notification=pre_customer_close_agent_notification)
                 else:
                     logger.error("Non-success response code from send_agent_pre_customer_close", extra=dict(
                         type="non_success_for_send_agent_pre_customer_close",
@@ -1346,9 +1345,9 @@ def send_agent_pre_customer_close_email():
                         application_id=application.id,
                         response=response.json()
                     ))
-                    NotificationStatus.objects.create(status=NotificationStatus.NOT_SENT, application=application,
-                                                      notification=pre_customer_close_agent_notification,
-                                                      reason=f"hubspot returned {response.status_code}")
+                    create_notification_status(status=NotificationStatus.NOT_SENT, application=application,
+                                               notification=pre_customer_close_agent_notification,
+                                               reason=f"hubspot returned {response.status_code}")
             except Exception:
                 logger.error(f"Unable to send agent pre-customer close email for application {application.id}",
                              extra=dict(
@@ -1360,7 +1359,7 @@ def send_agent_pre_customer_close_email():
 
 @periodic_task(run_every=timedelta(hours=24), options={'queue': 'application-service-tasks'})
 def send_pre_customer_close_email():
-    pre_customer_close_notification = Notification.objects.get(name=Notification.PRE_CUSTOMER_CLOSE)
+    pre_customer_close_notification = get_notification(Notification.PRE_CUSTOMER_CLOSE)
 
     if not pre_customer_close_notification.is_active:
         logger.info("pre_customer_close_notification is not active", extra=dict(
@@ -1408,8 +1407,8 @@ def send_pre_customer_close_email():
                                                           cc_email_list,
                                                           application.cx_manager, application.homeward_owner_email)
                 if response.status_code == 200:
-                    NotificationStatus.objects.create(status=NotificationStatus.SENT, application=application,
-                                                      notification=pre_customer_close_notification)
+                    create_notification_status(status=NotificationStatus.SENT, application=application,
+                                               notification=pre_customer_close_notification)
                 else:
                     logger.error("Non-success response code from send_pre_customer_close", extra=dict(
                         type="non_success_for_send_pre_customer_close",
@@ -1417,9 +1416,9 @@ def send_pre_customer_close_email():
                         application_id=application.id,
                         response=response.json()
                     ))
-                    NotificationStatus.objects.create(status=NotificationStatus.NOT_SENT, application=application,
-                                                      notification=pre_customer_close_notification,
-                                                      reason=f"hubspot returned {response.status_code}")
+                    create_notification_status(status=NotificationStatus.NOT_SENT, application=application,
+                                               notification=pre_customer_close_notification,
+                                               reason=f"hubspot returned {response.status_code}")
             except Exception as e:
                 logger.exception(f"Unable to send customer close email for application {application.id}", exc_info=e,
                                  extra=dict(
@@ -1431,7 +1430,7 @@ def send_pre_customer_close_email():
 
 @periodic_task(run_every=timedelta(hours=24), options={'queue': 'application-service-tasks'})
 def send_expiring_approval_email():
-    expiring_approval_notification = Notification.objects.get(name=Notification.EXPIRING_APPROVAL)
+    expiring_approval_notification = get_notification(Notification.EXPIRING_APPROVAL)
 
     if not expiring_approval_notification.is_active:
         logger.info("expiring_approval_notification is not active", extra=dict(
@@ -1461,8 +1460,8 @@ def send_expiring_approval_email():
                                                                application.buying_agent.email,
                                                                application.homeward_owner_email)
                 if response.status_code == 200:
-                    NotificationStatus.objects.create(status=NotificationStatus.SENT, application=application,
-                                                      notification=expiring_approval_notification)
+                    create_notification_status(status=NotificationStatus.SENT, application=application,
+                                               notification=expiring_approval_notification)
                 else:
                     logger.error("Non-success response code from send_expiring_approval_email", extra=dict(
                         type="non_success_for_send_expiring_approval_email",
@@ -1470,9 +1469,9 @@ def send_expiring_approval_email():
                         application_id=application.id,
                         response=response.json()
                     ))
-                    NotificationStatus.objects.create(status=NotificationStatus.NOT_SENT, application=application,
-                                                      notification=expiring_approval_notification,
-                                                      reason=f"hubspot returned {response.status_code}")
+                    create_notification_status(status=NotificationStatus.NOT_SENT, application=application,
+                                               notification=expiring_approval_notification,
+                                               reason=f"hubspot returned {response.status_code}")
             except Exception as e:
                 logger.exception(f"Unable to send expiration email for application {application.id}", exc_info=e,
                                  extra=dict(
@@ -1510,7 +1509,7 @@ def send_incomplete_application_reminders():
             notification_type = Notification.WEEK_REMINDER
 
         if notification_type:
-            notification = Notification.objects.get(name=notification_type)
+            notification = get_notification(notification_type)
 
             if not notification.is_active:
                 logger.info(f"Notification {notification_type} is not active", extra=dict(
@@ -1522,16 +1521,16 @@ def send_incomplete_application_reminders():
                 return
 
             if application.apex_partner_slug:
-                NotificationStatus.objects.create(status=NotificationStatus.SUPPRESSED,
-                                                  application=application,
-                                                  notification=notification,
-                                                  reason="Application has apex partner slug")
-            elif application.notificationstatus_set.filter(notification=notification).count() == 0:
+                create_notification_status(status=NotificationStatus.SUPPRESSED,
+                                           application=application,
+                                           notification=notification,
+                                           reason="Application has apex partner slug")
+            elif not notification_status_exists(application, notification):
                 response = mailer.send_incomplete_account_notification(application.customer, application.buying_agent,
                                                                        application.get_cta_link(), notification.name)
                 if response.status_code == 200:
-                    NotificationStatus.objects.create(status=NotificationStatus.SENT, application=application,
-                                                      notification=notification)
+                    create_notification_status(status=NotificationStatus.SENT, application=application,
+                                               notification=notification)
                 else:
                     logger.error("Non-success response code from send_incomplete_account_notification", extra=dict(
                         type="non_success_for_send_incomplete_account_notification_incomplete_application_reminders",
@@ -1541,14 +1540,14 @@ def send_incomplete_application_reminders():
                         application_id=application.id,
                         response=response.json()
                     ))
-                    NotificationStatus.objects.create(status=NotificationStatus.NOT_SENT, application=application,
-                                                      notification=notification,
-                                                      reason=f"hubspot returned {response.status_code}")
+                    create_notification_status(status=NotificationStatus.NOT_SENT, application=application,
+                                               notification=notification,
+                                               reason=f"hubspot returned {response.status_code}")
 
 
 @periodic_task(run_every=timedelta(hours=1), options={'queue': 'application-service-tasks'})
 def send_incomplete_agent_referral_reminders():
-    incomplete_agent_referral_notification = Notification.objects.get(name=Notification.INCOMPLETE_REFERRAL)
+    incomplete_agent_referral_notification = get_notification(Notification.INCOMPLETE_REFERRAL)
 
     if not incomplete_agent_referral_notification.is_active:
         logger.info(f"incomplete_agent_referral_notification is not active", extra=dict(
@@ -1582,7 +1581,7 @@ def send_incomplete_agent_referral_reminders():
 
 @periodic_task(run_every=timedelta(hours=24), options={'queue': 'application-service-tasks'})
 def send_vpal_ready_for_review_follow_up():
-    vpal_ready_for_review_notification = Notification.objects.get(name=Notification.VPAL_READY_FOR_REVIEW_FOLLOW_UP)
+    vpal_ready_for_review_notification = get_notification(Notification.VPAL_READY_FOR_REVIEW_FOLLOW_UP)
 
     if not vpal_ready_for_review_notification.is_active:
         logger.info(
@@ -1596,13 +1595,13 @@ def send_vpal_ready_for_review_follow_up():
     applications = Application.objects.filter(stage=ApplicationStage.QUALIFIED_APPLICATION,
                                               mortgage_status=MortgageStatus.VPAL_READY_FOR_REVIEW)  # grab all vpal ready for review apps
 
-    vpal_original_notification = Notification.objects.get(name=Notification.VPAL_READY_FOR_REVIEW)
+    vpal_original_notification = get_notification(Notification.VPAL_READY_FOR_REVIEW)
     time_threshold = timezone.now() - timedelta(hours=72)
 
     for application in applications:
         if application.notificationstatus_set.filter(
                 notification__in=[vpal_original_notification, vpal_ready_for_review_notification],
-                status=NotificationStatus.SENT, created_at__gt=time_threshold).count() > 0:
+                status=NotificationStatus.SENT, created_at__gt=time_threshold).exists():
             logger.info("Notification vpal_ready_for_review_notification already sent for application", extra=dict(
                 type="vpal_ready_for_review_notification_already_sent_within_72hrs",
                 vpal_ready_for_review_notification_id=vpal_ready_for_review_notification.id,
@@ -1616,8 +1615,8 @@ def send_vpal_ready_for_review_follow_up():
                                                                application.customer.co_borrower_email,
                                                                application.get_buying_agent_email())
         if response.status_code == 200:
-            NotificationStatus.objects.create(status=NotificationStatus.SENT, application=application,
-                                              notification=vpal_ready_for_review_notification)
+            create_notification_status(status=NotificationStatus.SENT, application=application,
+                                       notification=vpal_ready_for_review_notification)
         else:
             logger.error("Non-success response code from send_vpal_ready_for_review_follow_up", extra=dict(
                 type="non_success_for_send_vpal_ready_for_review_follow_up",
@@ -1626,8 +1625,8 @@ def send_vpal_ready_for_review_follow_up():
                 application_id=application.id,
                 response=response.json()
             ))
-            NotificationStatus.objects.create(status=NotificationStatus.NOT_SENT, application=application,
-                                              notification=vpal_ready_for_review_notification,
-                                              reason=f"hubspot returned {response.status_code}")
+            create_notification_status(status=NotificationStatus.NOT_SENT, application=application,
+                                       notification=vpal_ready_for_review_notification,
+                                       reason=f"hubspot returned {response.status_code}")
     
 
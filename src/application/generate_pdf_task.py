@@ -1,15 +1,16 @@
+import hashlib
+import io
+import json
 import locale
 import logging
-import os
-import os.path
-from datetime import datetime
-from pathlib import Path
+from functools import cached_property
 
 import pdfrw
 
+from application import contract_template_cache
 from application.models.contract_template import ContractTemplate, BuyingState
 from application.models.offer import Offer
-from utils.aws import retrieve_contract_template, upload_homeward_contract
+from utils.aws import find_homeward_contract, upload_homeward_contract
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +21,10 @@ SUPPORTED_STATES = {
 }
 
 
+class ContractTemplateNotFound(Exception):
+    pass
+
+
 class ProcessPdf:
 
     def __init__(self, offer_id):
@@ -27,12 +32,26 @@ class ProcessPdf:
         # If template exists and is active we will try to pre-fill it
         self.contract_template = self.get_template(offer)
         self.offer = offer
-        self.temp_directory = str(Path(__file__).parent) + "/tmp/"
-        self.output_file = self.format_file_name()
+        self.output_file = None
 
     def format_file_name(self):
-        return self.offer.application.customer.name.split(" ")[-1] + "_" + datetime.now().strftime(
-            "%Y_%m_%d_%H_%M_%S") + ".pdf"
+        """
+        Names the contract after the customer and a hash of what goes into it, so the same contract is only stored
+        once however many times it is downloaded.
+        """
+        return self.offer.application.customer.name.split(" ")[-1] + "_" + self.contract_hash() + ".pdf"
+
+    @cached_property
+    def template_etag(self):
+        # the template file can be replaced in S3 under the same filename, which the database row doesn't see
+        return contract_template_cache.template_etag(self.contract_template.filename)
+
+    def contract_hash(self):
+        payload = json.dumps({'template': self.contract_template.filename,
+                              'template_version': str(self.contract_template.updated_at),
+                              'template_etag': self.template_etag,
+                              'data': self.contract_data()}, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
 
     def format_address_string(self, inline_address_string):
         address_first_letter_capitalized = inline_address_string.title()
@@ -42,22 +61,31 @@ class ProcessPdf:
         return correct_address_capitalization
 
     def add_data_to_pdf(self):
-        data = self.contract_data()
-        template_filename = self.contract_template.filename
-        downloaded_contract = retrieve_contract_template(template_filename)
-        template = pdfrw.PdfReader(downloaded_contract)
-        file_path = self.temp_directory + self.output_file
-        for page in template.pages:
-            annotations = page['/Annots']
-            if annotations is None:
-                continue
-            self.populate_annotations(annotations, data)
+        self.output_file = self.format_file_name()
+        existing_contract_url = find_homeward_contract(self.offer.id, self.output_file)
+        if existing_contract_url:
+            logger.info("Reusing stored offer contract", extra=dict(
+                type="offer_contract_reused",
+                offer_id=self.offer.id,
+                output_file=self.output_file
+            ))
+            return existing_contract_url
 
+        s3_url = upload_homeward_contract(self.render(), self.offer.id, self.output_file)
+        return s3_url
+
+    def render(self) -> io.BytesIO:
+        """
+        Fills the template in memory, so rendering never touches the worker's disk.
+        """
+        template, annotations = contract_template_cache.get_template(self.contract_template.filename)
+        self.populate_annotations(annotations, self.contract_data())
         template.Root.AcroForm.update(pdfrw.PdfDict(NeedAppearances=pdfrw.PdfObject('true')))
-        pdfrw.PdfWriter().write(file_path, template)
 
-        s3_url = upload_homeward_contract(file_path, self.offer.id, self.output_file)
-        return s3_url
+        contract = io.BytesIO()
+        pdfrw.PdfWriter().write(contract, template)
+        contract.seek(0)
+        return contract
 
     def populate_annotations(self, page_annotations, data):
         for annotation in page_annotations:
@@ -98,18 +126,6 @@ class ProcessPdf:
             else:
                 return pdfrw.PdfDict(V=pdfrw.objects.pdfstring.PdfString.encode(''))
 
-    def delete_temp_files(self):
-        path = self.temp_directory + self.output_file
-        try:
-            os.remove(path)
-        except Exception as e:
-            logger.exception("Exception raised while deleting the temp file in ProcessPdf", exc_info=e, extra=dict(
-                type="exception_during_temp_file_delete",
-                path=path,
-                temp_directory=self.temp_directory,
-                output_file=self.output_file
-            ))
-
     def get_template(self, offer: Offer):
         if offer.offer_property_address:
             state = offer.offer_property_address.state
@@ -131,7 +147,7 @@ class ProcessPdf:
                 property_type=offer.property_type,
                 contract_type=offer.contract_type
             ))
-            raise Exception('Contract template not found.')
+            raise ContractTemplateNotFound('Contract template not found.')
         return contract_template
 
     def contract_data(self):
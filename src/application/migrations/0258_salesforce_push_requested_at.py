@@ -0,0 +1,23 @@
+# Generated by Django 2.2.24 on 2026-10-18 01:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('application', '0257_pricing_shared_on_date'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='application',
+            name='salesforce_push_requested_at',
+            field=models.DateTimeField(blank=True, db_index=True, default=None, null=True),
+        ),
+        migrations.AddField(
+            model_name='offer',
+            name='salesforce_push_requested_at',
+            field=models.DateTimeField(blank=True, db_index=True, null=True),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 2.2.24 on 2026-10-18 01:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('application', '0258_salesforce_push_requested_at'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='notificationstatus',
+            index=models.Index(fields=['application', 'notification', 'status'], name='application_applica_ed0ce0_idx'),
+        ),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 2.2.24 on 2026-10-18 02:01
+
+from django.db import migrations, models
+from django.db.migrations import RunPython
+from django.db.models import Case, FloatField, Q, Sum, Value, When
+
+
+def fill_closing_capacity(apps, schema_editor):
+    Offer = apps.get_model("application", "Offer")
+    ClosingCapacity = apps.get_model("application", "ClosingCapacity")
+
+    # the weights of application.closing_capacity as of this migration
+    capacity_weight = Case(
+        When(Q(application__stage__in=['qualified application', 'floor price requested', 'floor price completed',
+                                       'approved', 'offer requested', 'offer submitted'],
+               status__in=['Requested', 'MOP Complete', 'Approved', 'Backup Position Accepted']),
+             then=Value(0.45)),
+        When(Q(application__stage__in=['option period', 'post option'], status='Won'), then=Value(1.0)),
+        default=Value(0.0), output_field=FloatField())
+    weighted_closings = Offer.objects.exclude(finance_approved_close_date=None) \
+        .annotate(capacity_weight=capacity_weight) \
+        .values('finance_approved_close_date') \
+        .annotate(weighted_offers=Sum('capacity_weight')) \
+        .values_list('finance_approved_close_date', 'weighted_offers')
+
+    ClosingCapacity.objects.bulk_create([ClosingCapacity(date=date, weighted_offers=weighted_offers)
+                                         for date, weighted_offers in weighted_closings])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('application', '0259_notification_status_lookup_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ClosingCapacity',
+            fields=[
+                ('date', models.DateField(primary_key=True, serialize=False)),
+                ('weighted_offers', models.FloatField(default=0.0)),
+                ('updated_at', models.DateTimeField(auto_now=True, db_index=True)),
+            ],
+        ),
+        migrations.RunPython(fill_closing_capacity, RunPython.noop),
+    ]
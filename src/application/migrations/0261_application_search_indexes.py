@@ -0,0 +1,37 @@
+# Generated by Django 2.2.24 on 2026-10-18 03:10
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+# (index, table, column) searched by ApplicationFilterSet with icontains. The indexes are on the expression that
+# icontains compiles to, UPPER(column::text), so Postgres can answer those LIKE queries with them.
+SEARCH_INDEXES = [
+    ('application_id_trgm', 'application_application', 'id'),
+    ('customer_name_trgm', 'application_customer', 'name'),
+    ('customer_email_trgm', 'application_customer', 'email'),
+    ('customer_phone_trgm', 'application_customer', 'phone'),
+    ('realestateagent_name_trgm', 'application_realestateagent', 'name'),
+    ('realestateagent_email_trgm', 'application_realestateagent', 'email'),
+    ('realestateagent_phone_trgm', 'application_realestateagent', 'phone'),
+    ('mortgagelender_name_trgm', 'application_mortgagelender', 'name'),
+    ('mortgagelender_email_trgm', 'application_mortgagelender', 'email'),
+    ('mortgagelender_phone_trgm', 'application_mortgagelender', 'phone'),
+    ('builder_company_name_trgm', 'application_builder', 'company_name'),
+]
+
+
+class Migration(migrations.Migration):
+    # indexes are built concurrently so the tables stay writable, which can't happen inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('application', '0260_closing_capacity'),
+    ]
+
+    operations = [TrigramExtension()] + [
+        migrations.RunSQL(
+            f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {index} ON {table} USING gin ((UPPER({column}::text)) gin_trgm_ops)',
+            f'DROP INDEX CONCURRENTLY IF EXISTS {index}',
+        )
+        for index, table, column in SEARCH_INDEXES
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 2.2.24 on 2026-10-18 02:05
+
+import re
+
+from django.db import migrations, models
+from django.db.migrations import RunPython
+
+
+def address_search_text(*parts) -> str:
+    # application.models.address.address_search_text as of this migration
+    text = ' '.join(part for part in parts if part)
+    return ' '.join(re.sub(r'[^\w\s]', ' ', text.lower()).split())
+
+
+def fill_search_text(apps, schema_editor):
+    Address = apps.get_model("application", "Address")
+
+    batch = []
+    for address in Address.objects.only('id', 'street', 'city', 'state', 'zip').iterator(chunk_size=2000):
+        address.search_text = address_search_text(address.street, address.city, address.state, address.zip)
+        batch.append(address)
+        if len(batch) == 2000:
+            Address.objects.bulk_update(batch, ['search_text'])
+            batch = []
+    Address.objects.bulk_update(batch, ['search_text'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('application', '0261_application_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='address',
+            name='search_text',
+            field=models.TextField(blank=True, default=''),
+        ),
+        migrations.RunPython(fill_search_text, RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 2.2.24 on 2026-10-18 02:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('application', '0262_address_search_text'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pricing',
+            name='salesforce_push_requested_at',
+            field=models.DateTimeField(blank=True, db_index=True, null=True),
+        ),
+    ]
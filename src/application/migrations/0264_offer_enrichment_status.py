@@ -0,0 +1,23 @@
+# Generated by Django 2.2.24 on 2026-10-18 02:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('application', '0263_pricing_salesforce_push_requested_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='offer',
+            name='enriched_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='offer',
+            name='enrichment_status',
+            field=models.TextField(blank=True, choices=[('Pending', 'Pending'), ('Complete', 'Complete'), ('Failed', 'Failed')], null=True),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 2.2.24 on 2026-10-18 02:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('application', '0264_offer_enrichment_status'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='application',
+            name='salesforce_push_attempts',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='offer',
+            name='salesforce_push_attempts',
+            field=models.IntegerField(default=0),
+        ),
+    ]
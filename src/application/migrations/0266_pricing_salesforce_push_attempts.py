@@ -0,0 +1,18 @@
+# Generated by Django 2.2.24 on 2026-10-18 02:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('application', '0265_salesforce_push_attempts'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pricing',
+            name='salesforce_push_attempts',
+            field=models.IntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 2.2.24 on 2026-10-18 03:40
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # the index is built concurrently so addresses stay writable, which can't happen inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('application', '0266_pricing_salesforce_push_attempts'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(
+                    'CREATE INDEX CONCURRENTLY IF NOT EXISTS address_search_text_trgm ON application_address '
+                    'USING gin (search_text gin_trgm_ops)',
+                    'DROP INDEX CONCURRENTLY IF EXISTS address_search_text_trgm',
+                ),
+            ],
+            state_operations=[
+                migrations.AddIndex(
+                    model_name='address',
+                    index=django.contrib.postgres.indexes.GinIndex(fields=['search_text'],
+                                                                   name='address_search_text_trgm',
+                                                                   opclasses=['gin_trgm_ops']),
+                ),
+            ],
+        ),
+    ]
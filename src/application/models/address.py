@@ -1,4 +1,6 @@
+import re
 from enum import Enum
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 
 from utils.models import CustomBaseModelMixin
@@ -11,6 +13,19 @@ class SalesforceAddressType(str, Enum):
     BUYING_LOCATION = "buying location"
     GENERAL_ADDRESS = "general address"
 
+
+def normalize_search_text(text: str) -> str:
+    """
+    Lowercases text and reduces punctuation and runs of whitespace to single spaces, so that searches match
+    addresses however they were typed.
+    """
+    return ' '.join(re.sub(r'[^\w\s]', ' ', text.lower()).split())
+
+
+def address_search_text(street=None, city=None, state=None, zip=None) -> str:
+    return normalize_search_text(' '.join(part for part in [street, city, state, zip] if part))
+
+
 class Address(CustomBaseModelMixin, SalesforceModelMixin):
     # Salesforce fields
     BILLING_STREET_FIELD = 'BillingStreet'
@@ -40,6 +55,20 @@ class Address(CustomBaseModelMixin, SalesforceModelMixin):
     state = models.CharField(max_length=255, blank=True, null=True)
     zip = models.CharField(max_length=255, blank=True, null=True)
     unit = models.CharField(max_length=255, blank=True, null=True)
+    # street, city, state and zip as searched by the application filters, kept up to date on save
+    search_text = models.TextField(blank=True, default='')
+
+    class Meta:
+        indexes = [
+            GinIndex(fields=['search_text'], name='address_search_text_trgm', opclasses=['gin_trgm_ops'])
+        ]
+
+    def save(self, *args, **kwargs):
+        self.search_text = address_search_text(self.street, self.city, self.state, self.zip)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and {'street', 'city', 'state', 'zip'}.intersection(update_fields):
+            kwargs['update_fields'] = set(update_fields) | {'search_text'}
+        super().save(*args, **kwargs)
 
     def get_inline_address(self):
         """
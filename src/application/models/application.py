@@ -7,6 +7,7 @@ from django.contrib.postgres.fields import JSONField, ArrayField
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import models
 from django.db.models import Index
+from django.utils import timezone
 
 from application import constants
 from application.models.address import Address, SalesforceAddressType
@@ -268,6 +269,8 @@ class Application(CustomBaseModelMixin, SalesforceModelMixin, ModelDiffMixin):
     pushed_to_hubspot_on = models.DateTimeField(default=None, blank=True, null=True, )
     hubspot_context = JSONField(null=True, blank=True)
     pushed_to_salesforce_on = models.DateTimeField(default=None, blank=True, null=True, )
+    salesforce_push_requested_at = models.DateTimeField(default=None, blank=True, null=True, db_index=True)
+    salesforce_push_attempts = models.IntegerField(default=0)
     new_salesforce = models.CharField(max_length=255, editable=False, blank=True, null=True)
     utm = JSONField(blank=True, null=True, default=dict)
     lead_source = models.CharField(max_length=255, blank=True, null=True)
@@ -402,8 +405,8 @@ class Application(CustomBaseModelMixin, SalesforceModelMixin, ModelDiffMixin):
             return self.build_resume_link()
 
     def are_all_tasks_complete(self) -> bool:
-        return all([status.status == TaskProgress.COMPLETED for status in self.task_statuses
-                   .exclude(task_obj__category=TaskCategory.HOMEWARD_MORTGAGE).all()])
+        return not self.task_statuses.exclude(task_obj__category=TaskCategory.HOMEWARD_MORTGAGE) \
+            .exclude(status=TaskProgress.COMPLETED).exists()
 
     def get_buying_agent_email(self) -> str:
         if self.buying_agent is not None and self.buying_agent.email is not None:
@@ -569,5 +572,12 @@ class Application(CustomBaseModelMixin, SalesforceModelMixin, ModelDiffMixin):
     def salesforce_object_type(self):
         return SalesforceObjectType.ACCOUNT
 
+    def request_salesforce_push(self):
+        """
+        Marks the application to be sent to salesforce with the next batch, see application.salesforce_push_tasks.
+        """
+        Application.objects.filter(pk=self.pk).update(salesforce_push_requested_at=timezone.now(),
+                                                      salesforce_push_attempts=0)
+
     def is_hw_mortgage_candidate(self):
         return self.hw_mortgage_candidate == "Yes - Required" or self.hw_mortgage_candidate == "Yes"
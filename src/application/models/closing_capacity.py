@@ -0,0 +1,11 @@
+from django.db import models
+
+
+class ClosingCapacity(models.Model):
+    """
+    Weighted number of offers scheduled to close on a day, kept up to date from the offers themselves so that restricted
+    dates are read instead of aggregated on every request.
+    """
+    date = models.DateField(primary_key=True)
+    weighted_offers = models.FloatField(default=0.0)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
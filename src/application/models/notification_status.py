@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models import Index
 
 from application.models.application import Application
 from application.models.notification import Notification
@@ -14,3 +15,8 @@ class NotificationStatus(CustomBaseModelMixin):
     application = models.ForeignKey(Application, on_delete=models.CASCADE)
     status = models.CharField(max_length=50)
     reason = models.TextField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            Index(fields=['application', 'notification', 'status'])
+        ]
@@ -2,12 +2,14 @@ import logging
 from enum import Enum
 
 from django.db import models
+from django.utils import timezone
 
 from application.models.address import Address
 from application.models.application import Application
 from application.models.new_home_purchase import NewHomePurchase
-from utils.models import CustomBaseModelMixin
-from utils.property_data_aggregator import PropertyDataAggregatorClient, PropertyDataAggregatorClientException
+from utils.models import CustomBaseModelMixin, LoadedValuesMixin
+from utils.outbox import publish_on_commit
+from utils.property_data_aggregator import PropertyDataAggregatorClient
 from utils.salesforce_model_mixin import SalesforceModelMixin, SalesforceObjectType
 
 logger = logging.getLogger(__name__)
@@ -66,7 +68,14 @@ class OfferStatus(str, Enum):
     CONTRACT_CANCELLED = 'Contract Cancelled'
 
 
-class Offer(CustomBaseModelMixin, SalesforceModelMixin):
+class OfferEnrichmentStatus(str, Enum):
+    # progress of the listing enrichment that runs after the listing of an offer is picked
+    PENDING = 'Pending'
+    COMPLETE = 'Complete'
+    FAILED = 'Failed'
+
+
+class Offer(LoadedValuesMixin, CustomBaseModelMixin, SalesforceModelMixin):
     # Salesforce Fields
     OFFER_SALESFORCE_ID = 'Id'
     OFFER_TRANSACTION_ID = 'Offer__c'
@@ -94,6 +103,14 @@ class Offer(CustomBaseModelMixin, SalesforceModelMixin):
     FINANCE_APPROVED_CLOSE_DATE = 'Finance_Approved_Closed_Date__c'
 
     pda_enrichment_fields = [('office_name', 'office_name')]
+    # persisted values save() compares against, remembered when the offer is loaded
+    tracked_fields = ['pda_listing_uuid', 'offer_property_address', 'finance_approved_close_date', 'status']
+    listing_fields = ['mls_listing_id', 'year_built', 'home_square_footage', 'photo_url', 'bedrooms', 'bathrooms',
+                      'hoa', 'less_than_one_acre', 'home_list_price', 'offer_property_address'] + \
+                     [field[0] for field in pda_enrichment_fields]
+    # written by enrich_offer and application.salesforce_push_tasks
+    background_fields = listing_fields + ['enrichment_status', 'enriched_at', 'salesforce_id',
+                                          'salesforce_push_requested_at', 'salesforce_push_attempts']
 
     application = models.ForeignKey(Application, on_delete=models.CASCADE, related_name="offers")
     year_built = models.IntegerField(blank=True, null=True)
@@ -114,6 +131,8 @@ class Offer(CustomBaseModelMixin, SalesforceModelMixin):
                                                null=True)
     status = models.TextField(default='Incomplete', choices=[(tag.value, tag.value) for tag in OfferStatus])
     salesforce_id = models.TextField(blank=True, null=True, unique=True)
+    salesforce_push_requested_at = models.DateTimeField(blank=True, null=True, db_index=True)
+    salesforce_push_attempts = models.IntegerField(default=0)
     pda_listing_uuid = models.UUIDField(blank=True, null=True)  # property data aggregator listing model uuid
     mls_listing_id = models.TextField(blank=True, null=True)  # mls id
     bedrooms = models.DecimalField(max_digits=11, decimal_places=2, blank=True, null=True)
@@ -126,6 +145,9 @@ class Offer(CustomBaseModelMixin, SalesforceModelMixin):
     finance_approved_close_date = models.DateField(blank=True, null=True)
     office_name = models.TextField(blank=True, null=True)
     new_home_purchase = models.OneToOneField(NewHomePurchase, related_name='offer', on_delete=models.CASCADE, blank=True, null=True)
+    enrichment_status = models.TextField(blank=True, null=True,
+                                         choices=[(tag.value, tag.value) for tag in OfferEnrichmentStatus])
+    enriched_at = models.DateTimeField(blank=True, null=True)
 
     def __init__(self, *args, **kwargs):
         self._is_save_from_salesforce = False
@@ -168,62 +190,84 @@ class Offer(CustomBaseModelMixin, SalesforceModelMixin):
         }
 
     def save(self, *args, **kwargs):
-        if self.pda_listing_uuid:
-            self.attempt_enrich_from_property_data_aggregator()
-        else:
+        if not self.pda_listing_uuid:
             self.clear_pda_listing_info()
 
-        if self.status != 'Incomplete' and not self.is_save_from_salesforce:
-            self.attempt_push_to_salesforce()
+        fetch_listing = bool(self.pda_listing_uuid) and self.pda_listing_uuid != self.loaded_value('pda_listing_uuid')
+        push = self.status != OfferStatus.INCOMPLETE and not self.is_save_from_salesforce
+        changed_fields = set()
+        if fetch_listing:
+            self.enrichment_status = OfferEnrichmentStatus.PENDING
+            changed_fields.add('enrichment_status')
+        elif push:
+            # sent with the next batch, see application.salesforce_push_tasks
+            self.salesforce_push_requested_at = timezone.now()
+            self.salesforce_push_attempts = 0
+            changed_fields |= {'salesforce_push_requested_at', 'salesforce_push_attempts'}
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and changed_fields:
+            kwargs['update_fields'] = set(update_fields) | changed_fields
 
         super(Offer, self).save(*args, **kwargs)
 
-    def attempt_enrich_from_property_data_aggregator(self):
-        old_pda_listing_uuid = Offer.objects.get(id=self.id).pda_listing_uuid if self.created_at else None
-        if old_pda_listing_uuid != self.pda_listing_uuid:
-            try:
-                listing_info = PropertyDataAggregatorClient().get_listing(self.pda_listing_uuid)
-                self.mls_listing_id = listing_info.get("listing_id")
-                self.year_built = listing_info.get("year_built")
-                self.home_square_footage = listing_info.get("square_feet")
-                self.photo_url = listing_info.get("photo_url")
-                self.bedrooms = listing_info.get("total_bedrooms")
-                self.bathrooms = listing_info.get("total_bathrooms")
-                self.hoa = listing_info.get("has_hoa")
-                for field in self.pda_enrichment_fields:
-                    setattr(self, field[0], listing_info.get(field[1]))
-
-
-                try:
-                    acres_num = float(listing_info.get("acres"))
-                    self.less_than_one_acre = acres_num < 1
-                except (ValueError, TypeError):
-                    self.less_than_one_acre = None
-
-                self.home_list_price = listing_info.get("listing_price")
-
-                if self.offer_property_address:
-                    self.offer_property_address.street = listing_info.get('display_address')
-                    self.offer_property_address.city = listing_info.get('city')
-                    self.offer_property_address.state = listing_info.get('state')
-                    self.offer_property_address.zip = listing_info.get('postal_code')
-                    self.offer_property_address.save()
-                else:
-                    self.offer_property_address = Address.objects.create(street=listing_info.get('display_address'),
-                                                                         city=listing_info.get('city'),
-                                                                         state=listing_info.get('state'),
-                                                                         zip=listing_info.get('postal_code'))
-            except PropertyDataAggregatorClientException:
-                pass
+        if fetch_listing:
+            # the listing is slow to fetch, so it is left to a job that runs once the offer is committed. The job
+            # requests the salesforce push once the offer is enriched.
+            from application.tasks import enrich_offer
+            publish_on_commit(enrich_offer, args=[self.id, push])
+
+    def enrich_from_property_data_aggregator(self):
+        """
+        Copies the details of the listing onto the offer. The fields are written with update(), so nothing else that
+        changed on the offer in the meantime is overwritten. Raises PropertyDataAggregatorClientException when the
+        listing can't be fetched.
+        """
+        listing_info = PropertyDataAggregatorClient().get_listing(self.pda_listing_uuid)
+        fields = {
+            'mls_listing_id': listing_info.get("listing_id"),
+            'year_built': listing_info.get("year_built"),
+            'home_square_footage': listing_info.get("square_feet"),
+            'photo_url': listing_info.get("photo_url"),
+            'bedrooms': listing_info.get("total_bedrooms"),
+            'bathrooms': listing_info.get("total_bathrooms"),
+            'hoa': listing_info.get("has_hoa"),
+            'home_list_price': listing_info.get("listing_price"),
+        }
+        for field in self.pda_enrichment_fields:
+            fields[field[0]] = listing_info.get(field[1])
+
+        try:
+            acres_num = float(listing_info.get("acres"))
+            fields['less_than_one_acre'] = acres_num < 1
+        except (ValueError, TypeError):
+            fields['less_than_one_acre'] = None
+
+        if self.offer_property_address:
+            self.offer_property_address.street = listing_info.get('display_address')
+            self.offer_property_address.city = listing_info.get('city')
+            self.offer_property_address.state = listing_info.get('state')
+            self.offer_property_address.zip = listing_info.get('postal_code')
+            self.offer_property_address.save()
+        else:
+            fields['offer_property_address'] = Address.objects.create(street=listing_info.get('display_address'),
+                                                                      city=listing_info.get('city'),
+                                                                      state=listing_info.get('state'),
+                                                                      zip=listing_info.get('postal_code'))
+
+        # a listing picked after this one was fetched wins
+        Offer.objects.filter(pk=self.pk, pda_listing_uuid=self.pda_listing_uuid).update(**fields)
+        for field, value in fields.items():
+            setattr(self, field, value)
 
     def clear_pda_listing_info(self):
         # skip record if being created or synced from salesforce
         if not self.created_at or self._is_save_from_salesforce:
             return
 
-        old_offer_property = Offer.objects.get(id=self.id).offer_property_address
         # need this check for patching single listing fields where offer property address does not change
-        if old_offer_property != self.offer_property_address:
+        if self.loaded_value('offer_property_address') != self.offer_property_address_id:
+            # written even where they look unchanged, an enrichment may have filled them in since the offer was loaded
+            self.forget_loaded_values(*self.listing_fields)
             self.pda_listing_uuid = None
             self.mls_listing_id = None
             self.year_built = None
@@ -234,7 +278,17 @@ class Offer(CustomBaseModelMixin, SalesforceModelMixin):
             self.less_than_one_acre = None
             self.home_list_price = None
 
-    def attempt_push_to_salesforce(self):
+    def request_salesforce_push(self):
+        """
+        Marks the offer to be sent to salesforce with the next batch, see application.salesforce_push_tasks.
+        """
+        Offer.objects.filter(pk=self.pk).update(salesforce_push_requested_at=timezone.now(),
+                                                salesforce_push_attempts=0)
+
+    def attempt_push_to_salesforce(self) -> bool:
+        """
+        Sends the offer to salesforce, setting salesforce_id when the object is created. Returns whether it succeeded.
+        """
         from utils.salesforce import homeward_salesforce
         try:
             if self.salesforce_id:
@@ -252,3 +306,5 @@ class Offer(CustomBaseModelMixin, SalesforceModelMixin):
                 type="failed_sending_offer_to_salesforce_in_push",
                 offer_id=self.id
             ))
+            return False
+        return True
@@ -4,18 +4,19 @@ from enum import Enum
 from django.conf import settings
 from django.contrib.postgres.fields import ArrayField, JSONField
 from django.db import models
+from django.utils import timezone
 
 from application.models.address import Address
 from application.models.application import Application, ProductOffering
 from application.models.real_estate_agent import RealEstateAgent
-from utils.models import CustomBaseModelMixin
-from utils.salesforce import homeward_salesforce, SalesforceObjectType
+from utils.models import CustomBaseModelMixin, LoadedValuesMixin
+from utils.salesforce import SalesforceObjectType
 from utils.salesforce_model_mixin import SalesforceModelMixin
 
 logger = logging.getLogger(__name__)
 
 
-class Pricing(CustomBaseModelMixin, SalesforceModelMixin):
+class Pricing(LoadedValuesMixin, CustomBaseModelMixin, SalesforceModelMixin):
     
     class FilterStatus(str, Enum):
         ARCHIVED = 'Archived'
@@ -54,8 +55,12 @@ class Pricing(CustomBaseModelMixin, SalesforceModelMixin):
     other things!
     """
     salesforce_id = models.TextField(blank=True, null=True)
+    salesforce_push_requested_at = models.DateTimeField(blank=True, null=True, db_index=True)
+    salesforce_push_attempts = models.IntegerField(default=0)
 
     salesforce_object_type = SalesforceObjectType.QUOTE
+    # stored by application.salesforce_push_tasks
+    background_fields = ['salesforce_id']
 
     def salesforce_field_mapping(self):
         base_payload = {
@@ -263,20 +268,12 @@ class Pricing(CustomBaseModelMixin, SalesforceModelMixin):
     def save(self, *args, **kwargs):
         if self.buying_location and self.min_price is not None and self.max_price is not None:
             self.calculate_pricing()
-        try:
-            if self.salesforce_id:
-                homeward_salesforce.update_salesforce_object(self.salesforce_id,
-                                                             self.to_salesforce_representation(),
-                                                             self.salesforce_object_type)
-            else:
-                salesforce_id = homeward_salesforce.create_new_salesforce_object(self.to_salesforce_representation(),
-                                                                                 self.salesforce_object_type)
-                self.salesforce_id = salesforce_id
-        except Exception as e:
-            logger.error("Failed sending quote to salesforce", exc_info=e, extra=dict(
-                type="failed_sending_quote_to_salesforce",
-                pricing_id=self.id
-            ))
+        # the quote is sent to salesforce with the next batch, see application.salesforce_push_tasks
+        self.salesforce_push_requested_at = timezone.now()
+        self.salesforce_push_attempts = 0
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = set(update_fields) | {'salesforce_push_requested_at', 'salesforce_push_attempts'}
         return super(Pricing, self).save(*args, **kwargs)
 
     def get_resume_link(self):
@@ -0,0 +1,42 @@
+"""
+Registry of Notification rows and the "already sent" check used by the email tasks.
+
+The notification table is small and rarely changes, yet nearly every email task reads a row from it to check whether
+the notification is active and which template it uses, so rows are served from an in-process registry.
+"""
+from typing import Iterable, Optional, Union
+
+from application.email_dispatcher import pending_notification_statuses
+from application.models.application import Application
+from application.models.notification import Notification
+from application.models.notification_status import NotificationStatus
+from utils.model_registry import ModelRegistry
+
+registry = ModelRegistry(Notification, 'NOTIFICATION_REGISTRY_TTL_SECONDS', indexes=[('name',)])
+
+
+def get_notification(name: str) -> Notification:
+    return registry.get(name=name)
+
+
+def notification_status_exists(application: Application,
+                               notifications: Union[Notification, Iterable[Notification]],
+                               status: Optional[str] = None) -> bool:
+    """
+    Tells whether the application already has a status for any of the notifications, optionally limited to one
+    status. Statuses recorded earlier by the same task of a batch dispatch count even though they are not written
+    yet.
+    """
+    if isinstance(notifications, Notification):
+        notifications = [notifications]
+    notification_ids = {notification.id for notification in notifications}
+    for pending in pending_notification_statuses():
+        if pending.application_id == application.id and pending.notification_id in notification_ids \
+                and (status is None or pending.status == status):
+            return True
+
+    queryset = NotificationStatus.objects.filter(application=application, notification_id__in=notification_ids)
+    if status is not None:
+        queryset = queryset.filter(status=status)
+    return queryset.exists()
+
@@ -0,0 +1,65 @@
+"""
+Offer contract generation jobs.
+
+Rendering a contract takes several seconds, so the API starts a job and lets the client poll it instead of holding a
+web worker until the PDF is ready. A job is identified by a hash of the template and the data filled into it, so
+asking again for the contract of an unchanged offer returns the job that is already running or done.
+"""
+from enum import Enum
+from typing import Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+
+from application.generate_pdf_task import ProcessPdf
+from utils.aws import find_homeward_contract
+
+JOB_KEY = 'offer-contract-job:{}:{}'
+# time limit of the rendering task. A pending job lasts as long, so a job is only started over once its task is gone.
+RENDER_TIME_LIMIT_SECONDS = 600
+
+
+class ContractJobStatus(str, Enum):
+    PENDING = 'pending'
+    READY = 'ready'
+    FAILED = 'failed'
+
+
+def get_job(offer_id, job_id: str) -> Optional[dict]:
+    return cache.get(JOB_KEY.format(offer_id, job_id))
+
+
+def claim_job(offer_id) -> Tuple[dict, bool]:
+    """
+    Returns the job for the current contract of the offer and whether it was just created, in which case the caller
+    queues the rendering. Failed jobs are started over, and a contract already stored for the offer as it is now comes
+    back as a ready job without rendering. Raises ContractTemplateNotFound, or ValueError when the offer has no
+    property address, and lets cache errors through.
+    """
+    pdf = ProcessPdf(offer_id)
+    job_id = pdf.contract_hash()
+    job = {'job_id': job_id, 'status': ContractJobStatus.PENDING}
+    key = JOB_KEY.format(offer_id, job_id)
+    # a worker that died mid-render leaves a pending job behind until it times out
+    if not cache.add(key, job, RENDER_TIME_LIMIT_SECONDS):
+        existing_job = cache.get(key)
+        if existing_job is not None and existing_job['status'] != ContractJobStatus.FAILED:
+            return existing_job, False
+        cache.set(key, job, RENDER_TIME_LIMIT_SECONDS)
+
+    stored_url = find_homeward_contract(offer_id, pdf.format_file_name())
+    if stored_url:
+        finish_job(offer_id, job_id, stored_url)
+        return get_job(offer_id, job_id), False
+    return job, True
+
+
+def finish_job(offer_id, job_id: str, url: Optional[str]):
+    if url:
+        # presigned urls are valid for 10 minutes, the job must not outlive them
+        job = {'job_id': job_id, 'status': ContractJobStatus.READY, 'url': url}
+        timeout = int(getattr(settings, 'OFFER_CONTRACT_URL_TTL_SECONDS', 8 * 60))
+    else:
+        job = {'job_id': job_id, 'status': ContractJobStatus.FAILED}
+        timeout = 60
+    cache.set(JOB_KEY.format(offer_id, job_id), job, timeout)
@@ -0,0 +1,271 @@
+"""
+Batched pushes to Salesforce.
+
+Instead of pushing every change as soon as it happens, callers mark a record as pending with
+`Application.request_salesforce_push`/`Offer.request_salesforce_push`, and every saved quote is pending. A periodic
+task collects everything that became pending during the last window and sends it through the sObject Collections API,
+up to 200 records per call. Records which Salesforce does not know about yet still go through the single record push,
+which creates them. Only one run pushes at a time, so a run outlasting the window can't create a record twice.
+
+A push request is only cleared once Salesforce accepted the record. When a call raises the batch stays pending for the
+next window, and records Salesforce rejects are retried up to SALESFORCE_PUSH_MAX_ATTEMPTS times.
+"""
+import logging
+from datetime import timedelta
+from typing import Callable, Dict, Iterable, List
+
+from celery.task import periodic_task
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F
+from django.utils import timezone
+
+from application.models.application import Application
+from application.models.offer import Offer
+from application.models.pricing import Pricing
+from application.tasks import push_current_home_to_salesforce, push_to_salesforce
+from utils import salesforce_id_resolver
+from utils.salesforce import SalesforceException, homeward_salesforce
+from utils.salesforce_model_mixin import SalesforceObjectType
+
+logger = logging.getLogger(__name__)
+
+SALESFORCE_PUSH_BATCH_WINDOW = timedelta(seconds=int(getattr(settings, 'SALESFORCE_PUSH_BATCH_WINDOW_SECONDS', 30)))
+PUSH_LOCK_KEY = 'salesforce-push-pending'
+# time limit of a run. The lock lasts as long, so it is only taken over once the run holding it is gone.
+PUSH_TIME_LIMIT_SECONDS = int(getattr(settings, 'SALESFORCE_PUSH_TIME_LIMIT_SECONDS', 15 * 60))
+
+
+@periodic_task(run_every=SALESFORCE_PUSH_BATCH_WINDOW, time_limit=PUSH_TIME_LIMIT_SECONDS,
+               options={'queue': 'application-service-tasks'})
+def push_pending_to_salesforce():
+    started_at = timezone.now()
+    if not cache.add(PUSH_LOCK_KEY, str(started_at), PUSH_TIME_LIMIT_SECONDS):
+        # the previous run is still pushing, what became pending since is left to the next window
+        logger.info("Skipping salesforce batch push while the previous one runs", extra=dict(
+            type="salesforce_batch_push_skipped",
+            started_at=started_at
+        ))
+        return
+
+    try:
+        push_pending_applications(started_at)
+        push_pending_offers(started_at)
+        push_pending_quotes(started_at)
+    finally:
+        cache.delete(PUSH_LOCK_KEY)
+
+
+def chunks(items: List, size: int) -> Iterable[List]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def log_failed_records(failures: Dict, object_type: SalesforceObjectType):
+    for record_id, errors in failures.items():
+        logger.error("Salesforce rejected record during batch push", extra=dict(
+            type="salesforce_rejected_record_during_batch_push",
+            record_id=record_id,
+            object_type=object_type,
+            errors=errors
+        ))
+
+
+def push_pending_applications(started_at):
+    # applications sharing an account are sent as the one changed last
+    pending = Application.objects.filter(salesforce_push_requested_at__lte=started_at) \
+        .select_related('customer', 'current_home', 'current_home__address', 'current_home__floor_price',
+                        'listing_agent', 'buying_agent', 'mortgage_lender', 'home_buying_location',
+                        'offer_property_address') \
+        .order_by(F('updated_at').asc(nulls_first=True))
+
+    for batch in chunks(list(pending), homeward_salesforce.COLLECTION_BATCH_SIZE):
+        accepted = []
+        rejected = []
+        known = {}
+        account_ids = salesforce_id_resolver.resolve_account_ids(batch)
+        newly_resolved = []
+        for application in batch:
+            if application.id in account_ids:
+                if not application.new_salesforce:
+                    newly_resolved.append(application)
+                application.new_salesforce = account_ids[application.id]
+                known.setdefault(application.new_salesforce, []).append(application)
+            else:
+                # the account has to be created first
+                (accepted if push_new_application(application.id) else rejected).append(application.id)
+
+        for application in newly_resolved:
+            Application.objects.filter(pk=application.id).update(new_salesforce=application.new_salesforce)
+
+        if known:
+            try:
+                results = homeward_salesforce.update_salesforce_objects(
+                    {sf_id: applications[-1].to_salesforce_representation() for sf_id, applications in known.items()},
+                    SalesforceObjectType.ACCOUNT)
+            except SalesforceException as e:
+                # the batch stays pending for the next window
+                logger.exception("Salesforce raised exception during batch push", exc_info=e, extra=dict(
+                    type="salesforce_exception_during_batch_push",
+                    application_ids=[application.id for applications in known.values() for application in applications]
+                ))
+                results = {}
+
+            now = timezone.now()
+            updated = [application for sf_id, errors in results.items() if not errors for application in known[sf_id]]
+            failed = {application.id: errors for sf_id, errors in results.items() if errors
+                      for application in known[sf_id]}
+            log_failed_records(failed, SalesforceObjectType.ACCOUNT)
+            Application.objects.filter(pk__in=[application.id for application in updated]) \
+                .update(pushed_to_salesforce_on=now, updated_at=now)
+            push_current_homes(updated)
+            accepted += [application.id for application in updated]
+            rejected += list(failed)
+
+        settle_push_requests(Application, accepted, rejected, started_at)
+
+
+def push_new_application(application_id) -> bool:
+    try:
+        return push_to_salesforce(application_id) is not False
+    except Exception as e:
+        logger.exception("Unable to push application to salesforce during batch push", exc_info=e, extra=dict(
+            type="single_push_failed_during_batch_push",
+            application_id=application_id
+        ))
+        return False
+
+
+def settle_push_requests(model, accepted: List, rejected: List, started_at):
+    """
+    Clears the push requests of the records Salesforce accepted. Rejected records stay pending until they were rejected
+    SALESFORCE_PUSH_MAX_ATTEMPTS times in a row, anything else stays pending for the next window.
+    """
+    # anything re-requested while this batch was in flight stays pending for the next window
+    requested = model.objects.filter(salesforce_push_requested_at__lte=started_at)
+    requested.filter(pk__in=accepted).update(salesforce_push_requested_at=None, salesforce_push_attempts=0)
+    if not rejected:
+        return
+
+    requested.filter(pk__in=rejected).update(salesforce_push_attempts=F('salesforce_push_attempts') + 1)
+    given_up = requested.filter(pk__in=rejected,
+                                salesforce_push_attempts__gte=int(getattr(settings, 'SALESFORCE_PUSH_MAX_ATTEMPTS', 5)))
+    given_up_ids = list(given_up.values_list('pk', flat=True))
+    if given_up_ids:
+        logger.error("Gave up pushing records Salesforce keeps rejecting", extra=dict(
+            type="salesforce_batch_push_given_up",
+            record_ids=given_up_ids,
+            model=model.__name__
+        ))
+        given_up.update(salesforce_push_requested_at=None)
+
+
+def push_current_homes(applications: List[Application]):
+    known = {}
+    for application in applications:
+        current_home = application.current_home
+        if current_home is None:
+            continue
+        if current_home.salesforce_id:
+            known[current_home.salesforce_id] = current_home.to_salesforce_representation(
+                application.new_salesforce)
+        else:
+            push_current_home_to_salesforce(application.id)
+
+    if not known:
+        return
+
+    try:
+        results = homeward_salesforce.update_salesforce_objects(known, SalesforceObjectType.OLD_HOME)
+    except SalesforceException as e:
+        logger.exception("Salesforce raised exception during batch push of current homes", exc_info=e, extra=dict(
+            type="salesforce_exception_during_current_home_batch_push",
+            current_home_salesforce_ids=list(known)
+        ))
+        return
+    log_failed_records({sf_id: errors for sf_id, errors in results.items() if errors},
+                       SalesforceObjectType.OLD_HOME)
+
+
+def push_pending_offers(started_at):
+    pending = Offer.objects.filter(salesforce_push_requested_at__lte=started_at) \
+        .exclude(status='Incomplete') \
+        .select_related('application', 'offer_property_address')
+
+    for batch in chunks(list(pending), homeward_salesforce.COLLECTION_BATCH_SIZE):
+        push_records(Offer, batch, SalesforceObjectType.OFFER, offer_representation, started_at)
+
+
+def offer_representation(offer: Offer, creating: bool) -> dict:
+    data = offer.to_salesforce_representation()
+    if not creating:
+        # the customer is only sent when the offer is created
+        data.pop(Offer.CUSTOMER_FIELD, None)
+    return data
+
+
+def push_records(model, batch: List, object_type: SalesforceObjectType, representation: Callable, started_at):
+    """
+    Updates the records of the batch Salesforce knows and creates the others, storing their new ids, then settles their
+    push requests. A call that raises leaves its records pending.
+    """
+    accepted = []
+    rejected = []
+    known = {record.salesforce_id: record for record in batch if record.salesforce_id}
+    new = [record for record in batch if not record.salesforce_id]
+
+    if known:
+        try:
+            results = homeward_salesforce.update_salesforce_objects(
+                {sf_id: representation(record, False) for sf_id, record in known.items()}, object_type)
+        except SalesforceException as e:
+            log_batch_exception(e, list(known.values()), object_type)
+        else:
+            log_failed_records({known[sf_id].id: errors for sf_id, errors in results.items() if errors}, object_type)
+            accepted += [known[sf_id].id for sf_id, errors in results.items() if not errors]
+            rejected += [known[sf_id].id for sf_id, errors in results.items() if errors]
+
+    if new:
+        try:
+            created = homeward_salesforce.create_new_salesforce_objects(
+                [representation(record, True) for record in new], object_type)
+        except SalesforceException as e:
+            log_batch_exception(e, new, object_type)
+        else:
+            for record, (salesforce_id, errors) in zip(new, created):
+                if errors:
+                    log_failed_records({record.id: errors}, object_type)
+                    rejected.append(record.id)
+                else:
+                    store_salesforce_id(model, record, salesforce_id)
+                    accepted.append(record.id)
+
+    settle_push_requests(model, accepted, rejected, started_at)
+
+
+def store_salesforce_id(model, record, salesforce_id: str):
+    if not model.objects.filter(pk=record.pk, salesforce_id__isnull=True).update(salesforce_id=salesforce_id):
+        logger.error("Record got a salesforce id while it was being created", extra=dict(
+            type="salesforce_id_already_stored_during_batch_push",
+            record_id=record.id,
+            model=model.__name__,
+            salesforce_id=salesforce_id
+        ))
+
+
+def log_batch_exception(exception: SalesforceException, records: List, object_type: SalesforceObjectType):
+    # the records stay pending for the next window
+    logger.exception("Salesforce raised exception during batch push", exc_info=exception, extra=dict(
+        type="salesforce_exception_during_record_batch_push",
+        record_ids=[record.id for record in records],
+        object_type=object_type
+    ))
+
+
+def push_pending_quotes(started_at):
+    pending = Pricing.objects.filter(salesforce_push_requested_at__lte=started_at) \
+        .select_related('buying_location', 'agent', 'application')
+
+    for batch in chunks(list(pending), homeward_salesforce.COLLECTION_BATCH_SIZE):
+        push_records(Pricing, batch, SalesforceObjectType.QUOTE,
+                     lambda pricing, creating: pricing.to_salesforce_representation(), started_at)
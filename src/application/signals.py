@@ -1,10 +1,8 @@
 import logging
-from application.email_trigger_tasks import queue_photo_task_complete_notification
-from application.models.task_progress import TaskProgress
 from application.models.task_category import TaskCategory
 from application.models.task_status import TaskStatus
 
-from django.db.models.signals import post_save, pre_save
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 
 from application.email_trigger_tasks import (queue_agent_customer_close_email,
@@ -38,11 +36,13 @@ from application.models.models import Application, StageHistory
 from application.models.offer import Offer, OfferStatus
 from application.models.preapproval import PreApproval
 from application.models.pricing import Pricing
-from application.tasks import push_homeward_user_to_salesforce, push_to_salesforce
-from application.task_operations import run_task_operations
-from utils.partner_branding_config_service import get_partner
+from application.tasks import (push_homeward_user_to_salesforce, refresh_application_closing_capacity,
+                               refresh_closing_capacity)
+from application.task_operations import (complete_application_if_all_tasks_complete,
+                                         handle_task_status_change, run_task_operations)
 from user.models import User
 from utils.hubspot import Notification
+from utils.outbox import publish_on_commit
 
 logger = logging.getLogger(__name__)
 
@@ -51,7 +51,7 @@ logger = logging.getLogger(__name__)
 def create_stage_history(instance, **kwargs):
     if instance._state.adding:
         return
-    original_application = Application.objects.get(pk=instance.id)
+    original_application = instance.original
     if original_application.stage != instance.stage:
         StageHistory.objects.create(application=instance, previous_stage=original_application.stage,
                                     new_stage=instance.stage)
@@ -61,8 +61,8 @@ def create_stage_history(instance, **kwargs):
 def update_stage_when_all_tasks_are_complete(instance, **kwargs):
     if instance._state.adding:
         return
-    original_application = Application.objects.get(pk=instance.id)
-    if original_application.stage == ApplicationStage.INCOMPLETE and original_application.are_all_tasks_complete():
+    # the row has already been written, so the instance holds the persisted stage
+    if instance.stage == ApplicationStage.INCOMPLETE and instance.are_all_tasks_complete():
         instance.stage = ApplicationStage.COMPLETE
 
 
@@ -70,20 +70,20 @@ def update_stage_when_all_tasks_are_complete(instance, **kwargs):
 def send_emails_when_application_stage_changes(instance, **kwargs):
     if instance._state.adding:
         return
-    original_application = Application.objects.get(pk=instance.id)
+    original_application = instance.original
     if original_application.stage != instance.stage:
         if instance.stage == ApplicationStage.APPROVED:
-            queue_approval_email.delay(instance.id)
-            queue_agent_instructions_email.delay(instance.id)
+            publish_on_commit(queue_approval_email, args=[instance.id])
+            publish_on_commit(queue_agent_instructions_email, args=[instance.id])
         if instance.stage == ApplicationStage.QUALIFIED_APPLICATION:
-            queue_under_review_email.delay(instance.id)
+            publish_on_commit(queue_under_review_email, args=[instance.id])
         elif instance.stage == ApplicationStage.OPTION_PERIOD:
-            queue_offer_accepted_email.delay(instance.id)
+            publish_on_commit(queue_offer_accepted_email, args=[instance.id])
         elif instance.stage == ApplicationStage.HOMEWARD_PURCHASE:
-            queue_homeward_close_email.delay(instance.id)
+            publish_on_commit(queue_homeward_close_email, args=[instance.id])
         elif instance.stage == ApplicationStage.CUSTOMER_CLOSED:
-            queue_customer_close_email.delay(instance.id)
-            queue_agent_customer_close_email.delay(instance.id)
+            publish_on_commit(queue_customer_close_email, args=[instance.id])
+            publish_on_commit(queue_agent_customer_close_email, args=[instance.id])
 
 
 @receiver(post_save, sender=Acknowledgement)
@@ -91,7 +91,7 @@ def push_app_to_salesforce_when_service_agreement_complete(instance, **kwargs):
     acknowledgement = Acknowledgement.objects.get(pk=instance.id)
     if acknowledgement.disclosure.disclosure_type == DisclosureType.SERVICE_AGREEMENT\
             and acknowledgement.is_acknowledged:
-        push_to_salesforce(acknowledgement.application.id)
+        acknowledgement.application.request_salesforce_push()
 
 
 @receiver(pre_save, sender=Application)
@@ -99,7 +99,7 @@ def add_service_agreement_when_application_stage_changes(instance, **kwargs):
     if instance._state.adding:
         return
 
-    original_application = Application.objects.get(pk=instance.id)
+    original_application = instance.original
 
     current_stages = [ApplicationStage.OPTION_PERIOD,
                       ApplicationStage.POST_OPTION,
@@ -142,7 +142,7 @@ def send_email_when_application_complete(instance: Application, **kwargs):
 
     if 'stage' in instance.diff or 'approval_specialist' in instance.diff:
         if instance.stage == ApplicationStage.COMPLETE and instance.approval_specialist is not None:
-            queue_application_complete_email.delay(instance.id)
+            publish_on_commit(queue_application_complete_email, args=[instance.id])
 
 
 @receiver(pre_save, sender=Offer)
@@ -152,10 +152,10 @@ def send_emails_when_offer_stage_changes(instance, **kwargs):
     original_offer = Offer.objects.get(pk=instance.id)
     if original_offer.status != instance.status:
         if instance.status == OfferStatus.APPROVED:
-            queue_offer_submitted_agent_email.delay(instance.id)
+            publish_on_commit(queue_offer_submitted_agent_email, args=[instance.id])
         if instance.status == OfferStatus.REQUESTED:
             offer_price = int(instance.offer_price) if instance.offer_price else 0
-            queue_offer_submitted_email.delay(instance.id, offer_price)
+            publish_on_commit(queue_offer_submitted_email, args=[instance.id, offer_price])
 
 
 @receiver(pre_save, sender=PreApproval)
@@ -181,19 +181,48 @@ def send_emails_when_preapproval_amount_changes(instance, **kwargs):
     if original_preapproval.amount != instance.amount \
             and original_preapproval.amount < instance.amount:
         amount = int(instance.amount) if instance.amount else 0
-        queue_purchase_price_updated_email.delay(instance.id, amount)
+        publish_on_commit(queue_purchase_price_updated_email, args=[instance.id, amount])
 
 
 @receiver(pre_save, sender=Offer)
 def send_email_when_unacknowledged_service_agreement(instance, **kwargs):
     if instance._state.adding:
         if instance.status == OfferStatus.REQUESTED and not instance.application.new_service_agreement_acknowledged_date:
-            queue_unacknowledged_service_agreement_email.delay(instance.application.id)
+            publish_on_commit(queue_unacknowledged_service_agreement_email, args=[instance.application.id])
     else:
         original_offer = Offer.objects.get(pk=instance.id)
         if original_offer.status != instance.status:
             if instance.status == OfferStatus.REQUESTED and not instance.application.new_service_agreement_acknowledged_date:
-                queue_unacknowledged_service_agreement_email.delay(instance.application.id)
+                publish_on_commit(queue_unacknowledged_service_agreement_email, args=[instance.application.id])
+
+
+@receiver(post_save, sender=Offer)
+def refresh_closing_capacity_when_offer_closing_changes(instance, created, **kwargs):
+    # the loaded values still hold the row as it was before this save
+    previous_closing = None if created else \
+        (instance.loaded_value('finance_approved_close_date'), instance.loaded_value('status'))
+    if previous_closing != (instance.finance_approved_close_date, instance.status):
+        publish_closing_capacity_refresh([previous_closing[0] if previous_closing else None,
+                                          instance.finance_approved_close_date])
+
+
+@receiver(post_delete, sender=Offer)
+def refresh_closing_capacity_when_offer_deleted(instance, **kwargs):
+    publish_closing_capacity_refresh([instance.finance_approved_close_date])
+
+
+def publish_closing_capacity_refresh(dates):
+    # the days are locked while they are recomputed, so that is left to a job that runs once the save is committed
+    dates = sorted({str(date) for date in dates if date is not None})
+    if dates:
+        publish_on_commit(refresh_closing_capacity, args=[dates])
+
+
+@receiver(post_save, sender=Application)
+def refresh_closing_capacity_when_application_stage_changes(instance, created, **kwargs):
+    # original still holds the row as it was before this save
+    if not created and instance.original.stage != instance.stage:
+        publish_on_commit(refresh_application_closing_capacity, args=[instance.id])
 
 
 @receiver(pre_save, sender=Application)
@@ -201,14 +230,14 @@ def send_emails_when_mortgage_status_changes(instance, **kwargs):
     if instance._state.adding:
         return
     if instance.stage == ApplicationStage.QUALIFIED_APPLICATION:
-        original_application: Application = Application.objects.get(pk=instance.id)
+        original_application: Application = instance.original
         if original_application.mortgage_status != instance.mortgage_status:
             if instance.mortgage_status == MortgageStatus.VPAL_APP_INCOMPLETE:
-                queue_vpal_incomplete_email.delay(instance.id)
+                publish_on_commit(queue_vpal_incomplete_email, args=[instance.id])
             elif instance.mortgage_status == MortgageStatus.VPAL_SUSPENDED:
-                queue_vpal_suspended_email.delay(instance.id)
+                publish_on_commit(queue_vpal_suspended_email, args=[instance.id])
             elif instance.mortgage_status == MortgageStatus.VPAL_READY_FOR_REVIEW:
-                queue_vpal_ready_for_review_email.delay(instance.id)
+                publish_on_commit(queue_vpal_ready_for_review_email, args=[instance.id])
 
 
 @receiver(post_save, sender=User)
@@ -223,24 +252,24 @@ def queue_incomplete_reminder_email(instance, created, **kwargs):
                 instance_id=instance.id
             ))
             return
-        send_completion_reminder.apply_async(kwargs=
-                                             {
-                                                 "application_id": app.id,
-                                                 "reminder_type": Notification.FORTY_FIVE_MIN_REMINDER
-                                             }, countdown=2700)  # run incomplete app check in 45 min
+        publish_on_commit(send_completion_reminder, kwargs=
+                          {
+                              "application_id": app.id,
+                              "reminder_type": Notification.FORTY_FIVE_MIN_REMINDER
+                          }, countdown=2700)  # run incomplete app check in 45 min
 
 
 @receiver(post_save, sender=User)
 def sync_user_to_sf(instance, **kwargs):
-    push_homeward_user_to_salesforce.delay(instance.id)
+    publish_on_commit(push_homeward_user_to_salesforce, args=[instance.id])
 
 
 @receiver(post_save, sender=Application)
 def send_apex_site_pre_account_emails(instance, **kwargs):
     if instance.apex_partner_slug:
-        apex_partner = get_partner(instance.apex_partner_slug)
-        queue_new_customer_partner_email.delay(instance.id, apex_partner)
-        queue_apex_site_pre_account_email.delay(instance.id, apex_partner)
+        # the tasks look the partner up and skip emails already sent, saving the application doesn't wait on the cms
+        publish_on_commit(queue_new_customer_partner_email, args=[instance.id, instance.apex_partner_slug])
+        publish_on_commit(queue_apex_site_pre_account_email, args=[instance.id, instance.apex_partner_slug])
 
 
 @receiver(post_save, sender=Application)
@@ -252,13 +281,13 @@ def send_cma_request_when_agent_added(instance: Application, **kwargs):
         return
     elif instance.lead_status in [LeadStatus.NURTURE, LeadStatus.QUALIFIED] \
             and instance.stage in ApplicationStage.PRE_APPROVAL_STAGES:
-        queue_cma_request.delay(instance.id)
+        publish_on_commit(queue_cma_request, args=[instance.id])
 
 
 @receiver(post_save, sender=Application)
 def send_fast_track_resume_email(instance: Application, created, **kwargs):
     if created and instance.internal_referral_detail is FAST_TRACK_REGISTRATION:
-        queue_fast_track_resume_email.delay(instance.id)
+        publish_on_commit(queue_fast_track_resume_email, args=[instance.id])
 
 
 @receiver(pre_save, sender=Pricing)
@@ -268,7 +297,7 @@ def send_pricing_action_emails(instance: Pricing, **kwargs):
     original_actions = Pricing.objects.get(id=instance.id).actions
     new_actions = instance.actions.copy()
     if "saved" in set(new_actions) - set(original_actions):
-        queue_saved_quote_cta.delay(instance.id)
+        publish_on_commit(queue_saved_quote_cta, args=[instance.id])
 
 @receiver(pre_save, sender=TaskStatus)
 def send_task_status_update_emails(instance: TaskStatus, **kwargs):
@@ -276,20 +305,14 @@ def send_task_status_update_emails(instance: TaskStatus, **kwargs):
         return
     if instance.task_obj.category == TaskCategory.PHOTO_UPLOAD and instance.application.current_home:
         original_task_status = TaskStatus.objects.get(pk=instance.id)
-        if instance.status != original_task_status.status and \
-           instance.status == TaskProgress.COMPLETED:
-            queue_photo_task_complete_notification.apply_async(args=[instance.application.current_home.id], countdown=300)
+        handle_task_status_change(instance, original_task_status.status)
 
 @receiver(post_save, sender=TaskStatus)
 def update_application_stage_if_all_tasks_complete(instance: TaskStatus, **kwargs):
     if instance._state.adding:
         return
 
-    task_application = Application.objects.get(pk=instance.application.id)
-    if task_application.stage == ApplicationStage.INCOMPLETE and task_application.are_all_tasks_complete():
-        task_application.stage = ApplicationStage.COMPLETE
-        task_application.save()
-        push_to_salesforce(task_application.id)
+    complete_application_if_all_tasks_complete(instance.application_id)
 
 
 
@@ -0,0 +1,17 @@
+"""
+Registry of Task rows. The task table is static configuration read every time an application's tasks are assigned.
+"""
+from typing import List
+
+from application.models.task import Task
+from utils.model_registry import ModelRegistry
+
+registry = ModelRegistry(Task, 'TASK_CATALOG_TTL_SECONDS', indexes=[('name',), ('state', 'category')])
+
+
+def get_task(name: str) -> Task:
+    return registry.get(name=name)
+
+
+def get_tasks(state: str, category: str) -> List[Task]:
+    return registry.filter(state=state, category=category)
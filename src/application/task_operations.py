@@ -1,6 +1,10 @@
 import logging
+from typing import List
+
 from application.models.application import ProductOffering
 
+from django.utils import timezone
+
 from application.models.application import Application, ApplicationStage
 from application.models.blend_status import BlendStatus
 from application.models.task_category import TaskCategory
@@ -8,26 +12,45 @@ from application.models.task_name import TaskName
 from application.models.task_status import TaskStatus
 from application.models.task_progress import TaskProgress
 from application.models.task import Task
+from application import task_catalog
 from application.models.current_home import COMPLETED_LISTING_STATUSES
+from utils.outbox import publish_on_commit
 
 logger = logging.getLogger(__name__)
 
 
 def add_task_if_active(application, name):
-    task = Task.objects.get(name=name)
+    ensure_task_statuses(application, active_tasks(application, [name]))
 
-    if task.is_active():
-        defaults = {'status': TaskProgress.NOT_STARTED}
 
-        TaskStatus.objects.get_or_create(application=application, task_obj=Task.objects.get(name=name),
-                                         defaults=defaults)
-    else:
-        logger.error("Unable to add task to inactive application", extra=dict(
-            type="cant_add_task_to_inactive_application",
-            task_name=name,
-            application_id=application.id,
-            task_id=task.id
-        ))
+def active_tasks(application, names: List[str]) -> List[Task]:
+    tasks = []
+    for name in names:
+        task = task_catalog.get_task(name)
+        if task.is_active():
+            tasks.append(task)
+        else:
+            logger.error("Unable to add task to inactive application", extra=dict(
+                type="cant_add_task_to_inactive_application",
+                task_name=name,
+                application_id=application.id,
+                task_id=task.id
+            ))
+    return tasks
+
+
+def ensure_task_statuses(application, tasks: List[Task]):
+    """
+    Creates the missing task statuses of the application for the given tasks with one insert. New statuses have no
+    signal side effects, so bulk_create is safe here.
+    """
+    if not tasks:
+        return
+    existing_task_ids = set(application.task_statuses.filter(task_obj__in=tasks).values_list('task_obj_id', flat=True))
+    missing_task_statuses = [TaskStatus(application=application, task_obj=task, status=TaskProgress.NOT_STARTED)
+                             for task in tasks if task.id not in existing_task_ids]
+    if missing_task_statuses:
+        TaskStatus.objects.bulk_create(missing_task_statuses, ignore_conflicts=True)
 
 def delete_task_if_exists(application, name):
     application.task_statuses.filter(task_obj__name=name).delete()
@@ -94,9 +117,12 @@ def existing_property_status(application):
 def photo_upload_status(application):
     if application.current_home is not None:
         current_home = application.current_home
-        if application.current_home.listing_status in COMPLETED_LISTING_STATUSES or current_home.images.count() > 4:
+        if current_home.listing_status in COMPLETED_LISTING_STATUSES:
+            return TaskProgress.COMPLETED
+        image_count = current_home.images.count()
+        if image_count > 4:
             return TaskProgress.COMPLETED
-        elif current_home.images.count() > 0:
+        elif image_count > 0:
             return TaskProgress.IN_PROGRESS
         else:
             return TaskProgress.NOT_STARTED
@@ -132,49 +158,55 @@ def run_task_operations(application):
 
 
 def handle_application_tasks_assignment(application: Application):
-    handle_default_tasks_assignment(application)
-    handle_current_home_tasks_assignment(application)
-    handle_homeward_mortgage_task_assignment(application)
+    handle_current_home_tasks_removal(application)
+    task_names = default_task_names(application) + current_home_task_names(application) \
+        + homeward_mortgage_task_names(application)
+    ensure_task_statuses(application, active_tasks(application, task_names))
 
 
-def handle_homeward_mortgage_task_assignment(application):
+def homeward_mortgage_task_names(application) -> List[str]:
     state = application.get_purchasing_state()
-
-    if state:
-        mortgage_task = Task.objects.filter(state=state.lower(),
-                                            category=TaskCategory.HOMEWARD_MORTGAGE)
-        if mortgage_task.count() > 1:
-            logger.error(f"Found multiple mortgage tasks for state {state.lower()}", extra=dict(
-                type="multiple_mortgage_tasks_for_state",
-                category=TaskCategory.HOMEWARD_MORTGAGE,
-                state=state.lower(),
-                application_id=application.id
-            ))
-            raise Exception("looking for one mortgage task for {}, found {}!"
-                            .format(application.get_current_home_state(), mortgage_task.count()))
-        elif mortgage_task.count() == 1 and mortgage_task.first().is_active():
-            add_task_if_active(application=application, name=mortgage_task.first().name)
+    if not state:
+        return []
+
+    mortgage_tasks = task_catalog.get_tasks(state.lower(), TaskCategory.HOMEWARD_MORTGAGE)
+    if len(mortgage_tasks) > 1:
+        logger.error(f"Found multiple mortgage tasks for state {state.lower()}", extra=dict(
+            type="multiple_mortgage_tasks_for_state",
+            category=TaskCategory.HOMEWARD_MORTGAGE,
+            state=state.lower(),
+            application_id=application.id
+        ))
+        raise Exception("looking for one mortgage task for {}, found {}!"
+                        .format(application.get_current_home_state(), len(mortgage_tasks)))
+    return [task.name for task in mortgage_tasks if task.is_active()]
 
 
-def handle_current_home_tasks_assignment(application):
+def current_home_task_names(application) -> List[str]:
     if application.current_home and application.product_offering == ProductOffering.BUY_SELL:
-        add_task_if_active(application=application, name=TaskName.PHOTO_UPLOAD)
-        add_task_if_active(application=application, name=TaskName.EXISTING_PROPERTY)
-    elif application.product_offering == ProductOffering.BUY_ONLY:
+        return [TaskName.PHOTO_UPLOAD, TaskName.EXISTING_PROPERTY]
+    return []
+
+
+def handle_current_home_tasks_removal(application):
+    if application.product_offering == ProductOffering.BUY_ONLY:
         delete_task_if_exists(application=application, name=TaskName.PHOTO_UPLOAD)
         delete_task_if_exists(application=application, name=TaskName.EXISTING_PROPERTY)
 
 
-def handle_default_tasks_assignment(application):
-    add_task_if_active(application=application, name=TaskName.REAL_ESTATE_AGENT)
-    add_task_if_active(application=application, name=TaskName.BUYING_SITUATION)
-
+def default_task_names(application) -> List[str]:
+    task_names = [TaskName.REAL_ESTATE_AGENT, TaskName.BUYING_SITUATION]
     if application.has_disclosures():
-        add_task_if_active(application=application, name=TaskName.DISCLOSURES)
-
+        task_names.append(TaskName.DISCLOSURES)
+    return task_names
 
 
 def update_application_tasks(application):
+    """
+    Recomputes every task status of the application from one snapshot of its task statuses and writes only the
+    statuses that changed, in one query. bulk_update skips the TaskStatus signal receivers, so their side effects are
+    applied here once for the whole batch.
+    """
     status_checks = {
         TaskCategory.REAL_ESTATE_AGENT: real_estate_agent_status,
         TaskCategory.LENDER: lender_status,
@@ -184,10 +216,43 @@ def update_application_tasks(application):
         TaskCategory.PHOTO_UPLOAD: photo_upload_status,
         TaskCategory.HOMEWARD_MORTGAGE: homeward_mortgage_status
     }
-    for task_status in application.task_statuses.all():
-        updated_status = status_checks[task_status.task_obj.category](application)
-        task_status.status = updated_status
-        task_status.save()
+    task_statuses = list(application.task_statuses.select_related('task_obj'))
+    if not task_statuses:
+        return
+
+    category_statuses = {}
+    changed_task_statuses = []
+    now = timezone.now()
+    for task_status in task_statuses:
+        category = task_status.task_obj.category
+        if category not in category_statuses:
+            category_statuses[category] = status_checks[category](application)
+        previous_status = task_status.status
+        if previous_status != category_statuses[category]:
+            task_status.status = category_statuses[category]
+            task_status.updated_at = now
+            changed_task_statuses.append(task_status)
+            handle_task_status_change(task_status, previous_status)
+
+    if changed_task_statuses:
+        TaskStatus.objects.bulk_update(changed_task_statuses, ['status', 'updated_at'])
+    complete_application_if_all_tasks_complete(application.id)
+
+
+def handle_task_status_change(task_status: TaskStatus, previous_status: str):
+    if task_status.task_obj.category == TaskCategory.PHOTO_UPLOAD and task_status.application.current_home \
+            and task_status.status != previous_status and task_status.status == TaskProgress.COMPLETED:
+        from application.email_trigger_tasks import queue_photo_task_complete_notification
+        publish_on_commit(queue_photo_task_complete_notification, args=[task_status.application.current_home.id],
+                          countdown=300)
+
+
+def complete_application_if_all_tasks_complete(application_id):
+    application = Application.objects.get(pk=application_id)
+    if application.stage == ApplicationStage.INCOMPLETE and application.are_all_tasks_complete():
+        application.stage = ApplicationStage.COMPLETE
+        application.save()
+        application.request_salesforce_push()
 
 
 def update_photo_task(application):
@@ -13,6 +13,7 @@ from event_consumer import message_handler
 
 from application.application_acknowledgements import add_acknowledgements
 from application.email_trigger_tasks import send_registered_client_notification
+from application import closing_capacity, offer_contracts
 from application.generate_pdf_task import ProcessPdf
 from application.models.application import (BUILDER, FAST_TRACK_REGISTRATION,
                                             REAL_ESTATE_AGENT, REFERRAL_LINK,
@@ -27,16 +28,19 @@ from application.models.models import (Address, Application, ApplicationStage,
 from application.models.mortgage_lender import MortgageLender
 from application.models.notification import Notification
 from application.models.notification_status import NotificationStatus
+from application.models.offer import Offer, OfferEnrichmentStatus
 from application.models.pricing import Pricing
 from application.models.real_estate_agent import AgentType, RealEstateAgent
 from application.models.real_estate_lead import RealEstateLead
+from application.notification_registry import get_notification, notification_status_exists
 from application.task_operations import run_task_operations
 from user.models import User
-from utils import aws, hubspot, mailer
+from utils import aws, hubspot, mailer, salesforce_id_resolver
 from utils.celery import app as celery_app
 from utils.salesforce import (SalesforceException,
                               homeward_salesforce)
 from utils.agent_svc_client import AgentServiceClient, AgentServiceClientException
+from utils.property_data_aggregator import PropertyDataAggregatorClientException
 
 logger = logging.getLogger(__name__)
 
@@ -513,9 +517,7 @@ def create_application(customer, current_home, response):  # noqa: C901
 
     run_task_operations(application)
 
-    push_to_salesforce.apply_async(kwargs={
-        'application_id': application.pk
-    })
+    application.request_salesforce_push()
 
     sync_with_hubspot.apply_async(kwargs={
         'application_id': application.pk
@@ -788,9 +790,7 @@ def update_application(application: Application, response):  # noqa: C901
 
     run_task_operations(application)
 
-    push_to_salesforce.apply_async(kwargs={
-        'application_id': application.pk
-    })
+    application.request_salesforce_push()
 
     sync_with_hubspot.apply_async(kwargs={
         'application_id': application.pk
@@ -855,7 +855,7 @@ def update_app_status(application_id):  # pragma: no cover
 
 @celery_app.task(queue='application-service-tasks')
 def send_agent_referral_notification(application_id):
-    referral_sign_up_notification = Notification.objects.get(name=Notification.REFERRAL_SIGN_UP)
+    referral_sign_up_notification = get_notification(Notification.REFERRAL_SIGN_UP)
 
     if not referral_sign_up_notification.is_active:
         logger.info("referral_sign_up_notification is not active", extra=dict(
@@ -877,7 +877,7 @@ def send_agent_referral_notification(application_id):
 
 @celery_app.task(queue='application-service-tasks')
 def send_agent_registration_notification(application_id: uuid.UUID):
-    agent_registration_notification = Notification.objects.get(name=Notification.AGENT_REFERRAL_COMPLETE_EMAIL)
+    agent_registration_notification = get_notification(Notification.AGENT_REFERRAL_COMPLETE_EMAIL)
 
     if not agent_registration_notification.is_active:
         logger.info("agent_registration_notification is not active", extra=dict(
@@ -889,7 +889,7 @@ def send_agent_registration_notification(application_id: uuid.UUID):
 
     application = Application.objects.get(id=application_id)
     agent = application.listing_agent
-    if application.notificationstatus_set.filter(notification=agent_registration_notification).count() == 0:
+    if not notification_status_exists(application, agent_registration_notification):
         response = mailer.send_agent_registration_notification(agent_email=agent.email, agent_first_name=agent.get_first_name(),
                                                                customer_first_name=application.customer.get_first_name())
         if response.status_code == 200:
@@ -919,13 +919,13 @@ def push_to_salesforce(application_id: uuid.UUID):  # pragma: no cover
     except Application.DoesNotExist as err:
         raise Exception("tried pushing app {}, but couldnt find it!".format(application_id)) from err
     if application.pushed_to_salesforce_on and application.pushed_to_salesforce_on > application.updated_at:
-        return
+        return True
     if not application.customer.email:
         raise Exception("tried pushing to salesforce, but application {} has no email!".format(application_id))
 
     try:
 
-        person_id = homeward_salesforce.get_id_by_email(email=application.customer.email)
+        person_id = salesforce_id_resolver.resolve_account_id(application)
 
         homeward_person_data = application.to_salesforce_representation()
 
@@ -933,18 +933,20 @@ def push_to_salesforce(application_id: uuid.UUID):  # pragma: no cover
             homeward_salesforce.update_salesforce_object(person_id, homeward_person_data, application.salesforce_object_type())
         else:
             person_id = homeward_salesforce.create_new_salesforce_object(data=homeward_person_data, object_type=application.salesforce_object_type())
+            salesforce_id_resolver.remember_account_id(application.customer.email, person_id)
     except SalesforceException as e:
         logger.exception("Salesforce raised exception during get/update/create during push", exc_info=e, extra=dict(
             type="salesforce_exception_get_update_create_during_push",
             application_id=application_id
         ))
-        return
+        return False
 
     Application.objects.filter(pk=application.pk).update(
         new_salesforce=person_id,
         pushed_to_salesforce_on=timezone.now(),
         updated_at=timezone.now())
     push_current_home_to_salesforce(application.id)
+    return True
 
 
 @celery_app.task(queue='application-service-tasks')
@@ -959,10 +961,7 @@ def push_current_home_to_salesforce(application_id: uuid.UUID):
     if application.current_home and application.new_salesforce:
         app_salesforce_id = application.new_salesforce
         try:
-            if application.current_home.salesforce_id:
-                current_home_salesforce_id = application.current_home.salesforce_id
-            else:
-                current_home_salesforce_id = homeward_salesforce.get_current_home_id_by_account_id(account_id=app_salesforce_id)
+            current_home_salesforce_id = salesforce_id_resolver.resolve_current_home_id(application)
 
             current_home_data = application.current_home.to_salesforce_representation(app_salesforce_id)
 
@@ -973,6 +972,7 @@ def push_current_home_to_salesforce(application_id: uuid.UUID):
             else:
                 current_home_salesforce_id = homeward_salesforce.create_new_salesforce_object(data=current_home_data,
                                                                                               object_type=application.current_home.salesforce_object_type())
+                salesforce_id_resolver.remember_current_home_id(app_salesforce_id, current_home_salesforce_id)
         except SalesforceException as e:
             logger.exception(
                 "Salesforce raised exception during get/update/create during push current home",
@@ -1013,7 +1013,7 @@ def push_agent_to_salesforce(application: Application, agent: RealEstateAgent, a
 
     agent_data = agent.to_salesforce_representation(agent_type)
     try:
-        person_id = homeward_salesforce.get_id_by_email(email=application.customer.email)
+        person_id = salesforce_id_resolver.resolve_account_id(application)
 
         if person_id:
             homeward_salesforce.update_salesforce_object(person_id, agent_data, agent.salesforce_object_type())
@@ -1104,17 +1104,61 @@ def fill_in_null_lead_source():
         get_lead_source_from_hubspot(application.id, application.hubspot_context['hutk'])
 
 
-@celery_app.task(queue='application-service-tasks', time_limit=600)
-def queue_offer_contract(offer_id: uuid.UUID):
+@celery_app.task(queue='application-service-tasks')
+def refresh_closing_capacity(dates: list):
+    closing_capacity.refresh_dates(dates)
+
+
+@celery_app.task(queue='application-service-tasks')
+def refresh_application_closing_capacity(application_id: uuid.UUID):
+    closing_capacity.refresh_application(application_id)
+
+
+@periodic_task(run_every=timedelta(hours=24), options={'queue': 'application-service-tasks'})
+def rebuild_closing_capacity():
+    """
+    Catches the closing capacity up with offer changes that were saved without signals
+    """
+    closing_capacity.rebuild()
+
+
+@celery_app.task(queue='application-service-tasks', time_limit=offer_contracts.RENDER_TIME_LIMIT_SECONDS)
+def queue_offer_contract(offer_id: uuid.UUID, job_id: str = None):
+    url = None
     try:
         pdf = ProcessPdf(offer_id)
         url = pdf.add_data_to_pdf()
-        pdf.delete_temp_files()
     except Exception as e:
         logger.exception("Exception raised during queueing offer contract", exc_info=e, extra=dict(
             type="exception_during_queue_offer_contract",
             offer_id=offer_id
         ))
-        return
+    finally:
+        if job_id is not None:
+            offer_contracts.finish_job(offer_id, job_id, url)
 
     return url
+
+
+@celery_app.task(queue='application-service-tasks')
+def enrich_offer(offer_id: uuid.UUID, push: bool):
+    """
+    Fills the offer in from its listing, recording the outcome on the offer, and then requests the salesforce push.
+    """
+    offer = Offer.objects.select_related('application', 'offer_property_address').get(pk=offer_id)
+    status = OfferEnrichmentStatus.COMPLETE
+
+    if offer.pda_listing_uuid:
+        try:
+            offer.enrich_from_property_data_aggregator()
+        except PropertyDataAggregatorClientException as e:
+            logger.warning("Unable to enrich offer from listing", exc_info=e, extra=dict(
+                type="unable_to_enrich_offer_from_listing",
+                offer_id=offer_id,
+                pda_listing_uuid=offer.pda_listing_uuid
+            ))
+            status = OfferEnrichmentStatus.FAILED
+
+    Offer.objects.filter(pk=offer_id).update(enrichment_status=status, enriched_at=timezone.now())
+    if push:
+        offer.request_salesforce_push()
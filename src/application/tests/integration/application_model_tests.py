@@ -1,6 +1,10 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework.test import APITestCase
 
+from application.models.application import ApplicationStage
 from application.models.floor_price import FloorPrice, FloorPriceType
+from application.models.models import StageHistory
 from application.tests import random_objects
 
 
@@ -25,3 +29,18 @@ class ApplicationModelTests(APITestCase):
         app.current_home.floor_price.type = FloorPriceType.NONE
         app.current_home.floor_price.save()
         self.assertEqual(app.get_formatted_floor_price(), "Your Homeward transaction does not include a floor price")
+
+    def test_stage_transition_fetches_original_application_once(self):
+        app = random_objects.random_application(stage=ApplicationStage.INCOMPLETE)
+        app.stage = ApplicationStage.COMPLETE
+
+        with CaptureQueriesContext(connection) as context:
+            app.save()
+
+        original_lookup = 'FROM "application_application" WHERE "application_application"."id" = '
+        original_fetches = [query for query in context.captured_queries
+                            if query['sql'].startswith('SELECT') and original_lookup in query['sql']]
+        # previously each pre_save/post_save receiver re-fetched the row, issuing 4 of these per transition
+        self.assertEqual(len(original_fetches), 1)
+        self.assertEqual(StageHistory.objects.filter(application=app, previous_stage=ApplicationStage.INCOMPLETE,
+                                                     new_stage=ApplicationStage.COMPLETE).count(), 1)
@@ -0,0 +1,72 @@
+from unittest.mock import MagicMock, patch
+
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from application.email_dispatcher import create_notification_status, dispatch_email_batch
+from application.models.notification import Notification
+from application.models.notification_status import NotificationStatus
+from application.tests import random_objects
+
+
+@override_settings(EMAIL_DISPATCH_MAX_WORKERS=1)
+class DispatchEmailBatchTests(TestCase):
+    def setUp(self):
+        self.notification = Notification.objects.get(name=Notification.PHOTO_UPLOAD)
+        self.applications = [random_objects.random_application() for _ in range(3)]
+
+    def send_email(self, application_id):
+        if application_id == 'failing-application-id':
+            raise ValueError
+        create_notification_status(status=NotificationStatus.SENT, application_id=application_id,
+                                   notification=self.notification)
+
+    def record_twice(self, application_id):
+        self.send_email(application_id)
+        create_notification_status(status=NotificationStatus.NOT_SENT, application_id=application_id,
+                                   notification=self.notification)
+
+    def test_should_write_notification_statuses_of_a_task_in_one_insert(self):
+        task = MagicMock(run=self.record_twice)
+        entries = [['some.email.task', [self.applications[0].id], {}]]
+
+        with patch.dict('application.email_dispatcher.celery_app.tasks', {'some.email.task': task}), \
+                CaptureQueriesContext(connection) as queries:
+            dispatch_email_batch(entries)
+
+        inserts = [query for query in queries.captured_queries if query['sql'].startswith('INSERT')]
+        self.assertEqual(len(inserts), 1)
+        self.assertEqual(NotificationStatus.objects.filter(notification=self.notification).count(), 2)
+
+    def test_should_write_notification_statuses_as_each_task_completes(self):
+        written_before = []
+
+        def send_email(application_id):
+            written_before.append(NotificationStatus.objects.filter(notification=self.notification).count())
+            self.send_email(application_id)
+
+        task = MagicMock(run=send_email)
+        entries = [['some.email.task', [application.id], {}] for application in self.applications]
+
+        with patch.dict('application.email_dispatcher.celery_app.tasks', {'some.email.task': task}):
+            dispatch_email_batch(entries)
+
+        self.assertEqual(written_before, [0, 1, 2])
+
+    def test_should_keep_dispatching_when_a_task_fails(self):
+        task = MagicMock(run=self.send_email)
+        entries = [['some.email.task', ['failing-application-id'], {}],
+                   ['some.email.task', [self.applications[0].id], {}]]
+
+        with patch.dict('application.email_dispatcher.celery_app.tasks', {'some.email.task': task}):
+            dispatch_email_batch(entries)
+
+        self.assertTrue(NotificationStatus.objects.filter(application=self.applications[0]).exists())
+        task.apply_async.assert_called_once_with(args=['failing-application-id'], kwargs={})
+
+    def test_should_create_notification_status_immediately_outside_a_batch(self):
+        create_notification_status(status=NotificationStatus.SENT, application=self.applications[0],
+                                   notification=self.notification)
+
+        self.assertTrue(NotificationStatus.objects.filter(application=self.applications[0]).exists())
@@ -1294,7 +1294,7 @@ class EmailTriggerTests(AuthMixin, APITestCase):
                                                              countdown=2700)
 
     @patch("utils.hubspot.send_incomplete_account_notification")
-    @patch("application.signals.get_partner")
+    @patch("application.email_trigger_tasks.get_partner")
     def test_should_suppress_completion_reminder_when_apex_sulg(self, partner_patch, email_mock):
         partner_patch.return_value = {}
         customer = Customer.objects.create(email="test_fakeapplicant@fakeapplicantmail.com")
@@ -1310,7 +1310,7 @@ class EmailTriggerTests(AuthMixin, APITestCase):
 
 
     @patch("utils.hubspot.send_incomplete_account_notification")
-    @patch("application.signals.get_partner")
+    @patch("application.email_trigger_tasks.get_partner")
     def test_should_suppress_one_day_pre_account_reminders_when_apex_slug_on_app(self, partner_patch, email_patch):
         email_patch.return_value = self.mock_success_response
         partner_patch.return_value = {}
@@ -1330,7 +1330,7 @@ class EmailTriggerTests(AuthMixin, APITestCase):
         self.assertEqual(one_day_reminder_notification_status.reason, "Application has apex partner slug")
 
     @patch("utils.hubspot.send_incomplete_account_notification")
-    @patch("application.signals.get_partner")
+    @patch("application.email_trigger_tasks.get_partner")
     def test_should_suppress_three_day_pre_account_reminders_when_apex_slug_on_app(self, partner_patch, email_patch):
         email_patch.return_value = self.mock_success_response
         partner_patch.return_value = {}
@@ -1527,7 +1527,7 @@ class EmailTriggerTests(AuthMixin, APITestCase):
         email_patch.assert_called_with(ANY, ANY, ANY, ANY, ANY, app.build_resume_link())
 
     @patch("utils.hubspot.send_fast_track_resume_email")
-    @patch("application.signals.get_partner")
+    @patch("application.email_trigger_tasks.get_partner")
     def test_should_suppress_fast_track_email_when_app_has_apex_slug(self, partner_patch, email_patch):
         email_patch.return_value = self.mock_success_response
         partner_patch.return_value = {}
@@ -1919,7 +1919,7 @@ class EmailTriggerTests(AuthMixin, APITestCase):
 
 
     @patch("application.email_trigger_tasks.mailer")
-    @patch("application.signals.get_partner")
+    @patch("application.email_trigger_tasks.get_partner")
     def test_should_send_apex_site_pre_account_email(self, get_partner_patch, mailer_patch):
         get_partner_patch.return_value = {"name": "Apex Partner Name"}
         mailer_patch.send_apex_site_pre_account_email.return_value = self.mock_success_response
@@ -1933,8 +1933,34 @@ class EmailTriggerTests(AuthMixin, APITestCase):
                                                                         app.get_buying_agent_email())
 
 
+    @patch("application.email_trigger_tasks.queue_apex_site_pre_account_email.apply_async")
+    @patch("application.email_trigger_tasks.queue_new_customer_partner_email.apply_async")
+    @patch("application.email_trigger_tasks.get_partner")
+    def test_should_not_look_up_partner_when_saving_application(self, get_partner_patch, partner_email_patch,
+                                                                pre_account_email_patch):
+        app: Application = random_objects.random_application(internal_referral=APEX_PARTNER_SITE, apex_partner_slug="some-brokerage")
+
+        get_partner_patch.assert_not_called()
+        partner_email_patch.assert_called_with(args=(app.id, "some-brokerage"), kwargs={})
+        pre_account_email_patch.assert_called_with(args=(app.id, "some-brokerage"), kwargs={})
+
+    @patch("application.email_trigger_tasks.queue_apex_site_pre_account_email.apply_async")
+    @patch("application.email_trigger_tasks.queue_new_customer_partner_email.apply_async")
+    def test_should_queue_partner_emails_on_every_save_with_a_partner(self, partner_email_patch,
+                                                                      pre_account_email_patch):
+        app: Application = random_objects.random_application(internal_referral=APEX_PARTNER_SITE, apex_partner_slug="some-brokerage")
+
+        app.save()
+        app.apex_partner_slug = "another-brokerage"
+        app.save()
+
+        # the tasks skip emails that were already sent
+        self.assertEqual([c[1]['args'] for c in partner_email_patch.call_args_list],
+                         [(app.id, "some-brokerage"), (app.id, "some-brokerage"), (app.id, "another-brokerage")])
+        self.assertEqual(pre_account_email_patch.call_count, 3)
+
     @patch("application.email_trigger_tasks.mailer")
-    @patch("application.signals.get_partner")
+    @patch("application.email_trigger_tasks.get_partner")
     def test_should_send_new_customer_partner_email(self, get_partner_patch, mailer_patch):
         get_partner_patch.return_value = {"name": "Apex Partner Name", "partner-email": "some-partner@homeward.com"}
         mailer_patch.send_apex_site_pre_account_email.return_value = self.mock_success_response
@@ -1953,7 +1979,7 @@ class EmailTriggerTests(AuthMixin, APITestCase):
                                                                         "some-partner@homeward.com")
 
     @patch("application.email_trigger_tasks.mailer")
-    @patch("application.signals.get_partner")
+    @patch("application.email_trigger_tasks.get_partner")
     def test_should_send_new_customer_partner_email_with_legacy_webflow_field(self, get_partner_patch, mailer_patch):
         get_partner_patch.return_value = {"name": "Apex Partner Name", "parnter-email": "some-partner@homeward.com"}
         mailer_patch.send_apex_site_pre_account_email.return_value = self.mock_success_response
@@ -1972,7 +1998,7 @@ class EmailTriggerTests(AuthMixin, APITestCase):
                                                                         "some-partner@homeward.com")
 
     @patch("application.email_trigger_tasks.mailer")
-    @patch("application.signals.get_partner")
+    @patch("application.email_trigger_tasks.get_partner")
     def test_should_send_new_customer_partner_email_missing_address(self, get_partner_patch, mailer_patch):
         get_partner_patch.return_value = {"name": "Apex Partner Name", "partner-email": "some-partner@homeward.com"}
         mailer_patch.send_apex_site_pre_account_email.return_value = self.mock_success_response
@@ -1990,7 +2016,7 @@ class EmailTriggerTests(AuthMixin, APITestCase):
 
 
     @patch("application.email_trigger_tasks.mailer")
-    @patch("application.signals.get_partner")
+    @patch("application.email_trigger_tasks.get_partner")
     def test_should_not_send_if_missing_partner_email(self, get_partner_patch, mailer_patch):
         get_partner_patch.return_value = {}
         new_customer_partner_email_notification = Notification.objects.get(name=Notification.NEW_CUSTOMER_PARTNER_EMAIL)
@@ -2006,7 +2032,7 @@ class EmailTriggerTests(AuthMixin, APITestCase):
 
 
     @patch("utils.hubspot.send_apex_site_pre_account_email")
-    @patch("application.signals.get_partner")
+    @patch("application.email_trigger_tasks.get_partner")
     def test_should_send_apex_site_pre_account_email_with_no_agent_or_partner(self, get_partner_patch, hubspot_patch):
         hubspot_patch.return_value = self.mock_success_response
         get_partner_patch.return_value = {}
@@ -2021,7 +2047,7 @@ class EmailTriggerTests(AuthMixin, APITestCase):
                                          None)
 
     @patch("application.email_trigger_tasks.mailer")
-    @patch("application.signals.get_partner")
+    @patch("application.email_trigger_tasks.get_partner")
     def test_should_not_send_apex_site_pre_account_email_twice(self, get_partner_patch, mailer_patch):
         mailer_patch.send_apex_site_pre_account_email.return_value = self.mock_success_response
         get_partner_patch.return_value = {"name": "Apex Partner Name"}
@@ -2197,7 +2223,7 @@ class EmailTriggerTests(AuthMixin, APITestCase):
         mailer_patch.send_agent_referral_welcome_email.assert_called_once_with(app.customer, app.buying_agent, expected_url)
 
     @patch("application.email_trigger_tasks.mailer")
-    @patch("application.signals.get_partner")
+    @patch("application.email_trigger_tasks.get_partner")
     def test_should_suppress_welcome_email_for_pricing_referral_when_from_apex_site(self, get_partner_patch, mailer_patch):
         pricing = random_objects.random_pricing()
         get_partner_patch.return_value = {}
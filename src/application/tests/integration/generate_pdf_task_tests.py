@@ -1,11 +1,13 @@
+import io
 import locale
 import os
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 from datetime import datetime
 
 from django.test import TestCase
 
+from application import contract_template_cache
 from application.generate_pdf_task import ProcessPdf
 from application.models.address import Address
 from application.models.offer import PropertyType, ContractType, Offer
@@ -20,6 +22,11 @@ class GeneratePdfTaskTests(TestCase):
     module_dir = str(Path(__file__).parent)
     fixtures = [os.path.join(module_dir, "../static/contract_templates_test_data.json")]
 
+    def setUp(self):
+        etag_patch = patch('application.contract_template_cache.contract_template_etag', return_value='"v1"')
+        self.etag_mock = etag_patch.start()
+        self.addCleanup(etag_patch.stop)
+
     def create_pdf_offer(self, contract_type: ContractType, property_type: PropertyType, state: BuyingState, year_built: int = 1978, funding_type: str = None):
         application = random_objects.random_application()
         offer_property_address = Address.objects.create(street='3211 Test Rd.', city='Austin', state=state, zip='78704')
@@ -172,3 +179,55 @@ class GeneratePdfTaskTests(TestCase):
         offer.funding_type = None
         pdf = ProcessPdf(offer.id)
         self.assertEqual(pdf._get_buyer_name(offer.funding_type), None)
+
+    def test_file_name_changes_only_with_contract_data(self):
+        offer = self.create_pdf_offer(ContractType.RESALE, PropertyType.SINGLE_FAMILY, BuyingState.TX)
+        file_name = ProcessPdf(offer.id).format_file_name()
+
+        self.assertEqual(ProcessPdf(offer.id).format_file_name(), file_name)
+        offer.offer_price = Decimal('510000.00')
+        offer.save()
+        self.assertNotEqual(ProcessPdf(offer.id).format_file_name(), file_name)
+
+    def test_file_name_changes_when_the_template_file_is_replaced(self):
+        offer = self.create_pdf_offer(ContractType.RESALE, PropertyType.SINGLE_FAMILY, BuyingState.TX)
+        contract_template_cache.clear()
+        file_name = ProcessPdf(offer.id).format_file_name()
+
+        self.etag_mock.return_value = '"v2"'
+
+        self.assertNotEqual(ProcessPdf(offer.id).format_file_name(), file_name)
+
+    @patch('application.generate_pdf_task.upload_homeward_contract')
+    @patch('application.contract_template_cache.get_template')
+    @patch('application.generate_pdf_task.find_homeward_contract', return_value='https://contracts/stored.pdf')
+    def test_reuses_stored_contract_without_rendering(self, find_mock, get_template_mock, upload_mock):
+        offer = self.create_pdf_offer(ContractType.RESALE, PropertyType.SINGLE_FAMILY, BuyingState.TX)
+        pdf = ProcessPdf(offer.id)
+
+        url = pdf.add_data_to_pdf()
+
+        self.assertEqual(url, 'https://contracts/stored.pdf')
+        find_mock.assert_called_once_with(offer.id, pdf.format_file_name())
+        get_template_mock.assert_not_called()
+        upload_mock.assert_not_called()
+
+    @patch('application.generate_pdf_task.upload_homeward_contract', return_value='https://contracts/new.pdf')
+    @patch('application.generate_pdf_task.find_homeward_contract', return_value=None)
+    @patch('application.contract_template_cache.retrieve_contract_template_if_modified')
+    def test_renders_contract_in_memory(self, retrieve_mock, find_mock, upload_mock):
+        template_path = os.path.join(self.module_dir, "../static/test_contract_small.pdf")
+        with open(template_path, 'rb') as template:
+            retrieve_mock.return_value = (io.BytesIO(template.read()), '"v1"')
+        contract_template_cache.clear()
+        offer = self.create_pdf_offer(ContractType.RESALE, PropertyType.SINGLE_FAMILY, BuyingState.TX)
+        pdf = ProcessPdf(offer.id)
+
+        with patch('builtins.open', side_effect=AssertionError('contracts are rendered in memory')):
+            url = pdf.add_data_to_pdf()
+        contract_template_cache.clear()
+
+        self.assertEqual(url, 'https://contracts/new.pdf')
+        contract, folder, file_name = upload_mock.call_args[0]
+        self.assertTrue(contract.read().startswith(b'%PDF'))
+        self.assertEqual((folder, file_name), (offer.id, pdf.format_file_name()))
@@ -0,0 +1,62 @@
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from application import notification_registry
+from application.email_dispatcher import _local as dispatcher_local
+from application.models.notification import Notification
+from application.models.notification_status import NotificationStatus
+from application.notification_registry import get_notification, notification_status_exists
+from application.tests import random_objects
+
+
+@override_settings(NOTIFICATION_REGISTRY_TTL_SECONDS=300)
+class NotificationRegistryTests(TestCase):
+    def setUp(self):
+        notification_registry.registry.clear()
+        self.addCleanup(notification_registry.registry.clear)
+
+    def test_should_load_notifications_once(self):
+        get_notification(Notification.APPROVAL)
+
+        with CaptureQueriesContext(connection) as queries:
+            approval_notification = get_notification(Notification.APPROVAL)
+            get_notification(Notification.PHOTO_UPLOAD)
+
+        self.assertEqual(len(queries), 0)
+        self.assertEqual(approval_notification.name, Notification.APPROVAL)
+
+    def test_should_reload_after_notification_is_saved(self):
+        self.assertFalse(get_notification(Notification.APPROVAL).is_active)
+        notification = Notification.objects.get(name=Notification.APPROVAL)
+        notification.is_active = True
+        notification.save()
+
+        self.assertTrue(get_notification(Notification.APPROVAL).is_active)
+
+    def test_should_raise_for_unknown_notification(self):
+        with self.assertRaises(Notification.DoesNotExist):
+            get_notification('no such notification')
+
+
+class NotificationStatusExistsTests(TestCase):
+    def setUp(self):
+        self.application = random_objects.random_application()
+        self.notification = Notification.objects.get(name=Notification.APPROVAL)
+
+    def test_should_filter_by_status(self):
+        NotificationStatus.objects.create(application=self.application, notification=self.notification,
+                                          status=NotificationStatus.NOT_SENT)
+
+        self.assertTrue(notification_status_exists(self.application, self.notification))
+        self.assertFalse(notification_status_exists(self.application, self.notification, NotificationStatus.SENT))
+
+    def test_should_count_statuses_pending_in_a_batch_dispatch(self):
+        dispatcher_local.statuses = [NotificationStatus(application=self.application, notification=self.notification,
+                                                        status=NotificationStatus.SENT)]
+        self.addCleanup(setattr, dispatcher_local, 'statuses', None)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertTrue(notification_status_exists(self.application, [self.notification],
+                                                       NotificationStatus.SENT))
+        self.assertEqual(len(queries), 0)
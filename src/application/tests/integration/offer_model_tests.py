@@ -1,11 +1,14 @@
+import uuid
 from unittest.mock import call, patch, MagicMock, Mock
 
 from rest_framework.test import APITestCase
 
 from application.models.address import Address
-from application.models.offer import Offer, OfferStatus
+from application.models.offer import Offer, OfferEnrichmentStatus, OfferStatus
+from application.tasks import enrich_offer
 from application.tests import random_objects
 from application.tests.random_objects import fake
+from utils.property_data_aggregator import PropertyDataAggregatorClientException
 
 class OfferModelTests(APITestCase):
 
@@ -100,4 +103,74 @@ class OfferModelTests(APITestCase):
                                      funding_type=None,
                                      office_name=fake_office_name_locally)
         offer.save()
+        offer.refresh_from_db()
         assert offer.office_name == fake_office_name_from_pda
+        assert offer.enrichment_status == OfferEnrichmentStatus.COMPLETE
+
+    @patch('application.models.offer.PropertyDataAggregatorClient')
+    def test_marks_enrichment_failed_when_listing_is_unavailable(self, pda_mock):
+        pda_mock.return_value.get_listing.side_effect = PropertyDataAggregatorClientException("unable to fetch listing")
+
+        offer = random_objects.random_offer(application=self.application, pda_listing_uuid=uuid.uuid4(),
+                                            year_built=1999)
+        offer.refresh_from_db()
+
+        self.assertEqual(offer.enrichment_status, OfferEnrichmentStatus.FAILED)
+        self.assertEqual(offer.year_built, 1999)
+
+    @patch('application.models.offer.PropertyDataAggregatorClient')
+    def test_does_not_fetch_the_same_listing_again(self, pda_mock):
+        pda_mock.return_value.get_listing.return_value = {'year_built': 1999}
+        offer = random_objects.random_offer(application=self.application, pda_listing_uuid=uuid.uuid4())
+        offer = Offer.objects.get(pk=offer.pk)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(offer.loaded_value('pda_listing_uuid'), offer.pda_listing_uuid)
+        offer.comments = 'updated'
+        offer.save()
+
+        pda_mock.return_value.get_listing.assert_called_once()
+
+    @patch('application.tasks.enrich_offer.apply_async')
+    def test_leaves_the_listing_to_a_job(self, enrich_mock):
+        offer = random_objects.random_offer(application=self.application, pda_listing_uuid=uuid.uuid4(),
+                                            status=OfferStatus.COMPLETE)
+
+        self.assertEqual(offer.enrichment_status, OfferEnrichmentStatus.PENDING)
+        enrich_mock.assert_called_once_with(args=(offer.id, True), kwargs={})
+
+    @patch('application.models.offer.PropertyDataAggregatorClient')
+    def test_requests_the_salesforce_push_once_enriched(self, pda_mock):
+        pda_mock.return_value.get_listing.return_value = {'year_built': 1999}
+
+        offer = random_objects.random_offer(application=self.application, pda_listing_uuid=uuid.uuid4(),
+                                            status=OfferStatus.COMPLETE)
+        offer.refresh_from_db()
+
+        self.assertEqual(offer.year_built, 1999)
+        self.assertIsNotNone(offer.salesforce_push_requested_at)
+
+    @patch('application.tasks.enrich_offer.apply_async')
+    def test_requests_the_salesforce_push_without_a_job(self, enrich_mock):
+        offer = random_objects.random_offer(application=self.application, status=OfferStatus.COMPLETE)
+
+        enrich_mock.assert_not_called()
+        self.assertIsNotNone(offer.salesforce_push_requested_at)
+
+    @patch('application.models.offer.PropertyDataAggregatorClient')
+    def test_saving_a_stale_offer_keeps_the_enriched_fields(self, pda_mock):
+        pda_mock.return_value.get_listing.return_value = {'year_built': 1999}
+        with patch('application.tasks.enrich_offer.apply_async'):
+            offer = random_objects.random_offer(application=self.application, pda_listing_uuid=uuid.uuid4(),
+                                                year_built=None)
+        stale = Offer.objects.get(pk=offer.pk)
+        enrich_offer(offer.id, False)
+        Offer.objects.filter(pk=offer.pk).update(salesforce_id='offer-sf-id')
+
+        stale.comments = 'updated'
+        stale.save()
+
+        stale.refresh_from_db()
+        self.assertEqual(stale.year_built, 1999)
+        self.assertEqual(stale.salesforce_id, 'offer-sf-id')
+        self.assertEqual(stale.comments, 'updated')
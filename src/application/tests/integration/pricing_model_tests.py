@@ -195,10 +195,14 @@ class PricingModelTests(APITestCase):
         self.assertEqual(pricing.estimated_min_rent_amount, 60.62)
         self.assertEqual(pricing.estimated_max_rent_amount, 67.59)
 
-    @patch("application.models.pricing.homeward_salesforce")
-    def test_converting_to_salesforce_payload(self, hw_sf_patch):
-        hw_sf_patch.create_new_salesforce_object.return_value = random_objects.fake.pystr(max_chars=18)
+    @patch("utils.salesforce.homeward_salesforce.create_new_salesforce_object")
+    def test_saving_queues_the_quote_for_salesforce(self, create_object_mock):
+        pricing = random_objects.random_pricing()
 
+        create_object_mock.assert_not_called()
+        self.assertIsNotNone(pricing.salesforce_push_requested_at)
+
+    def test_converting_to_salesforce_payload(self):
         agent = random_objects.random_agent(sf_id="blah")
         application = random_objects.random_application(new_salesforce=fake.pystr(max_chars=18))
         pricing = random_objects.random_pricing(agent=agent, actions=['saved'],
@@ -4,6 +4,7 @@ from datetime import datetime
 from pathlib import Path
 from unittest.mock import ANY, call, patch
 
+from django.core.cache import cache
 from rest_framework.test import APITestCase
 
 from application.models.application import Application
@@ -82,6 +83,8 @@ class PushToSalesforceTests(APITestCase):
         get_current_home_id_mock.return_value = None
         get_id_mock.return_value = None
         create_mock.side_effect = ["new_person_id", "new_old_home_id"]
+        cache.clear()
+        Application.objects.filter(pk=app.pk).update(new_salesforce=None)
         current_home.salesforce_id = None
         current_home.save()
         push_to_salesforce(app.id)
@@ -90,4 +93,28 @@ class PushToSalesforceTests(APITestCase):
         current_home.refresh_from_db()
         self.assertEqual(current_home.salesforce_id, "new_old_home_id")
         get_current_home_id_mock.assert_called_once_with(account_id="new_person_id")
-  
\ No newline at end of file
+  
+    def test_should_resolve_ids_without_querying_salesforce_when_known(self, create_mock, update_mock,
+                                                                     get_current_home_id_mock, get_id_mock):
+        current_home = CurrentHome.objects.get(pk="74d75877-fefc-40cd-8479-7c2008eb7774")
+        current_home.salesforce_id = "current_home_id-123"
+        current_home.save()
+        app = random_objects.random_application(current_home=current_home, new_salesforce="person_id-123")
+
+        push_to_salesforce(app.id)
+
+        get_id_mock.assert_not_called()
+        get_current_home_id_mock.assert_not_called()
+        update_mock.assert_has_calls([call("person_id-123", ANY, SalesforceObjectType.ACCOUNT),
+                                      call("current_home_id-123", ANY, SalesforceObjectType.OLD_HOME)])
+
+    def test_should_cache_ids_found_in_salesforce(self, create_mock, update_mock, get_current_home_id_mock,
+                                                  get_id_mock):
+        app = random_objects.random_application()
+        get_id_mock.return_value = "person_id-123"
+        push_to_salesforce(app.id)
+        Application.objects.filter(pk=app.pk).update(new_salesforce=None, pushed_to_salesforce_on=None)
+
+        push_to_salesforce(app.id)
+
+        get_id_mock.assert_called_once_with(email=app.customer.email)
@@ -0,0 +1,227 @@
+from datetime import timedelta
+from unittest.mock import ANY, patch
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from application.models.application import Application
+from application.models.offer import Offer, OfferStatus
+from application.models.pricing import Pricing
+from application.salesforce_push_tasks import PUSH_LOCK_KEY, push_pending_to_salesforce
+from application.tests import random_objects
+from utils.salesforce import SalesforceException
+from utils.salesforce_model_mixin import SalesforceObjectType
+
+
+@patch("application.salesforce_push_tasks.push_to_salesforce")
+@patch("utils.salesforce.homeward_salesforce.update_salesforce_objects")
+class PushPendingToSalesforceTests(TestCase):
+    def test_should_push_pending_applications_in_one_call(self, update_objects_mock, push_mock):
+        first = random_objects.random_application(new_salesforce='first-sf-id')
+        second = random_objects.random_application(new_salesforce='second-sf-id')
+        not_requested = random_objects.random_application(new_salesforce='third-sf-id')
+        first.request_salesforce_push()
+        second.request_salesforce_push()
+        update_objects_mock.return_value = {'first-sf-id': [], 'second-sf-id': []}
+
+        push_pending_to_salesforce()
+
+        update_objects_mock.assert_called_once_with({'first-sf-id': ANY, 'second-sf-id': ANY},
+                                                    SalesforceObjectType.ACCOUNT)
+        push_mock.assert_not_called()
+        for application in [first, second]:
+            application.refresh_from_db()
+            self.assertIsNone(application.salesforce_push_requested_at)
+            self.assertIsNotNone(application.pushed_to_salesforce_on)
+        not_requested.refresh_from_db()
+        self.assertIsNone(not_requested.pushed_to_salesforce_on)
+
+    def test_should_settle_every_application_sharing_an_account(self, update_objects_mock, push_mock):
+        first = random_objects.random_application(new_salesforce='shared-sf-id')
+        second = random_objects.random_application(new_salesforce='shared-sf-id')
+        first.request_salesforce_push()
+        second.request_salesforce_push()
+        update_objects_mock.return_value = {'shared-sf-id': []}
+
+        push_pending_to_salesforce()
+
+        update_objects_mock.assert_called_once_with({'shared-sf-id': ANY}, SalesforceObjectType.ACCOUNT)
+        for application in [first, second]:
+            application.refresh_from_db()
+            self.assertIsNone(application.salesforce_push_requested_at)
+            self.assertIsNotNone(application.pushed_to_salesforce_on)
+
+    def test_should_not_push_while_the_previous_run_is_pushing(self, update_objects_mock, push_mock):
+        application = random_objects.random_application(new_salesforce='first-sf-id')
+        application.request_salesforce_push()
+        cache.set(PUSH_LOCK_KEY, 'running')
+        self.addCleanup(cache.delete, PUSH_LOCK_KEY)
+
+        push_pending_to_salesforce()
+
+        update_objects_mock.assert_not_called()
+        application.refresh_from_db()
+        self.assertIsNotNone(application.salesforce_push_requested_at)
+
+    @patch("utils.salesforce.homeward_salesforce.get_ids_by_emails")
+    def test_should_fall_back_to_single_push_without_salesforce_id(self, get_ids_mock, update_objects_mock, push_mock):
+        application = random_objects.random_application()
+        application.request_salesforce_push()
+        get_ids_mock.return_value = {}
+        update_objects_mock.return_value = {}
+
+        push_pending_to_salesforce()
+
+        push_mock.assert_called_once_with(application.id)
+        application.refresh_from_db()
+        self.assertIsNone(application.salesforce_push_requested_at)
+
+    @patch("utils.salesforce.homeward_salesforce.get_ids_by_emails")
+    def test_should_look_up_missing_salesforce_ids_in_one_query(self, get_ids_mock, update_objects_mock, push_mock):
+        first = random_objects.random_application()
+        second = random_objects.random_application()
+        first.request_salesforce_push()
+        second.request_salesforce_push()
+        get_ids_mock.return_value = {first.customer.email.lower(): 'first-sf-id',
+                                     second.customer.email.lower(): 'second-sf-id'}
+        update_objects_mock.return_value = {'first-sf-id': [], 'second-sf-id': []}
+
+        push_pending_to_salesforce()
+
+        get_ids_mock.assert_called_once()
+        push_mock.assert_not_called()
+        first.refresh_from_db()
+        self.assertEqual(first.new_salesforce, 'first-sf-id')
+
+    def test_should_not_mark_rejected_records_as_pushed(self, update_objects_mock, push_mock):
+        application = random_objects.random_application(new_salesforce='first-sf-id')
+        application.request_salesforce_push()
+        update_objects_mock.return_value = {'first-sf-id': [{'statusCode': 'FIELD_INTEGRITY_EXCEPTION'}]}
+
+        push_pending_to_salesforce()
+
+        application.refresh_from_db()
+        self.assertIsNone(application.pushed_to_salesforce_on)
+        self.assertIsNotNone(application.salesforce_push_requested_at)
+        self.assertEqual(application.salesforce_push_attempts, 1)
+
+    @override_settings(SALESFORCE_PUSH_MAX_ATTEMPTS=2)
+    def test_should_give_up_on_records_rejected_too_often(self, update_objects_mock, push_mock):
+        application = random_objects.random_application(new_salesforce='first-sf-id')
+        application.request_salesforce_push()
+        update_objects_mock.return_value = {'first-sf-id': [{'statusCode': 'FIELD_INTEGRITY_EXCEPTION'}]}
+
+        push_pending_to_salesforce()
+        push_pending_to_salesforce()
+
+        application.refresh_from_db()
+        self.assertIsNone(application.salesforce_push_requested_at)
+        self.assertEqual(update_objects_mock.call_count, 2)
+
+    def test_should_keep_the_batch_pending_when_salesforce_raises(self, update_objects_mock, push_mock):
+        application = random_objects.random_application(new_salesforce='first-sf-id')
+        application.request_salesforce_push()
+        update_objects_mock.side_effect = SalesforceException('session expired')
+
+        push_pending_to_salesforce()
+
+        application.refresh_from_db()
+        self.assertIsNotNone(application.salesforce_push_requested_at)
+        self.assertEqual(application.salesforce_push_attempts, 0)
+
+    def test_should_keep_applications_pending_when_single_push_fails(self, update_objects_mock, push_mock):
+        application = random_objects.random_application()
+        application.request_salesforce_push()
+        push_mock.return_value = False
+
+        with patch("utils.salesforce.homeward_salesforce.get_ids_by_emails", return_value={}):
+            push_pending_to_salesforce()
+
+        application.refresh_from_db()
+        self.assertIsNotNone(application.salesforce_push_requested_at)
+
+    @patch("utils.salesforce.homeward_salesforce.create_new_salesforce_objects")
+    def test_should_create_offers_when_the_update_call_raises(self, create_objects_mock, update_objects_mock, push_mock):
+        application = random_objects.random_application(new_salesforce='account-id')
+        known = random_objects.random_offer(application=application, salesforce_id='known-offer-id')
+        new = random_objects.random_offer(application=application)
+        Offer.objects.filter(pk__in=[known.pk, new.pk]).update(status=OfferStatus.COMPLETE)
+        known.request_salesforce_push()
+        new.request_salesforce_push()
+        update_objects_mock.side_effect = SalesforceException('session expired')
+        create_objects_mock.return_value = [('new-offer-id', [])]
+
+        push_pending_to_salesforce()
+
+        known.refresh_from_db()
+        new.refresh_from_db()
+        self.assertIsNotNone(known.salesforce_push_requested_at)
+        self.assertIsNone(new.salesforce_push_requested_at)
+        self.assertEqual(new.salesforce_id, 'new-offer-id')
+
+    def test_should_keep_requests_made_after_the_batch_started(self, update_objects_mock, push_mock):
+        application = random_objects.random_application(new_salesforce='first-sf-id')
+        later = timezone.now() + timedelta(minutes=1)
+        Application.objects.filter(pk=application.pk).update(salesforce_push_requested_at=later)
+
+        push_pending_to_salesforce()
+
+        update_objects_mock.assert_not_called()
+        application.refresh_from_db()
+        self.assertEqual(application.salesforce_push_requested_at, later)
+
+    @patch("utils.salesforce.homeward_salesforce.create_new_salesforce_objects")
+    def test_should_push_saved_quotes_in_one_batch(self, create_objects_mock, update_objects_mock, push_mock):
+        known = random_objects.random_pricing(salesforce_id='known-quote-id')
+        new = random_objects.random_pricing()
+        update_objects_mock.return_value = {'known-quote-id': []}
+        create_objects_mock.return_value = [('new-quote-id', [])]
+
+        push_pending_to_salesforce()
+
+        update_objects_mock.assert_called_once_with({'known-quote-id': ANY}, SalesforceObjectType.QUOTE)
+        create_objects_mock.assert_called_once_with([ANY], SalesforceObjectType.QUOTE)
+        new.refresh_from_db()
+        known.refresh_from_db()
+        self.assertEqual(new.salesforce_id, 'new-quote-id')
+        self.assertIsNone(new.salesforce_push_requested_at)
+        self.assertIsNone(known.salesforce_push_requested_at)
+
+    @patch("utils.salesforce.homeward_salesforce.create_new_salesforce_objects")
+    def test_should_not_store_ids_of_rejected_quotes(self, create_objects_mock, update_objects_mock, push_mock):
+        pricing = random_objects.random_pricing()
+        create_objects_mock.return_value = [(None, [{'statusCode': 'REQUIRED_FIELD_MISSING'}])]
+
+        push_pending_to_salesforce()
+
+        pricing.refresh_from_db()
+        self.assertIsNone(pricing.salesforce_id)
+        self.assertIsNotNone(pricing.salesforce_push_requested_at)
+        self.assertEqual(pricing.salesforce_push_attempts, 1)
+
+    @patch("utils.salesforce.homeward_salesforce.create_new_salesforce_objects")
+    def test_should_keep_quotes_pending_when_salesforce_raises(self, create_objects_mock, update_objects_mock,
+                                                                push_mock):
+        pricing = random_objects.random_pricing()
+        create_objects_mock.side_effect = SalesforceException('session expired')
+
+        push_pending_to_salesforce()
+
+        pricing.refresh_from_db()
+        self.assertIsNone(pricing.salesforce_id)
+        self.assertIsNotNone(pricing.salesforce_push_requested_at)
+        self.assertEqual(pricing.salesforce_push_attempts, 0)
+
+    @patch("utils.salesforce.homeward_salesforce.create_new_salesforce_objects")
+    def test_should_keep_quote_ids_when_a_stale_pricing_is_saved(self, create_objects_mock, update_objects_mock,
+                                                                  push_mock):
+        pricing = random_objects.random_pricing()
+        stale = Pricing.objects.get(pk=pricing.pk)
+        create_objects_mock.return_value = [('new-quote-id', [])]
+
+        push_pending_to_salesforce()
+        stale.save()
+
+        stale.refresh_from_db()
+        self.assertEqual(stale.salesforce_id, 'new-quote-id')
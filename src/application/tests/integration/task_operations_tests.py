@@ -3,10 +3,14 @@ import os
 from pathlib import Path
 from unittest.mock import patch
 
+from django.db import connection
 from django.db.utils import IntegrityError
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from parameterized import parameterized
 from rest_framework.test import APITestCase
 
+from application import task_catalog
 from application.models.acknowledgement import Acknowledgement
 from application.models.address import Address
 from application.models.application import (Application, ApplicationStage,
@@ -336,3 +340,35 @@ class TaskOperationsTests(APITestCase):
 
         self.assertFalse(app.task_statuses.filter(task_obj__name=TaskName.PHOTO_UPLOAD).exists())
         self.assertFalse(app.task_statuses.filter(task_obj__name=TaskName.EXISTING_PROPERTY).exists())
+
+    def test_should_write_only_changed_task_statuses_in_one_query(self):
+        app = random_application(current_home=random_current_home(), product_offering=ProductOffering.BUY_SELL)
+        run_task_operations(app)
+        app.task_statuses.update(status=TaskProgress.NOT_STARTED)
+
+        with patch.object(TaskStatus, 'save') as save_mock, \
+                patch.object(TaskStatus.objects, 'bulk_update') as bulk_update_mock:
+            update_application_tasks(app)
+
+        save_mock.assert_not_called()
+        bulk_update_mock.assert_called_once()
+        changed_task_names = {task_status.task_obj.name for task_status in bulk_update_mock.call_args[0][0]}
+        self.assertIn(TaskName.BUYING_SITUATION, changed_task_names)
+        self.assertNotIn(TaskName.PHOTO_UPLOAD, changed_task_names)
+
+    @override_settings(TASK_CATALOG_TTL_SECONDS=300)
+    def test_should_assign_tasks_from_the_catalog_with_one_insert(self):
+        task_catalog.registry.clear()
+        self.addCleanup(task_catalog.registry.clear)
+        task_catalog.get_task(TaskName.REAL_ESTATE_AGENT)
+        app = random_application(current_home=random_current_home(), product_offering=ProductOffering.BUY_SELL)
+        app.task_statuses.all().delete()
+
+        with CaptureQueriesContext(connection) as queries:
+            run_task_operations(app)
+
+        task_queries = [query for query in queries if 'FROM "application_task" ' in query['sql']]
+        inserts = [query for query in queries if query['sql'].startswith('INSERT INTO "application_taskstatus"')]
+        self.assertEqual(task_queries, [], "run_task_operations took {} queries".format(len(queries)))
+        self.assertEqual(len(inserts), 1)
+        self.assertTrue(app.task_statuses.filter(task_obj__name=TaskName.PHOTO_UPLOAD).exists())
@@ -80,7 +80,7 @@ class ApplicationTests(AuthMixin, APITestCase):
     buy_only_payload = open(os.path.join(module_dir, '../static/buy_only_payload.json')).read()
 
     @patch("application.models.pricing.homeward_salesforce")
-    @patch("application.signals.get_partner")
+    @patch("application.email_trigger_tasks.get_partner")
     def test_should_map_complete_response_to_application(self, pbc_patch, hw_sf_patch):
         hw_sf_patch.create_new_salesforce_object.return_value = random_objects.fake.pystr(max_chars=18)
         pbc_patch.return_value = {}
@@ -330,8 +330,8 @@ class ApplicationTests(AuthMixin, APITestCase):
         agent = RealEstateAgent.objects.first()
         self.assertEqual(updated_pricing.agent, agent)
 
-    @patch('utils.hubspot.requests')
-    def test_get_lead_source_should_try_to_create_hubspot_contact_and_try_again(self, mock_requests):
+    @patch('utils.hubspot.transport')
+    def test_get_lead_source_should_try_to_create_hubspot_contact_and_try_again(self, mock_transport):
         class MockResponse:
             __attrs__ = ['_content']
 
@@ -346,7 +346,7 @@ class ApplicationTests(AuthMixin, APITestCase):
             def status_code(self):
                 return 204
 
-        mock_requests.get.side_effect = [MockResponse(self.not_contact_payload), MockResponse(self.contact_payload)]
+        mock_transport.get.side_effect = [MockResponse(self.not_contact_payload), MockResponse(self.contact_payload)]
         get_lead_source_from_hubspot(uuid.uuid4(), '46f5b0be36ae6d90b5242941fca1a48c')
 
     def test_should_map_builder_referral_fields(self):
@@ -0,0 +1,12 @@
+from django.test import SimpleTestCase
+
+from application.models.address import address_search_text, normalize_search_text
+
+
+class AddressSearchTextTests(SimpleTestCase):
+
+    def test_search_text_is_normalized(self):
+        self.assertEqual(address_search_text('3211  Test Rd.', 'Round Rock', 'TX', None), '3211 test rd round rock tx')
+
+    def test_queries_normalize_like_addresses(self):
+        self.assertIn(normalize_search_text('Test Rd., ROUND rock'), address_search_text('3211 Test Rd', 'Round Rock'))
@@ -0,0 +1,99 @@
+import io
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pdfrw
+from django.test import SimpleTestCase, override_settings
+
+from application import contract_template_cache
+
+TEMPLATE_PATH = Path(__file__).parents[3] / 'utils' / 'static' / 'texas_noncondo_resale.pdf'
+TEMPLATE_NAME = 'texas_noncondo_resale.pdf'
+
+
+def template_response(etag='"v1"'):
+    return io.BytesIO(TEMPLATE_PATH.read_bytes()), etag
+
+
+@patch('application.contract_template_cache.retrieve_contract_template_if_modified')
+class ContractTemplateCacheTests(SimpleTestCase):
+
+    def setUp(self):
+        contract_template_cache.clear()
+
+    def tearDown(self):
+        contract_template_cache.clear()
+
+    def test_parses_template_once(self, retrieve_mock):
+        retrieve_mock.side_effect = lambda *args: template_response()
+
+        contract_template_cache.get_template(TEMPLATE_NAME)
+        contract_template_cache.get_template(TEMPLATE_NAME)
+
+        retrieve_mock.assert_called_once_with(TEMPLATE_NAME, None)
+
+    def test_renders_never_change_the_cached_template(self, retrieve_mock):
+        retrieve_mock.side_effect = lambda *args: template_response()
+
+        _, annotations = contract_template_cache.get_template(TEMPLATE_NAME)
+        annotations[0].update(pdfrw.PdfDict(V=pdfrw.objects.pdfstring.PdfString.encode('Filled In')))
+        _, fresh_annotations = contract_template_cache.get_template(TEMPLATE_NAME)
+
+        self.assertEqual(len(fresh_annotations), len(annotations))
+        self.assertNotEqual(fresh_annotations[0]['/V'], annotations[0]['/V'])
+
+    @override_settings(CONTRACT_TEMPLATE_REVALIDATE_SECONDS=0)
+    def test_revalidates_with_etag(self, retrieve_mock):
+        retrieve_mock.side_effect = [template_response(), None, template_response('"v2"')]
+
+        contract_template_cache.get_template(TEMPLATE_NAME)
+        contract_template_cache.get_template(TEMPLATE_NAME)
+        contract_template_cache.get_template(TEMPLATE_NAME)
+
+        self.assertEqual([c[0] for c in retrieve_mock.call_args_list],
+                         [(TEMPLATE_NAME, None), (TEMPLATE_NAME, '"v1"'), (TEMPLATE_NAME, '"v1"')])
+        self.assertEqual(contract_template_cache._templates[TEMPLATE_NAME].etag, '"v2"')
+
+    @patch('application.contract_template_cache.contract_template_etag', return_value='"v2"')
+    def test_template_etag_is_cached_until_revalidation(self, etag_mock, retrieve_mock):
+        retrieve_mock.side_effect = lambda *args: template_response()
+
+        self.assertEqual(contract_template_cache.template_etag(TEMPLATE_NAME), '"v2"')
+        contract_template_cache.get_template(TEMPLATE_NAME)
+        self.assertEqual(contract_template_cache.template_etag(TEMPLATE_NAME), '"v1"')
+        with override_settings(CONTRACT_TEMPLATE_REVALIDATE_SECONDS=0):
+            self.assertEqual(contract_template_cache.template_etag(TEMPLATE_NAME), '"v2"')
+
+        self.assertEqual(etag_mock.call_count, 2)
+
+    def test_warm_render_neither_fetches_nor_parses(self, retrieve_mock):
+        retrieve_mock.side_effect = lambda *args: template_response()
+
+        with patch('application.contract_template_cache.pdfrw.PdfReader', wraps=pdfrw.PdfReader) as reader_mock:
+            contract_template_cache.get_template(TEMPLATE_NAME)
+            contract_template_cache.get_template(TEMPLATE_NAME)
+
+        retrieve_mock.assert_called_once()
+        reader_mock.assert_called_once()
+
+    def test_loading_a_template_does_not_hold_up_other_templates(self, retrieve_mock):
+        downloading = threading.Event()
+        loaded_other_template = threading.Event()
+        waited_for = []
+
+        def retrieve(filename, etag):
+            if filename == 'slow.pdf':
+                downloading.set()
+                waited_for.append(loaded_other_template.wait(5))
+            return template_response()
+
+        retrieve_mock.side_effect = retrieve
+        slow_load = threading.Thread(target=contract_template_cache.get_template, args=['slow.pdf'])
+        slow_load.start()
+        downloading.wait(5)
+        contract_template_cache.get_template(TEMPLATE_NAME)
+        loaded_other_template.set()
+        slow_load.join()
+
+        self.assertEqual(waited_for, [True])
@@ -27,6 +27,14 @@ CELERY_TASK_ALWAYS_EAGER = True
 
 CELERY_TASK_DEFAULT_QUEUE = 'application-service-tasks'
 
+# in-process caches are off locally: test transactions roll back without post_save, and tests mock SSO and OAuth per case
+NOTIFICATION_REGISTRY_TTL_SECONDS = 0
+TASK_CATALOG_TTL_SECONDS = 0
+CAS_GROUPS_CACHE_TTL_SECONDS = 0
+HOMEWARD_OAUTH_TOKEN_MAX_AGE_SECONDS = 0
+PDA_LISTING_CACHE_TTL_SECONDS = 0
+PARTNER_CONFIG_CACHE_TTL_SECONDS = 0
+
 CLOUDAMQP_URL = ''
 
 CAS_SERVER_URL = ''
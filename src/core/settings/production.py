@@ -126,14 +126,42 @@ USE_NEW_PRICING_UPDATES = os.environ.get('USE_NEW_PRICING_UPDATES', False)
 
 HOMEWARD_SSO_BASE_URL = os.environ.get('HOMEWARD_SSO_BASE_URL', '')
 HOMEWARD_SSO_AUTH_TOKEN = os.environ.get('HOMEWARD_SSO_AUTH_TOKEN', '')
+CAS_GROUPS_CACHE_TTL_SECONDS = int(os.environ.get('CAS_GROUPS_CACHE_TTL_SECONDS', 60))
+CAS_GROUPS_CACHE_STALE_SECONDS = int(os.environ.get('CAS_GROUPS_CACHE_STALE_SECONDS', 600))
+CAS_GROUPS_TIMEOUT_SECONDS = float(os.environ.get('CAS_GROUPS_TIMEOUT_SECONDS', 2))
+CAS_GROUPS_CIRCUIT_FAILURE_THRESHOLD = int(os.environ.get('CAS_GROUPS_CIRCUIT_FAILURE_THRESHOLD', 5))
+CAS_GROUPS_CIRCUIT_RESET_SECONDS = int(os.environ.get('CAS_GROUPS_CIRCUIT_RESET_SECONDS', 30))
 
 CELERY_TASK_ALWAYS_EAGER = os.environ.get("CELERY_TASK_ALWAYS_EAGER", False)
 
+# shared between the web and worker dynos, the table is created on release
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': 'application_service_cache',
+    }
+}
+SALESFORCE_ID_CACHE_TTL_SECONDS = int(os.environ.get("SALESFORCE_ID_CACHE_TTL_SECONDS", 60 * 60 * 24))
+SALESFORCE_BULK_SYNC_CHUNK_SIZE = int(os.environ.get("SALESFORCE_BULK_SYNC_CHUNK_SIZE", 50))
+EMAIL_DISPATCH_MAX_WORKERS = int(os.environ.get("EMAIL_DISPATCH_MAX_WORKERS", 8))
+NOTIFICATION_REGISTRY_TTL_SECONDS = int(os.environ.get("NOTIFICATION_REGISTRY_TTL_SECONDS", 300))
+TASK_CATALOG_TTL_SECONDS = int(os.environ.get("TASK_CATALOG_TTL_SECONDS", 300))
+CONTRACT_TEMPLATE_REVALIDATE_SECONDS = int(os.environ.get("CONTRACT_TEMPLATE_REVALIDATE_SECONDS", 60))
+CONTRACT_UPLOAD_MULTIPART_THRESHOLD_BYTES = int(os.environ.get("CONTRACT_UPLOAD_MULTIPART_THRESHOLD_BYTES", 8 * 1024 * 1024))
+
 HOMEWARD_OAUTH_BASE_URL = os.environ.get("HOMEWARD_OAUTH_BASE_URL")
 APPLICATION_SERVICE_CLIENT_ID = os.environ.get("APPLICATION_SERVICE_CLIENT_ID")
 APPLICATION_SERVICE_CLIENT_SECRET = os.environ.get("APPLICATION_SERVICE_CLIENT_SECRET")
+HOMEWARD_OAUTH_TOKEN_MAX_AGE_SECONDS = int(os.environ.get("HOMEWARD_OAUTH_TOKEN_MAX_AGE_SECONDS", 3600))
+HOMEWARD_OAUTH_TOKEN_REFRESH_MARGIN_SECONDS = int(os.environ.get("HOMEWARD_OAUTH_TOKEN_REFRESH_MARGIN_SECONDS", 60))
 PROPERTY_DATA_AGGREGATOR_BASE_ENDPOINT = os.environ.get("PROPERTY_DATA_AGGREGATOR_BASE_ENDPOINT")
+PDA_LISTING_CACHE_TTL_SECONDS = int(os.environ.get("PDA_LISTING_CACHE_TTL_SECONDS", 300))
+PDA_LISTING_NOT_FOUND_TTL_SECONDS = int(os.environ.get("PDA_LISTING_NOT_FOUND_TTL_SECONDS", 60))
+PDA_LISTING_FETCH_MAX_WORKERS = int(os.environ.get("PDA_LISTING_FETCH_MAX_WORKERS", 8))
 AGENT_SERVICE_BASE_ENDPOINT = os.environ.get("AGENT_SERVICE_BASE_ENDPOINT")
 PARTNER_BRANDING_CONFIG_URL = os.environ.get("PARTNER_BRANDING_CONFIG_URL")
+PARTNER_CONFIG_CACHE_TTL_SECONDS = int(os.environ.get("PARTNER_CONFIG_CACHE_TTL_SECONDS", 300))
+PARTNER_CONFIG_CACHE_STALE_SECONDS = int(os.environ.get("PARTNER_CONFIG_CACHE_STALE_SECONDS", 3600))
+PARTNER_CONFIG_TIMEOUT_SECONDS = float(os.environ.get("PARTNER_CONFIG_TIMEOUT_SECONDS", 3))
 
 VALIDATE_PREFERRED_CLOSING_DATE = os.environ.get("VALIDATE_PREFERRED_CLOSING_DATE", True)
@@ -0,0 +1,150 @@
+"""
+Cache of the CAS groups users belong to in Homeward SSO.
+
+Agent-facing permission checks need the groups on every request. They are cached per username for
+CAS_GROUPS_CACHE_TTL_SECONDS. Once that passes, the cached groups are still served for up to
+CAS_GROUPS_CACHE_STALE_SECONDS while a background thread fetches them again, so requests never wait on SSO while a
+recent answer is available. SSO calls time out after CAS_GROUPS_TIMEOUT_SECONDS, and after
+CAS_GROUPS_CIRCUIT_FAILURE_THRESHOLD failures in a row they are skipped for CAS_GROUPS_CIRCUIT_RESET_SECONDS.
+A TTL of 0 turns the cache off.
+"""
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+import requests
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY = 'cas-groups:{}'
+
+_refresh_executor = ThreadPoolExecutor(max_workers=2)
+_refreshing = set()
+_refreshing_lock = threading.Lock()
+
+
+def setting(name: str, default):
+    return getattr(settings, name, default)
+
+
+def cache_ttl() -> int:
+    return int(setting('CAS_GROUPS_CACHE_TTL_SECONDS', 60))
+
+
+def request_timeout() -> float:
+    return float(setting('CAS_GROUPS_TIMEOUT_SECONDS', 2))
+
+
+class CircuitBreaker:
+    """
+    Stops calling a failing service for a while after too many failures in a row. Once the reset period is over the
+    next call goes through, and a single failure opens the circuit again.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.failures = 0
+        self.opened_at = None
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            return time.monotonic() - self.opened_at >= int(setting('CAS_GROUPS_CIRCUIT_RESET_SECONDS', 30))
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.failures >= int(setting('CAS_GROUPS_CIRCUIT_FAILURE_THRESHOLD', 5)):
+                self.opened_at = time.monotonic()
+                logger.warning("Opened circuit breaker", extra=dict(
+                    type="circuit_breaker_opened",
+                    circuit=self.name,
+                    failures=self.failures
+                ))
+
+
+breaker = CircuitBreaker('homeward_sso_groups')
+
+
+def get_groups(user) -> List[str]:
+    """
+    Returns the CAS groups of the user, or an empty list when they can't be determined.
+    """
+    ttl = cache_ttl()
+    if ttl <= 0:
+        return fetch_groups(user) or []
+
+    entry = cache.get(CACHE_KEY.format(user.username))
+    if entry is None:
+        return refresh_groups(user) or []
+    if time.time() - entry['fetched_at'] > ttl:
+        schedule_refresh(user)
+    return entry['groups']
+
+
+def fetch_groups(user) -> Optional[List[str]]:
+    try:
+        return user.request_cas_groups(timeout=request_timeout())
+    except requests.RequestException as e:
+        logger.exception("Unable to reach homeward-sso/user endpoint", exc_info=e, extra=dict(
+            type="fetch_cas_groups_cant_reach_homewardsso",
+            username=user.username
+        ))
+        return None
+
+
+def refresh_groups(user) -> Optional[List[str]]:
+    if not breaker.allow():
+        logger.info("Skipped fetching cas groups while the circuit is open", extra=dict(
+            type="fetch_cas_groups_circuit_open",
+            username=user.username
+        ))
+        return None
+
+    groups = fetch_groups(user)
+    if groups is None:
+        breaker.record_failure()
+        return None
+    breaker.record_success()
+    cache.set(CACHE_KEY.format(user.username), {'groups': groups, 'fetched_at': time.time()},
+              cache_ttl() + int(setting('CAS_GROUPS_CACHE_STALE_SECONDS', 600)))
+    return groups
+
+
+def schedule_refresh(user):
+    with _refreshing_lock:
+        if user.username in _refreshing:
+            return
+        _refreshing.add(user.username)
+    _refresh_executor.submit(refresh_in_background, user)
+
+
+def refresh_in_background(user):
+    try:
+        refresh_groups(user)
+    except Exception as e:
+        logger.exception("Failed refreshing cas groups", exc_info=e, extra=dict(
+            type="refresh_cas_groups_failed",
+            username=user.username
+        ))
+    finally:
+        with _refreshing_lock:
+            _refreshing.discard(user.username)
+        # the database cache opened a connection on this thread
+        connection.close()
+
+
+def invalidate(username: str):
+    cache.delete(CACHE_KEY.format(username))
@@ -1,19 +1,20 @@
 """
 User app models.
 """
-import logging
 import uuid
+from typing import List
+
 import requests
 
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser
 from django.contrib.postgres.fields import JSONField
 from django.db import models
+
+from user import cas_groups
 from utils.salesforce_model_mixin import (SalesforceModelMixin,
                                           SalesforceObjectType)
 
-logger = logging.getLogger(__name__)
-
 
 class User(AbstractUser, SalesforceModelMixin):
     # Salesforce Fields
@@ -29,21 +30,15 @@ class User(AbstractUser, SalesforceModelMixin):
         """
         return "{} {}".format(self.first_name, self.last_name)
 
-    def fetch_cas_groups(self):
+    def fetch_cas_groups(self) -> List[str]:
+        return cas_groups.get_groups(self)
+
+    def request_cas_groups(self, timeout=None) -> List[str]:
         headers = {'Authorization': getattr(settings, 'HOMEWARD_SSO_AUTH_TOKEN')}
         user_endpoint = getattr(settings, 'HOMEWARD_SSO_BASE_URL') + 'user/{}/'.format(self.username)
-        try:
-            resp = requests.get(user_endpoint, headers=headers)
-            resp.raise_for_status()
-            cas_groups = resp.json().get("groups", [])
-            return cas_groups
-        except requests.RequestException as e:
-            logger.exception("Unable to reach homeward-sso/user endpoint", exc_info=e, extra=dict(
-                type="fetch_cas_groups_cant_reach_homewardsso",
-                headers=headers,
-                user_endpoint=user_endpoint,
-            ))
-        return []
+        resp = requests.get(user_endpoint, headers=headers, timeout=timeout)
+        resp.raise_for_status()
+        return resp.json().get("groups", [])
 
     def salesforce_field_mapping(self):
         return {
@@ -0,0 +1,52 @@
+import time
+from unittest import mock
+
+import requests
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from user import cas_groups
+from user.cas_groups import CircuitBreaker
+
+
+@override_settings(CAS_GROUPS_CACHE_TTL_SECONDS=60, CAS_GROUPS_CIRCUIT_FAILURE_THRESHOLD=2)
+class CasGroupsTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        patcher = mock.patch.object(cas_groups, 'breaker', CircuitBreaker('test'))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.user = mock.MagicMock(username='fake_agent_user')
+        self.user.request_cas_groups.return_value = ['Verified Email', 'Claimed Agent']
+
+    def test_should_fetch_groups_once_within_ttl(self):
+        self.assertEqual(cas_groups.get_groups(self.user), ['Verified Email', 'Claimed Agent'])
+        self.assertEqual(cas_groups.get_groups(self.user), ['Verified Email', 'Claimed Agent'])
+
+        self.user.request_cas_groups.assert_called_once_with(timeout=2.0)
+
+    @mock.patch('user.cas_groups.schedule_refresh')
+    def test_should_serve_stale_groups_while_refreshing(self, schedule_refresh_mock):
+        cache.set(cas_groups.CACHE_KEY.format(self.user.username),
+                  {'groups': ['Claimed Agent'], 'fetched_at': time.time() - 120})
+
+        self.assertEqual(cas_groups.get_groups(self.user), ['Claimed Agent'])
+
+        schedule_refresh_mock.assert_called_once_with(self.user)
+        self.user.request_cas_groups.assert_not_called()
+
+    def test_should_stop_calling_sso_once_the_circuit_opens(self):
+        self.user.request_cas_groups.side_effect = requests.ConnectionError
+
+        for _ in range(3):
+            self.assertEqual(cas_groups.get_groups(self.user), [])
+
+        self.assertEqual(self.user.request_cas_groups.call_count, 2)
+
+    def test_should_fetch_again_after_invalidation(self):
+        cas_groups.get_groups(self.user)
+        cas_groups.invalidate(self.user.username)
+        cas_groups.get_groups(self.user)
+
+        self.assertEqual(self.user.request_cas_groups.call_count, 2)
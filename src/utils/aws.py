@@ -4,7 +4,10 @@ AWS related functions are implemented in this script.
 
 from datetime import datetime
 import mimetypes
+from typing import BinaryIO
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.exceptions import ClientError
 from django.conf import settings
 from rest_framework import status
 
@@ -66,44 +69,97 @@ def check_if_object_exists(key):
         return False
     return response['ResponseMetadata']['HTTPStatusCode'] == status.HTTP_200_OK
 
-def upload_homeward_contract(file_path: str, s3_folder_name: str , s3_file_name: str, s3_client=_homeward_contracts_s3_client):
+def homeward_contract_key(s3_folder_name: str, s3_file_name: str) -> str:
+    environment = getattr(settings, 'APP_ENV', 'local')
+    return f'{environment}/{s3_folder_name}/{s3_file_name}'
+
+
+def presign_homeward_contract(s3_key: str, s3_client=_homeward_contracts_s3_client) -> str:
     """
-    Function to upload pre-filled offer contract PDFs to S3
-    Returns a pre-signed s3 url
-    This function will throw FileNotFoundError if file_path is incorrect
+    Returns a pre-signed url to download the contract stored at s3_key, valid for 10 minutes
     """
     expiration = 10 * 60 # 10 minutes
-    environment = getattr(settings, 'APP_ENV', 'local')
-    s3_upload_key = f'{environment}/{s3_folder_name}/{s3_file_name}'
-    with open(file_path, 'rb') as reader:
-        file = reader.read()
-    s3_client.put_object(Bucket=HOMEWARD_CONTRACTS_BUCKET, Key=s3_upload_key, Body=file)
+    return s3_client.generate_presigned_url('get_object', Params={'Bucket': HOMEWARD_CONTRACTS_BUCKET, 'Key': s3_key},
+                                            ExpiresIn=expiration)
+
+
+def find_homeward_contract(s3_folder_name: str, s3_file_name: str, s3_client=_homeward_contracts_s3_client):
+    """
+    Returns a pre-signed url to a contract uploaded earlier, or None when there is no such contract
+    """
+    s3_key = homeward_contract_key(s3_folder_name, s3_file_name)
+    try:
+        s3_client.head_object(Bucket=HOMEWARD_CONTRACTS_BUCKET, Key=s3_key)
+    except ClientError as e:
+        if e.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey', 'NotFound'):
+            return None
+        raise
+    return presign_homeward_contract(s3_key, s3_client)
+
+
+def upload_homeward_contract(contract: BinaryIO, s3_folder_name: str, s3_file_name: str,
+                             s3_client=_homeward_contracts_s3_client):
+    """
+    Function to upload pre-filled offer contract PDFs to S3, streamed from a file-like object
+    Contracts over CONTRACT_UPLOAD_MULTIPART_THRESHOLD_BYTES are uploaded in parts
+    Returns a pre-signed s3 url
+    """
+    s3_upload_key = homeward_contract_key(s3_folder_name, s3_file_name)
+    threshold = int(getattr(settings, 'CONTRACT_UPLOAD_MULTIPART_THRESHOLD_BYTES', 8 * 1024 * 1024))
+    s3_client.upload_fileobj(contract, HOMEWARD_CONTRACTS_BUCKET, s3_upload_key,
+                             ExtraArgs={'ContentType': 'application/pdf'},
+                             Config=TransferConfig(multipart_threshold=threshold, multipart_chunksize=threshold))
 
     # Generate an expiring pre-signed url
-    url = s3_client.generate_presigned_url('get_object',Params={'Bucket': HOMEWARD_CONTRACTS_BUCKET, 'Key': s3_upload_key}, ExpiresIn=expiration)
-    return url
+    return presign_homeward_contract(s3_upload_key, s3_client)
+
+
+def contract_template_key(contract_template_name: str) -> str:
+    return f"contract-templates/{settings.APP_ENV if settings.APP_ENV != 'test' else 'dev'}/{contract_template_name}"
+
+
+def contract_template_etag(contract_template_name: str, s3_client=_homeward_contracts_s3_client) -> str:
+    """Returns the ETag of a contract template, without downloading it.
+
+    Raises:
+        ValueError: that contract template isn't in the bucket
+    """
+    s3_download_key = contract_template_key(contract_template_name)
+    try:
+        s3_response = s3_client.head_object(Bucket=HOMEWARD_CONTRACTS_BUCKET, Key=s3_download_key)
+    except ClientError as e:
+        if e.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey', 'NotFound'):
+            raise ValueError(f"Template '{contract_template_name}' not found at {s3_download_key}") from None
+        raise
+    return s3_response['ETag']
 
 
-def retrieve_contract_template(contract_template_name: str, s3_client=_homeward_contracts_s3_client):
+def retrieve_contract_template_if_modified(contract_template_name: str, etag: str = None,
+                                           s3_client=_homeward_contracts_s3_client):
     """Takes a contract template name and looks in the current
     contracts-templates 'folder' of the S3 bucket for the
-    named item.
+    named item, unless it still has the given ETag.
 
     Args:
         contract_template_name (str): The name of the template to
             retrieve.
+        etag (str): The ETag of the copy the caller already has.
         s3_client (boto3 client): The client to connect to AWS S3.
-            Not straightforward to type-hint, so not doing that.
 
     Returns:
-        StreamingBody: pdf as file-like object - works with PdfReader
+        Tuple[StreamingBody, str]: the template and its ETag, or None when the template still has the given ETag
 
     Raises:
         ValueError: that contract template isn't in the bucket
     """
-    s3_download_key = f"contract-templates/{settings.APP_ENV if settings.APP_ENV != 'test' else 'dev'}/{contract_template_name}"
+    s3_download_key = contract_template_key(contract_template_name)
+    kwargs = {'IfNoneMatch': etag} if etag else {}
     try:
-        s3_response = s3_client.get_object(Bucket=HOMEWARD_CONTRACTS_BUCKET, Key=s3_download_key)
+        s3_response = s3_client.get_object(Bucket=HOMEWARD_CONTRACTS_BUCKET, Key=s3_download_key, **kwargs)
     except s3_client.exceptions.NoSuchKey:
         raise ValueError(f"Template '{contract_template_name}' not found at {s3_download_key}") from None
-    return s3_response['Body']
+    except ClientError as e:
+        if e.response.get('Error', {}).get('Code') in ('304', 'NotModified'):
+            return None
+        raise
+    return s3_response['Body'], s3_response['ETag']
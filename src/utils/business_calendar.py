@@ -0,0 +1,102 @@
+"""
+Business calendar for closings.
+
+Weekends and holidays are precomputed once per year into a bitmap of the year's days and the sorted ordinals of its
+restricted days, so range queries are a bisect and a slice and single days are one lookup.
+"""
+import datetime
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from typing import Iterable, List, Tuple
+
+from dateutil.easter import easter
+from dateutil.relativedelta import relativedelta, MO, TH
+
+# weekdays are represented numerically, with Monday being 0 and sunday being 6
+WEEKEND_DAY_INDEXES = (5, 6)
+
+NON_VARIABLE_HOLIDAY_DATES = [
+    # month, day tuples
+    (1, 1),  # New Years Day
+    (7, 4),  # Independence Day
+    (12, 24),  # Christmas Eve
+    (12, 25),  # Christmas Day
+    (12, 31),  # New Years Eve
+]
+
+
+def holidays(year: int) -> List[datetime.date]:
+    good_friday = easter(year)
+    memorial_day = datetime.date(year, 5, 1) + relativedelta(day=31, weekday=MO(-1))
+    labor_day = datetime.date(year, 9, 1) + relativedelta(weekday=MO)
+    thanksgiving = datetime.date(year, 11, 1) + relativedelta(weekday=TH(+4))
+    day_after_thanksgiving = thanksgiving + datetime.timedelta(days=1)
+
+    return [datetime.date(year, month, day) for month, day in NON_VARIABLE_HOLIDAY_DATES] + \
+           [good_friday, memorial_day, labor_day, thanksgiving, day_after_thanksgiving]
+
+
+def weekend_days(start_date: datetime.date, end_date: datetime.date) -> List[datetime.date]:
+    """
+    Saturdays and Sundays between start_date and end_date (inclusive), stepping a week at a time.
+    """
+    days = []
+    for weekday in WEEKEND_DAY_INDEXES:
+        first = start_date + datetime.timedelta(days=(weekday - start_date.weekday()) % 7)
+        days += [first + datetime.timedelta(weeks=week) for week in range((end_date - first).days // 7 + 1)]
+    return sorted(days)
+
+
+@lru_cache(maxsize=None)
+def year_calendar(year: int) -> Tuple[bytes, Tuple[int, ...]]:
+    """
+    Returns a bitmap with one byte per day of the year, set on weekends and holidays, and the sorted ordinals of those
+    days.
+    """
+    first_day, last_day = datetime.date(year, 1, 1), datetime.date(year, 12, 31)
+    flags = bytearray((last_day - first_day).days + 1)
+    for day in weekend_days(first_day, last_day) + holidays(year):
+        flags[(day - first_day).days] = 1
+    first_ordinal = first_day.toordinal()
+    return bytes(flags), tuple(first_ordinal + index for index, flag in enumerate(flags) if flag)
+
+
+def is_closable(date: datetime.date) -> bool:
+    flags, _ = year_calendar(date.year)
+    return not flags[date.timetuple().tm_yday - 1]
+
+
+def restricted_days(start_date: datetime.date, end_date: datetime.date,
+                    exclude: Iterable[datetime.date] = ()) -> List[datetime.date]:
+    """
+    Weekends and holidays between start_date and end_date (inclusive), in order, leaving out the excluded dates.
+    """
+    start_ordinal, end_ordinal = start_date.toordinal(), end_date.toordinal()
+    exclude = {date.toordinal() for date in exclude}
+    days = []
+    for year in range(start_date.year, end_date.year + 1):
+        _, ordinals = year_calendar(year)
+        days += ordinals[bisect_left(ordinals, start_ordinal):bisect_right(ordinals, end_ordinal)]
+    return [datetime.date.fromordinal(ordinal) for ordinal in days if ordinal not in exclude]
+
+
+def next_closable_days(start_date: datetime.date, count: int,
+                       exclude: Iterable[datetime.date] = ()) -> List[datetime.date]:
+    """
+    The first `count` days from start_date (inclusive) that are neither weekends, holidays nor excluded.
+    """
+    exclude = set(exclude)
+    days = []
+    year = start_date.year
+    index = start_date.timetuple().tm_yday - 1
+    while len(days) < count:
+        flags, _ = year_calendar(year)
+        first_day = datetime.date(year, 1, 1)
+        offset = flags.find(0, index)
+        while offset != -1 and len(days) < count:
+            day = first_day + datetime.timedelta(days=offset)
+            if day not in exclude:
+                days.append(day)
+            offset = flags.find(0, offset + 1)
+        year, index = year + 1, 0
+    return days
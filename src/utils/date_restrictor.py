@@ -1,14 +1,13 @@
 import datetime
-from typing import List
+from typing import List, Optional
 
 import pytz
-from dateutil.easter import easter
-from dateutil.relativedelta import relativedelta, MO, TH
-from django.db.models import Case, When, Value, Sum, Q, FloatField
+from dateutil.relativedelta import relativedelta
+from django.db.models import Max
 
-from application.models.application import ApplicationStage
 from application.models.application import ProductOffering
-from application.models.offer import Offer, OfferStatus
+from application.models.closing_capacity import ClosingCapacity
+from utils import business_calendar
 
 RESTRICTED_DATE_RANGES = {ProductOffering.BUY_ONLY: datetime.timedelta(days=17),
                           ProductOffering.BUY_SELL: datetime.timedelta(days=21)}
@@ -37,11 +36,18 @@ def calculate_restricted_dates(start_date: datetime.date, end_date: datetime.dat
     Holistically determines which dates are restricted between start and end dates (inclusive)
     :param start_date: the earliest date in the date range you want to check
     :param end_date: the latest date in the date range you want to check
-    :return:  list of dates that are restricted.
+    :return:  list of dates that are restricted, dates at capacity first, without duplicates.
     """
+    dates_at_capacity = calculate_dates_at_capacity(start_date, end_date)
+    return dates_at_capacity + business_calendar.restricted_days(start_date, end_date, exclude=dates_at_capacity)
 
-    return calculate_dates_at_capacity(start_date, end_date) + get_weekend_dates(start_date, end_date) + \
-           get_holidays(start_date, end_date)
+
+def is_restricted(date: datetime.date) -> bool:
+    """
+    Whether a single date is restricted, without computing the restricted dates of a whole window.
+    """
+    return not business_calendar.is_closable(date) or \
+        date in calculate_dates_at_capacity(date - datetime.timedelta(days=1), date + datetime.timedelta(days=1))
 
 
 def calculate_dates_at_capacity(start_date: datetime.date, end_date: datetime.date) -> List[datetime.date]:
@@ -56,23 +62,17 @@ def calculate_dates_at_capacity(start_date: datetime.date, end_date: datetime.da
         Returns:
             List[date]: a list of dates that are at capacity (empty list if there are none).
         """
-    return list(Offer.objects \
-                .filter(finance_approved_close_date__gt=start_date, finance_approved_close_date__lt=end_date) \
-                .annotate(capacity_weight=Case(
-        When(Q(application__stage__in=[ApplicationStage.QUALIFIED_APPLICATION, ApplicationStage.FLOOR_PRICE_REQUESTED,
-                                       ApplicationStage.FLOOR_PRICE_COMPLETED, ApplicationStage.APPROVED,
-                                       ApplicationStage.OFFER_REQUESTED, ApplicationStage.OFFER_SUBMITTED],
-               status__in=[OfferStatus.REQUESTED, OfferStatus.MOP_COMPLETE, OfferStatus.APPROVED,
-                           OfferStatus.BACKUP_POSITION_ACCEPTED]),
-             then=Value(0.45)),
-        (When(Q(application__stage__in=[ApplicationStage.OPTION_PERIOD, ApplicationStage.POST_OPTION],
-                status=OfferStatus.WON),
-              then=Value(1.0))
-         ), default=Value(0.0), output_field=FloatField()))
-                .values('finance_approved_close_date')
-                .annotate(weighted_num_offers=Sum('capacity_weight'))
-                .filter(weighted_num_offers__gt=MAXIMUM_CLOSING_CAPACITY)
-                .values_list('finance_approved_close_date', flat=True))
+    return list(ClosingCapacity.objects
+                .filter(date__gt=start_date, date__lt=end_date, weighted_offers__gt=MAXIMUM_CLOSING_CAPACITY)
+                .order_by('date')
+                .values_list('date', flat=True))
+
+
+def closing_capacity_version() -> Optional[datetime.datetime]:
+    """
+    Changes whenever the closing capacity of any day changes.
+    """
+    return ClosingCapacity.objects.aggregate(version=Max('updated_at'))['version']
 
 
 def get_latest_close_date(offer_created_date: datetime.datetime) -> datetime.date:
@@ -83,11 +83,6 @@ def current_homeward_date():
     return datetime.datetime.now().date()
 
 
-def date_range(start_date: datetime.date, end_date: datetime.date):
-    for n in range(int((end_date - start_date).days) + 1):
-        yield start_date + datetime.timedelta(n)
-
-
 def get_weekend_dates(start_date: datetime.date, end_date: datetime.date) -> List[datetime.date]:
     """
     Returns a list of all Saturdays and Sundays between start_date and end_date (inclusive)
@@ -95,14 +90,7 @@ def get_weekend_dates(start_date: datetime.date, end_date: datetime.date) -> Lis
     :param end_date: the last date to check for saturday / sunday-ness
     :return: a list of dates that are all saturday or sunday.
     """
-    # weekdays are represented numerically, with Monday being 0 and sunday being 6
-    weekend_day_indexes = [5, 6]
-    weekend_days = []
-    for date in date_range(start_date, end_date):
-        if date.weekday() in weekend_day_indexes:
-            weekend_days.append(date)
-
-    return weekend_days
+    return business_calendar.weekend_days(start_date, end_date)
 
 
 def get_holidays(start_date: datetime.date, end_date: datetime.date) -> List[datetime.date]:
@@ -112,32 +100,5 @@ def get_holidays(start_date: datetime.date, end_date: datetime.date) -> List[dat
     :param end_date: the end of the date range
     :return: a list of holidays that fall within the date range
     """
-    years = range(start_date.year, end_date.year + 1)
-    non_variable_holiday_dates = [
-        # month, day tuples
-        (1, 1),  # New Years Day
-        (7, 4),  # Independence Day
-        (12, 24),  # Christmas Eve
-        (12, 25),  # Christmas Day
-        (12, 31),  # New Years Eve
-    ]
-    holidays = []
-
-    for year in years:
-        potential_holidays = []
-        for holiday in non_variable_holiday_dates:
-            potential_holidays.append(datetime.date(year, holiday[0], holiday[1]))
-
-        good_friday = easter(year)
-        memorial_day = datetime.date(year, 5, 1) + relativedelta(day=31, weekday=MO(-1))
-        labor_day = datetime.date(year, 9, 1) + relativedelta(weekday=MO)
-        thanksgiving = datetime.date(year, 11, 1) + relativedelta(weekday=TH(+4))
-        day_after_thanksgiving = thanksgiving + datetime.timedelta(days=1)
-
-        potential_holidays += [good_friday, memorial_day, labor_day, thanksgiving, day_after_thanksgiving]
-
-        for holiday_date in potential_holidays:
-            if start_date <= holiday_date <= end_date:
-                holidays.append(holiday_date)
-
-    return holidays
+    return [holiday for year in range(start_date.year, end_date.year + 1)
+            for holiday in business_calendar.holidays(year) if start_date <= holiday <= end_date]
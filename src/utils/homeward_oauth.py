@@ -1,19 +1,93 @@
+"""
+OAuth client for Homeward internal services.
+
+Fetching a token costs a round trip to the OAuth server, so tokens are kept per client id and shared by every client
+in the process. They are never written to the cache backend, which is a database table. A token is reused for up to
+HOMEWARD_OAUTH_TOKEN_MAX_AGE_SECONDS and fetched again HOMEWARD_OAUTH_TOKEN_REFRESH_MARGIN_SECONDS before it expires,
+by a single thread while the others wait for it. The session holding the token is shared as well, so calls to the
+services reuse pooled connections. A max age of 0 turns sharing off.
+"""
+import logging
+import os
+import threading
+import time
+from typing import Optional
+
 from django.conf import settings
 from oauthlib.oauth2 import BackendApplicationClient
 from requests_oauthlib import OAuth2Session
-import os
-
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
 
-class HomewardOauthClient:
+logger = logging.getLogger(__name__)
+
+
+def token_max_age() -> int:
+    return int(getattr(settings, 'HOMEWARD_OAUTH_TOKEN_MAX_AGE_SECONDS', 3600))
+
+
+def fetch_token(client_id: str, client_secret: str) -> dict:
+    oauth = OAuth2Session(client=BackendApplicationClient(client_id))
+    token = dict(oauth.fetch_token(token_url=f"{settings.HOMEWARD_OAUTH_BASE_URL}o/token/", client_id=client_id,
+                                   client_secret=client_secret))
+    lifetime = float(token.get('expires_in') or token_max_age())
+    margin = int(getattr(settings, 'HOMEWARD_OAUTH_TOKEN_REFRESH_MARGIN_SECONDS', 60))
+    token['reuse_until'] = time.time() + min(lifetime - margin, token_max_age())
+    logger.info("Fetched homeward oauth token", extra=dict(
+        type="homeward_oauth_token_fetched",
+        client_id=client_id
+    ))
+    return token
+
+
+def is_fresh(token: Optional[dict]) -> bool:
+    return token is not None and token.get('reuse_until', 0) > time.time()
+
+
+class TokenStore:
     def __init__(self):
-        homeward_oauth_base_endpoint = settings.HOMEWARD_OAUTH_BASE_URL
-        client_id = settings.APPLICATION_SERVICE_CLIENT_ID
-        client_secret = settings.APPLICATION_SERVICE_CLIENT_SECRET
+        self._tokens = {}
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    def get_token(self, client_id: str, client_secret: str) -> dict:
+        token = self._tokens.get(client_id)
+        if is_fresh(token):
+            return token
+        with self._lock:
+            token = self._tokens.get(client_id)
+            if is_fresh(token):
+                return token
+            token = self._tokens[client_id] = fetch_token(client_id, client_secret)
+            return token
+
+    def get_session(self, client_id: str, client_secret: str) -> OAuth2Session:
+        """
+        Returns the shared session of the client, holding a token that is valid for a while yet.
+        """
+        if token_max_age() <= 0:
+            return OAuth2Session(client_id, token=fetch_token(client_id, client_secret))
 
-        oauth = OAuth2Session(client=BackendApplicationClient(client_id))
-        token = oauth.fetch_token(token_url=f"{homeward_oauth_base_endpoint}o/token/", client_id=client_id,
-                                  client_secret=client_secret)
+        token = self.get_token(client_id, client_secret)
+        session = self._sessions.get(client_id)
+        if session is None:
+            with self._lock:
+                session = self._sessions.setdefault(client_id, OAuth2Session(client_id, token=token))
+        if session.token.get('access_token') != token['access_token']:
+            session.token = token
+        return session
 
-        self.client = OAuth2Session(client_id, token=token)
+    def clear(self):
+        with self._lock:
+            self._tokens = {}
+            self._sessions = {}
+
+
+token_store = TokenStore()
+
+
+class HomewardOauthClient:
+    @property
+    def client(self) -> OAuth2Session:
+        return token_store.get_session(settings.APPLICATION_SERVICE_CLIENT_ID,
+                                       settings.APPLICATION_SERVICE_CLIENT_SECRET)
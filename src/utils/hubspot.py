@@ -4,11 +4,8 @@ import urllib
 import urllib.parse
 from typing import Dict, List
 
-import requests
 from django.conf import settings
 from django.core.serializers.json import DjangoJSONEncoder
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 
 from application import constants
 from application.models.customer import Customer
@@ -17,6 +14,8 @@ from application.models.new_home_purchase import NewHomePurchase
 from application.models.notification import Notification
 from application.models.offer import Offer
 from application.models.real_estate_agent import RealEstateAgent
+from application.notification_registry import get_notification
+from utils.hubspot_transport import HubspotTransport
 
 logger = logging.getLogger(__name__)
 
@@ -61,6 +60,13 @@ base_url = "https://api.hubapi.com/"
 base_contact_url = "{}contacts/v1/contact".format(base_url)
 email_send_url = "{}email/public/v1/singleEmail/send?hapikey={}".format(base_url, token)
 
+transport = HubspotTransport(pool_size=int(settings.HUBSPOT.get('POOL_SIZE', 10)),
+                             timeout=float(settings.HUBSPOT.get('TIMEOUT_SECONDS', 10)),
+                             max_retries=int(settings.HUBSPOT.get('MAX_RETRIES', 3)),
+                             backoff_factor=float(settings.HUBSPOT.get('BACKOFF_FACTOR', 3)),
+                             # email sends were always retried, contact creates and updates must not be
+                             retried_post_prefixes=["{}email/public/v1/singleEmail/send".format(base_url)])
+
 
 def create(data):
     try:
@@ -72,7 +78,7 @@ def create(data):
         ))
         return False
 
-    result = requests.post(url=form_url, data=encoded_data, headers=URL_ENCODED_HEADERS)
+    result = transport.post(form_url, 'create', data=encoded_data, headers=URL_ENCODED_HEADERS)
 
     if result.status_code != 204:
         logger.error("Failed pushing data to hubspot", extra=dict(
@@ -88,7 +94,7 @@ def create(data):
 
 def update_contact(email, data):
     url = "{}/email/{}/profile?hapikey={}".format(base_contact_url, email, token)
-    response = requests.post(url=url, json=data)
+    response = transport.post(url, 'update_contact', json=data)
     if response.status_code == 204:
         return True
     elif response.status_code == 400:
@@ -159,7 +165,7 @@ def get_lead_source_from_hubspot(utk: str) -> Dict[str, str]:
 
 def get_profile_by_hutk(utk: str) -> Dict[str, str]:
     url = "{}/utk/{}/profile?hapikey={}".format(base_contact_url, utk, token)
-    response = requests.get(url=url, headers=URL_ENCODED_HEADERS)
+    response = transport.get(url, 'get_profile_by_hutk', headers=URL_ENCODED_HEADERS)
     hubspot_data = json.loads(response.content)
     if response.status_code == 404:
         raise HubspotTokenNotFound("user token {} not found".format(utk))
@@ -173,7 +179,7 @@ def send_photo_task_complete_notification(first_name, last_name, link):
     if not settings.PHOTO_UPLOAD_NOTIFICATION_EMAIL:
         raise EmailTemplateNotDefined("Unable to send email -- notification email address not configured")
 
-    photo_upload_notification = Notification.objects.get(name=Notification.PHOTO_UPLOAD)
+    photo_upload_notification = get_notification(Notification.PHOTO_UPLOAD)
     email_id = photo_upload_notification.template_id
     if not email_id:
         raise EmailTemplateNotDefined("no template ID specified photo upload notification - skipping")
@@ -197,7 +203,7 @@ def send_photo_task_complete_notification(first_name, last_name, link):
 
 
 def send_hca_referral_sign_up_notification(agent, customer_name, customer_first_name):
-    referral_sign_up_notification = Notification.objects.get(name=Notification.REFERRAL_SIGN_UP)
+    referral_sign_up_notification = get_notification(Notification.REFERRAL_SIGN_UP)
     email_id = referral_sign_up_notification.template_id
     if not email_id:
         raise EmailTemplateNotDefined("no template ID specified for hca referral sign up notification - skipping")
@@ -227,7 +233,7 @@ def send_hca_referral_sign_up_notification(agent, customer_name, customer_first_
 
 
 def send_agent_registration_notification(agent_email: str, agent_first_name: str, customer_first_name: str):
-    notification = Notification.objects.get(name=Notification.AGENT_REFERRAL_COMPLETE_EMAIL)
+    notification = get_notification(Notification.AGENT_REFERRAL_COMPLETE_EMAIL)
     email_id = notification.template_id
     if not email_id:
         raise EmailTemplateNotDefined("no template ID specified for agent registration notification - skipping")
@@ -257,7 +263,7 @@ def send_application_under_review(customer_name: str, customer_email: str, appli
                                   loan_advisor_last_name: str = None, loan_advisor_call_link: str = None,
                                   loan_advisor_phone: str = None):
 
-    application_under_review_notification = Notification.objects.get(name=Notification.APPLICATION_UNDER_REVIEW)
+    application_under_review_notification = get_notification(Notification.APPLICATION_UNDER_REVIEW)
     email_id = application_under_review_notification.template_id
     if not email_id:
         raise EmailTemplateNotDefined("no template ID specified for application under review email - skipping")
@@ -303,7 +309,7 @@ def send_application_under_review(customer_name: str, customer_email: str, appli
 
 
 def send_unacknowledged_service_agreement_email(customer: Customer):
-    unacknowledged_service_agreement_notification = Notification.objects.get(name=Notification.OFFER_REQUESTED_UNACKNOWLEDGED_SERVICE_AGREEMENT)
+    unacknowledged_service_agreement_notification = get_notification(Notification.OFFER_REQUESTED_UNACKNOWLEDGED_SERVICE_AGREEMENT)
     email_id = unacknowledged_service_agreement_notification.template_id
     if not email_id:
         raise EmailTemplateNotDefined("no template ID specified for unacknowledged service agreement email - skipping")
@@ -325,7 +331,7 @@ def send_unacknowledged_service_agreement_email(customer: Customer):
 
 
 def send_offer_submitted(customer: Customer, offer: Offer, offer_price: int, cc_email_list: List[str], from_email: str):
-    offer_submitted_notification = Notification.objects.get(name=Notification.OFFER_SUBMITTED)
+    offer_submitted_notification = get_notification(Notification.OFFER_SUBMITTED)
     email_id = offer_submitted_notification.template_id
     if not email_id:
         raise EmailTemplateNotDefined("no template ID specified for offer submitted email - skipping")
@@ -362,7 +368,7 @@ def send_offer_submitted(customer: Customer, offer: Offer, offer_price: int, cc_
 
 def send_offer_submitted_agent(agent_email: str, agent_name: str, new_home_street: str, cx_first_name: str,
                                cx_last_name: str, homeward_owner_email: str, cc_email_list: List[str]):
-    offer_submitted_agent_notification = Notification.objects.get(name=Notification.OFFER_SUBMITTED_AGENT)
+    offer_submitted_agent_notification = get_notification(Notification.OFFER_SUBMITTED_AGENT)
     email_id = offer_submitted_agent_notification.template_id
     if not email_id:
         raise EmailTemplateNotDefined("no template ID specified for offer submitted agent email - skipping")
@@ -401,7 +407,7 @@ def send_offer_submitted_agent(agent_email: str, agent_name: str, new_home_stree
 
 def send_offer_accepted(customer_email: str, customer_name: str, new_home_purchase: NewHomePurchase,
                         floor_price: str, cc_email_list: List[str], from_email: str):
-    offer_accepted_notification = Notification.objects.get(name=Notification.OFFER_ACCEPTED)
+    offer_accepted_notification = get_notification(Notification.OFFER_ACCEPTED)
     email_id = offer_accepted_notification.template_id
     if not email_id:
         raise EmailTemplateNotDefined("no template ID specified for offer accepted email - skipping")
@@ -459,7 +465,7 @@ def send_offer_accepted(customer_email: str, customer_name: str, new_home_purcha
 def send_purchase_price_updated(customer: Customer, preapproval_amount: int, cc_email_list: List[str],
                                 contact_first_name: str, contact_last_name: str, contact_email: str,
                                 contact_schedule_a_call_url: str):
-    purchase_price_updated_notification = Notification.objects.get(name=Notification.PURCHASE_PRICE_UPDATED)
+    purchase_price_updated_notification = get_notification(Notification.PURCHASE_PRICE_UPDATED)
     email_id = purchase_price_updated_notification.template_id
     if not email_id:
         raise EmailTemplateNotDefined("no template ID specified for purchase price updated email - skipping")
@@ -512,7 +518,7 @@ def send_non_hw_mortgage_candidate_approval(customer_email: str, customer_name:
                                             cx_last_name: str = None, cx_call_link: str = None, cx_email: str = None,
                                             cx_phone: str = None):
 
-    approval_notification = Notification.objects.get(name=Notification.APPROVAL)
+    approval_notification = get_notification(Notification.APPROVAL)
     email_id = approval_notification.template_id
     if not email_id:
         raise EmailTemplateNotDefined("no template ID specified for approval email - skipping")
@@ -584,7 +590,7 @@ def send_hw_mortgage_candidate_approval(customer_email: str,
                                         loan_advisor_email: str = None, 
                                         loan_advisor_schedule_a_call_link: str = None, 
                                         ):
-    approval_notification = Notification.objects.get(name=Notification.HW_MORTGAGE_CANDIDATE_APPROVAL)
+    approval_notification = get_notification(Notification.HW_MORTGAGE_CANDIDATE_APPROVAL)
     email_id = approval_notification.template_id
     if not email_id:
         raise EmailTemplateNotDefined("no template ID specified for approval email - skipping")
@@ -637,7 +643,7 @@ def send_hw_mortgage_candidate_approval(customer_email: str,
 def send_agent_instructions(agent_name, agent_email: str, customer_name: str, application_id: str,
                             cc_email_list: List[str], from_email: str, cx_first_name: str = None,
                             cx_last_name: str = None, cx_call_link: str = None):
-    agent_instructions_notification = Notification.objects.get(name=Notification.AGENT_OFFER_INSTRUCTIONS)
+    agent_instructions_notification = get_notification(Notification.AGENT_OFFER_INSTRUCTIONS)
     email_id = agent_instructions_notification.template_id
     if not email_id:
         raise EmailTemplateNotDefined("no template ID specified for agent instructions email - skipping")
@@ -684,7 +690,7 @@ def send_agent_instructions(agent_name, agent_email: str, customer_name: str, ap
 
 def send_pre_homeward_close(customer: Customer, new_home_purchase: NewHomePurchase, cc_email_list: List[str],
                             from_email: str):
-    pre_homeward_close_notification = Notification.objects.get(name=Notification.PRE_HOMEWARD_CLOSE)
+    pre_homeward_close_notification = get_notification(Notification.PRE_HOMEWARD_CLOSE)
     email_id = pre_homeward_close_notification.template_id
     if not email_id:
         raise EmailTemplateNotDefined("no template ID specified for pre-homeward close email - skipping")
@@ -725,7 +731,7 @@ def send_pre_homeward_close(customer: Customer, new_home_purchase: NewHomePurcha
 
 def send_pre_customer_close(customer: Customer, new_home_purchase: NewHomePurchase, cc_email_list: List[str],
                             cx_manager: InternalSupportUser, from_email: str):
-    pre_customer_close_notification = Notification.objects.get(name=Notification.PRE_CUSTOMER_CLOSE)
+    pre_customer_close_notification = get_notification(Notification.PRE_CUSTOMER_CLOSE)
     email_id = pre_customer_close_notification.template_id
     if not email_id:
         raise EmailTemplateNotDefined("no template ID specified for pre-customer close email - skipping")
@@ -769,7 +775,7 @@ def send_pre_customer_close(customer: Customer, new_home_purchase: NewHomePurcha
 
 
 def send_expiring_approval_email(customer_email: str, customer_name: str, agent_email: str, homeward_owner_email: str):
-    expiring_approval_notification = Notification.objects.get(name=Notification.EXPIRING_APPROVAL)
+    expiring_approval_notification = get_notification(Notification.EXPIRING_APPROVAL)
     email_id = expiring_approval_notification.template_id
     if not email_id:
         raise EmailTemplateNotDefined("no template ID specified for expiring approval email - skipping")
@@ -794,7 +800,7 @@ def send_expiring_approval_email(customer_email: str, customer_name: str, agent_
 def send_agent_pre_customer_close(customer_name: str, agent_name: str, agent_email: str,
                                   address_street: str, close_date: str, homeward_owner_email: str,
                                   transaction_coordinator_email):
-    pre_customer_close_agent_notification = Notification.objects.get(name=Notification.AGENT_PRE_CUSTOMER_CLOSE)
+    pre_customer_close_agent_notification = get_notification(Notification.AGENT_PRE_CUSTOMER_CLOSE)
     email_id = pre_customer_close_agent_notification.template_id
     if not email_id:
         raise EmailTemplateNotDefined("no template ID specified for agent pre-homeward close email - skipping")
@@ -833,7 +839,7 @@ def send_agent_pre_customer_close(customer_name: str, agent_name: str, agent_ema
 
 
 def send_agent_customer_close(agent_name, agent_email, customer_name, new_home_street, homeward_owner_email, transaction_coordinator_email):
-    agent_customer_close_notification = Notification.objects.get(name=Notification.AGENT_CUSTOMER_CLOSE)
+    agent_customer_close_notification = get_notification(Notification.AGENT_CUSTOMER_CLOSE)
     email_id = agent_customer_close_notification.template_id
     if not email_id:
         raise EmailTemplateNotDefined("no template ID specified for agent customer close email - skipping")
@@ -869,7 +875,7 @@ def send_agent_customer_close(agent_name, agent_email, customer_name, new_home_s
 
 
 def send_homeward_close(customer: Customer, cc_email_list: List[str], from_email: str):
-    homeward_close_notification = Notification.objects.get(name=Notification.HOMEWARD_CLOSE)
+    homeward_close_notification = get_notification(Notification.HOMEWARD_CLOSE)
     email_id = homeward_close_notification.template_id
     if not email_id:
         raise EmailTemplateNotDefined("no template ID specified for homeward close email - skipping")
@@ -896,7 +902,7 @@ def send_homeward_close(customer: Customer, cc_email_list: List[str], from_email
 
 def send_customer_close(name: str, email: str, street: str, cc_email_list: List[str],
                         from_email: str):
-    customer_close_notification = Notification.objects.get(name=Notification.CUSTOMER_CLOSE)
+    customer_close_notification = get_notification(Notification.CUSTOMER_CLOSE)
     email_id = customer_close_notification.template_id
     if not email_id:
         raise EmailTemplateNotDefined("no template ID specified for customer close email - skipping")
@@ -929,7 +935,7 @@ def send_customer_close(name: str, email: str, street: str, cc_email_list: List[
 
 def send_incomplete_account_notification(customer: Customer, buying_agent: RealEstateAgent, resume_link: str,
                                          notification_name: str):
-    notification = Notification.objects.get(name=notification_name)
+    notification = get_notification(notification_name)
 
     if not notification.template_id:
         raise EmailTemplateNotDefined("no template ID specified for {} - skipping".format(notification.name))
@@ -973,7 +979,7 @@ def send_incomplete_account_notification(customer: Customer, buying_agent: RealE
 
 def send_fast_track_resume_email(buy_agent_email: str, buy_agent_name: str, customer_name: str, customer_first_name: str,
                                  customer_email: str, resume_link: str):
-    notification = Notification.objects.get(name=Notification.FAST_TRACK_RESUME)
+    notification = get_notification(Notification.FAST_TRACK_RESUME)
 
     if not notification.template_id:
         raise EmailTemplateNotDefined("no template ID specified for fast track resume email - skipping")
@@ -1009,7 +1015,7 @@ def send_fast_track_resume_email(buy_agent_email: str, buy_agent_name: str, cust
 
 def send_vpal_incomplete_email(buying_agent_email, customer_first_name, customer_email, co_borrower_email, 
                                approval_specialist_email, approval_specialist_first_name, approval_specialist_last_name):
-    notification = Notification.objects.get(name=Notification.VPAL_INCOMPLETE)
+    notification = get_notification(Notification.VPAL_INCOMPLETE)
 
     if not notification.template_id:
         raise EmailTemplateNotDefined("no template ID specified for VPAL Incomplete - skipping")
@@ -1044,7 +1050,7 @@ def send_vpal_suspended_email(customer_email, customer_first_name, cc_email_list
                               loan_advisor_last_name: str = None, loan_advisor_call_link: str = None, loan_advisor_phone: str = None,
                               loan_advisor_email: str = None, approval_specialist_email: str = None, approval_specialist_first_name: str = None,
                               approval_specialist_last_name: str = None):
-    notification = Notification.objects.get(name=Notification.VPAL_SUSPENDED)
+    notification = get_notification(Notification.VPAL_SUSPENDED)
 
     if not notification.template_id:
         raise EmailTemplateNotDefined("no template ID specified for VPAL Suspended - skipping")
@@ -1098,7 +1104,7 @@ def send_vpal_suspended_email(customer_email, customer_first_name, cc_email_list
 
 def send_vpal_ready_for_review_email(customer_first_name, customer_email, co_borrower_email, buying_agent_email, 
                                     approval_specialist_email, approval_specialist_first_name, approval_specialist_last_name):
-    notification = Notification.objects.get(name=Notification.VPAL_READY_FOR_REVIEW)
+    notification = get_notification(Notification.VPAL_READY_FOR_REVIEW)
 
     if not notification.template_id:
         raise EmailTemplateNotDefined("no template ID specified for VPAL Ready For Review - skipping")
@@ -1131,7 +1137,7 @@ def send_vpal_ready_for_review_email(customer_first_name, customer_email, co_bor
 
 
 def send_vpal_ready_for_review_follow_up(customer_first_name, customer_last_name, customer_email, co_borrower_email, buying_agent_email):
-    notification = Notification.objects.get(name=Notification.VPAL_READY_FOR_REVIEW_FOLLOW_UP)
+    notification = get_notification(Notification.VPAL_READY_FOR_REVIEW_FOLLOW_UP)
 
     if not notification.template_id:
         raise EmailTemplateNotDefined("no template ID specified for VPAL Ready For Review Follow Up - skipping")
@@ -1147,7 +1153,7 @@ def send_vpal_ready_for_review_follow_up(customer_first_name, customer_last_name
 
 
 def send_agent_referral_welcome_email(customer: Customer, buying_agent: RealEstateAgent, pricing_link: str):
-    notification = Notification.objects.get(name=Notification.AGENT_REFERRAL_CUSTOMER_WELCOME_EMAIL)
+    notification = get_notification(Notification.AGENT_REFERRAL_CUSTOMER_WELCOME_EMAIL)
 
     if not notification.template_id:
         raise EmailTemplateNotDefined("no template ID specified for agent referral welcome email - skipping")
@@ -1189,7 +1195,7 @@ def send_agent_referral_welcome_email(customer: Customer, buying_agent: RealEsta
 
 
 def send_cma_request(agent_email, agent_name, customer_name, current_home_street):
-    cma_request_notification = Notification.objects.get(name=Notification.CMA_REQUEST)
+    cma_request_notification = get_notification(Notification.CMA_REQUEST)
     email_id = cma_request_notification.template_id
     if not email_id:
         raise EmailTemplateNotDefined("no template ID specified for CMA request - skipping")
@@ -1222,7 +1228,7 @@ def send_cma_request(agent_email, agent_name, customer_name, current_home_street
 
 
 def send_cx_manager_message(cx_manager_email, message, customer_name, customer_email, customer_sf_url):
-    cma_request_notification = Notification.objects.get(name=Notification.CX_MESSAGE)
+    cma_request_notification = get_notification(Notification.CX_MESSAGE)
     email_id = cma_request_notification.template_id
     if not email_id:
         raise EmailTemplateNotDefined("no template ID specified for cx message - skipping")
@@ -1258,7 +1264,7 @@ def send_cx_manager_message(cx_manager_email, message, customer_name, customer_e
 
 
 def send_incomplete_agent_referral_reminder(agent_email: str, agent_first_name: str, resume_link: str):
-    cma_request_notification = Notification.objects.get(name=Notification.INCOMPLETE_REFERRAL)
+    cma_request_notification = get_notification(Notification.INCOMPLETE_REFERRAL)
     email_id = cma_request_notification.template_id
     if not email_id:
         raise EmailTemplateNotDefined("no template ID specified for incomplete referral - skipping")
@@ -1284,7 +1290,7 @@ def send_incomplete_agent_referral_reminder(agent_email: str, agent_first_name:
 
 
 def send_saved_quote_cta(agent_first_name: str, agent_email: str, resume_link: str):
-    cma_saved_quote_cta = Notification.objects.get(name=Notification.SAVED_QUOTE)
+    cma_saved_quote_cta = get_notification(Notification.SAVED_QUOTE)
     email_id = cma_saved_quote_cta.template_id
     if not email_id:
         raise EmailTemplateNotDefined("no template ID specified for saved quote - skipping")
@@ -1317,7 +1323,7 @@ def send_saved_quote_cta(agent_first_name: str, agent_email: str, resume_link: s
 
 def send_new_customer_partner_email(customer_name, customer_email, customer_phone, home_buying_stage, home_buying_location,
                                     current_home_address, partner_name, partner_email):
-    new_customer_partner_email = Notification.objects.get(name=Notification.NEW_CUSTOMER_PARTNER_EMAIL)
+    new_customer_partner_email = get_notification(Notification.NEW_CUSTOMER_PARTNER_EMAIL)
     email_id = new_customer_partner_email.template_id
     if not email_id:
         raise EmailTemplateNotDefined("no template ID specified for {} - skipping".format(new_customer_partner_email.name))
@@ -1362,7 +1368,7 @@ def send_new_customer_partner_email(customer_name, customer_email, customer_phon
 
 
 def send_apex_site_pre_account_email(customer_email, customer_first_name, partner_name, resume_link, agent_email):
-    apex_site_pre_account_notification = Notification.objects.get(name=Notification.APEX_SITE_PRE_ACCOUNT)
+    apex_site_pre_account_notification = get_notification(Notification.APEX_SITE_PRE_ACCOUNT)
     email_id = apex_site_pre_account_notification.template_id
     if not email_id:
         raise EmailTemplateNotDefined("no template ID specified for {} - skipping".format(apex_site_pre_account_notification.name))
@@ -1392,7 +1398,7 @@ def send_apex_site_pre_account_email(customer_email, customer_first_name, partne
 
 def send_application_complete_email(customer_email, customer_first_name, agent_email, 
                                     approval_specialist_first_name, approval_specialist_last_name, approval_specialist_phone_number, approval_specialist_email, loan_advisor_first_name, loan_advisor_last_name):
-    application_complete_notification = Notification.objects.get(name=Notification.APPLICATION_COMPLETE)
+    application_complete_notification = get_notification(Notification.APPLICATION_COMPLETE)
     email_id = application_complete_notification.template_id
     if not email_id:
         raise EmailTemplateNotDefined(f"no template ID specified for {application_complete_notification.name} - skipping")
@@ -1434,10 +1440,8 @@ def send_application_complete_email(customer_email, customer_first_name, agent_e
 
 
 def send_mail(data):
-    s = requests.Session()
-    retries = Retry(total=3, backoff_factor=3, method_whitelist=['POST'], status_forcelist=[500, 502, 503, 504], raise_on_status=False)
-    s.mount('https://', HTTPAdapter(max_retries=retries))
-    response = s.post(url=email_send_url, data=json.dumps(data, cls=DjangoJSONEncoder), headers=JSON_HEADERS)
+    response = transport.post(email_send_url, 'send_mail', data=json.dumps(data, cls=DjangoJSONEncoder),
+                              headers=JSON_HEADERS)
     if response.status_code != 200:
         logger.error("Failed to send email", extra=dict(
             type="failed_to_send_hubspot_email",
@@ -0,0 +1,80 @@
+import logging
+import os
+import threading
+import time
+from collections import Counter
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+
+class HubspotTransport:
+    """
+    Keep-alive connection pool for calls to HubSpot, shared by the threads of a process. The session is rebuilt after a
+    fork so celery workers never share sockets with their parent.
+
+    Rate limited and failed calls are retried for idempotent methods only, since a retried POST may create a contact
+    twice. POSTs to urls starting with one of `retried_post_prefixes` are retried as well.
+    """
+
+    def __init__(self, pool_size=10, timeout=10, max_retries=3, backoff_factor=3, retried_post_prefixes=()):
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.retried_post_prefixes = retried_post_prefixes
+        self.stats = Counter()
+        self._session = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def build_adapter(self, retried_methods) -> HTTPAdapter:
+        retries = Retry(total=self.max_retries, backoff_factor=self.backoff_factor, method_whitelist=retried_methods,
+                        status_forcelist=[429, 500, 502, 503, 504], raise_on_status=False)
+        return HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size, max_retries=retries)
+
+    def build_session(self) -> requests.Session:
+        adapter = self.build_adapter(Retry.DEFAULT_METHOD_WHITELIST)
+        session = requests.Session()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        for prefix in self.retried_post_prefixes:
+            # requests picks the adapter of the longest matching prefix
+            session.mount(prefix, self.build_adapter(Retry.DEFAULT_METHOD_WHITELIST | {'POST'}))
+        return session
+
+    @property
+    def session(self) -> requests.Session:
+        if self._session is None or self._pid != os.getpid():
+            with self._lock:
+                if self._session is None or self._pid != os.getpid():
+                    self._session = self.build_session()
+                    self._pid = os.getpid()
+        return self._session
+
+    def request(self, method: str, url: str, call: str, **kwargs) -> requests.Response:
+        kwargs.setdefault('timeout', self.timeout)
+        started = time.monotonic()
+        response = None
+        try:
+            response = self.session.request(method, url, **kwargs)
+            return response
+        finally:
+            elapsed_ms = (time.monotonic() - started) * 1000
+            self.stats['{}_calls'.format(call)] += 1
+            self.stats['{}_ms'.format(call)] += elapsed_ms
+            logger.info("Hubspot call finished", extra=dict(
+                type="hubspot_call_latency",
+                call=call,
+                elapsed_ms=round(elapsed_ms, 1),
+                status_code=response.status_code if response is not None else None
+            ))
+
+    def get(self, url: str, call: str, **kwargs) -> requests.Response:
+        return self.request('GET', url, call, **kwargs)
+
+    def post(self, url: str, call: str, **kwargs) -> requests.Response:
+        return self.request('POST', url, call, **kwargs)
@@ -0,0 +1,60 @@
+import time
+import uuid
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from api.v1_0_0.filters import ApplicationFilterSet
+from application.models.models import Application
+from application.models.customer import Customer
+
+LAST_NAMES = ['Smith', 'Johnson', 'Williams', 'Brown', 'Jones', 'Garcia', 'Miller', 'Davis', 'Rodriguez', 'Martinez']
+
+SEARCHES = [
+    {'name': 'garcia'},
+    {'email': 'buyer4242'},
+    {'phone': '5554242'},
+    {'q': 'martinez'},
+    {'q': 'buyer4242'},
+]
+
+
+class Command(BaseCommand):
+    help = 'Times the application list filters against synthetic applications, which are rolled back afterwards'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--applications', type=int, default=1000000)
+        parser.add_argument('--batch-size', type=int, default=10000)
+        parser.add_argument('--explain', action='store_true', help='Print the query plan of every search')
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            self.create_applications(options['applications'], options['batch_size'])
+            with connection.cursor() as cursor:
+                cursor.execute('ANALYZE application_customer')
+                cursor.execute('ANALYZE application_application')
+            for search in SEARCHES:
+                self.time_search(search, options['explain'])
+            transaction.set_rollback(True)
+
+    def create_applications(self, count, batch_size):
+        started = time.monotonic()
+        for offset in range(0, count, batch_size):
+            customers = [Customer(id=uuid.uuid4(),
+                                  name='Buyer{} {}'.format(number, LAST_NAMES[number % len(LAST_NAMES)]),
+                                  email='buyer{}@example.com'.format(number),
+                                  phone='555{:07d}'.format(number))
+                         for number in range(offset, min(offset + batch_size, count))]
+            Customer.objects.bulk_create(customers)
+            Application.objects.bulk_create([Application(customer=customer, product_offering='buy-sell')
+                                             for customer in customers])
+        self.stdout.write('Created {} applications in {:.1f}s'.format(count, time.monotonic() - started))
+
+    def time_search(self, search, explain):
+        queryset = ApplicationFilterSet(search, queryset=Application.objects.all()).qs[:10]
+        started = time.monotonic()
+        results = len(queryset)
+        elapsed_ms = (time.monotonic() - started) * 1000
+        self.stdout.write('{}: {} results in {:.1f}ms'.format(search, results, elapsed_ms))
+        if explain:
+            self.stdout.write(queryset.explain(analyze=True))
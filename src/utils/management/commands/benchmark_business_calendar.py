@@ -0,0 +1,37 @@
+import datetime
+import timeit
+
+from django.core.management.base import BaseCommand
+
+from utils import business_calendar
+
+
+def day_by_day_restricted_days(start_date, end_date):
+    # the calendar as computed before it was precomputed per year, kept as a reference
+    holidays = {holiday for year in range(start_date.year, end_date.year + 1)
+                for holiday in business_calendar.holidays(year)}
+    days = []
+    for n in range((end_date - start_date).days + 1):
+        date = start_date + datetime.timedelta(n)
+        if date.weekday() in [5, 6] or date in holidays:
+            days.append(date)
+    return days
+
+
+class Command(BaseCommand):
+    help = 'Times the precomputed business calendar against computing the restricted days one day at a time'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--runs', type=int, default=20)
+
+    def handle(self, *args, **options):
+        start_date = datetime.date.today()
+        for months in [18, 60]:
+            end_date = start_date + datetime.timedelta(days=months * 30)
+            business_calendar.restricted_days(start_date, end_date)
+            precomputed = timeit.timeit(lambda: business_calendar.restricted_days(start_date, end_date),
+                                        number=options['runs'])
+            day_by_day = timeit.timeit(lambda: day_by_day_restricted_days(start_date, end_date),
+                                       number=options['runs'])
+            self.stdout.write('{} months: precomputed {:.2f}ms, day by day {:.2f}ms per run'.format(
+                months, precomputed * 1000 / options['runs'], day_by_day * 1000 / options['runs']))
@@ -0,0 +1,32 @@
+import io
+import time
+from pathlib import Path
+
+import pdfrw
+from django.core.management.base import BaseCommand
+
+from application.contract_template_cache import ParsedTemplate
+
+TEMPLATE_PATH = Path(__file__).parents[2] / 'static' / 'texas_noncondo_resale.pdf'
+
+
+class Command(BaseCommand):
+    help = 'Times parsing a contract template against copying the cached parse, as cold and warm renders do'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--template', default=str(TEMPLATE_PATH), help='Path of a local contract template')
+        parser.add_argument('--renders', type=int, default=20)
+
+    def handle(self, *args, **options):
+        body = Path(options['template']).read_bytes()
+
+        started = time.perf_counter()
+        template = ParsedTemplate('benchmark', pdfrw.PdfReader(io.BytesIO(body)))
+        cold_ms = (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        for _ in range(options['renders']):
+            template.copy()
+        warm_ms = (time.perf_counter() - started) * 1000 / options['renders']
+
+        self.stdout.write('cold: {:.1f}ms, warm: {:.1f}ms per render'.format(cold_ms, warm_ms))
@@ -0,0 +1,76 @@
+import time
+import uuid
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from application.models.address import Address
+from application.models.customer import Customer
+from application.models.models import Application
+from application.models.offer import Offer, OfferStatus
+from utils.salesforce import bulk_sync_offer_records_from_salesforce, sync_records_in_bulk, \
+    update_offer_from_salesforce
+
+
+class Command(BaseCommand):
+    help = 'Times syncing offer records from salesforce one by one against the bulk sync, on synthetic offers which ' \
+           'are rolled back afterwards'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--offers', type=int, default=1000)
+        parser.add_argument('--chunk-size', type=int, default=50, help='Records per bulk sync task')
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            offers = self.create_offers(options['offers'])
+            applications = {application.id: application.new_salesforce for application in
+                            Application.objects.filter(id__in={offer.application_id for offer in offers})}
+
+            def sync_one_by_one(records):
+                def sync_record(salesforce_data):
+                    application = Application.objects.get(new_salesforce=salesforce_data[Offer.CUSTOMER_FIELD])
+                    update_offer_from_salesforce(application, salesforce_data)
+                return sync_records_in_bulk(records, sync_record)
+
+            for name, sync in [('one by one', sync_one_by_one), ('bulk', bulk_sync_offer_records_from_salesforce)]:
+                records = [self.offer_record(offer, applications[offer.application_id]) for offer in offers]
+                self.time_sync(name, sync, records, options['chunk_size'])
+            transaction.set_rollback(True)
+
+    def create_offers(self, count):
+        customers = Customer.objects.bulk_create([Customer(id=uuid.uuid4(), name='Buyer{} Smith'.format(number),
+                                                           email='buyer{}@example.com'.format(number))
+                                                  for number in range(count)])
+        applications = Application.objects.bulk_create([
+            Application(customer=customer, product_offering='buy-sell', new_salesforce='benchmark-account-{}'.format(
+                number)) for number, customer in enumerate(customers)])
+        addresses = Address.objects.bulk_create([Address(id=uuid.uuid4(), street='{} Main St'.format(number))
+                                                 for number in range(count)])
+        return Offer.objects.bulk_create([
+            Offer(id=uuid.uuid4(), application=application, offer_property_address=address,
+                  status=OfferStatus.REQUESTED, salesforce_id='benchmark-offer-{}'.format(number))
+            for number, (application, address) in enumerate(zip(applications, addresses))])
+
+    def offer_record(self, offer, account_id):
+        return {
+            'Id': offer.salesforce_id,
+            Offer.OFFER_SALESFORCE_ID: offer.salesforce_id,
+            Offer.HOMEWARD_ID: str(offer.id),
+            Offer.CUSTOMER_FIELD: account_id,
+            Offer.STATUS_FIELD: offer.status,
+            Offer.OFFER_PRICE_FIELD: uuid.uuid4().int % 1000000,
+            Offer.ADDRESS_STREET_FIELD: '{} Oak Ave'.format(uuid.uuid4().int % 10000),
+            Offer.ADDRESS_CITY_FIELD: 'Austin',
+            Offer.ADDRESS_STATE_FIELD: 'TX',
+            Offer.ADDRESS_ZIP_FIELD: '78701',
+        }
+
+    def time_sync(self, name, sync, records, chunk_size):
+        started = time.monotonic()
+        with CaptureQueriesContext(connection) as queries:
+            for start in range(0, len(records), chunk_size):
+                sync(records[start:start + chunk_size])
+        elapsed = time.monotonic() - started
+        self.stdout.write('{}: {} records in {:.1f}s, {:.0f} records/s, {} queries'.format(
+            name, len(records), elapsed, len(records) / elapsed, len(queries)))
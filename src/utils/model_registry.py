@@ -0,0 +1,88 @@
+"""
+In-process snapshots of small configuration tables.
+
+A registry loads every row of its model with one query, indexes the rows by the field combinations it is asked for,
+and serves lookups from memory. It is cleared when a row is saved or deleted in this process and reloaded after the
+TTL read from settings, which bounds how long other processes keep a stale row. A TTL of 0 turns the registry off and
+sends every lookup to the database.
+"""
+import logging
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+
+logger = logging.getLogger(__name__)
+
+
+class ModelRegistry:
+    def __init__(self, model, ttl_setting: str, indexes: Iterable[Tuple[str, ...]], default_ttl: int = 300):
+        self.model = model
+        self.ttl_setting = ttl_setting
+        self.default_ttl = default_ttl
+        self.indexes = [tuple(sorted(fields)) for fields in indexes]
+        self._lock = threading.Lock()
+        self._snapshot = None
+        self._loaded_at = None
+        post_save.connect(self.clear, sender=model, weak=False)
+        post_delete.connect(self.clear, sender=model, weak=False)
+
+    def ttl(self) -> int:
+        return int(getattr(settings, self.ttl_setting, self.default_ttl))
+
+    def clear(self, **kwargs):
+        with self._lock:
+            self._snapshot = None
+            self._loaded_at = None
+
+    def snapshot(self) -> Optional[Dict[tuple, Dict[tuple, list]]]:
+        ttl = self.ttl()
+        if ttl <= 0:
+            return None
+        with self._lock:
+            if self._snapshot is None or time.monotonic() - self._loaded_at > ttl:
+                rows = list(self.model.objects.all())
+                self._snapshot = {fields: self.build_index(rows, fields) for fields in self.indexes}
+                self._loaded_at = time.monotonic()
+                logger.debug("Loaded model registry", extra=dict(
+                    type="model_registry_loaded",
+                    model=self.model.__name__,
+                    row_count=len(rows)
+                ))
+            return self._snapshot
+
+    @staticmethod
+    def build_index(rows: list, fields: tuple) -> Dict[tuple, list]:
+        index = defaultdict(list)
+        for row in rows:
+            index[tuple(getattr(row, field) for field in fields)].append(row)
+        return dict(index)
+
+    def filter(self, **lookup) -> List:
+        """
+        Returns the rows whose fields equal the lookup. The lookup fields must be one of the registry's indexes.
+        """
+        snapshot = self.snapshot()
+        if snapshot is None:
+            return list(self.model.objects.filter(**lookup))
+        fields = tuple(sorted(lookup))
+        return list(snapshot[fields].get(tuple(lookup[field] for field in fields), []))
+
+    def get(self, **lookup):
+        """
+        Returns the one row matching the lookup, raising like Model.objects.get. Rows are shared, so they must not be
+        modified.
+        """
+        if self.ttl() <= 0:
+            return self.model.objects.get(**lookup)
+        rows = self.filter(**lookup)
+        if len(rows) > 1:
+            raise self.model.MultipleObjectsReturned(
+                "get() returned {} {} rows for {}".format(len(rows), self.model.__name__, lookup))
+        if not rows:
+            # added by another process since the registry was loaded, or missing altogether
+            return self.model.objects.get(**lookup)
+        return rows[0]
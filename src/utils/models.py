@@ -20,6 +20,74 @@ class CustomBaseModelMixin(models.Model):
         abstract = True
 
 
+class LoadedValuesMixin(models.Model):
+    """
+    Abstract model class remembering the values fields had when the instance was loaded, so saves can compare against
+    them without reading the row again.
+
+    Fields in `background_fields` are written by background jobs with update(). A save only writes them when they were
+    changed on the instance, so an instance loaded before the job ran doesn't reset them.
+    """
+    tracked_fields = []
+    background_fields = []
+
+    class Meta:
+        """ Meta class """
+        abstract = True
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super(LoadedValuesMixin, cls).from_db(db, field_names, values)
+        instance.remember_loaded_values()
+        return instance
+
+    def refresh_from_db(self, using=None, fields=None):
+        super(LoadedValuesMixin, self).refresh_from_db(using=using, fields=fields)
+        self.remember_loaded_values(fields)
+
+    def remember_loaded_values(self, fields=None):
+        loaded = self.__dict__.setdefault('_loaded_values', {})
+        for name in set(self.tracked_fields) | set(self.background_fields):
+            attname = self._meta.get_field(name).attname
+            # deferred fields are left out rather than loaded
+            if (fields is None or name in fields or attname in fields) and attname in self.__dict__:
+                loaded[name] = self.__dict__[attname]
+
+    def forget_loaded_values(self, *names):
+        """
+        Makes the next save write the fields, whether or not they changed since the instance was loaded.
+        """
+        loaded = self.__dict__.get('_loaded_values', {})
+        for name in names:
+            loaded.pop(name, None)
+
+    def loaded_value(self, name):
+        """
+        Returns the persisted value of a tracked field, the id for foreign keys, or None for instances that are not
+        saved yet.
+        """
+        if self._state.adding:
+            return None
+        loaded = self.__dict__.get('_loaded_values', {})
+        if name not in loaded:
+            return type(self)._default_manager.filter(pk=self.pk) \
+                .values_list(self._meta.get_field(name).attname, flat=True).first()
+        return loaded[name]
+
+    def save(self, *args, **kwargs):
+        loaded = self.__dict__.get('_loaded_values', {})
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            untouched = {name for name in self.background_fields
+                         if name in loaded and getattr(self, self._meta.get_field(name).attname) == loaded[name]}
+            if untouched:
+                deferred = self.get_deferred_fields()
+                kwargs['update_fields'] = [field.name for field in self._meta.concrete_fields
+                                           if not field.primary_key and field.attname not in deferred
+                                           and field.name not in untouched]
+        super(LoadedValuesMixin, self).save(*args, **kwargs)
+        self.remember_loaded_values(kwargs.get('update_fields'))
+
+
 class ModelDiffMixin(object):
     """
     A model mixin that tracks model fields' values and provide some useful api
@@ -29,6 +97,7 @@ class ModelDiffMixin(object):
     def __init__(self, *args, **kwargs):
         super(ModelDiffMixin, self).__init__(*args, **kwargs)
         self.__initial = self._dict
+        self.__original = None
 
     @property
     def diff(self):
@@ -45,6 +114,24 @@ class ModelDiffMixin(object):
     def changed_fields(self):
         return self.diff.keys()
 
+    @property
+    def original(self):
+        """
+        Returns the persisted version of this instance. The row is fetched at most once per save so that
+        every pre_save receiver can compare against it without issuing its own query.
+        """
+        if self._state.adding or self.pk is None:
+            return None
+        if self.__original is None:
+            self.__original = type(self)._default_manager.get(pk=self.pk)
+        return self.__original
+
+    def clear_original(self):
+        """
+        Drops the cached persisted version, so the next save compares against a fresh snapshot.
+        """
+        self.__original = None
+
     def get_field_diff(self, field_name):
         """
         Returns a diff for field if it's changed and None otherwise.
@@ -55,8 +142,12 @@ class ModelDiffMixin(object):
         """
         Saves model and set initial state.
         """
-        super(ModelDiffMixin, self).save(*args, **kwargs)
-        self.__initial = self._dict
+        try:
+            super(ModelDiffMixin, self).save(*args, **kwargs)
+            self.__initial = self._dict
+        finally:
+            # the cached original only describes the row as it was before this save, even when the save failed
+            self.__original = None
 
     @property
     def _dict(self):
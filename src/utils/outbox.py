@@ -0,0 +1,156 @@
+"""
+Transactional outbox for celery side effects triggered from model signals.
+
+Tasks handed to `publish_on_commit` inside a transaction are buffered until that transaction commits, collapsed
+by (task, key) and then published as one batch over a single broker connection. Nothing is published when the
+transaction rolls back, and messages added inside a savepoint that rolls back are dropped with it. Inside a
+`window()` the messages of every transaction committed during the block are held back and published together when it
+ends. OutboxWindowMiddleware opens a window around every request, so the saves of one API call publish once.
+
+Tasks declared with `batch_dispatch=True` that are published together are sent as a single dispatch_email_batch
+message instead of one message each.
+"""
+import json
+import logging
+import threading
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import transaction
+
+from utils.celery import app as celery_app
+
+logger = logging.getLogger(__name__)
+
+_local = threading.local()
+
+
+class OutboxBuffer:
+    def __init__(self):
+        self.messages = {}
+
+    def add(self, task, args, kwargs, key, options):
+        dedupe_key = (task.name, key)
+        if dedupe_key in self.messages:
+            logger.debug("Collapsed duplicate outbox message", extra=dict(
+                type="outbox_message_collapsed",
+                task=task.name
+            ))
+        self.messages[dedupe_key] = (task, args, kwargs, options)
+
+    def flush(self):
+        buffers = getattr(_local, 'buffers', {})
+        for savepoint_ids in [savepoint_ids for savepoint_ids, buffer in buffers.items() if buffer is self]:
+            del buffers[savepoint_ids]
+        window_buffer = getattr(_local, 'window', None)
+        if window_buffer is not None and window_buffer is not self:
+            window_buffer.messages.update(self.messages)
+            self.messages = {}
+            return
+        messages, self.messages = batch_dispatch_messages(list(self.messages.values())), {}
+        if not messages:
+            return
+        with celery_app.producer_or_acquire() as producer:
+            for task, args, kwargs, options in messages:
+                try:
+                    task.apply_async(args=args, kwargs=kwargs, producer=producer, **options)
+                except Exception as e:
+                    # the transaction is already committed, so a failed publish must not take the others with it
+                    logger.exception("Unable to publish outbox message", exc_info=e, extra=dict(
+                        type="outbox_publish_failed",
+                        task=task.name,
+                        task_args=args,
+                        task_kwargs=kwargs
+                    ))
+        logger.info("Flushed outbox", extra=dict(
+            type="outbox_flushed",
+            message_count=len(messages)
+        ))
+
+
+def batch_dispatch_messages(messages: list) -> list:
+    batchable = [message for message in messages if getattr(message[0], 'batch_dispatch', False) is True
+                 and not message[3]]
+    if len(batchable) < 2:
+        return messages
+    from application.email_dispatcher import dispatch_email_batch
+    entries = [[task.name, list(args), kwargs] for task, args, kwargs, _ in batchable]
+    return [message for message in messages if message not in batchable] + [(dispatch_email_batch, (entries,), {}, {})]
+
+
+@contextmanager
+def window():
+    """
+    Holds back everything published inside the block, across any number of transactions, and publishes it in one
+    batch when the block ends.
+    """
+    if getattr(_local, 'window', None) is not None:
+        yield
+        return
+    buffer = _local.window = OutboxBuffer()
+    try:
+        yield
+    finally:
+        _local.window = None
+        buffer.flush()
+
+
+class OutboxWindowMiddleware:
+    """
+    Publishes what a request triggers once the response is ready, collapsing the messages of all its saves.
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with window():
+            return self.get_response(request)
+
+
+def _current_buffer(connection) -> OutboxBuffer:
+    """
+    Returns the buffer of the innermost savepoint. Django drops the on_commit hooks of a transaction or savepoint that
+    rolls back, so each savepoint gets a buffer and hook of its own and its messages are dropped with it.
+    """
+    registered = [hook for _, hook in connection.run_on_commit]
+    # buffers whose hook was dropped belong to a rolled back savepoint or transaction
+    buffers = _local.buffers = {savepoint_ids: buffer for savepoint_ids, buffer in getattr(_local, 'buffers', {}).items()
+                                if buffer.flush in registered}
+    savepoint_ids = tuple(connection.savepoint_ids)
+    buffer = buffers.get(savepoint_ids)
+    if buffer is None:
+        buffer = buffers[savepoint_ids] = OutboxBuffer()
+        transaction.on_commit(buffer.flush)
+    # savepoints nested in this one that are left have been released, so their messages now belong to this one
+    for released_ids in [ids for ids in buffers if len(ids) > len(savepoint_ids)
+                         and ids[:len(savepoint_ids)] == savepoint_ids]:
+        released = buffers.pop(released_ids)
+        buffer.messages.update(released.messages)
+        released.messages = {}
+    return buffer
+
+
+def default_key(args, kwargs) -> str:
+    return json.dumps([list(args), kwargs], sort_keys=True, default=str)
+
+
+def publish_on_commit(task, args=(), kwargs=None, key=None, **options):
+    """
+    Publishes `task` once the current transaction commits. Messages for the same task and key are sent once per
+    transaction; the key defaults to the task arguments. Outside of a transaction and a window, or when tasks run
+    eagerly, the task is published straight away.
+    """
+    args = tuple(args)
+    kwargs = kwargs or {}
+    connection = transaction.get_connection()
+    if getattr(settings, 'CELERY_TASK_ALWAYS_EAGER', False):
+        return task.apply_async(args=args, kwargs=kwargs, **options)
+    if not connection.in_atomic_block:
+        window_buffer = getattr(_local, 'window', None)
+        if window_buffer is None:
+            return task.apply_async(args=args, kwargs=kwargs, **options)
+        window_buffer.add(task, args, kwargs, key if key is not None else default_key(args, kwargs), options)
+        return None
+
+    _current_buffer(connection).add(task, args, kwargs, key if key is not None else default_key(args, kwargs),
+                                    options)
@@ -1,28 +1,103 @@
+"""
+Branding configuration of Apex partners, read from the CMS.
+
+Configs are cached per partner slug for PARTNER_CONFIG_CACHE_TTL_SECONDS. Once that passes, the cached config is still
+served for up to PARTNER_CONFIG_CACHE_STALE_SECONDS while a background thread fetches it again. Requests share one
+pooled session and time out after PARTNER_CONFIG_TIMEOUT_SECONDS. A TTL of 0 turns the cache off.
+"""
+import json
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
 
-from django.conf import settings
 import requests
-from requests.packages.urllib3.util.retry import Retry
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
 from requests.adapters import HTTPAdapter
-import json
-from rest_framework import serializers
-
+from requests.packages.urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+CACHE_KEY = 'partner-config:{}'
+
+retry_strategy = Retry(
+    total=2,
+    status_forcelist=[429, 500, 502, 503, 504],
+    backoff_factor=0.5
+)
+http = requests.Session()
+http.mount("https://", HTTPAdapter(max_retries=retry_strategy))
+
+_refresh_executor = ThreadPoolExecutor(max_workers=2)
+_refreshing = set()
+_refreshing_lock = threading.Lock()
+
 
-def get_partner(slug):
-    retry_strategy = Retry(
-        total=3,
-        status_forcelist=[429, 500, 502, 503, 504],
-        backoff_factor=3
-    )
-    adapter = HTTPAdapter(max_retries=retry_strategy)
-    http = requests.Session()
-    http.mount("https://", adapter)
-    response = http.get(f'{settings.PARTNER_BRANDING_CONFIG_URL}partners/{slug}/cms-config/')
+def cache_ttl() -> int:
+    return int(getattr(settings, 'PARTNER_CONFIG_CACHE_TTL_SECONDS', 300))
+
+
+def get_partner(slug) -> dict:
+    """
+    Returns the config of the partner, or an empty dict when it can't be determined.
+    """
+    ttl = cache_ttl()
+    if ttl <= 0:
+        return fetch_partner(slug) or {}
+
+    entry = cache.get(CACHE_KEY.format(slug))
+    if entry is None:
+        return refresh_partner(slug) or {}
+    if time.time() - entry['fetched_at'] > ttl:
+        schedule_refresh(slug)
+    return entry['partner']
+
+
+def fetch_partner(slug) -> Optional[dict]:
+    try:
+        response = http.get(f'{settings.PARTNER_BRANDING_CONFIG_URL}partners/{slug}/cms-config/',
+                            timeout=float(getattr(settings, 'PARTNER_CONFIG_TIMEOUT_SECONDS', 3)))
+    except requests.RequestException as e:
+        logger.exception("Unable to reach partner branding service", exc_info=e, extra=dict(
+            type="partner_branding_service_unreachable",
+            partner_slug=slug
+        ))
+        return None
     if response.status_code == 200:
         return json.loads(response.content)['items'][0]
-    else:
-        logger.error(f"Partner Branding Service returned {response.status_code} with message {response.reason}")
-        return {}
\ No newline at end of file
+    logger.error(f"Partner Branding Service returned {response.status_code} with message {response.reason}")
+    return None
+
+
+def refresh_partner(slug) -> Optional[dict]:
+    partner = fetch_partner(slug)
+    if partner is not None:
+        cache.set(CACHE_KEY.format(slug), {'partner': partner, 'fetched_at': time.time()},
+                  cache_ttl() + int(getattr(settings, 'PARTNER_CONFIG_CACHE_STALE_SECONDS', 3600)))
+    return partner
+
+
+def schedule_refresh(slug):
+    with _refreshing_lock:
+        if slug in _refreshing:
+            return
+        _refreshing.add(slug)
+    _refresh_executor.submit(refresh_in_background, slug)
+
+
+def refresh_in_background(slug):
+    try:
+        refresh_partner(slug)
+    except Exception as e:
+        logger.exception("Failed refreshing partner config", exc_info=e, extra=dict(
+            type="refresh_partner_config_failed",
+            partner_slug=slug
+        ))
+    finally:
+        with _refreshing_lock:
+            _refreshing.discard(slug)
+        # the database cache opened a connection on this thread
+        connection.close()
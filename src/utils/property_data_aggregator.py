@@ -1,12 +1,54 @@
+"""
+Client of the property data aggregator, which serves MLS listings.
+
+Agents often make several offers on the same listings, so listings are cached by uuid for PDA_LISTING_CACHE_TTL_SECONDS
+and listings the aggregator doesn't know for PDA_LISTING_NOT_FOUND_TTL_SECONDS. A TTL of 0 turns the cache off. Cache
+hits and misses are counted per process and logged with every lookup.
+"""
 import logging
-from utils.homeward_oauth import HomewardOauthClient
+import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Optional, Tuple
 
+import requests
 from django.conf import settings
+from django.core.cache import cache
 
+from utils.homeward_oauth import HomewardOauthClient
 
 logger = logging.getLogger(__name__)
 
+LISTING_KEY = 'pda-listing:{}'
+NOT_FOUND = 'not-found'
+
+
+def listing_cache_ttl() -> int:
+    return int(getattr(settings, 'PDA_LISTING_CACHE_TTL_SECONDS', 300))
+
+
+def listing_key(pda_listing_uuid) -> str:
+    return LISTING_KEY.format(str(pda_listing_uuid).lower())
+
+
+class ListingCacheStats:
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def record(self, hits: int, misses: int):
+        with self._lock:
+            self.hits += hits
+            self.misses += misses
+
+    def hit_rate(self) -> Optional[float]:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else None
+
+
+listing_stats = ListingCacheStats()
+
 
 class PropertyDataAggregatorClientException(Exception):
     pass
@@ -18,14 +60,73 @@ class PropertyDataAggregatorClient(HomewardOauthClient):
         self.property_data_aggregator_base_endpoint = settings.PROPERTY_DATA_AGGREGATOR_BASE_ENDPOINT
 
     def get_listing(self, pda_listing_uuid: uuid) -> dict:
-        response = self.client.get(f'{self.property_data_aggregator_base_endpoint}listings/{pda_listing_uuid}')
-        if response.status_code == 200:
-            return response.json()
-        else:
-            logger.error("Non-success response from property data aggregator", extra=dict(
-                type="non_success_property_data_aggregator",
-                status=response.status_code,
-                reason=response.reason,
+        listing = self.get_listings([pda_listing_uuid]).get(pda_listing_uuid)
+        if listing is None:
+            raise PropertyDataAggregatorClientException(f"unable to fetch listing")
+        return listing
+
+    def get_listings(self, pda_listing_uuids: Iterable[uuid.UUID]) -> Dict[uuid.UUID, dict]:
+        """
+        Returns the listings by uuid, leaving out the ones that couldn't be fetched. Listings that aren't cached are
+        fetched concurrently.
+        """
+        pda_listing_uuids = list(dict.fromkeys(pda_listing_uuids))
+        ttl = listing_cache_ttl()
+        cached = cache.get_many([listing_key(listing_uuid) for listing_uuid in pda_listing_uuids]) if ttl > 0 else {}
+
+        listings = {}
+        misses = []
+        for listing_uuid in pda_listing_uuids:
+            entry = cached.get(listing_key(listing_uuid))
+            if entry is None:
+                misses.append(listing_uuid)
+            elif entry != NOT_FOUND:
+                listings[listing_uuid] = entry
+        listing_stats.record(len(pda_listing_uuids) - len(misses), len(misses))
+
+        if misses:
+            session = self.client
+            max_workers = min(len(misses), int(getattr(settings, 'PDA_LISTING_FETCH_MAX_WORKERS', 8)))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(lambda listing_uuid: self.fetch_listing(session, listing_uuid), misses))
+
+            found = {}
+            not_found = {}
+            for listing_uuid, (status_code, listing) in zip(misses, results):
+                if listing is not None:
+                    listings[listing_uuid] = found[listing_key(listing_uuid)] = listing
+                elif status_code == 404:
+                    not_found[listing_key(listing_uuid)] = NOT_FOUND
+            if ttl > 0:
+                cache.set_many(found, ttl)
+                cache.set_many(not_found, int(getattr(settings, 'PDA_LISTING_NOT_FOUND_TTL_SECONDS', 60)))
+
+        logger.info("Looked up property data aggregator listings", extra=dict(
+            type="property_data_aggregator_listings_looked_up",
+            hits=len(pda_listing_uuids) - len(misses),
+            misses=len(misses),
+            hit_rate=listing_stats.hit_rate()
+        ))
+        return listings
+
+    def fetch_listing(self, session, pda_listing_uuid: uuid) -> Tuple[Optional[int], Optional[dict]]:
+        """
+        Returns the status code of the response and the listing, which is None unless the request succeeded.
+        """
+        try:
+            response = session.get(f'{self.property_data_aggregator_base_endpoint}listings/{pda_listing_uuid}')
+        except requests.RequestException as e:
+            logger.exception("Unable to reach property data aggregator", exc_info=e, extra=dict(
+                type="property_data_aggregator_unreachable",
                 pda_listing_uuid=pda_listing_uuid
             ))
-            raise PropertyDataAggregatorClientException(f"unable to fetch listing")
+            return None, None
+        if response.status_code == 200:
+            return response.status_code, response.json()
+        logger.error("Non-success response from property data aggregator", extra=dict(
+            type="non_success_property_data_aggregator",
+            status=response.status_code,
+            reason=response.reason,
+            pda_listing_uuid=pda_listing_uuid
+        ))
+        return response.status_code, None
@@ -1,15 +1,22 @@
 import logging
+import threading
+import time
+import uuid
+from collections import Counter
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 import pytz
+from django.db import transaction
+from django.utils import timezone
 from simple_salesforce import Salesforce as sf, SalesforceExpiredSession
 from simple_salesforce.exceptions import (SalesforceGeneralError,
                                           SalesforceMalformedRequest)
+from simple_salesforce.format import format_soql
 
 from application import constants
-from application.models.address import Address
+from application.models.address import Address, address_search_text
 from application.models.application import Application
 from application.models.brokerage import Brokerage
 from application.models.builder import Builder
@@ -28,6 +35,7 @@ from application.models.stakeholder import Stakeholder
 from application.models.stakeholder_type import StakeholderType
 from application.task_operations import run_task_operations
 from core import settings
+from utils import outbox
 from utils.celery import app as celery_app
 
 logger = logging.getLogger(__name__)
@@ -49,6 +57,9 @@ class SalesforceException(Exception):
 
 
 class Salesforce(object):
+    # sObject Collections accept at most 200 records per request
+    COLLECTION_BATCH_SIZE = 200
+
     SUPPRESSED_SALESFORCE_ERRORS = [
         'UNABLE_TO_LOCK_ROW',  # we should handle this by retry (CF-3609)
         'INSUFFICIENT_ACCESS_ON_CROSS_REFERENCE_ENTITY',  # this is caused by the agent in app-svc having a different
@@ -57,23 +68,60 @@ class Salesforce(object):
     ]
 
     def __init__(self):
-        self.salesforce = sf(**settings.NEW_SALESFORCE)
+        # one session is shared by every thread of the process, it is only replaced when salesforce reports it expired
+        self.salesforce = None
+        self.logged_in_at = None
+        self.session_lock = threading.Lock()
+        self.stats = Counter()
 
+    def login(self):
+        self.salesforce = sf(**settings.NEW_SALESFORCE)
         if self.salesforce is None:
             raise Exception("salesforce was not configured properly")
+        self.logged_in_at = time.monotonic()
+        self.stats['logins'] += 1
 
-    def login(self):
-        self.salesforce = sf(**settings.NEW_SALESFORCE)
+    def session_age(self) -> Optional[float]:
+        if self.logged_in_at is None:
+            return None
+        return time.monotonic() - self.logged_in_at
 
     def get_salesforce(self):
+        session = self.salesforce
+        if session is None:
+            with self.session_lock:
+                if self.salesforce is None:
+                    self.login()
+                session = self.salesforce
+        return session
+
+    def refresh_session(self, expired_session):
+        with self.session_lock:
+            # another thread may have logged in again while this one was waiting
+            if self.salesforce is expired_session:
+                logger.info("Salesforce session expired, logging in again", extra=dict(
+                    type="salesforce_session_expired",
+                    session_age_seconds=self.session_age(),
+                    limits_calls_saved=self.stats['limits_calls_saved']
+                ))
+                self.login()
+                self.stats['session_refreshes'] += 1
+
+    def call(self, operation):
+        """
+        Runs `operation` against the shared session, logging in again and retrying once if the session has expired.
+        """
+        session = self.get_salesforce()
+        # every call used to be preceded by a limits() request to check the session
+        self.stats['limits_calls_saved'] += 1
         try:
-            self.salesforce.limits()
+            return operation(session)
         except SalesforceExpiredSession:
-            self.login()
-        return self.salesforce
+            self.refresh_session(session)
+            return operation(self.get_salesforce())
 
     def build_sf_url(self, sf_id):
-        instance_url = self.salesforce.sf_instance
+        instance_url = self.get_salesforce().sf_instance
         return "https://{}/lightning/r/Account/{}/view".format(instance_url, sf_id)
 
     def get_id_by_email(self, email: str) -> Optional:
@@ -108,13 +156,42 @@ class Salesforce(object):
             return results['records'][0]['Id']
         return None
 
+    def get_ids_by_emails(self, emails: List[str]) -> Dict[str, str]:
+        """
+        Looks up the accounts for many emails with one query per batch. Emails which match more than one account are
+        left out, like get_id_by_email they need to be looked at by hand.
+        """
+        ids = {}
+        ambiguous = set()
+        for start in range(0, len(emails), self.COLLECTION_BATCH_SIZE):
+            search_query = format_soql("SELECT Id, PersonEmail "
+                                       "FROM Account "
+                                       "WHERE PersonEmail IN {} "
+                                       "and RecordTypeId = {}",
+                                       emails[start:start + self.COLLECTION_BATCH_SIZE],
+                                       Application.RECORD_TYPE_ID_VALUE)
+            for record in self.query_all(search_query)['records']:
+                email = record['PersonEmail'].lower()
+                if email in ids:
+                    ambiguous.add(email)
+                ids[email] = record['Id']
+        for email in ambiguous:
+            logger.warning("Found more than one application for email", extra=dict(
+                type="more_than_one_salesforce_account_for_email",
+                email=email
+            ))
+            del ids[email]
+        return ids
+
     def query(self, query):
-        return self.get_salesforce().query(query)
+        return self.call(lambda salesforce: salesforce.query(query))
+
+    def query_all(self, query):
+        return self.call(lambda salesforce: salesforce.query_all(query))
 
     def update_salesforce_object(self, sf_id, data, object_type: SalesforceObjectType):
-        sf_model = getattr(self.get_salesforce(), object_type.value)
         try:
-            sf_model.update(sf_id, data)
+            self.call(lambda salesforce: getattr(salesforce, object_type.value).update(sf_id, data))
         except SalesforceMalformedRequest as e:
             raise SalesforceException(e)
         except SalesforceGeneralError as e:
@@ -126,24 +203,61 @@ class Salesforce(object):
                     sf_id=sf_id,
                     data=data,
                     object_type=object_type,
-                    sf_model=sf_model
+                    sf_model=object_type.value
                 ))
             else:
                 raise e
 
     def create_new_salesforce_object(self, data, object_type: SalesforceObjectType):
-        sf_model = getattr(self.get_salesforce(), object_type.value)
         try:
-            item = sf_model.create(data)
+            item = self.call(lambda salesforce: getattr(salesforce, object_type.value).create(data))
         except SalesforceMalformedRequest as e:
             raise SalesforceException(e)
         return item['id']
 
+    def update_salesforce_objects(self, records: Dict[str, dict], object_type: SalesforceObjectType) -> Dict[str, list]:
+        """
+        Updates many records of one type through the sObject Collections API. Returns the errors reported for each
+        salesforce id; an empty list means the record was updated.
+        """
+        results = {}
+        items = list(records.items())
+        for start in range(0, len(items), self.COLLECTION_BATCH_SIZE):
+            chunk = items[start:start + self.COLLECTION_BATCH_SIZE]
+            payload = [dict(data, id=sf_id, attributes={'type': object_type.value}) for sf_id, data in chunk]
+            for (sf_id, _), result in zip(chunk, self._send_collection('PATCH', payload)):
+                results[sf_id] = [] if result.get('success') else result.get('errors', [])
+        return results
+
+    def create_new_salesforce_objects(self, records: List[dict],
+                                      object_type: SalesforceObjectType) -> List[Tuple[Optional[str], list]]:
+        """
+        Creates many records of one type through the sObject Collections API. Returns a (salesforce id, errors) pair
+        for each record, in the order they were given.
+        """
+        results = []
+        for start in range(0, len(records), self.COLLECTION_BATCH_SIZE):
+            payload = [dict(data, attributes={'type': object_type.value})
+                       for data in records[start:start + self.COLLECTION_BATCH_SIZE]]
+            for result in self._send_collection('POST', payload):
+                if result.get('success'):
+                    results.append((result.get('id'), []))
+                else:
+                    results.append((None, result.get('errors', [])))
+        return results
+
+    def _send_collection(self, method: str, payload: List[dict]) -> list:
+        try:
+            return self.call(lambda salesforce: salesforce.restful('composite/sobjects', method=method,
+                                                                   json={'allOrNone': False, 'records': payload}))
+        except SalesforceMalformedRequest as e:
+            raise SalesforceException(e)
+
     def get_account_by_id(self, sf_id: str):
-        return self.get_salesforce().Account.get(sf_id)
+        return self.call(lambda salesforce: salesforce.Account.get(sf_id))
 
     def get_user_by_id(self, sf_id: str):
-        return self.get_salesforce().User.get(sf_id)
+        return self.call(lambda salesforce: salesforce.User.get(sf_id))
 
 
 homeward_salesforce = Salesforce()
@@ -273,53 +387,65 @@ def sync_offer_record_from_salesforce(salesforce_data):
                              ))
             raise SalesforceException('unable to sync offer due to missing application')
 
-        if salesforce_data.get(Offer.FINANCE_APPROVED_CLOSE_DATE):
-            finance_approved_close_date = datetime.strptime(salesforce_data.get(Offer.FINANCE_APPROVED_CLOSE_DATE),
-                                                            "%Y-%m-%d").date()
-        else:
-            finance_approved_close_date = None
-
-        offer_defaults = {
-            'application': application,
-            'status': salesforce_data.get(Offer.STATUS_FIELD),
-            'offer_price': salesforce_data.get(Offer.OFFER_PRICE_FIELD),
-            'contract_type': salesforce_data.get(Offer.CONTRACT_TYPE_FIELD),
-            'other_offers': salesforce_data.get(Offer.OTHER_OFFER_FIELD),
-            'offer_deadline': salesforce_data.get(Offer.OFFER_DEADLINE_FIELD),
-            'plan_to_lease_back_to_seller': salesforce_data.get(Offer.LEASE_BACK_TO_SELLER_FIELD),
-            'waive_appraisal': salesforce_data.get(Offer.WAIVE_APPRAISAL_FIELD),
-            'year_built': salesforce_data.get(Offer.YEAR_BUILT_FIELD),
-            'home_square_footage': salesforce_data.get(Offer.HOME_SQUARE_FOOTAGE_FIELD),
-            'property_type': salesforce_data.get(Offer.PROPERTY_TYPE_FIELD),
-            'less_than_one_acre': salesforce_data.get(Offer.LESS_THAN_ONE_ACRE_FIELD) == 'Yes',
-            'home_list_price': salesforce_data.get(Offer.HOME_LIST_PRICE_FIELD),
-            'already_under_contract': salesforce_data.get(Offer.ALREADY_UNDER_CONTRACT_FIELD) == 'Yes',
-            'funding_type': salesforce_data.get(Offer.FUNDING_TYPE),
-            'finance_approved_close_date': finance_approved_close_date,
-            'is_save_from_salesforce': True,
-            'salesforce_id': salesforce_data.get(Offer.OFFER_SALESFORCE_ID)
-        }
+        update_offer_from_salesforce(application, salesforce_data)
 
-        address_defaults = {
-            'street': salesforce_data.get(Offer.ADDRESS_STREET_FIELD),
-            'city': salesforce_data.get(Offer.ADDRESS_CITY_FIELD),
-            'state': salesforce_data.get(Offer.ADDRESS_STATE_FIELD),
-            'zip': salesforce_data.get(Offer.ADDRESS_ZIP_FIELD),
-        }
 
-        offer, created = Offer.objects.update_or_create(id=salesforce_data.get(Offer.HOMEWARD_ID),
-                                                        defaults=offer_defaults)
+def offer_values_from_salesforce(application: Application, salesforce_data: dict) -> Tuple[dict, dict]:
+    """
+    Returns the offer fields and the property address fields an offer record from salesforce sets.
+    """
+    if salesforce_data.get(Offer.FINANCE_APPROVED_CLOSE_DATE):
+        finance_approved_close_date = datetime.strptime(salesforce_data.get(Offer.FINANCE_APPROVED_CLOSE_DATE),
+                                                        "%Y-%m-%d").date()
+    else:
+        finance_approved_close_date = None
+
+    offer_defaults = {
+        'application': application,
+        'status': salesforce_data.get(Offer.STATUS_FIELD),
+        'offer_price': salesforce_data.get(Offer.OFFER_PRICE_FIELD),
+        'contract_type': salesforce_data.get(Offer.CONTRACT_TYPE_FIELD),
+        'other_offers': salesforce_data.get(Offer.OTHER_OFFER_FIELD),
+        'offer_deadline': salesforce_data.get(Offer.OFFER_DEADLINE_FIELD),
+        'plan_to_lease_back_to_seller': salesforce_data.get(Offer.LEASE_BACK_TO_SELLER_FIELD),
+        'waive_appraisal': salesforce_data.get(Offer.WAIVE_APPRAISAL_FIELD),
+        'year_built': salesforce_data.get(Offer.YEAR_BUILT_FIELD),
+        'home_square_footage': salesforce_data.get(Offer.HOME_SQUARE_FOOTAGE_FIELD),
+        'property_type': salesforce_data.get(Offer.PROPERTY_TYPE_FIELD),
+        'less_than_one_acre': salesforce_data.get(Offer.LESS_THAN_ONE_ACRE_FIELD) == 'Yes',
+        'home_list_price': salesforce_data.get(Offer.HOME_LIST_PRICE_FIELD),
+        'already_under_contract': salesforce_data.get(Offer.ALREADY_UNDER_CONTRACT_FIELD) == 'Yes',
+        'funding_type': salesforce_data.get(Offer.FUNDING_TYPE),
+        'finance_approved_close_date': finance_approved_close_date,
+        'is_save_from_salesforce': True,
+        'salesforce_id': salesforce_data.get(Offer.OFFER_SALESFORCE_ID)
+    }
 
-        if created:
-            homeward_salesforce.update_salesforce_object(offer.salesforce_id, {Offer.HOMEWARD_ID: str(offer.id)},
-                                                         Offer.salesforce_object_type)
+    address_defaults = {
+        'street': salesforce_data.get(Offer.ADDRESS_STREET_FIELD),
+        'city': salesforce_data.get(Offer.ADDRESS_CITY_FIELD),
+        'state': salesforce_data.get(Offer.ADDRESS_STATE_FIELD),
+        'zip': salesforce_data.get(Offer.ADDRESS_ZIP_FIELD),
+    }
+    return offer_defaults, address_defaults
 
-        if offer.offer_property_address:
-            Address.objects.filter(id=offer.offer_property_address.id).update(**address_defaults)
-        else:
-            offer.offer_property_address = Address.objects.create(**address_defaults)
-            offer.is_save_from_salesforce = True
-            offer.save()
+
+def update_offer_from_salesforce(application: Application, salesforce_data: dict):
+    offer_defaults, address_defaults = offer_values_from_salesforce(application, salesforce_data)
+    offer, created = Offer.objects.update_or_create(id=salesforce_data.get(Offer.HOMEWARD_ID),
+                                                    defaults=offer_defaults)
+
+    if created:
+        homeward_salesforce.update_salesforce_object(offer.salesforce_id, {Offer.HOMEWARD_ID: str(offer.id)},
+                                                     Offer.salesforce_object_type)
+
+    if offer.offer_property_address_id:
+        Address.objects.filter(id=offer.offer_property_address_id) \
+            .update(search_text=address_search_text(**address_defaults), **address_defaults)
+    else:
+        offer.offer_property_address = Address.objects.create(**address_defaults)
+        offer.is_save_from_salesforce = True
+        offer.save()
 
 
 def sync_homeward_purchase_transaction_record_from_salesforce(salesforce_data):
@@ -331,17 +457,37 @@ def sync_homeward_purchase_transaction_record_from_salesforce(salesforce_data):
     if not salesforce_data.get(Offer.OFFER_TRANSACTION_ID):
         raise KeyError('Related Offer ID to Homeward Purchase is not provided')
 
-    try:
-        offer = Offer.objects.get(salesforce_id=salesforce_data.get(Offer.OFFER_TRANSACTION_ID))
-    except Offer.DoesNotExist:
-        logger.warning(f"No offer for salesforce ID: {salesforce_data.get(Offer.OFFER_TRANSACTION_ID)}",
+    offer = get_offer_for_transaction(salesforce_data)
+    if offer is None:
+        return
+
+    new_home_purchase = update_homeward_purchase_from_transaction(offer, salesforce_data)
+    if new_home_purchase:
+        new_home_purchase.save()
+
+
+def get_offer_for_transaction(salesforce_data, known_offers: Optional[Dict[str, Offer]] = None) -> Optional[Offer]:
+    salesforce_id = salesforce_data.get(Offer.OFFER_TRANSACTION_ID)
+    if known_offers is not None:
+        offer = known_offers.get(salesforce_id)
+    else:
+        offer = Offer.objects.filter(salesforce_id=salesforce_id).first()
+
+    if offer is None:
+        logger.warning(f"No offer for salesforce ID: {salesforce_id}",
                        extra=dict(
                            type="no_offer_for_given_sf_id",
-                           salesforce_id=salesforce_data.get(Offer.OFFER_TRANSACTION_ID),
+                           salesforce_id=salesforce_id,
                            salesforce_data=salesforce_data
                        ))
-        return
+    return offer
+
 
+def update_homeward_purchase_from_transaction(offer: Offer, salesforce_data) -> Optional[NewHomePurchase]:
+    """
+    Applies a homeward purchase transaction to the offer's new home purchase. Returns the new home purchase if it
+    already existed and still has to be saved.
+    """
     new_option_end_date = salesforce_data.get(NewHomePurchase.OPTION_END_DATE_FIELD)
     new_homeward_purchase_close_date = salesforce_data.get(NewHomePurchase.NEW_HOME_PURCHASE_CLOSE_DATE)
     new_contract_price = salesforce_data.get(NewHomePurchase.CONTRACT_PRICE_TRANSACTION_FIELD)
@@ -358,16 +504,16 @@ def sync_homeward_purchase_transaction_record_from_salesforce(salesforce_data):
         new_home_purchase.earnest_deposit_percentage = new_earnest_deposit_percentage
         new_home_purchase.homeward_purchase_status = new_homeward_purchase_status
         new_home_purchase.is_reassigned_contract = new_is_reassigned_contract
+        return new_home_purchase
 
-        new_home_purchase.save()
-    else:
-        offer.new_home_purchase = NewHomePurchase.objects.create(option_period_end_date=new_option_end_date,
-                                                                 homeward_purchase_close_date=new_homeward_purchase_close_date,
-                                                                 contract_price=new_contract_price,
-                                                                 earnest_deposit_percentage=new_earnest_deposit_percentage,
-                                                                 homeward_purchase_status=new_homeward_purchase_status,
-                                                                 is_reassigned_contract=new_is_reassigned_contract)
-        offer.save()
+    offer.new_home_purchase = NewHomePurchase.objects.create(option_period_end_date=new_option_end_date,
+                                                             homeward_purchase_close_date=new_homeward_purchase_close_date,
+                                                             contract_price=new_contract_price,
+                                                             earnest_deposit_percentage=new_earnest_deposit_percentage,
+                                                             homeward_purchase_status=new_homeward_purchase_status,
+                                                             is_reassigned_contract=new_is_reassigned_contract)
+    offer.save()
+    return None
 
 
 def sync_customer_purchase_transaction_record_from_salesforce(salesforce_data):
@@ -379,17 +525,20 @@ def sync_customer_purchase_transaction_record_from_salesforce(salesforce_data):
     if not salesforce_data.get(Offer.OFFER_TRANSACTION_ID):
         raise KeyError('Related Offer ID to Customer Purchase is not provided')
 
-    try:
-        offer = Offer.objects.get(salesforce_id=salesforce_data.get(Offer.OFFER_TRANSACTION_ID))
-    except Offer.DoesNotExist:
-        logger.warning(f"No offer for salesforce ID: {salesforce_data.get(Offer.OFFER_TRANSACTION_ID)}",
-                       extra=dict(
-                           type="no_offer_for_given_sf_id",
-                           salesforce_id=salesforce_data.get(Offer.OFFER_TRANSACTION_ID),
-                           salesforce_data=salesforce_data
-                       ))
+    offer = get_offer_for_transaction(salesforce_data)
+    if offer is None:
         return
 
+    new_home_purchase = update_customer_purchase_from_transaction(offer, salesforce_data)
+    if new_home_purchase:
+        new_home_purchase.save()
+
+
+def update_customer_purchase_from_transaction(offer: Offer, salesforce_data) -> Optional[NewHomePurchase]:
+    """
+    Applies a customer purchase transaction to the offer's new home purchase. Returns the new home purchase if it
+    still has to be saved.
+    """
     if not offer.new_home_purchase:
         logger.warning(f"Unable to sync new home purchase for offer {offer.id}", extra=dict(
             type="no_new_home_purchase_for_given_offer_id",
@@ -397,7 +546,7 @@ def sync_customer_purchase_transaction_record_from_salesforce(salesforce_data):
             salesforce_data=salesforce_data,
             offer_id=offer.id
         ))
-        return
+        return None
 
     update_rent(offer.new_home_purchase, salesforce_data)
 
@@ -406,7 +555,7 @@ def sync_customer_purchase_transaction_record_from_salesforce(salesforce_data):
 
     offer.new_home_purchase.customer_purchase_close_date = new_customer_purchase_close_date
     offer.new_home_purchase.customer_purchase_status = new_customer_purchase_status
-    offer.new_home_purchase.save()
+    return offer.new_home_purchase
 
 
 # TODO Removing after transition (CLOS-219)
@@ -467,21 +616,267 @@ def sync_record_from_salesforce(salesforce_data):
             application_id=application.id
         ))
         return
-    application = application.first()
+    update_record_from_salesforce(application.first(), salesforce_data)
+
+
+def update_record_from_salesforce(application: Application, salesforce_data: dict,
+                                  known_agents: Optional[Dict[str, RealEstateAgent]] = None):
     customer = application.customer
-    update_application(application, salesforce_data)
-    update_customer(customer, salesforce_data)
-    update_builder(application, salesforce_data)
-    update_offer_property_address(application, salesforce_data)
-    update_current_home(application, salesforce_data)
-    update_lender(application, salesforce_data)
-    update_real_estate_agent(application, salesforce_data)
-    update_cx_manager(application, salesforce_data)
-    update_loan_advisor(application, salesforce_data)
-    update_stakeholders(application, salesforce_data)
-    update_approval_specialist_on_application(application, salesforce_data)
+    # the application is saved several times below; one transaction lets the outbox collapse the side effects
+    with transaction.atomic():
+        update_application(application, salesforce_data)
+        update_customer(customer, salesforce_data)
+        update_builder(application, salesforce_data)
+        update_offer_property_address(application, salesforce_data)
+        update_current_home(application, salesforce_data)
+        update_lender(application, salesforce_data)
+        update_real_estate_agent(application, salesforce_data, known_agents)
+        update_cx_manager(application, salesforce_data)
+        update_loan_advisor(application, salesforce_data)
+        update_stakeholders(application, salesforce_data)
+        update_approval_specialist_on_application(application, salesforce_data)
+
+        run_task_operations(Application.objects.get(id=application.id))
+
+
+def queue_bulk_sync(bulk_sync_task, records: List[dict]) -> List[str]:
+    """
+    Splits the records of a salesforce flow into chunks handled by one `bulk_sync_task` each. Returns the task ids,
+    whose results hold the status of every record.
+    """
+    chunk_size = int(getattr(settings, 'SALESFORCE_BULK_SYNC_CHUNK_SIZE', 50))
+    return [bulk_sync_task.delay(records[start:start + chunk_size]).id
+            for start in range(0, len(records), chunk_size)]
 
-    run_task_operations(Application.objects.get(id=application.id))
+
+class SyncStatus(str, Enum):
+    SYNCED = "synced"
+    SKIPPED = "skipped"
+    FAILED = "failed"
+
+
+def sync_records_in_bulk(records: List[dict], sync_record) -> List[dict]:
+    """
+    Runs `sync_record` for every record in its own savepoint so one bad record doesn't roll back the others, and
+    returns the outcome of each record in order. `sync_record` returns False when it skipped the record. The tasks
+    queued by the whole chunk are published together once it is done.
+    """
+    statuses = []
+    with outbox.window():
+        for record in records:
+            try:
+                with transaction.atomic():
+                    synced = sync_record(record)
+            except Exception as e:
+                logger.exception("Failed syncing record in bulk from salesforce", exc_info=e, extra=dict(
+                    type="failed_syncing_record_in_bulk_from_salesforce",
+                    data=record
+                ))
+                statuses.append({'id': record.get('Id'), 'status': SyncStatus.FAILED, 'error': str(e)})
+            else:
+                statuses.append({'id': record.get('Id'), 'status': SyncStatus.SYNCED if synced is not False
+                                 else SyncStatus.SKIPPED})
+    return statuses
+
+
+@celery_app.task(queue='application-service-tasks')
+def bulk_sync_records_from_salesforce(records: List[dict]) -> List[dict]:
+    """
+    Syncs a chunk of account records. Applications and agents referenced by the chunk are loaded with one query each
+    instead of once per record.
+    """
+    emails = [record[Customer.EMAIL_FIELD] for record in records if record.get(Customer.EMAIL_FIELD)]
+    applications_by_email = {}
+    for application in Application.objects.filter(customer__email__in=emails) \
+            .select_related('customer', 'builder', 'current_home', 'current_home__address',
+                            'current_home__floor_price', 'mortgage_lender', 'listing_agent', 'buying_agent',
+                            'offer_property_address', 'preapproval', 'new_home_purchase'):
+        applications_by_email.setdefault(application.customer.email, []).append(application)
+
+    agent_ids = {record.get(field) for record in records
+                 for field in [RealEstateAgent.LISTING_AGENT_ID_FIELD, RealEstateAgent.BUYING_AGENT_ID_FIELD]}
+    known_agents = {agent.sf_id: agent for agent in RealEstateAgent.objects.filter(sf_id__in=agent_ids - {None})}
+
+    def sync_record(salesforce_data):
+        if Customer.EMAIL_FIELD not in salesforce_data:
+            raise KeyError('Email not provided')
+        applications = applications_by_email.get(salesforce_data[Customer.EMAIL_FIELD], [])
+        if len(applications) != 1:
+            logger.warning(f"Found {len(applications)} applications for email: {salesforce_data[Customer.EMAIL_FIELD]}",
+                           extra=dict(
+                               type="no_single_application_for_given_email_bulk_sync_record_from_salesforce",
+                               email=salesforce_data[Customer.EMAIL_FIELD],
+                               data=salesforce_data
+                           ))
+            return False
+        update_record_from_salesforce(applications[0], salesforce_data, known_agents)
+
+    return sync_records_in_bulk(records, sync_record)
+
+
+# offers whose status or closing date change are saved one by one, the signals react to those
+OFFER_FIELDS_SAVED_ONE_BY_ONE = ['status', 'finance_approved_close_date']
+
+
+def parse_uuid(value) -> Optional[uuid.UUID]:
+    try:
+        return uuid.UUID(str(value))
+    except ValueError:
+        return None
+
+
+@celery_app.task(queue='application-service-tasks')
+def bulk_sync_offer_records_from_salesforce(records: List[dict]) -> List[dict]:
+    """
+    Syncs a chunk of offer records. The applications and offers they point at are loaded with one query each. Offers
+    that only get new details are written with bulk_update, along with their property addresses; new offers and offers
+    whose status or closing date change are saved one by one so the signals send their emails and refresh the closing
+    capacity. Records whose offer couldn't be written are reported as failed.
+    """
+    customer_ids = [record.get(Offer.CUSTOMER_FIELD) for record in records if record.get(Offer.CUSTOMER_FIELD)]
+    applications = {application.new_salesforce: application
+                    for application in Application.objects.filter(new_salesforce__in=customer_ids)}
+    offer_ids = {parse_uuid(record.get(Offer.HOMEWARD_ID)) for record in records if record.get(Offer.HOMEWARD_ID)}
+    known_offers = {offer.id: offer for offer in Offer.objects.filter(id__in=offer_ids - {None})}
+    pending_offers = {}
+    pending_addresses = {}
+    offer_fields = set()
+    offer_ids_by_record = {}
+
+    def sync_record(salesforce_data):
+        if not salesforce_data.get(Offer.OFFER_SALESFORCE_ID):
+            return False
+        application = applications.get(salesforce_data.get(Offer.CUSTOMER_FIELD))
+        if application is None:
+            raise SalesforceException('unable to sync offer due to missing application')
+        offer = known_offers.get(parse_uuid(salesforce_data.get(Offer.HOMEWARD_ID)))
+        offer_defaults, address_defaults = offer_values_from_salesforce(application, salesforce_data)
+        if offer is None or offer.id in pending_offers or not offer.offer_property_address_id \
+                or any(getattr(offer, name) != offer_defaults[name] for name in OFFER_FIELDS_SAVED_ONE_BY_ONE):
+            update_offer_from_salesforce(application, salesforce_data)
+            if offer is not None:
+                # the offer is saved from now on, over what earlier records of the chunk set, as if synced one by one
+                del known_offers[offer.id]
+                pending_offers.pop(offer.id, None)
+                pending_addresses.pop(offer.id, None)
+            return
+        for name, value in offer_defaults.items():
+            setattr(offer, name, value)
+        offer_fields.update(offer_defaults)
+        pending_offers[offer.id] = offer
+        pending_addresses[offer.id] = Address(id=offer.offer_property_address_id,
+                                              search_text=address_search_text(**address_defaults), **address_defaults)
+        offer_ids_by_record[salesforce_data.get('Id')] = offer.id
+
+    statuses = sync_records_in_bulk(records, sync_record)
+    if not pending_offers:
+        return statuses
+
+    now = timezone.now()
+    for instance in [*pending_offers.values(), *pending_addresses.values()]:
+        instance.updated_at = now
+    try:
+        with transaction.atomic():
+            Offer.objects.bulk_update(pending_offers.values(), [field.name for field in Offer._meta.concrete_fields
+                                                                if field.name in offer_fields] + ['updated_at'])
+            Address.objects.bulk_update(pending_addresses.values(),
+                                        ['street', 'city', 'state', 'zip', 'search_text', 'updated_at'])
+    except Exception as e:
+        logger.exception("Failed writing offers synced from salesforce", exc_info=e, extra=dict(
+            type="failed_bulk_updating_offers_from_salesforce",
+            offer_ids=list(pending_offers)
+        ))
+        return [{'id': status['id'], 'status': SyncStatus.FAILED, 'error': str(e)}
+                if offer_ids_by_record.get(status['id']) in pending_offers and status['status'] == SyncStatus.SYNCED
+                else status for status in statuses]
+
+    return statuses
+
+
+@celery_app.task(queue='application-service-tasks')
+def bulk_sync_transaction_records_from_salesforce(records: List[dict]) -> List[dict]:
+    """
+    Syncs a chunk of transaction records. Offer transactions go through the offer bulk sync; the offers purchase
+    transactions point at are loaded with one query and their new home purchases are written with bulk_update. Records
+    whose new home purchase couldn't be written are reported as failed.
+    """
+    statuses = {}
+    offer_records = []
+    purchase_records = []
+    for index, record in enumerate(records):
+        record_type = record.get(NewHomePurchase.TRANSACTION_RECORD_TYPE)
+        if record_type == constants.OFFER_TRANSACTION:
+            offer_records.append((index, record))
+        elif record_type in [constants.HOMEWARD_PURCHASE_TRANSACTION, constants.CUSTOMER_PURCHASE_TRANSACTION]:
+            purchase_records.append((index, record))
+        else:
+            if record_type != constants.OLD_HOME_SALE_TRANSACTION:
+                logger.warning(f"Transaction record type is invalid {record_type}", extra=dict(
+                    type="invalid_record_type_when_bulk_syncing_transaction_from_salesforce",
+                    data=record,
+                    record_type=record_type
+                ))
+            # old home sales are not synced at the moment
+            statuses[index] = {'id': record.get('Id'), 'status': SyncStatus.SKIPPED}
+
+    for (index, _), status in zip(offer_records, bulk_sync_offer_records_from_salesforce(
+            [record for _, record in offer_records])):
+        statuses[index] = status
+
+    offer_ids = [record.get(Offer.OFFER_TRANSACTION_ID) for _, record in purchase_records]
+    known_offers = {offer.salesforce_id: offer for offer in Offer.objects.filter(salesforce_id__in=offer_ids)
+                    .select_related('new_home_purchase', 'new_home_purchase__rent')}
+    homeward_purchases = {}
+    customer_purchases = {}
+    purchase_ids_by_record = {}
+
+    def sync_record(salesforce_data):
+        if not salesforce_data.get(Offer.OFFER_TRANSACTION_ID):
+            raise KeyError('Related Offer ID to the Transaction field not provided in Transaction SF sync')
+        offer = get_offer_for_transaction(salesforce_data, known_offers)
+        if offer is None:
+            return False
+        if salesforce_data.get(NewHomePurchase.TRANSACTION_RECORD_TYPE) == constants.HOMEWARD_PURCHASE_TRANSACTION:
+            new_home_purchase = update_homeward_purchase_from_transaction(offer, salesforce_data)
+            pending = homeward_purchases
+        else:
+            new_home_purchase = update_customer_purchase_from_transaction(offer, salesforce_data)
+            pending = customer_purchases
+        if new_home_purchase is None:
+            return False if offer.new_home_purchase is None else None
+        pending[new_home_purchase.id] = new_home_purchase
+        purchase_ids_by_record[salesforce_data.get('Id')] = new_home_purchase.id
+
+    for (index, _), status in zip(purchase_records, sync_records_in_bulk(
+            [record for _, record in purchase_records], sync_record)):
+        statuses[index] = status
+
+    now = timezone.now()
+    for new_home_purchase in [*homeward_purchases.values(), *customer_purchases.values()]:
+        new_home_purchase.updated_at = now
+    errors = {}
+    for purchases, fields in [(homeward_purchases, ['option_period_end_date', 'homeward_purchase_close_date',
+                                                    'contract_price', 'earnest_deposit_percentage',
+                                                    'homeward_purchase_status', 'is_reassigned_contract',
+                                                    'updated_at']),
+                              (customer_purchases, ['customer_purchase_close_date', 'customer_purchase_status',
+                                                    'updated_at'])]:
+        try:
+            with transaction.atomic():
+                NewHomePurchase.objects.bulk_update(purchases.values(), fields)
+        except Exception as e:
+            logger.exception("Failed writing new home purchases synced from salesforce", exc_info=e, extra=dict(
+                type="failed_bulk_updating_new_home_purchases_from_salesforce",
+                new_home_purchase_ids=list(purchases)
+            ))
+            errors.update((purchase_id, str(e)) for purchase_id in purchases)
+
+    for index, record in purchase_records:
+        error = errors.get(purchase_ids_by_record.get(record.get('Id')))
+        if error is not None and statuses[index]['status'] == SyncStatus.SYNCED:
+            statuses[index] = {'id': record.get('Id'), 'status': SyncStatus.FAILED, 'error': error}
+
+    return [statuses[index] for index in range(len(records))]
 
 
 def update_application(application: Application, updated_application):
@@ -742,7 +1137,10 @@ def update_offer_property_address(application: Application, salesforce_data) ->
             application.save()
 
 
-def get_or_create_agent_from_salesforce(sf_id: str):
+def get_or_create_agent_from_salesforce(sf_id: str, known_agents: Optional[Dict[str, RealEstateAgent]] = None):
+    if known_agents is not None and sf_id in known_agents:
+        return known_agents[sf_id]
+
     data = homeward_salesforce.get_account_by_id(sf_id)
     defaults = {
         'name': f"{data.get(Customer.FIRST_NAME_FIELD, '')} {data.get(Customer.LAST_NAME_FIELD, '')}",
@@ -752,6 +1150,8 @@ def get_or_create_agent_from_salesforce(sf_id: str):
     }
 
     agent, _ = RealEstateAgent.objects.get_or_create(sf_id=sf_id, defaults=defaults)
+    if known_agents is not None:
+        known_agents[sf_id] = agent
     return agent
 
 
@@ -772,7 +1172,7 @@ def update_agent_from_salesforce(agent: RealEstateAgent, sf_id: str):
     agent.save()
 
 
-def update_real_estate_agent(application, updated_application):
+def update_real_estate_agent(application, updated_application, known_agents=None):
     """
     Updates the application's listing and buying agents to those supplied in the updated_application
         from SalesForce. In the case of an update we gets or creates a new agent record rather than overwriting
@@ -783,14 +1183,14 @@ def update_real_estate_agent(application, updated_application):
     if sf_listing_agent_id is not None:
         if application.listing_agent is None or \
                 (application.listing_agent is not None and sf_listing_agent_id != application.listing_agent.sf_id):
-            application.listing_agent = get_or_create_agent_from_salesforce(sf_listing_agent_id)
+            application.listing_agent = get_or_create_agent_from_salesforce(sf_listing_agent_id, known_agents)
             application_changed = True
 
     sf_buying_agent_id = updated_application.get(RealEstateAgent.BUYING_AGENT_ID_FIELD)
     if sf_buying_agent_id is not None:
         if application.buying_agent is None or \
                 (application.buying_agent is not None and sf_buying_agent_id != application.buying_agent.sf_id):
-            application.buying_agent = get_or_create_agent_from_salesforce(sf_buying_agent_id)
+            application.buying_agent = get_or_create_agent_from_salesforce(sf_buying_agent_id, known_agents)
             application_changed = True
 
     if application_changed:
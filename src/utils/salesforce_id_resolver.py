@@ -0,0 +1,101 @@
+"""
+Resolves the salesforce ids of applications and current homes without querying salesforce when they are already known.
+
+Ids are looked up in order from the local DB column, the shared cache (keyed by customer email or account id) and only
+then with a SOQL query, whose result is written back to the cache. Misses are not cached since the record is usually
+created right after.
+"""
+import logging
+from typing import Dict, Iterable, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+from application.models.application import Application
+from utils.salesforce import homeward_salesforce
+
+logger = logging.getLogger(__name__)
+
+ACCOUNT_KEY = 'salesforce-id:account:{}'
+CURRENT_HOME_KEY = 'salesforce-id:old-home:{}'
+
+
+def cache_ttl() -> int:
+    return getattr(settings, 'SALESFORCE_ID_CACHE_TTL_SECONDS', 60 * 60 * 24)
+
+
+def account_key(email: str) -> str:
+    return ACCOUNT_KEY.format(email.lower())
+
+
+def remember_account_id(email: str, account_id: str):
+    if email and account_id:
+        cache.set(account_key(email), account_id, cache_ttl())
+
+
+def remember_current_home_id(account_id: str, current_home_id: str):
+    if account_id and current_home_id:
+        cache.set(CURRENT_HOME_KEY.format(account_id), current_home_id, cache_ttl())
+
+
+def resolve_account_id(application: Application) -> Optional[str]:
+    if application.new_salesforce:
+        return application.new_salesforce
+
+    email = application.customer.email
+    account_id = cache.get(account_key(email))
+    if account_id:
+        return account_id
+
+    account_id = homeward_salesforce.get_id_by_email(email=email)
+    remember_account_id(email, account_id)
+    return account_id
+
+
+def resolve_account_ids(applications: Iterable[Application]) -> Dict[str, str]:
+    """
+    Resolves the account ids of many applications with at most one SOQL query per 200 misses. Returns the account id
+    for each application id that could be resolved.
+    """
+    resolved = {}
+    by_key = {}
+    for application in applications:
+        if application.new_salesforce:
+            resolved[application.id] = application.new_salesforce
+        elif application.customer.email:
+            by_key.setdefault(account_key(application.customer.email), []).append(application)
+
+    cached = cache.get_many(list(by_key))
+    misses = [key for key in by_key if key not in cached]
+    found = {}
+    if misses:
+        emails = [by_key[key][0].customer.email.lower() for key in misses]
+        found = {account_key(email): account_id
+                 for email, account_id in homeward_salesforce.get_ids_by_emails(emails).items()}
+        cache.set_many(found, cache_ttl())
+
+    logger.info("Resolved salesforce account ids", extra=dict(
+        type="salesforce_account_ids_resolved",
+        from_db=len(resolved),
+        from_cache=len(cached),
+        from_salesforce=len(found),
+        unresolved=len(misses) - len(found)
+    ))
+
+    for key, account_id in {**cached, **found}.items():
+        for application in by_key[key]:
+            resolved[application.id] = account_id
+    return resolved
+
+
+def resolve_current_home_id(application: Application) -> Optional[str]:
+    if application.current_home.salesforce_id:
+        return application.current_home.salesforce_id
+
+    current_home_id = cache.get(CURRENT_HOME_KEY.format(application.new_salesforce))
+    if current_home_id:
+        return current_home_id
+
+    current_home_id = homeward_salesforce.get_current_home_id_by_account_id(account_id=application.new_salesforce)
+    remember_current_home_id(application.new_salesforce, current_home_id)
+    return current_home_id
@@ -1,11 +1,13 @@
 import datetime
+from unittest.mock import patch
 
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
 from application.models.application import ApplicationStage
+from application.models.closing_capacity import ClosingCapacity
 from application.models.offer import OfferStatus
 from application.tests import random_objects
-from utils.date_restrictor import calculate_dates_at_capacity
+from utils.date_restrictor import calculate_dates_at_capacity, closing_capacity_version
 from utils.date_restrictor import MAXIMUM_CLOSING_CAPACITY
 
 
@@ -97,3 +99,48 @@ class DateRestrictionTests(TestCase):
         restricted_dates = calculate_dates_at_capacity(datetime.datetime.today(), datetime.datetime.today() + datetime.timedelta(weeks=52))
 
         self.assertEqual(len(restricted_dates), 0)
+
+    def test_closing_capacity_follows_offer_status(self):
+        date_at_capacity = datetime.date.today() + datetime.timedelta(days=1)
+        offers = []
+        for _ in range(MAXIMUM_CLOSING_CAPACITY + 1):
+            app = random_objects.random_application(stage=ApplicationStage.OPTION_PERIOD)
+            offers.append(random_objects.random_offer(application=app, finance_approved_close_date=date_at_capacity,
+                                                      status=OfferStatus.WON))
+        version = closing_capacity_version()
+
+        offers[0].status = OfferStatus.CANCELLED
+        offers[0].save()
+
+        self.assertEqual(ClosingCapacity.objects.get(date=date_at_capacity).weighted_offers, MAXIMUM_CLOSING_CAPACITY)
+        self.assertNotEqual(closing_capacity_version(), version)
+        self.assertNotIn(date_at_capacity, calculate_dates_at_capacity(datetime.date.today(),
+                                                                       datetime.date.today() + datetime.timedelta(weeks=52)))
+
+    def test_closing_capacity_follows_close_date_and_application_stage(self):
+        old_date = datetime.date.today() + datetime.timedelta(days=1)
+        new_date = datetime.date.today() + datetime.timedelta(days=2)
+        app = random_objects.random_application(stage=ApplicationStage.OPTION_PERIOD)
+        offer = random_objects.random_offer(application=app, finance_approved_close_date=old_date,
+                                            status=OfferStatus.WON)
+
+        offer.finance_approved_close_date = new_date
+        offer.save()
+
+        self.assertEqual(ClosingCapacity.objects.get(date=old_date).weighted_offers, 0.0)
+        self.assertEqual(ClosingCapacity.objects.get(date=new_date).weighted_offers, 1.0)
+
+        app.stage = ApplicationStage.CANCELLED_CONTRACT
+        app.save()
+
+        self.assertEqual(ClosingCapacity.objects.get(date=new_date).weighted_offers, 0.0)
+
+    @override_settings(CELERY_TASK_ALWAYS_EAGER=False)
+    @patch('application.signals.refresh_closing_capacity.apply_async')
+    def test_closing_capacity_is_refreshed_by_a_job(self, refresh_mock):
+        close_date = datetime.date.today() + datetime.timedelta(days=1)
+        app = random_objects.random_application(stage=ApplicationStage.OPTION_PERIOD)
+
+        random_objects.random_offer(application=app, finance_approved_close_date=close_date, status=OfferStatus.WON)
+
+        self.assertFalse(ClosingCapacity.objects.filter(date=close_date).exists())
@@ -0,0 +1,122 @@
+from unittest.mock import MagicMock, patch
+
+from django.db import transaction
+from django.test import TestCase, override_settings
+
+from utils import outbox
+from utils.outbox import publish_on_commit
+
+
+def run_commit_hooks():
+    for _, hook in transaction.get_connection().run_on_commit:
+        hook()
+
+
+@override_settings(CELERY_TASK_ALWAYS_EAGER=False)
+@patch('utils.outbox.celery_app.producer_or_acquire', MagicMock())
+class OutboxTests(TestCase):
+    def setUp(self):
+        self.task = MagicMock()
+        self.task.name = 'application.email_trigger_tasks.queue_approval_email'
+
+    def test_should_collapse_duplicate_messages_in_a_transaction(self):
+        publish_on_commit(self.task, args=['some-application-id'])
+        publish_on_commit(self.task, args=['some-application-id'])
+        publish_on_commit(self.task, args=['another-application-id'])
+        self.task.apply_async.assert_not_called()
+
+        run_commit_hooks()
+
+        self.assertEqual(self.task.apply_async.call_count, 2)
+
+    def test_should_collapse_messages_by_key(self):
+        publish_on_commit(self.task, args=['some-application-id', {'name': 'old'}], key='some-application-id')
+        publish_on_commit(self.task, args=['some-application-id', {'name': 'new'}], key='some-application-id')
+
+        run_commit_hooks()
+
+        self.task.apply_async.assert_called_once()
+        self.assertEqual(self.task.apply_async.call_args[1]['args'], ('some-application-id', {'name': 'new'}))
+
+    def test_should_drop_messages_from_rolled_back_transaction(self):
+        try:
+            with transaction.atomic():
+                publish_on_commit(self.task, args=['rolled-back-application-id'])
+                raise ValueError
+        except ValueError:
+            pass
+        publish_on_commit(self.task, args=['some-application-id'])
+
+        run_commit_hooks()
+
+        self.task.apply_async.assert_called_once()
+        self.assertEqual(self.task.apply_async.call_args[1]['args'], ('some-application-id',))
+
+    def test_should_drop_messages_from_rolled_back_savepoint(self):
+        with transaction.atomic():
+            publish_on_commit(self.task, args=['some-application-id'])
+            try:
+                with transaction.atomic():
+                    publish_on_commit(self.task, args=['rolled-back-application-id'])
+                    with transaction.atomic():
+                        publish_on_commit(self.task, args=['nested-application-id'])
+                    raise ValueError
+            except ValueError:
+                pass
+            with transaction.atomic():
+                publish_on_commit(self.task, args=['released-application-id'])
+            publish_on_commit(self.task, args=['another-application-id'])
+
+        run_commit_hooks()
+
+        self.assertEqual(sorted(call[1]['args'] for call in self.task.apply_async.call_args_list),
+                         [('another-application-id',), ('released-application-id',), ('some-application-id',)])
+
+    @override_settings(CELERY_TASK_ALWAYS_EAGER=True)
+    def test_should_publish_immediately_when_tasks_run_eagerly(self):
+        publish_on_commit(self.task, args=['some-application-id'], countdown=300)
+
+        self.task.apply_async.assert_called_once_with(args=('some-application-id',), kwargs={}, countdown=300)
+
+    @patch('application.email_dispatcher.dispatch_email_batch.apply_async')
+    def test_should_send_batch_dispatch_tasks_as_one_message(self, dispatch_mock):
+        email_task = MagicMock(batch_dispatch=True)
+        email_task.name = 'application.email_trigger_tasks.queue_approval_email'
+        publish_on_commit(email_task, args=['some-application-id'])
+        publish_on_commit(email_task, args=['another-application-id'])
+        publish_on_commit(self.task, args=['some-application-id'])
+
+        run_commit_hooks()
+
+        email_task.apply_async.assert_not_called()
+        self.task.apply_async.assert_called_once()
+        dispatch_mock.assert_called_once()
+        self.assertEqual(dispatch_mock.call_args[1]['args'],
+                         ([[email_task.name, ['some-application-id'], {}],
+                           [email_task.name, ['another-application-id'], {}]],))
+
+    def test_should_hold_messages_back_until_the_window_ends(self):
+        with outbox.window():
+            with transaction.atomic():
+                publish_on_commit(self.task, args=['some-application-id'])
+            run_commit_hooks()
+            with transaction.atomic():
+                publish_on_commit(self.task, args=['another-application-id'])
+            run_commit_hooks()
+            self.task.apply_async.assert_not_called()
+
+        self.assertEqual(self.task.apply_async.call_count, 2)
+
+    def test_should_publish_the_messages_of_a_request_once(self):
+        def get_response(request):
+            for _ in range(3):
+                with transaction.atomic():
+                    publish_on_commit(self.task, args=['some-application-id'])
+                run_commit_hooks()
+            self.task.apply_async.assert_not_called()
+            return 'response'
+
+        response = outbox.OutboxWindowMiddleware(get_response)('request')
+
+        self.assertEqual(response, 'response')
+        self.task.apply_async.assert_called_once()
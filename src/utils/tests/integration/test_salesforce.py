@@ -2,7 +2,9 @@ from datetime import datetime, date
 from unittest.mock import patch
 
 from django.core.exceptions import ObjectDoesNotExist
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from faker import Faker
 from pytz import UTC
 
@@ -782,3 +784,111 @@ class SalesforceTests(TestCase):
         self.assertEqual(rent.total_leaseback_credit, int(customer_purchase_payload[Rent.RENT_TOTAL_LEASEBACK_CREDIT]))
         self.assertEqual(offer.new_home_purchase.customer_purchase_close_date, customer_purchase_payload[NewHomePurchase.NEW_HOME_PURCHASE_CLOSE_DATE])
         self.assertEqual(offer.new_home_purchase.customer_purchase_status, customer_purchase_payload[NewHomePurchase.NEW_HOME_PURCHASE_STATUS])
+
+    def offer_details_payload(self, offer):
+        # keeps the status and closing date of the offer, so only its details change
+        return {
+            'Id': offer.salesforce_id,
+            Offer.OFFER_SALESFORCE_ID: offer.salesforce_id,
+            Offer.HOMEWARD_ID: str(offer.id),
+            Offer.CUSTOMER_FIELD: offer.application.new_salesforce,
+            Offer.STATUS_FIELD: offer.status,
+            Offer.FINANCE_APPROVED_CLOSE_DATE: offer.finance_approved_close_date.strftime("%Y-%m-%d")
+            if offer.finance_approved_close_date else None,
+            Offer.OFFER_PRICE_FIELD: fake.random_int(min=200000, max=3000000),
+            Offer.ADDRESS_STREET_FIELD: fake.street_address(),
+            Offer.ADDRESS_CITY_FIELD: fake.city(),
+            Offer.ADDRESS_STATE_FIELD: fake.state(),
+            Offer.ADDRESS_ZIP_FIELD: fake.postcode(),
+        }
+
+    def test_bulk_sync_offers_writes_details_in_bulk(self):
+        application = random_objects.random_application(new_salesforce='A1BCD')
+        offers = [random_objects.random_offer(application=application, salesforce_id=str(fake.md5()))
+                  for _ in range(10)]
+        payloads = [self.offer_details_payload(offer) for offer in offers]
+
+        with CaptureQueriesContext(connection) as one_record:
+            salesforce.bulk_sync_offer_records_from_salesforce(payloads[:1])
+        with CaptureQueriesContext(connection) as ten_records:
+            statuses = salesforce.bulk_sync_offer_records_from_salesforce(payloads)
+
+        self.assertEqual({status['status'] for status in statuses}, {salesforce.SyncStatus.SYNCED})
+        # only the savepoint around each record is repeated
+        self.assertEqual(len(ten_records) - len(one_record), 9 * 2)
+        offers[-1].refresh_from_db()
+        self.assertEqual(offers[-1].offer_price, payloads[-1][Offer.OFFER_PRICE_FIELD])
+        self.assertEqual(offers[-1].offer_property_address.street, payloads[-1][Offer.ADDRESS_STREET_FIELD])
+
+    def test_bulk_sync_offers_reports_failed_writes(self):
+        application = random_objects.random_application(new_salesforce='A1BCD')
+        offer = random_objects.random_offer(application=application, salesforce_id=str(fake.md5()))
+
+        with patch.object(Offer.objects, 'bulk_update', side_effect=ValueError('deadlock detected')):
+            statuses = salesforce.bulk_sync_offer_records_from_salesforce([self.offer_details_payload(offer)])
+
+        self.assertEqual(statuses[0]['status'], salesforce.SyncStatus.FAILED)
+        self.assertEqual(statuses[0]['error'], 'deadlock detected')
+
+    def homeward_purchase_payload(self, offer):
+        return {
+            Offer.OFFER_SALESFORCE_ID: str(fake.md5()),
+            Offer.OFFER_TRANSACTION_ID: offer.salesforce_id,
+            NewHomePurchase.TRANSACTION_RECORD_TYPE: constants.HOMEWARD_PURCHASE_TRANSACTION,
+            NewHomePurchase.NEW_HOME_PURCHASE_CLOSE_DATE: date.today(),
+            NewHomePurchase.OPTION_END_DATE_FIELD: date.today(),
+            NewHomePurchase.CONTRACT_PRICE_TRANSACTION_FIELD: fake.random_int(min=200000, max=500000),
+            NewHomePurchase.EARNEST_DEPOSIT_PERCENTAGE_FIELD: 2.0,
+            NewHomePurchase.NEW_HOME_PURCHASE_STATUS: "Offer Won",
+            NewHomePurchase.REASSIGNED_CONTRACT_FIELD: False
+        }
+
+    def test_bulk_sync_transactions_reports_status_per_record(self):
+        application = random_objects.random_application(new_salesforce='A1BCD')
+        offer = random_objects.random_offer(application=application,
+                                            new_home_purchase=random_objects.random_new_home_purchase(),
+                                            salesforce_id='bloop')
+        synced = self.homeward_purchase_payload(offer)
+        unknown_offer = dict(self.homeward_purchase_payload(offer), **{Offer.OFFER_TRANSACTION_ID: 'missing'})
+        missing_offer_id = dict(self.homeward_purchase_payload(offer), **{Offer.OFFER_TRANSACTION_ID: None})
+        old_home_sale = dict(self.homeward_purchase_payload(offer), **{
+            NewHomePurchase.TRANSACTION_RECORD_TYPE: constants.OLD_HOME_SALE_TRANSACTION})
+
+        statuses = salesforce.bulk_sync_transaction_records_from_salesforce(
+            [synced, unknown_offer, missing_offer_id, old_home_sale])
+
+        self.assertEqual([status['status'] for status in statuses], [salesforce.SyncStatus.SYNCED,
+                                                                     salesforce.SyncStatus.SKIPPED,
+                                                                     salesforce.SyncStatus.FAILED,
+                                                                     salesforce.SyncStatus.SKIPPED])
+        offer.refresh_from_db()
+        self.assertEqual(offer.new_home_purchase.contract_price,
+                         synced[NewHomePurchase.CONTRACT_PRICE_TRANSACTION_FIELD])
+
+    def test_bulk_sync_transactions_reports_failed_writes(self):
+        application = random_objects.random_application(new_salesforce='A1BCD')
+        offer = random_objects.random_offer(application=application,
+                                            new_home_purchase=random_objects.random_new_home_purchase(),
+                                            salesforce_id='bloop')
+
+        with patch.object(NewHomePurchase.objects, 'bulk_update', side_effect=ValueError('deadlock detected')):
+            statuses = salesforce.bulk_sync_transaction_records_from_salesforce(
+                [self.homeward_purchase_payload(offer)])
+
+        self.assertEqual(statuses[0]['status'], salesforce.SyncStatus.FAILED)
+        self.assertEqual(statuses[0]['error'], 'deadlock detected')
+
+    def test_bulk_sync_transactions_queries_do_not_grow_with_records(self):
+        application = random_objects.random_application(new_salesforce='A1BCD')
+        offers = [random_objects.random_offer(application=application,
+                                              new_home_purchase=random_objects.random_new_home_purchase(),
+                                              salesforce_id=str(fake.md5())) for _ in range(10)]
+
+        with CaptureQueriesContext(connection) as one_record:
+            salesforce.bulk_sync_transaction_records_from_salesforce([self.homeward_purchase_payload(offers[0])])
+        with CaptureQueriesContext(connection) as ten_records:
+            salesforce.bulk_sync_transaction_records_from_salesforce(
+                [self.homeward_purchase_payload(offer) for offer in offers])
+
+        # only the savepoint around each record is repeated
+        self.assertEqual(len(ten_records) - len(one_record), 9 * 2)
@@ -1,5 +1,8 @@
+import io
+
+import boto3
 import botocore.session
-from botocore.stub import Stubber
+from botocore.stub import ANY, Stubber
 
 from django.test import SimpleTestCase
 
@@ -17,4 +20,76 @@ class ContractTemplateRetrievalTests(SimpleTestCase):
         stubber.activate()
 
         with self.assertRaises(ValueError):
-            aws.retrieve_contract_template(TEMPLATE_NAME, s3)
+            aws.retrieve_contract_template_if_modified(TEMPLATE_NAME, s3_client=s3)
+
+    def test_returns_none_for_unchanged_template(self):
+        s3 = botocore.session.get_session().create_client('s3')
+        stubber = Stubber(s3)
+        stubber.add_client_error('get_object', service_error_code='304', http_status_code=304,
+                                 expected_params={'Bucket': aws.HOMEWARD_CONTRACTS_BUCKET,
+                                                  'Key': aws.contract_template_key(TEMPLATE_NAME),
+                                                  'IfNoneMatch': '"v1"'})
+        stubber.activate()
+
+        self.assertIsNone(aws.retrieve_contract_template_if_modified(TEMPLATE_NAME, '"v1"', s3))
+
+
+class ContractTemplateEtagTests(SimpleTestCase):
+
+    def test_returns_etag_without_downloading(self):
+        s3 = botocore.session.get_session().create_client('s3', region_name='us-west-2')
+        stubber = Stubber(s3)
+        stubber.add_response('head_object', {'ETag': '"v1"'}, {'Bucket': aws.HOMEWARD_CONTRACTS_BUCKET,
+                                                               'Key': aws.contract_template_key(TEMPLATE_NAME)})
+        stubber.activate()
+
+        self.assertEqual(aws.contract_template_etag(TEMPLATE_NAME, s3), '"v1"')
+
+    def test_raises_for_missing_template(self):
+        s3 = botocore.session.get_session().create_client('s3', region_name='us-west-2')
+        stubber = Stubber(s3)
+        stubber.add_client_error('head_object', service_error_code='404', http_status_code=404)
+        stubber.activate()
+
+        with self.assertRaises(ValueError):
+            aws.contract_template_etag(TEMPLATE_NAME, s3)
+
+
+class HomewardContractLookupTests(SimpleTestCase):
+
+    def test_returns_none_for_missing_contract(self):
+        s3 = botocore.session.get_session().create_client('s3', region_name='us-west-2')
+        stubber = Stubber(s3)
+        stubber.add_client_error('head_object', service_error_code='404', http_status_code=404)
+        stubber.activate()
+
+        self.assertIsNone(aws.find_homeward_contract('offer-id', 'Doe_abc.pdf', s3))
+
+    def test_presigns_stored_contract(self):
+        s3 = botocore.session.get_session().create_client('s3', region_name='us-west-2',
+                                                          aws_access_key_id='key', aws_secret_access_key='secret')
+        stubber = Stubber(s3)
+        stubber.add_response('head_object', {}, {'Bucket': aws.HOMEWARD_CONTRACTS_BUCKET,
+                                                 'Key': aws.homeward_contract_key('offer-id', 'Doe_abc.pdf')})
+        stubber.activate()
+
+        url = aws.find_homeward_contract('offer-id', 'Doe_abc.pdf', s3)
+
+        self.assertIn('Doe_abc.pdf', url)
+
+
+class HomewardContractUploadTests(SimpleTestCase):
+
+    def test_streams_contract_from_memory(self):
+        # upload_fileobj is only on boto3 clients
+        s3 = boto3.client('s3', region_name='us-west-2', aws_access_key_id='key', aws_secret_access_key='secret')
+        key = aws.homeward_contract_key('offer-id', 'Doe_abc.pdf')
+        stubber = Stubber(s3)
+        stubber.add_response('put_object', {}, {'Bucket': aws.HOMEWARD_CONTRACTS_BUCKET, 'Key': key,
+                                                'Body': ANY, 'ContentType': 'application/pdf'})
+        stubber.activate()
+
+        url = aws.upload_homeward_contract(io.BytesIO(b'%PDF-1.3'), 'offer-id', 'Doe_abc.pdf', s3)
+
+        stubber.assert_no_pending_responses()
+        self.assertIn('Doe_abc.pdf', url)
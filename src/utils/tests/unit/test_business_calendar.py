@@ -0,0 +1,38 @@
+import datetime
+
+from django.test import SimpleTestCase
+
+from utils import business_calendar
+from utils.management.commands.benchmark_business_calendar import day_by_day_restricted_days
+
+
+class BusinessCalendarTests(SimpleTestCase):
+    start_date = datetime.date(2021, 8, 19)
+
+    def test_restricted_days_match_day_by_day_calendar(self):
+        end_date = datetime.date(2026, 8, 19)
+
+        self.assertEqual(business_calendar.restricted_days(self.start_date, end_date),
+                         day_by_day_restricted_days(self.start_date, end_date))
+
+    def test_restricted_days_leave_out_excluded_dates(self):
+        saturday = datetime.date(2021, 8, 21)
+
+        days = business_calendar.restricted_days(self.start_date, datetime.date(2021, 8, 22), exclude=[saturday])
+
+        self.assertEqual(days, [datetime.date(2021, 8, 22)])
+
+    def test_is_closable(self):
+        self.assertTrue(business_calendar.is_closable(datetime.date(2021, 8, 19)))
+        self.assertFalse(business_calendar.is_closable(datetime.date(2021, 8, 21)))
+        self.assertFalse(business_calendar.is_closable(datetime.date(2021, 11, 26)))
+
+    def test_next_closable_days_skip_weekends_holidays_and_excluded_dates(self):
+        days = business_calendar.next_closable_days(datetime.date(2021, 12, 23), 3, exclude=[datetime.date(2021, 12, 27)])
+
+        self.assertEqual(days, [datetime.date(2021, 12, 23), datetime.date(2021, 12, 28), datetime.date(2021, 12, 29)])
+
+    def test_next_closable_days_cross_years(self):
+        days = business_calendar.next_closable_days(datetime.date(2021, 12, 30), 2)
+
+        self.assertEqual(days, [datetime.date(2021, 12, 30), datetime.date(2022, 1, 3)])
@@ -1,4 +1,5 @@
 import datetime
+from unittest import mock
 
 from django.test import SimpleTestCase
 
@@ -6,6 +7,7 @@ from application.models.application import ProductOffering
 from utils.date_restrictor import calculate_dates_at_capacity
 from utils.date_restrictor import get_latest_close_date, get_weekend_dates, get_holidays
 from utils.date_restrictor import get_earliest_close_date
+from utils.date_restrictor import calculate_restricted_dates, is_restricted
 
 
 class DateRestrictionTests(SimpleTestCase):
@@ -56,3 +58,22 @@ class DateRestrictionTests(SimpleTestCase):
         self.assertIn(datetime.date(2020, 12, 25), dates)
         self.assertIn(datetime.date(2020, 12, 31), dates)
         self.assertIn(datetime.date(2021, 1, 1), dates)
+
+    @mock.patch('utils.date_restrictor.calculate_dates_at_capacity')
+    def test_restricted_dates_list_capacity_first_without_duplicates(self, capacity_patch):
+        saturday, tuesday = datetime.date(2021, 9, 4), datetime.date(2021, 9, 7)
+        capacity_patch.return_value = [tuesday, saturday]
+
+        dates = calculate_restricted_dates(datetime.date(2021, 9, 1), datetime.date(2021, 9, 12))
+
+        self.assertEqual(dates, [tuesday, saturday, datetime.date(2021, 9, 5), datetime.date(2021, 9, 6),
+                                 datetime.date(2021, 9, 11), datetime.date(2021, 9, 12)])
+
+    @mock.patch('utils.date_restrictor.calculate_dates_at_capacity')
+    def test_is_restricted_checks_calendar_before_capacity(self, capacity_patch):
+        capacity_patch.return_value = [datetime.date(2021, 9, 8)]
+
+        self.assertTrue(is_restricted(datetime.date(2021, 9, 6)))
+        capacity_patch.assert_not_called()
+        self.assertTrue(is_restricted(datetime.date(2021, 9, 8)))
+        capacity_patch.assert_called_once_with(datetime.date(2021, 9, 7), datetime.date(2021, 9, 9))
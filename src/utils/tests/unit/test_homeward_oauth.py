@@ -0,0 +1,66 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+
+from utils import homeward_oauth
+from utils.agent_svc_client import AgentServiceClient
+from utils.property_data_aggregator import PropertyDataAggregatorClient
+
+
+@override_settings(HOMEWARD_OAUTH_TOKEN_MAX_AGE_SECONDS=300, HOMEWARD_OAUTH_TOKEN_REFRESH_MARGIN_SECONDS=60)
+class TokenStoreTests(SimpleTestCase):
+    def setUp(self):
+        homeward_oauth.token_store.clear()
+        self.addCleanup(homeward_oauth.token_store.clear)
+
+    @mock.patch.object(homeward_oauth.OAuth2Session, 'fetch_token',
+                       return_value={'access_token': '_ASDF_', 'expires_in': 36000})
+    def test_should_share_one_token_between_clients(self, fetch_mock):
+        first = PropertyDataAggregatorClient().client
+        second = AgentServiceClient().client
+
+        fetch_mock.assert_called_once()
+        self.assertIs(first, second)
+        self.assertEqual(first.access_token, '_ASDF_')
+
+    @mock.patch.object(homeward_oauth.OAuth2Session, 'fetch_token')
+    def test_should_fetch_a_new_token_ahead_of_expiry(self, fetch_mock):
+        fetch_mock.side_effect = [{'access_token': '_OLD_', 'expires_in': 30},
+                                  {'access_token': '_NEW_', 'expires_in': 36000}]
+
+        self.assertEqual(AgentServiceClient().client.access_token, '_OLD_')
+        session = AgentServiceClient().client
+
+        self.assertEqual(fetch_mock.call_count, 2)
+        self.assertEqual(session.access_token, '_NEW_')
+
+    @mock.patch.object(homeward_oauth.OAuth2Session, 'fetch_token')
+    def test_should_fetch_once_for_concurrent_callers(self, fetch_mock):
+        def slow_fetch(*args, **kwargs):
+            time.sleep(0.05)
+            return {'access_token': '_ASDF_', 'expires_in': 36000}
+        fetch_mock.side_effect = slow_fetch
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            tokens = list(executor.map(lambda _: AgentServiceClient().client.access_token, range(8)))
+
+        fetch_mock.assert_called_once()
+        self.assertEqual(set(tokens), {'_ASDF_'})
+
+    @mock.patch('django.core.cache.cache.set')
+    @mock.patch.object(homeward_oauth.OAuth2Session, 'fetch_token',
+                       return_value={'access_token': '_ASDF_', 'expires_in': 36000})
+    def test_should_keep_tokens_out_of_the_cache_backend(self, fetch_mock, cache_set_mock):
+        AgentServiceClient().client
+
+        cache_set_mock.assert_not_called()
+
+    @override_settings(HOMEWARD_OAUTH_TOKEN_MAX_AGE_SECONDS=0)
+    @mock.patch.object(homeward_oauth.OAuth2Session, 'fetch_token', return_value={'access_token': '_ASDF_'})
+    def test_should_fetch_a_token_per_client_when_sharing_is_off(self, fetch_mock):
+        AgentServiceClient().client
+        AgentServiceClient().client
+
+        self.assertEqual(fetch_mock.call_count, 2)
@@ -0,0 +1,52 @@
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from utils.hubspot_transport import HubspotTransport
+
+
+class HubspotTransportTests(SimpleTestCase):
+    def test_should_reuse_session_between_calls(self):
+        transport = HubspotTransport()
+        with mock.patch.object(HubspotTransport, 'build_session') as build_session:
+            transport.post('https://api.hubapi.com/', 'send_mail', json={})
+            transport.get('https://api.hubapi.com/', 'get_profile_by_hutk')
+
+        build_session.assert_called_once()
+        self.assertEqual(build_session.return_value.request.call_count, 2)
+
+    def test_should_build_new_session_after_fork(self):
+        transport = HubspotTransport()
+        with mock.patch.object(HubspotTransport, 'build_session') as build_session:
+            transport.post('https://api.hubapi.com/', 'send_mail')
+            # as seen from a forked child
+            transport._pid = -1
+            transport.post('https://api.hubapi.com/', 'send_mail')
+
+        self.assertEqual(build_session.call_count, 2)
+
+    def test_should_apply_default_timeout_and_record_latency(self):
+        transport = HubspotTransport(timeout=5)
+        with mock.patch.object(HubspotTransport, 'build_session') as build_session:
+            transport.post('https://api.hubapi.com/', 'send_mail', json={})
+
+        build_session.return_value.request.assert_called_once_with('POST', 'https://api.hubapi.com/', json={},
+                                                                    timeout=5)
+        self.assertEqual(transport.stats['send_mail_calls'], 1)
+        self.assertIn('send_mail_ms', transport.stats)
+
+    def test_should_pool_connections(self):
+        session = HubspotTransport(pool_size=25).build_session()
+
+        adapter = session.get_adapter('https://api.hubapi.com/')
+        self.assertEqual(adapter._pool_maxsize, 25)
+        self.assertIn(429, adapter.max_retries.status_forcelist)
+
+    def test_should_only_retry_posts_to_retried_prefixes(self):
+        session = HubspotTransport(retried_post_prefixes=['https://api.hubapi.com/email/']).build_session()
+
+        contact_retries = session.get_adapter('https://api.hubapi.com/contacts/v1/contact').max_retries
+        email_retries = session.get_adapter('https://api.hubapi.com/email/public/v1/singleEmail/send').max_retries
+        self.assertFalse(contact_retries.is_retry('POST', 503))
+        self.assertTrue(contact_retries.is_retry('GET', 503))
+        self.assertTrue(email_retries.is_retry('POST', 503))
@@ -0,0 +1,45 @@
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+
+from application.models.task import Task
+from utils.model_registry import ModelRegistry
+
+
+@override_settings(TEST_REGISTRY_TTL_SECONDS=300)
+class ModelRegistryTests(SimpleTestCase):
+    def setUp(self):
+        self.rows = [Task(name='real estate agent', state=None, category='real estate agent'),
+                     Task(name='homeward mortgage (texas)', state='tx', category='homeward mortgage')]
+        self.registry = ModelRegistry(Task, 'TEST_REGISTRY_TTL_SECONDS', indexes=[('name',), ('state', 'category')])
+        patcher = mock.patch.object(Task, 'objects')
+        self.objects_mock = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.objects_mock.all.return_value = self.rows
+
+    def test_should_load_rows_once(self):
+        self.assertIs(self.registry.get(name='real estate agent'), self.rows[0])
+        self.assertEqual(self.registry.filter(state='tx', category='homeward mortgage'), [self.rows[1]])
+        self.assertEqual(self.registry.filter(category='homeward mortgage', state='co'), [])
+
+        self.objects_mock.all.assert_called_once()
+        self.objects_mock.get.assert_not_called()
+
+    def test_should_reload_after_clear(self):
+        self.registry.get(name='real estate agent')
+        self.registry.clear()
+        self.registry.get(name='real estate agent')
+
+        self.assertEqual(self.objects_mock.all.call_count, 2)
+
+    def test_should_fall_back_to_database_for_unknown_rows(self):
+        self.registry.get(name='added elsewhere')
+
+        self.objects_mock.get.assert_called_once_with(name='added elsewhere')
+
+    @override_settings(TEST_REGISTRY_TTL_SECONDS=0)
+    def test_should_query_database_when_turned_off(self):
+        self.registry.get(name='real estate agent')
+
+        self.objects_mock.all.assert_not_called()
+        self.objects_mock.get.assert_called_once_with(name='real estate agent')
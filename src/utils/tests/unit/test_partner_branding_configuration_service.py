@@ -1,8 +1,12 @@
 import os
+import time
 from rest_framework.test import APITestCase
 from unittest.mock import patch
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from utils import partner_branding_config_service
 from utils.partner_branding_config_service import get_partner
-from requests import Session
+from requests import ConnectionError, Session
 
 class PartnerBrandingConfigServiceTests(APITestCase):
     module_dir = os.path.dirname(__file__)
@@ -16,3 +20,42 @@ class PartnerBrandingConfigServiceTests(APITestCase):
         mock_get.return_value.status_code = 200
         partner = get_partner(slug)
         self.assertEqual(partner['name'], 'Van Poole Properties Group')
+
+
+@override_settings(PARTNER_CONFIG_CACHE_TTL_SECONDS=300, PARTNER_CONFIG_CACHE_STALE_SECONDS=3600)
+class PartnerConfigCacheTests(SimpleTestCase):
+    cms_config_payload = PartnerBrandingConfigServiceTests.cms_config_payload
+
+    def setUp(self):
+        cache.clear()
+
+    @patch.object(Session, 'get')
+    def test_should_fetch_partner_once(self, mock_get):
+        mock_get.return_value.content = self.cms_config_payload
+        mock_get.return_value.status_code = 200
+
+        get_partner("vpp")
+        partner = get_partner("vpp")
+
+        mock_get.assert_called_once()
+        self.assertEqual(partner['name'], 'Van Poole Properties Group')
+        self.assertIsNotNone(mock_get.call_args[1]['timeout'])
+
+    @patch('utils.partner_branding_config_service.schedule_refresh')
+    @patch.object(Session, 'get')
+    def test_should_serve_stale_partner_while_refreshing(self, mock_get, schedule_mock):
+        cache.set(partner_branding_config_service.CACHE_KEY.format("vpp"),
+                  {'partner': {'name': 'Old Name'}, 'fetched_at': time.time() - 301})
+
+        partner = get_partner("vpp")
+
+        self.assertEqual(partner, {'name': 'Old Name'})
+        schedule_mock.assert_called_once_with("vpp")
+        mock_get.assert_not_called()
+
+    @patch.object(Session, 'get', side_effect=ConnectionError())
+    def test_should_not_cache_failures(self, mock_get):
+        self.assertEqual(get_partner("vpp"), {})
+        self.assertEqual(get_partner("vpp"), {})
+
+        self.assertEqual(mock_get.call_count, 2)
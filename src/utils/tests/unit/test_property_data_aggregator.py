@@ -0,0 +1,90 @@
+import uuid
+from unittest import mock
+
+import requests
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from utils import homeward_oauth, property_data_aggregator
+from utils.property_data_aggregator import PropertyDataAggregatorClient, PropertyDataAggregatorClientException
+
+
+class MockResponse:
+    def __init__(self, status_code, listing=None):
+        self.status_code = status_code
+        self.listing = listing
+        self.reason = ""
+
+    def json(self):
+        return self.listing
+
+
+@override_settings(PDA_LISTING_CACHE_TTL_SECONDS=300, PROPERTY_DATA_AGGREGATOR_BASE_ENDPOINT='https://pda/')
+@mock.patch.object(homeward_oauth.OAuth2Session, 'fetch_token', return_value={'access_token': '_ASDF_'})
+class PropertyDataAggregatorClientTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.listing_uuid = uuid.uuid4()
+        self.listing = {'id': str(self.listing_uuid), 'year_built': 1984}
+
+    @mock.patch('utils.homeward_oauth.OAuth2Session.get')
+    def test_should_fetch_a_listing_once(self, get_mock, fetch_mock):
+        get_mock.return_value = MockResponse(200, self.listing)
+
+        self.assertEqual(PropertyDataAggregatorClient().get_listing(self.listing_uuid), self.listing)
+        self.assertEqual(PropertyDataAggregatorClient().get_listing(self.listing_uuid), self.listing)
+
+        get_mock.assert_called_once_with(f'https://pda/listings/{self.listing_uuid}')
+
+    @mock.patch('utils.homeward_oauth.OAuth2Session.get', return_value=MockResponse(404))
+    def test_should_remember_missing_listings(self, get_mock, fetch_mock):
+        for _ in range(2):
+            with self.assertRaises(PropertyDataAggregatorClientException):
+                PropertyDataAggregatorClient().get_listing(self.listing_uuid)
+
+        get_mock.assert_called_once()
+
+    @mock.patch('utils.homeward_oauth.OAuth2Session.get')
+    def test_should_not_remember_failures(self, get_mock, fetch_mock):
+        get_mock.side_effect = [MockResponse(503), requests.ConnectionError(), MockResponse(200, self.listing)]
+
+        for _ in range(2):
+            with self.assertRaises(PropertyDataAggregatorClientException):
+                PropertyDataAggregatorClient().get_listing(self.listing_uuid)
+
+        self.assertEqual(PropertyDataAggregatorClient().get_listing(self.listing_uuid), self.listing)
+
+    @mock.patch('utils.homeward_oauth.OAuth2Session.get')
+    def test_should_fetch_only_the_listings_that_are_not_cached(self, get_mock, fetch_mock):
+        missing_uuid = uuid.uuid4()
+        other_uuid = uuid.uuid4()
+        get_mock.return_value = MockResponse(200, self.listing)
+        PropertyDataAggregatorClient().get_listing(self.listing_uuid)
+        get_mock.side_effect = lambda url: MockResponse(404) if str(missing_uuid) in url \
+            else MockResponse(200, {'id': str(other_uuid)})
+
+        listings = PropertyDataAggregatorClient().get_listings([self.listing_uuid, missing_uuid, other_uuid])
+
+        self.assertEqual(listings, {self.listing_uuid: self.listing, other_uuid: {'id': str(other_uuid)}})
+        self.assertEqual(get_mock.call_count, 3)
+
+    @mock.patch('utils.homeward_oauth.OAuth2Session.get')
+    def test_should_count_cache_hits(self, get_mock, fetch_mock):
+        self.addCleanup(setattr, property_data_aggregator, 'listing_stats', property_data_aggregator.listing_stats)
+        property_data_aggregator.listing_stats = property_data_aggregator.ListingCacheStats()
+        get_mock.return_value = MockResponse(200, self.listing)
+
+        for _ in range(4):
+            PropertyDataAggregatorClient().get_listing(self.listing_uuid)
+
+        self.assertEqual(property_data_aggregator.listing_stats.hit_rate(), 0.75)
+
+    @override_settings(PDA_LISTING_CACHE_TTL_SECONDS=0)
+    @mock.patch('utils.homeward_oauth.OAuth2Session.get')
+    def test_should_fetch_every_time_when_the_cache_is_off(self, get_mock, fetch_mock):
+        get_mock.return_value = MockResponse(200, self.listing)
+
+        PropertyDataAggregatorClient().get_listing(self.listing_uuid)
+        PropertyDataAggregatorClient().get_listing(self.listing_uuid)
+
+        self.assertEqual(get_mock.call_count, 2)
@@ -0,0 +1,55 @@
+from unittest import mock
+
+from django.test import SimpleTestCase
+from simple_salesforce import SalesforceExpiredSession
+
+from utils.salesforce import Salesforce
+
+
+def expired_session():
+    return SalesforceExpiredSession('https://example.my.salesforce.com', 401, 'Account', 'Session expired')
+
+
+@mock.patch('utils.salesforce.sf')
+class SalesforceSessionTests(SimpleTestCase):
+    def test_should_login_lazily_and_not_probe_limits(self, sf_mock):
+        salesforce = Salesforce()
+        sf_mock.assert_not_called()
+
+        salesforce.query("SELECT Id FROM Account")
+        salesforce.query("SELECT Id FROM Account")
+
+        sf_mock.assert_called_once()
+        sf_mock.return_value.limits.assert_not_called()
+        self.assertEqual(sf_mock.return_value.query.call_count, 2)
+        self.assertEqual(salesforce.stats['limits_calls_saved'], 2)
+
+    def test_should_login_again_and_retry_once_when_session_expired(self, sf_mock):
+        expired, fresh = mock.MagicMock(), mock.MagicMock()
+        sf_mock.side_effect = [expired, fresh]
+        expired.query.side_effect = expired_session()
+        fresh.query.return_value = {'totalSize': 0}
+        salesforce = Salesforce()
+
+        self.assertEqual(salesforce.query("SELECT Id FROM Account"), {'totalSize': 0})
+
+        self.assertEqual(sf_mock.call_count, 2)
+        self.assertEqual(salesforce.stats['session_refreshes'], 1)
+        self.assertIsNotNone(salesforce.session_age())
+
+    def test_should_raise_when_retry_also_fails(self, sf_mock):
+        sf_mock.return_value.query.side_effect = expired_session()
+        salesforce = Salesforce()
+
+        with self.assertRaises(SalesforceExpiredSession):
+            salesforce.query("SELECT Id FROM Account")
+        self.assertEqual(sf_mock.return_value.query.call_count, 2)
+
+    def test_should_not_login_again_when_another_thread_already_refreshed(self, sf_mock):
+        sf_mock.side_effect = [mock.MagicMock(), mock.MagicMock()]
+        salesforce = Salesforce()
+        stale = salesforce.get_salesforce()
+        salesforce.refresh_session(stale)
+        salesforce.refresh_session(stale)
+
+        self.assertEqual(sf_mock.call_count, 2)